@@ -11,8 +11,14 @@ Acis.py:
 Collection of classes necessary to read and analyse Standard ACIS Text (*.sat) files.
 '''
 
-import traceback, Part, FreeCAD, re
-
+import traceback, Part, FreeCAD, re, multiprocessing
+
+from struct            import Struct
+from concurrent        import futures
+try:
+	import numpy
+except:
+	numpy = None
 from importerUtils     import *
 from FreeCAD           import Vector as VEC, Placement as PLC, Matrix as MAT, Base
 from math              import inf, pi, fabs, degrees, asin, sin, cos, tan, atan2, ceil, e, cosh, sinh, tanh, acos, acosh, asin, asinh, atan, atanh, log, sqrt, exp, log10
@@ -88,9 +94,6 @@ CURV_DIR    = {0: 'left',   2: 'right'}
 
 scale = 1.0
 
-_nameMtchAttr    = {}
-_dcIdxAttributes = {} # dict of an attribute list
-
 LENGTH_TEXT = re.compile('[ \t]*(\\d+) +(.*)')
 
 TOKEN_TRANSLATIONS = {
@@ -103,16 +106,30 @@ TOKEN_TRANSLATIONS = {
 	'#':          TAG_TERMINATOR
 }
 
-_reader = None
-_getSLong = getSInt32
-_getULong = getUInt32
+# Tokenizer for the bulk text reader (.sat): each match skips leading white
+# spaces and types the token by the matching group (see TOKEN_* below).
+_TEXT_SPACE      = re.compile('[ \t\n\b\f]*')
+_TEXT_WORD       = re.compile('[ \t\n\b\f]*([#(){}]|[^ \t\n\b\f#(){}]+)')
+_TEXT_TOKEN      = re.compile(
+	'[ \t\n\b\f]*(?:'
+	'([#(){}])|'                                                   # 1: single character
+	'([-+]?(?:\\d+\\.?\\d*|\\.\\d+)(?:[eE][-+]?\\d+)?)(?![^ \t\n\b\f#(){}])|' # 2: number
+	'\\$(-?\\d+)(?![^ \t\n\b\f#(){}])|'                             # 3: entity reference
+	'@(\\d+)(?![^ \t\n\b\f#(){}])|'                                 # 4: length of the following text
+	'([^ \t\n\b\f#(){}]+))'                                         # 5: any other word
+)
+_TEXT_FLOAT_WORD = re.compile('[-+]?(?:inf(?:inity)?|nan)$', re.IGNORECASE)
+TOKEN_CHAR   = 1
+TOKEN_NUMBER = 2
+TOKEN_REF    = 3
+TOKEN_TEXT   = 4
+TOKEN_WORD   = 5
 
 def getReader():
 	'''
 	Returns the current reader for the ACIS document.
 	'''
-	global _reader
-	return _reader
+	return getContext().acisReader
 
 def setReader(reader):
 	'''
@@ -121,13 +138,11 @@ def setReader(reader):
 	reader: AcisReader
 		The current ACIS document's reader
 	'''
-	global _reader
 	clearEntities()
-	_reader = reader
+	getContext().acisReader = reader
 
 def getDcAttributes():
-	global _dcIdxAttributes
-	return _dcIdxAttributes
+	return getContext().dcAttributes
 
 def _getStr_DEFAULT(data, offset, end):
 	txt = data[offset: end].decode('cp1252')
@@ -135,37 +150,6 @@ def _getStr_DEFAULT(data, offset, end):
 		txt = txt.encode(ENCODING_FS).decode("utf8")
 	return txt, end
 
-SPACE_CLAIM={}
-SPACE_CLAIM_A={}
-
-def _getStr_SpaceClaim(data, offset, end):
-	blob = data[offset: end]
-	i = blob.find(b'%')
-	if (i>=0):
-		txt = blob[0:i].decode('cp1252')
-		if (sys.version_info.major < 3):
-			txt = txt.encode(ENCODING_FS).decode("utf8")
-		if (len(blob) ==  i + 2):
-			idx, _ = getUInt8(blob, i + 1)
-			if (i == 0):
-				txt = SPACE_CLAIM_A[idx]
-			else:
-				SPACE_CLAIM_A[idx] = txt
-		elif (len(blob) == i + 5):
-			idx, _ = _getULong(blob, i + 1)
-			if (i == 0):
-				txt = SPACE_CLAIM[idx]
-			else:
-				SPACE_CLAIM[idx] = txt
-	else:
-		txt = blob.decode('cp1252')
-		if (sys.version_info.major < 3):
-			txt = txt.encode(ENCODING_FS).decode("utf8")
-
-	return txt, end
-
-_getStr_ = _getStr_DEFAULT
-
 def _set_attribute_DEFAULT(self, record, pos):
 	i = pos
 	self._next, i     = getRefNode(record, i, 'attrib')
@@ -182,8 +166,6 @@ def _set_attribute_SpaceClaim(self, record, pos):
 	i += 1 # skip ???
 	return i
 
-_set_attribute_ = _set_attribute_DEFAULT
-
 def _handle_topology_DEFAULT(obj, pos):
 	i = pos
 	vrs = getVersion()
@@ -196,8 +178,6 @@ def _handle_topology_SpaceClaim(obj, pos):
 	i += 2 # UINT32, REF, UINT32
 	return i
 
-_handle_topology_ = _handle_topology_DEFAULT
-
 def COS(x):        return (cos(x))
 def COSH(x):       return (cosh(x))
 def COT(x):        return (cos(x)/sin(x))
@@ -245,6 +225,56 @@ def MAX(*x):       return max(x)
 def DCUR(c, x):     return c.parameter(x)
 def DSURF(c, u, v): return c.parameter(u, v)
 
+def _createLawFunctionsNumPy():
+	'''
+	Returns the vectorized law functions for Law.evaluateMany.
+	Laws that use other functions are evaluated value by value.
+	'''
+	if (numpy is None): return None
+	np = numpy
+	functions = {
+		'COS':     np.cos,
+		'COSH':    np.cosh,
+		'COT':     lambda x: np.cos(x) / np.sin(x),
+		'COTH':    lambda x: np.cosh(x) / np.sinh(x),
+		'CSC':     lambda x: 1 / np.sin(x),
+		'CSCH':    lambda x: 1 / np.sinh(x),
+		'SEC':     lambda x: 1 / np.cos(x),
+		'SECH':    lambda x: 1 / np.cosh(x),
+		'SIN':     np.sin,
+		'SINH':    np.sinh,
+		'TAN':     np.tan,
+		'TANH':    np.tanh,
+		'ARCCOS':  np.arccos,
+		'ARCCOSH': np.arccosh,
+		'ARCOT':   lambda x: pi/2 - np.arctan(x),
+		'ARCOTH':  lambda x: 0.5 * np.log((x+1)/(x-1)),
+		'ARCCSC':  lambda x: np.arcsin(1/x),
+		'ARCCSCH': lambda x: np.log((1+np.sqrt(1+x**2))/x),
+		'ARCSEC':  lambda x: np.arccos(1/x),
+		'ARCSECH': lambda x: np.log((1+np.sqrt(1-x**2))/x),
+		'ARCSIN':  np.arcsin,
+		'ARCSINH': np.arcsinh,
+		'ARCTAN':  np.arctan,
+		'ARCTANH': np.arctanh,
+		'ABS':     np.abs,
+		'EXP':     np.exp,
+		'LN':      np.log,
+		'LOG':     np.log10,
+		'SET':     np.sign,
+		'SIGN':    np.sign,
+		'cos':     np.cos,   'cosh':  np.cosh,  'acos':    np.arccos, 'acosh': np.arccosh,
+		'sin':     np.sin,   'sinh':  np.sinh,  'asin':    np.arcsin, 'asinh': np.arcsinh,
+		'tan':     np.tan,   'tanh':  np.tanh,  'atan':    np.arctan, 'atanh': np.arctanh,
+		'exp':     np.exp,   'log':   np.log,   'log10':   np.log10,  'sqrt':  np.sqrt,
+		'fabs':    np.fabs,  'ceil':  np.ceil,  'degrees': np.degrees, 'atan2': np.arctan2,
+		'pi':      pi,       'e':     e,        'inf':     inf,
+	}
+	return functions
+
+_LAW_FUNCTIONS_NUMPY = _createLawFunctionsNumPy()
+_LAW_CODES = {} # equation -> compiled code
+
 def vec2sat(v): return u"%s %s %s" %(v.x, v.y, v.z)
 
 class Law(object):
@@ -271,25 +301,53 @@ class Law(object):
 		#FIXME: how to handle cross operator???
 		# convert ^ into **
 		self.eq = eq.replace('^', ' ** ')
+	def _getCode(self):
+		try:
+			return _LAW_CODES[self.eq]
+		except KeyError:
+			code = compile(self.eq, '<law>', 'eval')
+			_LAW_CODES[self.eq] = code
+		return code
 	def evaluate(self, X):
 		try:
-			return eval(self.eq)
+			return eval(self._getCode(), globals(), {'X': X})
 		except Exception as e:
 			logError(u"    Can't evaluate '%s': %s", self.eq, e)
 		return None
+	def _evaluateNumPy(self, xs):
+		X = numpy.asarray(xs, dtype=float)
+		with numpy.errstate(all='ignore'):
+			values = eval(self._getCode(), _LAW_FUNCTIONS_NUMPY, {'X': X})
+		if (type(values) in (tuple, list)):
+			values = [numpy.broadcast_to(numpy.asarray(v, dtype=float), X.shape) for v in values]
+			if (not all(numpy.isfinite(v).all() for v in values)): return None
+			return list(zip(*[v.tolist() for v in values]))
+		values = numpy.broadcast_to(numpy.asarray(values, dtype=float), X.shape)
+		if (not numpy.isfinite(values).all()): return None
+		return values.tolist()
+	def evaluateMany(self, xs):
+		'''
+		Evaluates the law for all values of xs at once.
+		Returns the list of the values.
+		'''
+		if (_LAW_FUNCTIONS_NUMPY is not None):
+			try:
+				values = self._evaluateNumPy(xs)
+				if (values is not None):
+					return values
+			except:
+				pass # e.g. functions for single values only => evaluate them one by one.
+		return [self.evaluate(x) for x in xs]
 
 def init():
-	global _dcIdxAttributes
-
 	clearEntities()
-	_dcIdxAttributes.clear()
+	getContext().dcAttributes.clear()
 
 def clearEntities():
 	'''
 	Clears all cached enties.
 	'''
-	global _nameMtchAttr
-	_nameMtchAttr.clear()
+	getContext().nameMatchAttributes.clear()
 
 def getScale():
 	return getReader().scale
@@ -307,8 +365,7 @@ def isASM():
 
 def getAsmMajor():
 	# e.g.: Inventor 2010 -> 215, 2020 -> 225
-	global _reader
-	header = _reader.header
+	header = getReader().header
 	if (hasattr(header, 'asm')):
 		return header.asm[0]
 	return 0
@@ -380,7 +437,7 @@ def getIntegers(chunks, index, count):
 	return arr, i
 
 def getDcIndexMappings(chunks, index, attr):
-	global _dcIdxAttributes
+	dcIdxAttributes = getContext().dcAttributes
 	m = []
 	count, i = getInteger(chunks, index)
 	for n in range(count):
@@ -388,10 +445,10 @@ def getDcIndexMappings(chunks, index, attr):
 		value, i = getInteger(chunks, i)
 		m.append((dcIdx, value))
 		try:
-			indexMappings = _dcIdxAttributes[dcIdx]
+			indexMappings = dcIdxAttributes[dcIdx]
 		except:
 			indexMappings = IndexMappings()
-			_dcIdxAttributes[dcIdx] = indexMappings
+			dcIdxAttributes[dcIdx] = indexMappings
 		indexMappings.append(attr)
 	return m, i
 
@@ -461,6 +518,10 @@ def getEnumByTag(chunks, index, values):
 	elif (chunk.tag == TAG_DOUBLE):
 		chunk = AcisChunkEnumValue(TAG_ENUM_VALUE, 11 - int(chunk.val), values)
 		chunks[index] = chunk
+	elif (chunk.tag in (TAG_TRUE, TAG_FALSE)):
+		# don't modify the shared boolean chunks!
+		chunk = AcisChunkEnumValue(chunk.tag, chunk.val, values)
+		chunks[index] = chunk
 	else:
 		chunk.values = values
 	return values[chunk.val], index + 1
@@ -802,7 +863,7 @@ def isSeam(edge, face):
 				elif (isinstance(c, Part.ArcOfEllipse)):
 					if isOnEllipse(c.Ellipse, fEdge.Curve.Ellipse): return True
 				else:
-					logError(u"    Unknown edge type '%s'!", c.__class__.__name)
+					logError(u"    Unknown edge type '%s'!", c.__class__.__name__)
 		except Exception as e:
 			pass
 	return False
@@ -832,6 +893,80 @@ def eliminateOuterFaces(faces, edges):
 			return face
 	return None
 
+def trimSurface(surface, edges):
+	'''
+	Splits the surface by the edges.
+	Returns the face bounded by the edges (or None) and the split faces.
+	'''
+	component, elements = surface.generalFuse(edges, 0.1)
+	faces = elements[0]
+	if (len(faces) == 0):
+		return None, faces
+	return eliminateOuterFaces(faces, edges), faces
+
+def _importBrep(brep):
+	shape = Part.Shape()
+	shape.importBrepFromString(brep)
+	return shape.Faces[0]
+
+# The faces to be trimmed by the worker processes: they inherit this list when forked.
+_faceJobs = []
+
+MIN_PARALLEL_FACES = 32 # forking isn't worth it for less faces
+
+def _trimFace(index):
+	surface, edges = _faceJobs[index]
+	face, faces = trimSurface(surface, edges)
+	if (face is None):
+		return None, [f.exportBrepToString() for f in faces]
+	return face.exportBrepToString(), []
+
+def _trimFacesParallel(jobs, workers):
+	global _faceJobs
+
+	results = [None] * len(jobs)
+	_faceJobs = jobs
+	try:
+		with futures.ProcessPoolExecutor(workers, multiprocessing.get_context('fork')) as pool:
+			pending = [pool.submit(_trimFace, index) for index in range(len(jobs))]
+			for index, job in enumerate(pending):
+				try:
+					brep, breps = job.result()
+					face = None if (brep is None) else _importBrep(brep)
+					results[index] = (face, [_importBrep(b) for b in breps])
+				except Exception as e:
+					logWarning(u"    Can't trim face in a separate process (%s)!", e)
+	except Exception as e:
+		logWarning(u"    Can't trim faces in separate processes (%s)!", e)
+	_faceJobs = []
+	return results
+
+def buildFaceShapes(faces):
+	'''
+	Builds the shapes of the faces in two steps:
+	1. create the surfaces and edges - each only once, as the entities keep their shapes,
+	2. trim the surfaces by the edges - in a process pool for large bodies.
+	Faces that can't be returned from a worker are trimmed again sequentially.
+	FreeCAD's GUI can't be forked, so with GUI the faces are trimmed sequentially.
+	Returns the list of the faces' shapes.
+	'''
+	prepared = [(face, face.prepare()) for face in faces]
+	jobs     = [job for face, job in prepared if (job is not None)]
+	results  = [None] * len(jobs)
+	workers  = getFaceWorkers()
+	fork     = (not FreeCAD.GuiUp) and ('fork' in multiprocessing.get_all_start_methods())
+	if ((workers > 1) and (len(jobs) >= MIN_PARALLEL_FACES) and (fork)):
+		results = _trimFacesParallel(jobs, workers)
+	index = 0
+	for face, job in prepared:
+		if (job is not None):
+			trimmed = results[index]
+			if (trimmed is None):
+				trimmed = trimSurface(*job)
+			face.setTrimmed(job[0], *trimmed)
+			index += 1
+	return [face.shape for face in faces]
+
 def createCircle(center, normal, radius):
 	circle = Part.Circle(center, normal, radius.Length)
 	circle.XAxis = radius
@@ -927,7 +1062,7 @@ def createBSplinesCurve(nubs, sense, subtype):
 				)
 			shape = bsc.toShape()
 		except Exception as e:
-			logWarning("Can't create BSpline-Curve for suptype '%s'!" %(subtype))
+			logWarning("Can't create BSpline-Curve for suptype '%s'!", subtype)
 	if (shape is not None):
 		shape.Orientation = str('Reversed') if (sense == 'reversed') else str('Forward')
 	return shape
@@ -1135,14 +1270,11 @@ def getBlendValues(chunks, index):
 	raise Exception("Unknown BlendValue %s!" %(name))
 
 def getNameMatchAttributes():
-	global _nameMtchAttr
-	return _nameMtchAttr
+	return getContext().nameMatchAttributes
 
 def releaseMemory():
-	global _dcIdxAttributes
-
 	clearEntities()
-	_dcIdxAttributes.clear()
+	getContext().dcAttributes.clear()
 
 def pointOnSurface(point, surface): # point should be an ACIS-Point and surface an ACIS-Spline-Surface
 	if (surface.shape is None):
@@ -1630,7 +1762,7 @@ class Topology(Entity):
 	def __init__(self): super(Topology, self).__init__()
 	def set(self, record):
 		i = super(Topology, self).set(record)
-		i = _handle_topology_(self, i)
+		i = getReader().handleTopology(self, i)
 		return i
 class Body(Topology):
 	def __init__(self):
@@ -1797,7 +1929,11 @@ class Face(Topology):
 		if (loop is not None):
 			edges += loop.buildEdges()
 		return edges
-	def build(self):
+	def prepare(self):
+		'''
+		Builds the face's edges and surface.
+		Returns the surface and the edges if the surface has to be trimmed, otherwise None.
+		'''
 		if (self.__ready_to_build__):
 			self.__ready_to_build__ = False
 			edges = self.buildCoEdges()
@@ -1805,23 +1941,27 @@ class Face(Topology):
 				surface = self.getSurface().build()
 				if (surface):
 					if (self.sense == 'reversed'):
-						surface.reverse()
+						surface = surface.reversed() # the surface's shape can be shared with other faces!
 					if (len(edges) > 0):
-						tolerance = 0.1
-						component, elements = surface.generalFuse(edges, tolerance)
-						faces = elements[0]
-						if (len(faces) == 0):
-							logWarning("Can't apply wires for face (no elements) for %s" %(self._surface))
-							self.shape = surface
-						else:
-							self.shape = eliminateOuterFaces(faces, edges)
-							if (self.shape is None):
-								# edges can be empty because not all edges can be created right now :(
-								logWarning("Can't apply wires for face %s!" %(surface.Surface))
-								for f in faces:
-									Part.show(f, "Face-%d" %(self.record.index))
-					else:
-						self.shape = surface
+						return surface, edges
+					self.shape = surface
+		return None
+	def setTrimmed(self, surface, shape, faces):
+		self.shape = shape
+		if (shape is not None):
+			return
+		if (len(faces) == 0):
+			logWarning("Can't apply wires for face (no elements) for %s", self._surface)
+			self.shape = surface
+		else:
+			# edges can be empty because not all edges can be created right now :(
+			logWarning("Can't apply wires for face %s!", surface.Surface)
+			for f in faces:
+				Part.show(f, "Face-%d" %(self.record.index))
+	def build(self):
+		job = self.prepare()
+		if (job is not None):
+			self.setTrimmed(job[0], *trimSurface(*job))
 		return self.shape
 	def isCone(self):   return isinstance(self.getSurface(), SurfaceCone)
 	def isMesh(self):   return isinstance(self.getSurface(), SurfaceMesh)
@@ -2613,10 +2753,11 @@ class CurveInt(Curve):     # interpolated ('Bezier') curve "intcurve-curve"
 					d = d / 25 # interpolation limit for BSplineCurve!
 					b = r.upper.getLimit()
 					l = Law(self.laws[0][0])
-					p = []
+					xs = []
 					while b >= x:
-						p.append(VEC(l.evaluate(x)))
+						xs.append(x)
 						x += d
+					p = [VEC(v) for v in l.evaluateMany(xs)]
 					spline = Part.BSplineCurve()
 					spline.interpolate(p)
 					self.shape = spline.toShape()
@@ -2868,7 +3009,7 @@ class SurfaceCone(Surface):
 						cone = l.revolve(self.center, self.axis, 360.0)
 						self.shape = cone.Faces[0]
 					except:
-						logError(u"    ... Can't create cone surface for Apex=%s, Center=%s, Major=%s, Axis=%s - skipped!" % (self.apex, self.center, self.major, self.axis))
+						logError(u"    ... Can't create cone surface for Apex=%s, Center=%s, Major=%s, Axis=%s - skipped!", self.apex, self.center, self.major, self.axis)
 		return self.shape
 class SurfaceMesh(Surface):
 	def __init__(self):
@@ -3942,7 +4083,7 @@ class SurfaceSpline(Surface):
 						self.surface.Radius = radius.Length + 1.0
 						self.shape = self.surface.toShape()
 					else:
-						logError("    Can't create cylinder from profile (%r)" %(self.profile))
+						logError("    Can't create cylinder from profile (%r)", self.profile)
 			elif (self.subtype == 'VBL_SURF'):
 				if (self.surface is None):
 					edges = []
@@ -3988,7 +4129,7 @@ class SurfaceSpline(Surface):
 					if (curve is not None):
 						self.shape = Part.SurfaceOfRevolution(curve.Curve, self.loc, self.dir).toShape()
 					else:
-						logError("    Can't create curve for revolution of (%r)" %(self.profile))
+						logError("    Can't create curve for revolution of (%r)", self.profile)
 			elif (self.subtype == 'sum_spl_sur'):
 				rngU = self.rangeU
 				curve1 = self.curve1.build(rngU.getLowerLimit(), rngU.getUpperLimit())
@@ -3999,9 +4140,9 @@ class SurfaceSpline(Surface):
 						self.shape = Part.makeRuledSurface(curve1, curve2)
 						self.shape.translate(self.origin)
 					else:
-						logError("    Can't create ruled surface of 2nd curve - (%r)" %(self.curve2))
+						logError("    Can't create ruled surface of 2nd curve - (%r)", self.curve2)
 				else:
-					logError("    Can't create ruled surface of 1st curve - (%r)" %(self.curve1))
+					logError("    Can't create ruled surface of 1st curve - (%r)", self.curve1)
 #			elif (self.subtype == 'sweep_spl_sur'):
 #				profile = self.profile.build(None, None)
 #				if (profile):
@@ -4081,7 +4222,7 @@ class SurfaceTorus(Surface):
 				torus = Part.SurfaceOfRevolution(circle, self.center, self.axis)
 				self.shape = torus.toShape()
 			except Exception as e:
-				logWarning("Can't create torus for center=%s, axis=%s, major=%g, minor=%g, UV=%s: %s"%(self.center, self.axis, self.major, self.minor, self.uvorigin, e))
+				logWarning("Can't create torus for center=%s, axis=%s, major=%g, minor=%g, UV=%s: %s", self.center, self.axis, self.major, self.minor, self.uvorigin, e)
 		return self.shape
 
 class Point(Geometry):
@@ -4138,7 +4279,7 @@ class Attributes(Entity):
 		self._owner    = None
 	def set(self, record):
 		i = super(Attributes, self).set(record)
-		i = _set_attribute_(self, record, i)
+		i = getReader().setAttribute(self, record, i)
 		return i
 	def getNext(self):     return None if (self._next is None)     else self._next.entity
 	def getPrevious(self): return None if (self._previous is None) else self._previous.entity
@@ -4648,15 +4789,15 @@ class AttribNamingMatchingNMxBrepTagNameGenerated(AttribNamingMatchingNMxBrepTag
 	# n1, n2, n3
 	def __init__(self): super(AttribNamingMatchingNMxBrepTagNameGenerated, self).__init__()
 	def set(self, record):
-		global _nameMtchAttr
 		i = super(AttribNamingMatchingNMxBrepTagNameGenerated, self).set(record)
 		self.key, i = getInteger(record.chunks, i)
 		self.n2,  i = getInteger(record.chunks, i)
 		self.n3,  i = getInteger(record.chunks, i)
-		lst = _nameMtchAttr.get(self.key, None)
+		nameMtchAttr = getContext().nameMatchAttributes
+		lst = nameMtchAttr.get(self.key, None)
 		if (lst is None):
 			lst = []
-			_nameMtchAttr[self.key] = lst
+			nameMtchAttr[self.key] = lst
 		lst.append(self)
 		return i
 class AttribNamingMatchingNMxBrepTagNameGrillSplitFace(AttribNamingMatchingNMxBrepTagName):
@@ -4740,101 +4881,114 @@ class CShell(Entity):
 	def __init__(self): super(CShell, self).__init__()
 
 class _AcisChunk_(object):
+	__slots__ = ('tag', 'val')
 	def __init__(self, key, val = None):
 		self.tag = key
 		self.val = val
 	def __str__(self):  return self.__repr__()
 	def __repr__(self): return "%s " %(self.val)
-	def read(self, data, offset): return offset
+	def read(self, data, offset, reader): return offset
 class AcisChunkChar(_AcisChunk_):
 	'''Single character (unsigned 8 bit)'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkChar, self).__init__(TAG_CHAR, value)
 	def __repr__(self): return u"%s " %(self.val)
-	def read(self, data, offset):
+	def read(self, data, offset, reader):
 		self.val = data[offset]
 		return offset + 1
 class _AcisChunkNumber_(_AcisChunk_):
+	__slots__ = ()
 	def __init__(self, tag, value = None):
 		super(_AcisChunkNumber_, self).__init__(tag, value)
 	def __repr__(self): return u"%g " %(self.val)
 class AcisChunkShort(_AcisChunkNumber_):
 	'''16Bit signed value'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkShort, self).__init__(TAG_SHORT, value)
-	def read(self, data, offset):
+	def read(self, data, offset, reader):
 		self.val, i = getSInt16(data, offset)
 		return i
 class AcisChunkHuge(_AcisChunkNumber_):
 	'''64Bit signed value'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkHuge, self).__init__(TAG_INT64, value)
-	def read(self, data, offset):
+	def read(self, data, offset, reader):
 		self.val, i = getSInt64(data, offset)
 		return i
 class AcisChunkLong(_AcisChunkNumber_):
 	'''32/64 Bit signed value depending on the Header!'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkLong, self).__init__(TAG_LONG, value)
-	def read(self, data, offset):
-		global _getSLong
-		self.val, i = _getSLong(data, offset)
+	def read(self, data, offset, reader):
+		self.val, i = reader.getSLong(data, offset)
 		return i
 class AcisChunkFloat(_AcisChunkNumber_):
 	'''32Bit IEEE float value'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkFloat, self).__init__(TAG_FLOAT, value)
-	def read(self, data, offset):
+	def read(self, data, offset, reader):
 		self.val, i = getFloat32(data, offset)
 		return i
 class AcisChunkDouble(_AcisChunkNumber_):
 	'''64Bit IEEE float value'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkDouble, self).__init__(TAG_DOUBLE, value)
-	def read(self, data, offset):
+	def read(self, data, offset, reader):
 		self.val, i = getFloat64(data, offset)
 		return i
 class AcisChunkUtf8U8(_AcisChunk_):
 	'''8Bit length + UTF8-Chars'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkUtf8U8, self).__init__(TAG_UTF8_U8, value)
 	def __str__(self):  return u"@%d %s " %(len(self.val), self.val)
 	def __repr__(self): return u"'%s' " %(self.val)
-	def read(self, data, offset):
+	def read(self, data, offset, reader):
 		l, i = getUInt8(data, offset)
-		self.val, i = _getStr_(data, i, l + i)
+		self.val, i = reader.getStr(data, i, l + i)
 		return i
 class _AcisChunkUtf8String_(_AcisChunk_):
+	__slots__ = ()
 	def __init__(self, key, val = None):
 		super(_AcisChunkUtf8String_, self).__init__(key, val)
 	def __str__(self):  return u"@%d %s " %(len(self.val), self.val)
 	def __repr__(self): return u"'%s' " %(self.val)
 class AcisChunkUtf8U16(_AcisChunkUtf8String_):
 	'''16Bit length + UTF8-Chars'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkUtf8U16, self).__init__(TAG_UTF8_U16, value)
-	def read(self, data, offset):
+	def read(self, data, offset, reader):
 		l, i = getUInt16(data, offset)
-		self.val, i = _getStr_(data, i, l + i)
+		self.val, i = reader.getStr(data, i, l + i)
 		return i
 class AcisChunkUtf8U32A(_AcisChunkUtf8String_):
 	'''32Bit length + UTF8-Chars'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkUtf8U32A, self).__init__(TAG_UTF8_U32_A, value)
-	def read(self, data, offset):
+	def read(self, data, offset, reader):
 		l, i = getUInt32(data, offset)
-		self.val, i = _getStr_(data, i, l + i)
+		self.val, i = reader.getStr(data, i, l + i)
 		return i
 class AcisChunkUtf8U32B(_AcisChunkUtf8String_):
 	'''32Bit length + UTF8-Chars'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkUtf8U32B, self).__init__(TAG_UTF8_U32_B, value)
-	def read(self, data, offset):
+	def read(self, data, offset, reader):
 		l, i = getUInt32(data, offset)
-		self.val, i = _getStr_(data, i, l + i)
+		self.val, i = reader.getStr(data, i, l + i)
 		return i
 class AcisChunkEnumValue(_AcisChunk_):
 	'''value of an enumeration or boolean'''
+	__slots__ = ('values',)
 	def __init__(self, tag = TAG_ENUM_VALUE, value = None, values = None):
 		super(AcisChunkEnumValue, self).__init__(tag, value)
 		self.values = values
@@ -4843,9 +4997,8 @@ class AcisChunkEnumValue(_AcisChunk_):
 			return u"%s " %(self.values[self.val])
 		except:
 			return u"%s " %(self.val)
-	def read(self, data, offset):
-		global _getULong
-		self.val, i = _getULong(data, offset)
+	def read(self, data, offset, reader):
+		self.val, i = reader.getULong(data, offset)
 		return i
 	def getValue(self):
 		if (self.values):
@@ -4853,59 +5006,75 @@ class AcisChunkEnumValue(_AcisChunk_):
 		return self.val
 class AcisChunkEntityRef(_AcisChunk_):
 	'''Entity reference'''
+	__slots__ = ('record',)
 	def __init__(self, value = -1, record = None):
 		super(AcisChunkEntityRef, self).__init__(TAG_ENTITY_REF, value)
 		self.record = record
 	def __repr__(self): return u"$%s " %(self.val)
+	def __getstate__(self):
+		# Don't follow the references - the reader links the records again (see AcisReader.__setstate__).
+		return (self.tag, self.val)
+	def __setstate__(self, state):
+		self.tag, self.val = state
+		self.record = None
 class AcisChunkIdent(_AcisChunk_):
 	'''name of the base class'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkIdent, self).__init__(TAG_IDENT, value)
 	def __repr__(self): return u"%s " %(self.val)
-	def read(self, data, offset):
+	def read(self, data, offset, reader):
 		l, i = getUInt8(data, offset)
-		self.val, i = _getStr_(data, i, l + i)
+		self.val, i = reader.getStr(data, i, l + i)
 		return i
 class AcisChunkSubident(_AcisChunk_):
 	'''name of the sub class'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkSubident, self).__init__(TAG_SUBIDENT, value)
 	def __repr__(self): return u"%s-" %(self.val)
-	def read(self, data, offset):
+	def read(self, data, offset, reader):
 		l, i = getUInt8(data, offset)
-		self.val, i = _getStr_(data, i, l + i)
+		self.val, i = reader.getStr(data, i, l + i)
 		return i
 class AcisChunkSubtypeOpen(_AcisChunk_):
 	'''Opening block tag'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkSubtypeOpen, self).__init__(TAG_SUBTYPE_OPEN, u"{")
 class AcisChunkSubtypeClose(_AcisChunk_):
 	'''Closing block tag'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkSubtypeClose, self).__init__(TAG_SUBTYPE_CLOSE, u"}")
 class AcisChunkTerminator(_AcisChunk_):
 	'''terminator char ('#') for the record'''
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkTerminator, self).__init__(TAG_TERMINATOR, u"#")
 	def __repr__(self): return u"#"
 class _AcisChunkArray_(_AcisChunk_):
+	__slots__ = ('array_size',)
 	def __init__(self, tag, array_size, value = None):
 		super(_AcisChunkArray_, self).__init__(tag, value)
 		self.array_size = array_size
 	def __repr__(self): return u"%s " %(" ".join(["%g" %(f) for f in self.val]))
-	def read(self, data, offset):
+	def read(self, data, offset, reader):
 		self.val, i = getFloat64A(data, offset, self.array_size)
 		return i
 class AcisChunkPosition(_AcisChunkArray_):
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkPosition, self).__init__(TAG_POSITION, 3, value)
 	def __str__(self):
 		s = getScale()
 		return u"%s " %(" ".join(["%g" %(f * s) for f in self.val]))
 class AcisChunkVector2D(_AcisChunkArray_):
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkVector2D, self).__init__(TAG_VECTOR_2D, 2, value)
 class AcisChunkVector3D(_AcisChunkArray_):
+	__slots__ = ()
 	def __init__(self, value = None):
 		super(AcisChunkVector3D, self).__init__(TAG_VECTOR_3D, 3, value)
 
@@ -4932,6 +5101,16 @@ ACIS_VALUE_CHUNKS = {
 	TAG_INT64        : AcisChunkHuge,
 }
 
+# Chunks without own data are shared by all records of binary files (.sab)!
+ACIS_CHUNK_TRUE       = AcisChunkEnumValue(TAG_TRUE, TAG_TRUE, BOOLEAN)
+ACIS_CHUNK_FALSE      = AcisChunkEnumValue(TAG_FALSE, TAG_FALSE, BOOLEAN)
+ACIS_CHUNK_TERMINATOR = AcisChunkTerminator()
+
+def _createEnumChunk(value):
+	return AcisChunkEnumValue(TAG_ENUM_VALUE, value)
+
+_BINARY_RUNS = {} # struct format of a run of fixed size chunks -> unpack_from
+
 class History(object):
 	def __init__(self, record):
 		super(History, self).__init__()
@@ -5006,6 +5185,52 @@ class AcisReader(object):
 		self.resolved   = False
 		self.bodies     = []
 		self._subtypes  = []
+		# format dependent readers and handlers - see _readHeaderBinary
+		self.getSLong       = getSInt32
+		self.getULong       = getUInt32
+		self.getStr         = _getStr_DEFAULT
+		self.handleTopology = _handle_topology_DEFAULT
+		self.setAttribute   = _set_attribute_DEFAULT
+		self._spaceClaim    = {}
+		self._spaceClaimA   = {}
+		self._initBinaryChunks(False)
+
+	def __getstate__(self):
+		# the stream and its raw data are only required while the records are read.
+		state = self.__dict__.copy()
+		state['_stream'] = None
+		state['_data']   = None
+		return state
+
+	def __setstate__(self, state):
+		self.__dict__.update(state)
+		self._resolfChunkReferences()
+
+	def _getStrSpaceClaim(self, data, offset, end):
+		blob = data[offset: end]
+		i = blob.find(b'%')
+		if (i>=0):
+			txt = blob[0:i].decode('cp1252')
+			if (sys.version_info.major < 3):
+				txt = txt.encode(ENCODING_FS).decode("utf8")
+			if (len(blob) ==  i + 2):
+				idx, _ = getUInt8(blob, i + 1)
+				if (i == 0):
+					txt = self._spaceClaimA[idx]
+				else:
+					self._spaceClaimA[idx] = txt
+			elif (len(blob) == i + 5):
+				idx, _ = self.getULong(blob, i + 1)
+				if (i == 0):
+					txt = self._spaceClaim[idx]
+				else:
+					self._spaceClaim[idx] = txt
+		else:
+			txt = blob.decode('cp1252')
+			if (sys.version_info.major < 3):
+				txt = txt.encode(ENCODING_FS).decode("utf8")
+
+		return txt, end
 
 	def addSubtypeEntity(self, entity):
 		self._subtypes.append(entity)
@@ -5041,13 +5266,7 @@ class AcisReader(object):
 			self._pos += count + 1
 			return TAG_UTF8_U16, text
 		if (token.startswith('$')):
-			ref = int(token[1:])
-			try:
-				chunk = self._refChunks[ref]
-			except:
-				chunk = AcisChunkEntityRef(ref)
-				self._refChunks[ref] = chunk
-			return TAG_ENTITY_REF, chunk
+			return TAG_ENTITY_REF, self._getRefChunk(int(token[1:]))
 		if (token == '('):
 			tokX  = self._readChunkText()
 			tokY  = self._readChunkText()
@@ -5090,26 +5309,165 @@ class AcisReader(object):
 				token = None
 		return token
 
+	def _readWordText(self):
+		m = _TEXT_WORD.match(self._data, self._pos)
+		if (m is None):
+			self._pos = self._length
+			return None
+		self._pos = m.end()
+		return m.group(1)
+
+	def _getRefChunk(self, ref):
+		try:
+			return self._refChunks[ref]
+		except KeyError:
+			chunk = AcisChunkEntityRef(ref)
+			self._refChunks[ref] = chunk
+		return chunk
+
+	def _readChunkTextBulk(self):
+		m = _TEXT_TOKEN.match(self._data, self._pos)
+		if (m is None):
+			self._pos = self._length
+			return None
+		self._pos = m.end()
+		kind  = m.lastindex
+		token = m.group(kind)
+		if (kind == TOKEN_NUMBER):
+			return AcisChunkDouble(float(token))
+		if (kind == TOKEN_REF):
+			return self._getRefChunk(int(token))
+		if (kind == TOKEN_CHAR):
+			if (token == '#'): return AcisChunkTerminator()
+			if (token == '('):
+				x = float(self._readWordText())
+				y = float(self._readWordText())
+				z = self._readWordText()
+				if (z == ')'): return AcisChunkVector2D([x, y])
+				dummy = self._readWordText()
+				assert (dummy == ')'), "Expected ')' but found '%s'!" %(dummy)
+				return AcisChunkVector3D([x, y, float(z)])
+			if (token == '{'): return AcisChunkSubtypeOpen()
+			if (token == '}'): return AcisChunkSubtypeClose()
+			return AcisChunkUtf8U8(token)
+		if (kind == TOKEN_TEXT):
+			count = int(token)
+			self._pos = _TEXT_SPACE.match(self._data, self._pos).end()
+			text = self._data[self._pos:self._pos + count]
+			self._pos += count + 1
+			return AcisChunkUtf8U16(text)
+		tag = TOKEN_TRANSLATIONS.get(token, None)
+		if (tag is not None):
+			return AcisChunkEnumValue(tag, tag, BOOLEAN)
+		if (_TEXT_FLOAT_WORD.match(token)):
+			return AcisChunkDouble(float(token))
+		return AcisChunkUtf8U8(token)
+
 	def _readChunkBinary(self):
-		global _getSLong
 		tag, self._pos = getUInt8(self._data, self._pos)
 		if (tag == TAG_ENTITY_REF):
-			refIdx, self._pos = _getSLong(self._data, self._pos)
+			refIdx, self._pos = self.getSLong(self._data, self._pos)
 			try:
 				chunk = self._refChunks[refIdx]
 			except:
 				chunk = AcisChunkEntityRef(refIdx)
 				self._refChunks[refIdx] = chunk
-		elif (tag in [TAG_TRUE, TAG_FALSE]):
-			chunk = AcisChunkEnumValue(tag, tag, BOOLEAN)
+		elif (tag == TAG_TRUE):
+			chunk = ACIS_CHUNK_TRUE
+		elif (tag == TAG_FALSE):
+			chunk = ACIS_CHUNK_FALSE
+		elif (tag == TAG_TERMINATOR):
+			chunk = ACIS_CHUNK_TERMINATOR
 		else:
 			try:
 				chunk = ACIS_VALUE_CHUNKS[tag]()
-				self._pos = chunk.read(self._data, self._pos)
+				self._pos = chunk.read(self._data, self._pos, self)
 			except KeyError as ke:
 				raise Exception("Don't know to read TAG %X" %(tag))
 		return chunk
 
+	def _initBinaryChunks(self, wide):
+		'''
+		Creates the table for the chunks with fixed size:
+		tag -> (struct format incl. tag, size in bytes, number of values, factory).
+		Chunks without values are shared - the 'factory' is the chunk itself.
+		'''
+		sl, ul = ('q', 'Q') if (wide) else ('i', 'I')
+		table = {
+			TAG_TRUE      : ('x',      0, ACIS_CHUNK_TRUE),
+			TAG_FALSE     : ('x',      0, ACIS_CHUNK_FALSE),
+			TAG_TERMINATOR: ('x',      0, ACIS_CHUNK_TERMINATOR),
+			TAG_CHAR      : ('xB',     1, AcisChunkChar),
+			TAG_SHORT     : ('xh',     1, AcisChunkShort),
+			TAG_LONG      : ('x' + sl, 1, AcisChunkLong),
+			TAG_FLOAT     : ('xf',     1, AcisChunkFloat),
+			TAG_DOUBLE    : ('xd',     1, AcisChunkDouble),
+			TAG_INT64     : ('xq',     1, AcisChunkHuge),
+			TAG_ENTITY_REF: ('x' + sl, 1, self._getRefChunk),
+			TAG_ENUM_VALUE: ('x' + ul, 1, _createEnumChunk),
+			TAG_POSITION  : ('xddd',   3, AcisChunkPosition),
+			TAG_VECTOR_3D : ('xddd',   3, AcisChunkVector3D),
+			TAG_VECTOR_2D : ('xdd',    2, AcisChunkVector2D),
+		}
+		self._binaryChunks = {tag: (fmt, Struct('<' + fmt).size, count, factory) for tag, (fmt, count, factory) in table.items()}
+
+	def _readChunksBinary(self, chunks):
+		'''
+		Reads the chunks of a record up to the terminator. Consecutive chunks
+		with fixed size are unpacked at once.
+		'''
+		data   = self._data
+		length = self._length
+		table  = self._binaryChunks
+		pos    = self._pos
+		while (pos < length):
+			tag   = data[pos]
+			entry = table.get(tag)
+			if (entry is None):
+				self._pos = pos
+				chunk = self._readChunkBinary()
+				pos = self._pos
+				chunks.append(chunk)
+				continue
+			start = pos
+			fmt   = []
+			run   = []
+			while (entry is not None):
+				fmt.append(entry[0])
+				run.append(entry)
+				pos += entry[1]
+				if ((tag == TAG_TERMINATOR) or (pos >= length)):
+					break
+				tag   = data[pos]
+				entry = table.get(tag)
+			fmt = ''.join(fmt)
+			try:
+				unpack = _BINARY_RUNS[fmt]
+			except KeyError:
+				unpack = Struct('<' + fmt).unpack_from
+				_BINARY_RUNS[fmt] = unpack
+			values = unpack(data, start)
+			i = 0
+			for _, _, count, factory in run:
+				if (count == 1):
+					chunks.append(factory(values[i]))
+				elif (count == 0):
+					chunks.append(factory)
+				else:
+					chunks.append(factory(values[i:i + count]))
+				i += count
+			if (tag == TAG_TERMINATOR):
+				break
+		self._pos = pos
+
+	def _readChunksBinarySingle(self, chunks):
+		'''Reads the chunks of a record up to the terminator one by one.'''
+		while (self._hasNext()):
+			chunk = self._readChunkBinary()
+			chunks.append(chunk)
+			if (chunk.tag == TAG_TERMINATOR):
+				break
+
 	def _readHeaderText(self):
 		self._pos      = 0
 		data   = self._stream.readline()
@@ -5131,20 +5489,20 @@ class AcisReader(object):
 		return
 
 	def _readHeaderBinary(self):
-		global _getSLong, _getULong
 		self._pos = 0
 		self.header.format = self._data[0:15].decode()
 		if (self.header.format in ['ACIS BinaryFile', 'ASM BinaryFile4', 'ASM BinaryFile8']):
 			if (self.header.format[-1:] == '8'):
-				_getSLong = getSInt64
-				_getULong = getUInt64
+				self.getSLong = getSInt64
+				self.getULong = getUInt64
 			else:
-				_getSLong = getSInt32
-				_getULong = getUInt32
-			self.header.version, self._pos = _getULong(self._data, 15)
-			self.header.records, self._pos = _getULong(self._data, self._pos)
-			self.header.bodies, self._pos  = _getULong(self._data, self._pos)
-			self.header.flags, self._pos   = _getULong(self._data, self._pos)
+				self.getSLong = getSInt32
+				self.getULong = getUInt32
+			self._initBinaryChunks(self.getSLong is getSInt64)
+			self.header.version, self._pos = self.getULong(self._data, 15)
+			self.header.records, self._pos = self.getULong(self._data, self._pos)
+			self.header.bodies, self._pos  = self.getULong(self._data, self._pos)
+			self.header.flags, self._pos   = self.getULong(self._data, self._pos)
 			self.header.version = int2version(self.header.version)
 			self.header.prodId  = self._readChunkBinary().val
 			self.header.prodVer = self._readChunkBinary().val
@@ -5153,10 +5511,9 @@ class AcisReader(object):
 			self.header.resabs  = self._readChunkBinary().val
 			self.header.resnor  = self._readChunkBinary().val
 			if (self.header.prodId == 'SpaceClaim'):
-				global _getStr_, _handle_topology_, _set_attribute_
-				_getStr_ = _getStr_SpaceClaim
-				_handle_topology_ = _handle_topology_SpaceClaim
-				_set_attribute_ = _set_attribute_SpaceClaim
+				self.getStr         = self._getStrSpaceClaim
+				self.handleTopology = _handle_topology_SpaceClaim
+				self.setAttribute   = _set_attribute_SpaceClaim
 				dummy = self._readChunkBinary() # True | False (read next chunk?)
 				if (dummy.tag == TAG_TRUE):
 					dummy = self._readChunkBinary() # e.g. SPT5X6MJB_CC42A7Z4XQU39P3RUX3QNS8TMFV67BA_VJ86VA83VFP7V2DKCQ8NX2CNKF87AKCQ3R
@@ -5192,7 +5549,27 @@ class AcisReader(object):
 					break
 		return record, id + 1
 
-	def _readRecordBinary(self, index):
+	def _readRecordTextBulk(self, index):
+		id = index
+		name = self._readWordText()
+		if (name is None):
+			return None, id
+		if (name.startswith('-')):
+			id = int(name[1:])
+			name = self._readWordText()
+		record = Record(name)
+		record.index = id
+		chunks = record.chunks
+		while (self._pos < self._length):
+			chunk = self._readChunkTextBulk()
+			if (chunk is None):
+				break
+			chunks.append(chunk)
+			if (chunk.tag == TAG_TERMINATOR):
+				break
+		return record, id + 1
+
+	def _readRecordBinary(self, index, readChunks):
 		names = []
 		id = index
 		chunk = self._readChunkBinary()
@@ -5207,11 +5584,7 @@ class AcisReader(object):
 		record = Record('-'.join(names))
 		record.index = id
 		if (not record.name.startswith('End-of-')):
-			while (self._hasNext()):
-				chunk = self._readChunkBinary()
-				record.chunks.append(chunk)
-				if (chunk.tag == TAG_TERMINATOR):
-					break
+			readChunks(record.chunks)
 		return record, id + 1
 
 	def _resolfChunkReferences(self):
@@ -5229,7 +5602,14 @@ class AcisReader(object):
 	def getRecords(self):
 		return self._records
 
-	def readText(self):
+	def readText(self, bulk = True):
+		'''
+		Reads the records of an ACIS text file (*.sat).
+		Parameters:
+		bulk: bool
+			True (default) to tokenize the data with compiled regular expressions,
+			False to use the character based scanner.
+		'''
 		setReader(self)
 		self._readHeaderText()
 		self._data     = self._stream.read()
@@ -5237,8 +5617,9 @@ class AcisReader(object):
 		historySec   = False
 		index        = 0
 		recordIdx    = 0
+		readRecord   = self._readRecordTextBulk if (bulk) else self._readRecordText
 		init()
-		record, index = self._readRecordText(index)
+		record, index = readRecord(index)
 		if (record.name == 'asmheader'):
 			asmheader = AsmHeader()
 			asmheader.set(record)
@@ -5246,7 +5627,7 @@ class AcisReader(object):
 			self._records += [None for _ in range(record.index - len(self._records) + 1)]
 			self._records[record.index] = record
 		while (self._hasNext()):
-			record, index = self._readRecordText(index)
+			record, index = readRecord(index)
 			if (record):
 				if (record.name == "Begin-of-ACIS-History-Data"):
 					historySec = True
@@ -5271,7 +5652,14 @@ class AcisReader(object):
 		self._resolfChunkReferences()
 		return True
 
-	def readBinary(self):
+	def readBinary(self, batched = True):
+		'''
+		Reads the records of an ACIS binary file (*.sab).
+		Parameters:
+		batched: bool
+			True (default) to unpack consecutive chunks with fixed size at once,
+			False to read the chunks one by one.
+		'''
 		setReader(self)
 		self._data     = self._stream.read()
 		self._length   = len(self._data)
@@ -5279,12 +5667,13 @@ class AcisReader(object):
 		historySec   = False
 		index        = 0
 		recordIdx    = 0
+		readChunks   = self._readChunksBinary if (batched) else self._readChunksBinarySingle
 		init()
 		self._readHeaderBinary()
-		SPACE_CLAIM.clear()
-		SPACE_CLAIM_A.clear()
+		self._spaceClaim.clear()
+		self._spaceClaimA.clear()
 		while (self._hasNext()):
-			record, index = self._readRecordBinary(index)
+			record, index = self._readRecordBinary(index, readChunks)
 			if (record.name == "Begin-of-ACIS-History-Data"):
 				historySec = True
 				recordIdx = record.index
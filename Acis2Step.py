@@ -7,7 +7,7 @@ MC:
  Con la reflection viene dumpato il nome della classe.
 '''
 
-import traceback, os, sys, math, io
+import traceback, os, sys, math, io, threading, tempfile, shutil
 import Part
 import Acis
 
@@ -24,21 +24,40 @@ if (sys.version_info.major > 2):
 # private variables
 #############################################################
 
-_pointsVertex    = {}
-_pointsCartesian = {}
-_directions      = {}
-_edgeCurves      = {}
-_lines           = {}
-_ellipses        = {}
-_vectors         = {}
-_cones           = {}
-_cylinders       = {}
-_planes          = {}
-_spheres         = {}
-_curveBSplines   = {}
-_assignments     = {}
-_entities        = []
-_colorPalette    = {}
+class ExportContext(object):
+	'''
+	The state of a single STEP export: the entities to be written and the
+	caches to share equal points, directions, curves, surfaces and colors.
+	Each thread works on its own context.
+	'''
+	def __init__(self):
+		self.pointsVertex    = {}
+		self.pointsCartesian = {}
+		self.directions      = {}
+		self.edgeCurves      = {}
+		self.lines           = {}
+		self.ellipses        = {}
+		self.vectors         = {}
+		self.cones           = {}
+		self.cylinders       = {}
+		self.planes          = {}
+		self.spheres         = {}
+		self.curveBSplines   = {}
+		self.assignments     = {}
+		self.entities        = []
+		self.colorPalette    = {}
+		self.scale           = 1.0
+		self.pointGrid       = 1e6  # grid cells per unit to merge points (1 / resabs)
+		self.directionGrid   = 1e10 # grid cells per unit to merge directions (1 / resnor)
+
+	def setResolution(self, scale, resabs, resnor):
+		'''Sets the tolerances of the ACIS model used to merge equal points and directions.'''
+		if (resabs > 0.0): self.pointGrid     = 1.0 / (resabs * scale)
+		if (resnor > 0.0): self.directionGrid = 1.0 / resnor
+
+_exportContexts = threading.local()
+
+_tempFolders = {} # STEP file -> temporary folder created for it by export
 
 TRANSFORM_NONE   = PLC()
 
@@ -101,6 +120,21 @@ def _obj2str(o):
 def _values3D(v):
 	return [v.x, v.y, v.z]
 
+def _getGridKey(v, grid):
+	return (round(v.x * grid), round(v.y * grid), round(v.z * grid))
+
+def _getPointKey(v):
+	'''Returns the cell of the point on a grid with the model's resabs as spacing.'''
+	return _getGridKey(v, getExportContext().pointGrid)
+
+def _getDirectionKey(v):
+	'''Returns the cell of the normalized vector on a grid with the model's resnor as spacing.'''
+	return _getGridKey(VEC(v).normalize(), getExportContext().directionGrid)
+
+def _getListKey(l):
+	if (l): return tuple(l)
+	return ()
+
 def rotation_matrix(axis, angle):
 	axis.normalize()
 	a = math.cos(angle / 2.0)
@@ -127,7 +161,7 @@ def _rotate(vec, rotation):
 	return rotation_matrix(rotation.Axis, rotation.Angle) * vec
 
 def getColor(entity):
-	global _colorPalette
+	colorPalette = getExportContext().colorPalette
 
 	r = g = b = None
 
@@ -142,14 +176,14 @@ def getColor(entity):
 			return None
 	key = "#%02X%02X%02X" %(int(r*255.0), int(g*255.0), int(b*255.0))
 	try:
-		rgb = _colorPalette[key]
+		rgb = colorPalette[key]
 	except:
 		rgb = COLOUR_RGB('', r, g, b)
-		_colorPalette[key] = rgb
+		colorPalette[key] = rgb
 	return rgb
 
 def assignColor(color, item, context):
-	global _assignments
+	assignments = getExportContext().assignments
 
 	if (color):
 		keyRGB = "%g,%g,%g" %(color.red, color.green, color.blue)
@@ -157,10 +191,10 @@ def assignColor(color, item, context):
 		style = STYLED_ITEM('color', [], item)
 		representation.items.append(style)
 		try:
-			assignment = _assignments[keyRGB]
+			assignment = assignments[keyRGB]
 		except:
 			assignment = PRESENTATION_STYLE_ASSIGNMENT(color);
-			_assignments[keyRGB] = assignment
+			assignments[keyRGB] = assignment
 		style.styles = [assignment]
 
 def _createTransformation(ref1, ref2, idt):
@@ -185,47 +219,48 @@ def _createUnit(tolerance):
 	return unit
 
 def _createCartesianPoint(fcVec, name = ''):
-	global _pointsCartesian
-	key = "%s,'%s'" %(fcVec, name)
+	pointsCartesian = getExportContext().pointsCartesian
+	key = (_getPointKey(fcVec), name)
 	try:
-		cp = _pointsCartesian[key]
+		cp = pointsCartesian[key]
 	except:
 		cp = CARTESIAN_POINT(name, _values3D(fcVec))
-		_pointsCartesian[key] = cp
+		pointsCartesian[key] = cp
 	return cp
 
 def _createVertexPoint(fcVec, name = ''):
-	global _pointsVertex
-	key = "%s,'%s'" %(fcVec, name)
+	pointsVertex = getExportContext().pointsVertex
+	key = (_getPointKey(fcVec), name)
 	try:
-		vp = _pointsVertex[key]
+		vp = pointsVertex[key]
 	except:
 		vp = VERTEX_POINT('', None)
 		vp.point = _createCartesianPoint(fcVec)
-		_pointsVertex[key] = vp
+		pointsVertex[key] = vp
 	return vp
 
 def _createDirection(fcVec, name = ''):
-	global _directions
+	directions = getExportContext().directions
 	v = VEC(fcVec).normalize()
-	key = "%s,'%s'" %(v, name)
+	key = (_getGridKey(v, getExportContext().directionGrid), name)
 	try:
-		dir =  _directions[key]
+		dir =  directions[key]
 	except:
 		dir = DIRECTION(name, _values3D(v))
-		_directions[key] = dir
+		directions[key] = dir
 	return dir
 
 def _createVector(fcVec, name = ''):
-	global _vectors
-	global _scale
-	key = "%s,'%s'" %(fcVec, name)
+	vectors = getExportContext().vectors
+	scale = getExportContext().scale
+	dir = _createDirection(fcVec)
+	key = dir.id # the vector's magnitude is the model's scale
 	try:
-		vec = _vectors[key]
+		vec = vectors[key]
 	except:
-		vec = VECTOR('', None, _scale)
-		vec.orientation = _createDirection(fcVec)
-		_vectors[key] = vec
+		vec = VECTOR('', None, scale)
+		vec.orientation = dir
+		vectors[key] = vec
 	return vec
 
 def _createAxis1Placement(name, aPt, aName, bPt, bName):
@@ -242,26 +277,15 @@ def _createAxis2Placement3D(name, aPt, aName, bPt, bName, cPt, cName):
 	return plc
 
 def _createEdgeCurve(p1, p2, curve, sense):
-	global _edgeCurves
-	key = "#%d,#%d,#%d,%s" %(p1.id, p2.id, curve.id, _bool2str(sense))
+	edgeCurves = getExportContext().edgeCurves
+	key = (p1.id, p2.id, curve.id, sense)
 	try:
-		ec = _edgeCurves[key]
+		ec = edgeCurves[key]
 	except:
 		ec = EDGE_CURVE('', p1, p2, curve, sense)
-		_edgeCurves[key] = ec
+		edgeCurves[key] = ec
 	return ec
 
-def _exportInternalList_(a):
-	step = ''
-	for i in a:
-		if (isinstance(i, ExportEntity)):
-			step += i.exportSTEP()
-		elif (type(i) == list):
-			step += _exportInternalList_(i)
-		elif (type(i) == tuple):
-			step += _exportInternalList_(i)
-	return step
-
 def _createCurveComp(acisCurve):
 	# TODO
 	return None
@@ -271,10 +295,10 @@ def _createCurveDegenerate(acisCurve):
 	return None
 
 def _createCurveEllipse(acisCurve):
-	global _ellipses
-	key = '%s,%s,%s,%s' %(acisCurve.center, acisCurve.axis, acisCurve.major, acisCurve.ratio)
+	ellipses = getExportContext().ellipses
+	key = (_getPointKey(acisCurve.center), _getDirectionKey(acisCurve.axis), _getPointKey(acisCurve.major), acisCurve.ratio)
 	try:
-		circle = _ellipses[key]
+		circle = ellipses[key]
 	except:
 		if (isEqual1D(acisCurve.ratio, 1.0)):
 			circle = CIRCLE('', None, acisCurve.major.Length)
@@ -282,24 +306,18 @@ def _createCurveEllipse(acisCurve):
 			axis1 = acisCurve.major.Length
 			circle = ELLIPSE('', None, axis1, axis1 * acisCurve.ratio)
 		circle.placement = _createAxis2Placement3D('', acisCurve.center, 'Origin', acisCurve.axis, 'center_axis', acisCurve.major, 'ref_axis')
-		_ellipses[key] = circle
+		ellipses[key] = circle
 	return circle
 
 def __create_b_spline_curve(spline):
+	curveBSplines = getExportContext().curveBSplines
 	if (spline):
 		points = [_createCartesianPoint(pole, 'Ctrl Pts') for pole in spline.poles]
-		k1 = ",".join(["#%d"%(point.id) for point in points])
-		k2 = ""
 		mults = spline.uMults
-		if (mults):
-			k2 = ",".join(["%d" %(mult) for mult in mults])
-		k3 = ""
 		knots = spline.uKnots
-		if (knots):
-			k3 = ",".join(["%r" %(knot) for knot in knots])
-		key = "(%s),(%s),(%s)" %(k1, k2, k3)
+		key = (tuple([point.id for point in points]), _getListKey(mults), _getListKey(knots))
 		try:
-			curve = _curveBSplines[key]
+			curve = curveBSplines[key]
 		except:
 			degree = spline.uDegree
 			closed = (spline.poles[0] == spline.poles[-1])
@@ -314,7 +332,7 @@ def __create_b_spline_curve(spline):
 				curve = ListEntity(p0, p1, p2, p3, p4, p5, p6)
 			else:
 				curve = B_SPLINE_CURVE_WITH_KNOTS(name='', degree=degree, points=points, form='UNSPECIFIED', closed=closed, selfIntersecting=False, mults=spline.uMults, knots=spline.uKnots, form2='UNSPECIFIED')
-			_curveBSplines[key] = curve
+			curveBSplines[key] = curve
 		return curve
 	return None
 
@@ -433,7 +451,8 @@ CREATE_CURVE_INT ={
 
 #MC vecchio/nuovo mergiato
 def _createCurveInt(acisCurve):
-	global _curveBSplines
+	lines = getExportContext().lines
+	curveBSplines = getExportContext().curveBSplines
 	shape = acisCurve.build() # fa il build con Part, va benissimo
 	spline = acisCurve.spline
 	if (spline):
@@ -443,17 +462,9 @@ def _createCurveInt(acisCurve):
 		bsc = shape.Curve
 		if (isinstance(bsc, Part.BSplineCurve)):
 			points = [_createCartesianPoint(v, 'Ctrl Pts') for v in bsc.getPoles()]
-			k1 = ",".join(["#%d"%(p.id) for p in points])
-			k2 = ""
-			mults = bsc.getMultiplicities()
-			if (mults is not None):
-				k2 = ",".join(["%d" %(d) for d in mults])
-			k3 = ""
-			knots = bsc.getKnots()
-			if (knots is not None): k3 = ",".join(["%r" %(r) for r in knots])
-			key = "(%s),(%s),(%s)" %(k1, k2, k3)
+			key = (tuple([p.id for p in points]), _getListKey(bsc.getMultiplicities()), _getListKey(bsc.getKnots()))
 			try:
-				curve = _curveBSplines[key]
+				curve = curveBSplines[key]
 			except:
 				if (bsc.isRational()):
 					p0 = BOUNDED_CURVE()
@@ -466,24 +477,24 @@ def _createCurveInt(acisCurve):
 					curve = ListEntity(p0, p1, p2, p3, p4, p5, p6)
 				else:
 					curve = B_SPLINE_CURVE_WITH_KNOTS(name='', degree=bsc.Degree, points=points, form='UNSPECIFIED', closed=bsc.isClosed(), selfIntersecting=False, mults=bsc.getMultiplicities(), knots=bsc.getKnots(), form2='UNSPECIFIED')
-				_curveBSplines[key] = curve
+				curveBSplines[key] = curve
 			return curve
 		if (isinstance(bsc, Part.Line)):
-			key = "%s,%s" %(bsc.Location, bsc.Direction)
+			key = (_getPointKey(bsc.Location), _getDirectionKey(bsc.Direction))
 			try:
-				line = _lines[key]
+				line = lines[key]
 			except:
 				line = LINE('', None, None)
 				line.pnt = _createCartesianPoint(bsc.Location)
 				line.dir = _createVector(bsc.Direction)
-				_lines[key] = line
+				lines[key] = line
 			return line
 	else:
 		try:
 			create = CREATE_CURVE_INT[acisCurve.subtype]
 			return create(acisCurve)
 		except Exception as ex:
-			logError("Don't know how how to create INT_CURVE %s - %s" %(acisCurve.subtype, ex))
+			logError("Don't know how how to create INT_CURVE %s - %s", acisCurve.subtype, ex)
 	return None
 
 def _createCurveP(acisCurve):
@@ -491,16 +502,16 @@ def _createCurveP(acisCurve):
 	return None
 
 def _createCurveStraight(acisCurve):
-	global _lines
+	lines = getExportContext().lines
 
-	key = "%s,%s" %(acisCurve.root, acisCurve.dir)
+	key = (_getPointKey(acisCurve.root), _getDirectionKey(acisCurve.dir))
 	try:
-		line = _lines[key]
+		line = lines[key]
 	except:
 		line = LINE('', None, None)
 		line.pnt = _createCartesianPoint(acisCurve.root)
 		line.dir = _createVector(acisCurve.dir)
-		_lines[key] = line
+		lines[key] = line
 	return line
 
 def _createCurve(acisCurve):
@@ -577,10 +588,10 @@ def _createSurfaceBSpline(bss, acisSurface, sense):
 	return spline, sense == 'forward'
 
 def _createSurfaceCone(center, axis, cosine, sine, major, sense):
-	global _cones
-	key = "%s,%s,%s,%s,%s,%s" %(center, axis, major, cosine, sine, major)
+	cones = getExportContext().cones
+	key = (_getPointKey(center), _getDirectionKey(axis), _getPointKey(major), cosine, sine)
 	try:
-		cone = _cones[key]
+		cone = cones[key]
 	except:
 		if (cosine * sine < 0):
 			plc = _createAxis2Placement3D('', center, 'Origin', axis.negative(), 'center_axis', major, 'ref_axis')
@@ -592,34 +603,34 @@ def _createSurfaceCone(center, axis, cosine, sine, major, sense):
 		else:
 			angle = math.fabs(math.asin(sine))
 			cone  = CONICAL_SURFACE('', plc, radius, angle)
-		_cones[key] = cone
+		cones[key] = cone
 	if( cosine < 0.0):
 		return cone, (sense != 'forward')
 	return cone, (sense == 'forward')
 
 def _createSurfaceCylinder(center, axis, radius, sense):
-	global _cylinders
-	key = "%s,%s,%s" %(center, axis, radius)
+	cylinders = getExportContext().cylinders
+	key = (_getPointKey(center), _getDirectionKey(axis), radius)
 	try:
-		cylinder = _cylinders[key]
+		cylinder = cylinders[key]
 	except:
 		ref = _calculateRef(axis)
 		plc = _createAxis2Placement3D('', center, 'Origin', axis, 'center_axis',  ref, 'ref_axis')
 		cylinder = CYLINDRICAL_SURFACE('', plc, radius)
-		_cylinders[key] = cylinder
+		cylinders[key] = cylinder
 	return cylinder, (sense == 'forward')
 
 def _createSurfacePlane(center, axis, sense):
-	global _planes
+	planes = getExportContext().planes
 
-	key = "%s,%s" %(center, axis)
+	key = (_getPointKey(center), _getDirectionKey(axis))
 	try:
-		plane = _planes[key]
+		plane = planes[key]
 	except:
 		ref = _calculateRef(axis)
 		plane = PLANE('', None)
 		plane.placement = _createAxis2Placement3D('', center, 'Origin', axis, 'center_axis', ref, 'ref_axis')
-		_planes[key] = plane
+		planes[key] = plane
 	return plane, sense == 'forward'
 
 def _createSurfaceRevolution(curve, center, axis, sense):
@@ -630,15 +641,15 @@ def _createSurfaceRevolution(curve, center, axis, sense):
 	return revolution, (sense == 'forward')
 
 def _createSurfaceSphere(center, radius, pole, sense):
-	global _spheres
-	key = "%s,%r" %(center, radius)
+	spheres = getExportContext().spheres
+	key = (_getPointKey(center), radius)
 	try:
-		sphere = _spheres[key]
+		sphere = spheres[key]
 	except:
 		sphere = SPHERICAL_SURFACE('', None, radius)
 		ref = _calculateRef(pole)
 		sphere.placement = _createAxis2Placement3D('', center, 'Origin', pole, 'center_axis', ref, 'ref_axis')
-		_spheres[key] = sphere
+		spheres[key] = sphere
 	return sphere, (sense == 'forward')
 
 def _createSurfaceBS(acisSurface, sense):
@@ -708,7 +719,7 @@ def _createSurfaceFaceShape(acisFace):
 		return _createSurfaceToroid(surface.major, surface.minor, surface.center, surface.axis, acisFace.sense)
 	if (isinstance(surface, Acis.SurfaceSpline)):
 		return _createSurfaceSpline(acisFace)
-	logWarning("Can't export surface '%s.%s'!" %(surface.__class__.__module__, surface.__class__.__name__))
+	logWarning("Can't export surface '%s.%s'!", surface.__class__.__module__, surface.__class__.__name__)
 	return None, (acisFace.sense == 'forward')
 
 # MC vecchio
@@ -887,53 +898,23 @@ def _convertBody(acisBody, appPrtDef):
 
 	return bodies
 
+def getExportContext():
+	'''
+	Returns the export context of the current thread.
+	'''
+	context = getattr(_exportContexts, 'current', None)
+	if (context is None):
+		context = ExportContext()
+		_exportContexts.current = context
+	return context
+
 def _initExport():
-	global _pointsVertex, _pointsCartesian, _directions, _vectors
-	global _edgeCurves, _lines, _ellipses, _curveBSplines
-	global _cones, _cylinders, _planes, _spheres
-	global _assignments
-	global _colorPalette
-	global _entities
-
-	_pointsVertex.clear()
-	_pointsCartesian.clear()
-	_directions.clear()
-	_edgeCurves.clear()
-	_lines.clear()
-	_ellipses.clear()
-	_vectors.clear()
-	_cones.clear()
-	_cylinders.clear()
-	_planes.clear()
-	_spheres.clear()
-	_curveBSplines.clear()
-	_assignments.clear()
-	_colorPalette.clear()
-	_entities[:]= []
-	return
+	context = ExportContext()
+	_exportContexts.current = context
+	return context
 
 def _finalizeExport():
-	global _pointsVertex, _pointsCartesian, _directions, _vectors
-	global _edgeCurves, _lines, _ellipses, _curveBSplines
-	global _cones, _cylinders, _planes, _spheres
-	global _assignments
-	global _colorPalette
-	global _entities
-
-	_pointsVertex.clear()
-	_pointsCartesian.clear()
-	_directions.clear()
-	_edgeCurves.clear()
-	_lines.clear()
-	_ellipses.clear()
-	_vectors.clear()
-	_cones.clear()
-	_cylinders.clear()
-	_planes.clear()
-	_spheres.clear()
-	_curveBSplines.clear()
-	_assignments.clear()
-	_entities[:] = []
+	_exportContexts.current = None
 
 def _setExported(l, b):
 	if ((type(l) == dict) or (type(l) == list)):
@@ -968,9 +949,9 @@ class AnyEntity(object):
 
 class AnonymEntity(object):
 	def __init__(self):
-		global _entities
-		self.id = len(_entities) + 1
-		_entities.append(self)
+		entities = getExportContext().entities
+		self.id = len(entities) + 1
+		entities.append(self)
 	def _getParameters(self):
 		return []
 	def _getClassName(self):
@@ -993,31 +974,16 @@ class ExportEntity(AnonymEntity):
 		self.has_been_exported = False
 	def _getClassName(self):
 		return self.__class__.__name__
-	def exportProperties(self):
-		step = u""
-		variables = self._getParameters()
-		for a in variables:
-			try:
-				if (isinstance(a, ReferencedEntity)):
-					step += a.exportSTEP()
-				elif (type(a) in (list, tuple)):
-					step += _exportInternalList_(a)
-			except:
-				logError(traceback.format_exc())
-		return step
-	def exportSTEP(self):
+	def writeSTEP(self, stream):
 		if (self.has_been_exported):
-			return ''
-		step = u""
+			return
 		if (hasattr(self, '__acis__')):
 			if (self.__acis__.subtype == 'ref'):
-				step += u"/*\n * ref = %d\n */\n" %(self.__acis__.ref)
+				stream.write(u"/*\n * ref = %d\n */\n" %(self.__acis__.ref))
 			else:
-				step += u"/*\n * $%d\n */\n" %(self.__acis__.index)
-		step += u"%s;\n" %(self.__repr__())
-		step += self.exportProperties()
+				stream.write(u"/*\n * $%d\n */\n" %(self.__acis__.index))
+		stream.write(u"%r;\n" %(self))
 		self.has_been_exported = True
-		return step
 
 class ReferencedEntity(ExportEntity):
 	def __init__(self):
@@ -1233,28 +1199,6 @@ class ListEntity(ReferencedEntity):
 		params = super(ListEntity, self)._getParameters() + [self.entities]
 		params = sorted(params)
 		return params
-	def exportSTEP(self):
-		if (self.has_been_exported):
-			return ''
-		step = u""
-		if (hasattr(self, '__acis__')):
-			if (self.__acis__.subtype == 'ref'):
-				step += u"/*\n * ref = %d\n */\n" %(self.__acis__.ref)
-			else:
-				step += u"/*\n * $%d\n */\n" %(self.__acis__.index)
-		step += u"%r;\n" %(self)
-		for e in self.entities:
-			try:
-				if (isinstance(e, ExportEntity)):
-					step += e.exportProperties()
-				elif (type(e) == list):
-					step += _exportInternalList_(e)
-				elif (type(e) == tuple):
-					step += _exportInternalList_(e)
-			except:
-				logError(traceback.format_exc())
-		self.has_been_exported = True
-		return step
 	def __repr__(self):
 		return u"#%d\t= (%s)" %(self.id, " ".join(["%s" % (e.toString()) for e in self.entities]))
 
@@ -1850,9 +1794,7 @@ class GROUP(NamedEntity):
 # Global functions
 #############################################################
 
-def export(filename, satHeader, satBodies):
-	global _scale, _entities
-
+def _writeStep(stream, stepfile):
 	dt     = datetime.now() # 2018-05-13T08:03:27-07:00
 	user   = getAuthor()
 	desc   = getDescription()
@@ -1860,9 +1802,39 @@ def export(filename, satHeader, satBodies):
 	proc   = 'InventorImporter'
 	auth   = ''
 
-	_initExport()
-
-	_scale = satHeader.scale
+	if (sys.version_info.major < 3):
+		user = user.decode('utf8')
+
+	stream.write(u"ISO-10303-21;\n")
+	stream.write(u"HEADER;\n")
+	stream.write(u"FILE_DESCRIPTION(('FreeCAD Model'),'2;1');\n")
+	stream.write(u"FILE_NAME('%s','%s',('%s'),('%s'),'%s','FreeCAD','%s');\n" %(stepfile, dt.strftime("%Y-%m-%dT%H:%M:%S"), user, orga, proc, auth))
+	stream.write(u"FILE_SCHEMA (('AUTOMOTIVE_DESIGN { 1 0 10303 214 1 1 1 1}'));\n")
+	stream.write(u"ENDSEC;\n")
+	stream.write(u"\n")
+	stream.write(u"DATA;\n")
+
+	# write the entities in the order of their ids - no need to build the whole file in memory.
+	for entity in getExportContext().entities:
+		entity.writeSTEP(stream)
+
+	stream.write(u"ENDSEC;\n")
+	stream.write(u"END-ISO-10303-21;")
+
+def export(filename, satHeader, satBodies, stream = None):
+	'''
+	Converts the ACIS bodies into STEP.
+	Parameters:
+	stream: text stream
+		None (default) to write the STEP file into the dump folder, otherwise
+		the stream to write into (e.g. io.StringIO() to keep the data in memory).
+	Returns:
+		The name of the STEP file or the stream.
+	'''
+	context = _initExport()
+
+	context.scale = satHeader.scale
+	context.setResolution(satHeader.scale, satHeader.resabs, satHeader.resnor)
 
 	appPrtDef = APPLICATION_PROTOCOL_DEFINITION()
 
@@ -1874,37 +1846,31 @@ def export(filename, satHeader, satBodies):
 
 	path, f = os.path.split(filename)
 	name, x = os.path.splitext(f)
-	path = getDumpFolder().replace('\\', '/')
-	stepfile = "%s/%s.step" %(path, name)
-
-	step = u"ISO-10303-21;\n"
-	step += u"HEADER;\n"
-	step += u"FILE_DESCRIPTION(('FreeCAD Model'),'2;1');\n"
-	step += u"FILE_NAME('%s'," %(stepfile)
-	step += u"'%s'," %(dt.strftime("%Y-%m-%dT%H:%M:%S"))
-	if (sys.version_info.major < 3):
-		step += u"('%s')," %(user.decode('utf8'))
-	else:
-		step += u"('%s')," %(user)
-	step += u"('%s')," %(orga)
-	step += u"'%s'," %(proc)
-	step += u"'FreeCAD','%s');\n" %(auth)
-	step += u"FILE_SCHEMA (('AUTOMOTIVE_DESIGN { 1 0 10303 214 1 1 1 1}'));\n"
-	step += u"ENDSEC;\n"
-	step += u"\n"
-	step += u"DATA;\n"
 
-	for entity in _entities:
-		step += entity.exportSTEP()
+	if (stream is not None):
+		_writeStep(stream, "%s.step" %(name))
+		_finalizeExport()
+		return stream
 
-	step += u"ENDSEC;\n"
-	step += u"END-ISO-10303-21;"
+	path = getDumpFolder()
+	temp = (path is None)
+	if (temp):
+		path = tempfile.mkdtemp(prefix='InventorLoader_')
+	stepfile = "%s/%s.step" %(path.replace('\\', '/'), name)
+	if (temp):
+		_tempFolders[stepfile] = path
 
 	with io.open(stepfile, 'wt', encoding="UTF-8") as stepFile:
-		stepFile.write(step)
+		_writeStep(stepFile, stepfile)
 
 	_finalizeExport()
 
 	logInfo(u"STEP file written to '%s'.", stepfile)
 
 	return stepfile #MC: non lo usa nessuno
+
+def releaseStepFile(stepfile):
+	'''Removes the temporary folder that export created for the STEP file - other folders are kept.'''
+	folder = _tempFolders.pop(stepfile, None)
+	if (folder is not None):
+		shutil.rmtree(folder, True)
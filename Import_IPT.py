@@ -9,16 +9,15 @@ __author__     = "Jens M. Plonka"
 __copyright__  = 'Copyright 2018, Germany'
 __url__        = "https://www.github.com/jmplonka/InventorLoader"
 
-import os, FreeCAD, FreeCADGui, importerBRep, importerSAT, io, importerUFRxDoc
+import os, FreeCAD, importerBRep, importerSAT, io, importerUFRxDoc, multiprocessing
 from olefile           import OleFileIO
 from importerUtils     import *
 from importerReader    import *
 from importerClasses   import Inventor
-from importerFreeCAD   import FreeCADImporter
 from importerSAT       import importModel, convertModel
 from Acis              import setReader
-from PySide.QtGui      import QMessageBox
 from struct            import unpack
+from concurrent        import futures
 
 VT_EMPTY=0; VT_NULL=1; VT_I2=2; VT_I4=3; VT_R4=4; VT_R8=5; VT_CY=6;
 VT_DATE=7; VT_BSTR=8; VT_DISPATCH=9; VT_ERROR=10; VT_BOOL=11;
@@ -49,7 +48,31 @@ def ReadIgnorable(fname):
 def skip():
 	return
 
-def ReadElement(ole, fname, counter):
+def isSegmentElement(fname):
+	return (fname[0] == 'RSeStorage') and (not isEmbeddings(fname)) and fname[-1].startswith('M') and not ('Templates' in fname)
+
+def ReadSegmentStreams(ole, fname, counter):
+	'''Reads the meta data (M-stream) of a segment and returns it together with its raw data (B-stream).'''
+	name   = fname[-1]
+	fnameB = []
+	for n in (fname):
+		fnameB.append(n)
+	fnameB[-1] = 'B' + name[1:]
+	seg = ReadRSeMetaDataM(ole.openstream(fname).read(), name[1:])
+	seg.file = name[1:]
+	seg.index = counter
+	getModel().addSegment(seg)
+	dataB = ole.openstream(fnameB).read()
+	return seg, dataB
+
+def ReadElement(ole, fname, counter, lazy = False):
+	'''
+	Reads the element of the OLE file.
+	Parameters:
+	lazy: bool
+		True to keep the segment's compressed data until the model requests the
+		segment (e.g. getModel().getBRep()), otherwise the segment is read now.
+	'''
 	name        = fname[-1]
 	path        = PrintableName(fname)
 
@@ -68,22 +91,95 @@ def ReadElement(ole, fname, counter):
 				skip()
 		elif (name.startswith('M')):
 			if not ('Templates' in fname):
-				fnameB = []
-				for n in (fname):
-					fnameB.append(n)
-				fnameB[-1] = 'B' + name[1:]
-				seg = ReadRSeMetaDataM(ole.openstream(fname).read(), name[1:])
-				seg.file = name[1:]
-				seg.index = counter
-				getModel().RSeMetaData[seg.name] = seg
-				dataB = ole.openstream(fnameB).read()
-				ReadRSeMetaDataB(dataB, seg)
+				seg, dataB = ReadSegmentStreams(ole, fname, counter)
+				if (lazy):
+					seg.dataB = dataB
+				else:
+					ReadRSeMetaDataB(dataB, seg)
 			else:
 				skip()
 		else:
 			ReadIgnorable(fname)
 	return
 
+# The segments to be parsed by the worker processes: they inherit this list when forked.
+_segmentJobs = []
+
+def _parseSegment(index):
+	seg, data = _segmentJobs[index]
+	ReadRSeSegmentData(data, seg)
+	return seg, getFileVersion()
+
+def ReadElementsParallel(ole, elements, workers):
+	'''
+	Reads all elements, but the segments are read in three steps:
+	1. read the M- and B-streams of all segments,
+	2. decompress the B-streams in a thread pool,
+	3. parse the segments in a process pool.
+	The parsed segments are merged into the model in the order of the file.
+	Segments that can't be returned from a worker are parsed again sequentially.
+	FreeCAD's GUI can't be forked, so with GUI the segments are parsed sequentially.
+	'''
+	global _segmentJobs
+
+	segments = []
+	counter  = 1
+	for fname in elements:
+		if (isSegmentElement(fname)):
+			segments.append(ReadSegmentStreams(ole, fname, counter))
+		else:
+			ReadElement(ole, fname, counter)
+		counter += 1
+
+	with futures.ThreadPoolExecutor(workers) as pool: # zlib releases the GIL
+		datas = list(pool.map(UncompressRSeMetaDataB, [dataB for seg, dataB in segments]))
+	_segmentJobs = [(seg, data) for (seg, dataB), data in zip(segments, datas)]
+
+	results = [None] * len(_segmentJobs)
+	if ((not FreeCAD.GuiUp) and ('fork' in multiprocessing.get_all_start_methods())):
+		try:
+			with futures.ProcessPoolExecutor(workers, multiprocessing.get_context('fork')) as pool:
+				jobs = [pool.submit(_parseSegment, index) for index in range(len(_segmentJobs))]
+				for index, job in enumerate(jobs):
+					try:
+						results[index] = job.result()
+					except Exception as e:
+						logWarning(u"    Can't parse segment '%s' in a separate process (%s)!", _segmentJobs[index][0].name, e)
+		except Exception as e:
+			logWarning(u"    Can't parse segments in separate processes (%s)!", e)
+
+	for index, (seg, data) in enumerate(_segmentJobs):
+		if (results[index] is None):
+			ReadRSeSegmentData(data, seg)
+		else:
+			seg, version = results[index]
+			setFileVersion(version)
+		getModel().addSegment(seg)
+	_segmentJobs = []
+	return
+
+def getRequiredKinds():
+	'''Returns the kinds of segments (see SEGMENT_KINDS) the import strategy needs.'''
+	if (isStrategyNative()):
+		return ('App', 'DC', 'Browser', 'Graphics', 'BRep')
+	return ('App', 'BRep') # App sets the default color of the STEP export.
+
+def loadRequiredSegments():
+	'''
+	Reads the deferred segments the import needs, e.g. before the model is
+	cached. Returns True if a segment was read.
+	'''
+	model    = getModel()
+	segments = {}
+	for kind in getRequiredKinds():
+		for seg in model.segmentKinds.get(kind, {}).values():
+			if (seg.dataB is not None):
+				segments[seg.name] = seg
+	# read them in the order of the file, as an eager read would do.
+	for seg in sorted(segments.values(), key=lambda seg: seg.index):
+		model.loadSegment(seg)
+	return (len(segments) > 0)
+
 def dumpRSeDBFile(db, log):
 	log.write(u"Schema: %d\n"   %(db.schema))
 	log.write(u"UID:    {%s}\n" %(db.uid))
@@ -151,6 +247,11 @@ def dumpRevisionInfo(revisions):
 				file.write(u"%s\n" %(rev))
 	return
 
+def _showError(msg):
+	if (FreeCAD.GuiUp):
+		from PySide.QtGui import QMessageBox
+		QMessageBox.critical(FreeCAD.ActiveDocument, 'FreeCAD: Inventor workbench...', msg)
+
 def checkVersion(file):
 	vrs = None
 	filename = os.path.abspath(file)
@@ -168,10 +269,10 @@ def checkVersion(file):
 	if (version):
 		vrsName = version.major
 		if (version.major >= 11): vrsName += 1996
-		QMessageBox.critical(FreeCAD.ActiveDocument, 'FreeCAD: Inventor workbench...', 'Can\'t load file created with Inventor v%d' %(vrsName))
+		_showError('Can\'t load file created with Inventor v%d' %(vrsName))
 		logError('Can\'t load file created with Inventor v%d' %(vrsName))
 	else:
-		QMessageBox.critical(FreeCAD.ActiveDocument, 'FreeCAD: Inventor workbench...', 'Can\'t determine Inventor version file was created with')
+		_showError('Can\'t determine Inventor version file was created with')
 		logError('Can\'t determine Inventor version file was created with!')
 	return None
 
@@ -251,9 +352,15 @@ def read(ole):
 
 	dumpiProperties(getModel().iProperties)
 
-	for fname in list:
-		ReadElement(ole, fname, counter)
-		counter += 1
+	workers = getSegmentWorkers()
+	if (workers > 1):
+		ReadElementsParallel(ole, list, workers)
+	else:
+		# SAT and STEP only need the BRep segment => read the others on demand.
+		lazy = not isStrategyNative()
+		for fname in list:
+			ReadElement(ole, fname, counter, lazy)
+			counter += 1
 	ole.close()
 
 	now = datetime.datetime.now()
@@ -285,12 +392,13 @@ def resolveLinks():
 						if (creator is not None):
 							creator.outline = outline
 						else:
-							logWarning(u"    No outline-creator found for index=%04X!" %(dcIndex))
+							logWarning(u"    No outline-creator found for index=%04X!", dcIndex)
 	return
 
 def create3dModel(root, doc):
 	strategy = getStrategy()
 	if (strategy == STRATEGY_NATIVE):
+		from importerFreeCAD import FreeCADImporter
 		creator = FreeCADImporter()
 		creator.importModel(root)
 	else:
@@ -5,10 +5,10 @@ InventorViewProviders.py
 GUI representations for objectec imported from Inventor
 '''
 
-import os, re, sys, Part, Draft, FreeCAD, FreeCADGui
-from importerUtils   import logInfo, getIconPath, getTableValue, setTableValue, logInfo, logWarning, logError, getCellRef, setTableValue, calcAliasname, isEqual1D
+import os, re, sys, io, json, time, shutil, tempfile, subprocess, multiprocessing, Part, Draft, FreeCAD, FreeCADGui
+from importerUtils   import logInfo, getIconPath, getTableValue, setTableValue, logInfo, logWarning, logError, logAlways, getCellRef, setTableValue, updateTableValue, calcAliasname, isEqual1D
+from concurrent      import futures
 from FreeCAD         import Vector as VEC, Rotation as ROT, Placement as PLC
-from importerClasses import ParameterTableModel, VariantTableModel
 from math            import degrees, radians, pi, sqrt, cos, sin, atan
 from PySide.QtCore   import *
 from PySide.QtGui    import *
@@ -39,6 +39,157 @@ DIM_CONSTRAINTS = {
 	'Diameter' : u'mm',
 }
 
+class TableModel(QAbstractTableModel):
+	def __init__(self, parent, mylist, header, *args):
+		super(TableModel, self).__init__(parent, *args)
+		self.mylist = mylist
+		self.header = header
+		parent.setModel(self)
+
+	def rowCount(self, parent):
+		return len(self.mylist)
+
+	def columnCount(self, parent):
+		cols = [len(row) for row in self.mylist]
+		if (len(cols) == 0):
+			return 0
+		return max(cols)
+
+	def data(self, index, role):
+		if (index.isValid()):
+			value = self.mylist[index.row()][index.column()]
+			if (hasattr(value, 'Value')):
+				value = value.Value
+			if (type(value) == bool):
+				if (role == Qt.CheckStateRole):
+					if value:
+						return Qt.Checked
+					return Qt.Unchecked
+			else:
+				if (role in [Qt.EditRole, Qt.DisplayRole]):
+					return value
+		return None
+
+	def setData(self, index, value, role):
+		if (index.isValid()):
+			orgVal = self.mylist[index.row()][index.column()]
+			if (role == Qt.CheckStateRole):
+				value = (value == Qt.Checked)
+			if (hasattr(orgVal, 'Value')):
+				orgVal.Value = value
+			else:
+				self.mylist[index.row()][index.column()] = value
+			return True
+		return False
+
+	def headerData(self, position, orientation, role):
+		if ((role == Qt.DisplayRole) and (orientation == Qt.Horizontal)):
+			return self.header[position]
+		return QAbstractTableModel.headerData(self, position, orientation, role)
+
+	def setHeaderData(self, position, orientation, header, role): # int, orientation, QVariant, int = Qt.EditRole
+		if ((role == Qt.DisplayRole) and (orientation == Qt.Horizontal)):
+			self.header[position] = header
+			return True
+		return QAbstractTableModel.setHeaderData(self, position, orientation, header, role)
+
+	def insertRow(self, row, index=QModelIndex()):
+		'''Insert a row into the model.'''
+		self.beginInsertRows(index, row, row)
+		data = ['' for c in range(self.columnCount(self.parent))]
+		self.mylist.insert(row, data)
+		self.endInsertRows()
+		return True
+
+	def insertRows(self, position, rows=1, index=QModelIndex()):
+		'''Insert a row into the model.'''
+		self.beginInsertRows(index, position, position + rows - 1)
+		for row in range(rows):
+			data = ['' for c in range(self.columnCount(self.parent))]
+			self.mylist.insert(position + row, data)
+		self.endInsertRows()
+		return True
+
+	def removeRow(self, row, index=QModelIndex()):
+		'''Remove a row from the model.'''
+		self.beginRemoveRows(index, row, row)
+		del self.mylist[row]
+		self.endRemoveRows()
+		return True
+
+	def removeRows(self, position, rows=1, index=QModelIndex()):
+		'''Remove rows from the model.'''
+		self.beginRemoveRows(index, position, position + rows - 1)
+		del self.mylist[position:position+rows]
+		self.endRemoveRows()
+		return True
+
+	def insertColumn(self, column, index=QModelIndex()):
+		'''Insert a column into the model.'''
+		self.beginInsertColumns(index, column, column)
+		self.header.insert(column, '')
+		for row in self.mylist:
+			row.insert(column, '')
+		self.endInsertColumns()
+		return True
+
+	def insertColumns(self, position, column=1, index=QModelIndex()):
+		'''Insert a row into the model.'''
+		self.beginInsertColumns(index, position, position + column - 1)
+		for col in range(column):
+			self.header.insert(position + col, '')
+		for row in self.mylist:
+			for col in range(column):
+				row.insert(position + column, '')
+		self.endInsertColumns()
+		return True
+
+	def removeColumn(self, column, index=QModelIndex()):
+		'''Remove a column from the model.'''
+		self.beginRemoveColumns(index, column, column)
+		del self.header[column]
+		for row in self.mylist:
+			del row[column]
+		self.endRemoveColumns()
+		return True
+
+	def removeColumns(self, position, column=1, index=QModelIndex()):
+		'''Remove columns from the model.'''
+		self.beginRemoveColumns(index, position, position + column - 1)
+		for col in range(column):
+			del self.header[position]
+		for row in self.mylist:
+			del row[position:position+column]
+		self.endRemoveColumns()
+		return True
+
+	def flags(self, index):
+		'''Returns the item flags for the given index.
+		The base class implementation returns a combination of flags that enables the item
+		and allows it to be selected.'''
+		if not index.isValid():
+			return Qt.NoItemFlags
+		return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+class ParameterTableModel(TableModel):
+	def __init__(self, parent, mylist, *args):
+		super(TableModel, self).__init__(parent, mylist, ['Variant', 'Source', 'Property', 'Parameter', 'Value', 'Units'], *args)
+	def flags(self, index):
+		if (index.column() == 0):
+			return Qt.ItemIsEnabled | Qt.ItemIsEditable | Qt.ItemIsUserCheckable
+		if (index.column() in [1, 2, 5]): # make object's name and property and unit column read only!
+			return Qt.ItemIsEnabled
+		return Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+class VariantTableModel(TableModel):
+	def __init__(self, parent, values, *args):
+		if (values):
+			super().__init__(parent, values[1:], values[0], *args)
+		else:
+			super().__init__(parent, ['Part-01'], ['Member'], *args)
+	def flags(self, index):
+		return Qt.ItemIsEnabled | Qt.ItemIsEditable
+
 def getProfileFromSelection():
 	edges = []
 	selections = FreeCADGui.Selection.getSelectionEx(FreeCAD.ActiveDocument.Name)
@@ -47,6 +198,19 @@ def getProfileFromSelection():
 			edges += obj.Edges
 	return edges
 
+_recomputeScheduler = None # set by the importer to defer the recomputes of the created objects
+
+def setRecomputeScheduler(scheduler):
+	global _recomputeScheduler
+	_recomputeScheduler = scheduler
+
+def recomputeFeature(obj):
+	'''Recomputes the document, or only marks the object as outstanding while a model is imported.'''
+	if (_recomputeScheduler is not None):
+		_recomputeScheduler.touch(obj)
+	else:
+		FreeCAD.ActiveDocument.recompute()
+
 def createPartFeature(doctype, name):
 	iPart = FreeCAD.ActiveDocument.addObject(doctype, getObjectName(name))
 	iPart.Label = name
@@ -110,7 +274,7 @@ def makeBoundaryPatch(edges, name = "BoundaryPatch"):
 	bPatch.Shape = Part.Face(Part.Wire(edges))
 	if FreeCAD.GuiUp:
 		_ViewProviderBoundaryPatch(bPatch.ViewObject)
-	FreeCAD.ActiveDocument.recompute()
+	recomputeFeature(bPatch)
 	return bPatch
 
 class _Stich(_ObjectProxy):
@@ -148,7 +312,7 @@ def makeStitch(faces, name = u"FxStitch", solid = False):
 		_ViewProviderStitch(stich.ViewObject)
 	for face in faces:
 		face.ViewObject.Visibility = False
-	FreeCAD.ActiveDocument.recompute()
+	recomputeFeature(stich)
 	return stich
 
 class _Point(_ObjectProxy):
@@ -202,7 +366,7 @@ def makePoint(pt, name = u"Point"):
 	_Point(point, pt)
 	if FreeCAD.GuiUp:
 		_ViewProviderPoint(point.ViewObject)
-	FreeCAD.ActiveDocument.recompute()
+	recomputeFeature(point)
 	return point
 
 class _Line(_ObjectProxy):
@@ -225,7 +389,7 @@ def makeLine(pt1, pt2, name = u"Line"):
 	_Line(line, pt1, pt2)
 	if FreeCAD.GuiUp:
 		_ViewProviderLine(line.ViewObject)
-	FreeCAD.ActiveDocument.recompute()
+	recomputeFeature(line)
 	return line
 
 class _Plane(_ObjectProxy):
@@ -296,7 +460,7 @@ def makePlane(c, n, name = u"Plane"):
 	_Plane(plane, c, n)
 	if FreeCAD.GuiUp:
 		_ViewProviderPlane(plane.ViewObject)
-	FreeCAD.ActiveDocument.recompute()
+	recomputeFeature(plane)
 	return plane
 
 class _Sketch3D(_ObjectProxy):
@@ -342,7 +506,7 @@ def makeSketch3D(name = u"Sketch3D"):
 	_Sketch3D(sketch)
 	if (FreeCAD.GuiUp):
 		_ViewProviderSketch3D(sketch.ViewObject)
-	FreeCAD.ActiveDocument.recompute()
+	recomputeFeature(sketch)
 	return sketch
 
 class _PartVariants(_ObjectProxy):
@@ -391,14 +555,16 @@ class _PartVariants(_ObjectProxy):
 				return False
 			r = fp.Rows[fp.Variant]
 			FreeCAD.Console.PrintMessage(f"Set parameters according to variant '{fp.Variant}' (row={r}):\n")
+			changed = False
 			for col in fp.Mapping:
 				prm = fp.Values[0][col]
 				val = fp.Values[r][col]
 				if (hasattr(val, 'Value')):
 					val = val.Value
-				setTableValue(fp.Parameters, 'B', fp.Mapping[col], val)
-				FreeCAD.Console.PrintMessage("    '%s' = %s\n" %(prm, val))
-			if (FreeCAD.ActiveDocument):
+				if (updateTableValue(fp.Parameters, 'B', fp.Mapping[col], val)):
+					changed = True
+					FreeCAD.Console.PrintMessage("    '%s' = %s\n" %(prm, val))
+			if (changed and FreeCAD.ActiveDocument):
 				FreeCAD.ActiveDocument.recompute()
 			return True
 		except Exception as ex:
@@ -423,6 +589,215 @@ class _PartVariants(_ObjectProxy):
 		elif (prop == 'Values'):
 			self._updateValues_(fp)
 
+def isPartVariants(obj):
+	return hasattr(getattr(obj, 'Proxy', None), '_updateVariant_')
+
+# The document's copy, the variants' name and the output folder for the worker processes: they inherit this when forked.
+_variantJobs = None
+
+# Command for the worker processes started from FreeCAD's GUI, as the GUI can't be forked.
+VARIANT_WORKER = u"import sys; sys.path.insert(0, %r); import InventorViewProviders; InventorViewProviders.exportVariantsJob(%r)"
+
+INVALID_FILE_CHARS = re.compile(r'[\\/:*?"<>|]')
+
+def _getVariantMapping(fp):
+	'''Returns the rows of the parameter table for the columns of the variant table.'''
+	headers = fp.Proxy._getHeadersByRow_(fp.Parameters)
+	mapping = {}
+	for col in range(1, len(fp.Values[0])):
+		row = headers.get(fp.Values[0][col], None)
+		if (row is not None):
+			mapping[col] = row
+	return mapping
+
+def _getVariantObjects(doc):
+	'''Returns the bodies' tips and the visible solids that aren't used by other shapes.'''
+	objects = []
+	for obj in doc.Objects:
+		if (obj.TypeId == 'PartDesign::Body'):
+			if (obj.Tip is not None):
+				objects.append(obj.Tip)
+		elif (hasattr(obj, 'Shape') and getattr(obj, 'Visibility', True) and (len(obj.Shape.Solids) > 0)):
+			if (all(not hasattr(parent, 'Shape') for parent in obj.InList)):
+				objects.append(obj)
+	return objects
+
+def _exportVariant(doc, fp, mapping, row, folder):
+	variant = str(fp.Values[row][0])
+	result  = {'variant': variant, 'row': row, 'status': 'failed', 'parameters': 0}
+	start   = time.time()
+	try:
+		for col in mapping:
+			val = fp.Values[row][col]
+			if (hasattr(val, 'Value')):
+				val = val.Value
+			if (updateTableValue(fp.Parameters, 'B', mapping[col], val)):
+				result['parameters'] += 1
+		doc.recompute()
+		invalid = [obj.Label for obj in doc.Objects if ('Invalid' in obj.State)]
+		if (len(invalid) > 0):
+			result['error'] = u"Can't recompute %s" %(", ".join(invalid))
+		else:
+			filename = os.path.join(folder, u"%s.step" %(INVALID_FILE_CHARS.sub('_', variant)))
+			Part.export(_getVariantObjects(doc), filename)
+			result['file']   = filename
+			result['status'] = 'ok'
+	except Exception as e:
+		result['error'] = u"%s" %(e)
+	result['time'] = time.time() - start
+	if (result['status'] == 'ok'):
+		logInfo(u"Exported variant '%s' in %.3fs.", variant, result['time'])
+	else:
+		logError(u"Can't export variant '%s' - %s", variant, result['error'])
+	return result
+
+def _exportVariants(rows):
+	'''Exports the variants of the rows one after the other in a copy of the document.'''
+	docFile, name, folder = _variantJobs
+	try:
+		doc = FreeCAD.openDocument(docFile, True) # hidden
+	except TypeError: # FreeCAD < 0.19
+		doc = FreeCAD.openDocument(docFile)
+	try:
+		fp = doc.getObject(name)
+		mapping = _getVariantMapping(fp)
+		return [_exportVariant(doc, fp, mapping, row, folder) for row in rows]
+	finally:
+		FreeCAD.closeDocument(doc.Name)
+
+def exportVariantsJob(jobFile):
+	'''Entry point of the worker processes: exports the variants of the job file's rows.'''
+	global _variantJobs
+
+	with io.open(jobFile, 'rt', encoding="UTF-8") as f:
+		job = json.load(f)
+	_variantJobs = (job['document'], job['name'], job['folder'])
+	try:
+		result = _exportVariants(job['rows'])
+	finally:
+		_variantJobs = None
+	with io.open(job['result'], 'wt', encoding="UTF-8") as f:
+		json.dump(result, f)
+
+def _getFreeCADCmd():
+	'''Returns FreeCAD's console executable or None if it can't be found.'''
+	folders = [os.path.dirname(sys.executable), os.path.join(FreeCAD.getHomePath(), 'bin')]
+	names   = [os.path.basename(sys.executable).replace('FreeCAD', 'FreeCADCmd').replace('freecad', 'freecadcmd'), 'FreeCADCmd', 'freecadcmd', 'FreeCADCmd.exe']
+	for folder in folders:
+		for name in names:
+			executable = os.path.join(folder, name)
+			if (os.path.isfile(executable)):
+				return executable
+	return None
+
+def _startVariantWorkers(fp, executable, chunks, tmp):
+	'''
+	Exports the chunks of rows in separate FreeCADCmd processes. The GUI is kept
+	responsive while waiting for the processes.
+	'''
+	addinPath = os.path.dirname(os.path.abspath(__file__))
+	docFile, name, folder = _variantJobs
+	workers = []
+	for i, chunk in enumerate(chunks):
+		jobFile = os.path.join(tmp, u"job%d.json" %(i))
+		job = {'document': docFile, 'name': name, 'folder': folder, 'rows': chunk, 'result': os.path.join(tmp, u"result%d.json" %(i))}
+		with io.open(jobFile, 'wt', encoding="UTF-8") as f:
+			json.dump(job, f)
+		with io.open(os.path.join(tmp, u"worker%d.log" %(i)), 'wb') as log:
+			process = subprocess.Popen([executable, '-c', VARIANT_WORKER %(addinPath, jobFile)], stdout=log, stderr=subprocess.STDOUT)
+		workers.append((chunk, job, process))
+	while (any(process.poll() is None for chunk, job, process in workers)):
+		if (FreeCAD.GuiUp):
+			QCoreApplication.processEvents()
+		time.sleep(0.1)
+	result = []
+	for chunk, job, process in workers:
+		try:
+			with io.open(job['result'], 'rt', encoding="UTF-8") as f:
+				result += json.load(f)
+		except Exception: # e.g. the worker process crashed
+			logError(u"Can't export variants of rows %d-%d - worker exited with %d", chunk[0], chunk[-1], process.returncode)
+			result += [{'variant': str(fp.Values[row][0]), 'row': row, 'status': 'failed', 'error': u"worker exited with %d" %(process.returncode)} for row in chunk]
+	return result
+
+def exportPartVariants(fp, folder, workers = None, reportFile = None):
+	'''
+	Recomputes each variant of the iPart in a copy of its document and exports
+	the variant into a STEP file. Per variant only the changed parameters are
+	written into the parameter table.
+	Parameters:
+	fp: the iPart's variants (see makePartVariants).
+	folder: folder for the STEP files.
+	workers: number of processes; None (default) for one per CPU. Without GUI
+		the processes are forked, otherwise separate FreeCADCmd processes are
+		started, so the export doesn't block the GUI. If FreeCADCmd can't be
+		found, the variants are exported sequentially in FreeCAD itself.
+	reportFile: JSON file for the report; None (default) for 'variants.json' in the folder.
+	Returns:
+		The report as dict.
+	'''
+	global _variantJobs
+
+	if (workers is None):
+		workers = multiprocessing.cpu_count()
+	fork = (not FreeCAD.GuiUp) and ('fork' in multiprocessing.get_all_start_methods())
+	executable = None if (fork) else _getFreeCADCmd()
+	if ((not fork) and (executable is None)):
+		logWarning(u"Can't find FreeCADCmd - exporting variants sequentially.")
+		workers = 1
+	folder = os.path.abspath(folder)
+	if (reportFile is None):
+		reportFile = os.path.join(folder, 'variants.json')
+	if (not os.path.exists(folder)):
+		os.makedirs(folder)
+
+	rows    = list(range(1, len(fp.Values)))
+	workers = max(1, min(workers, len(rows)))
+	start   = time.time()
+	tmp     = tempfile.mkdtemp(prefix='InventorLoader_')
+	docFile = os.path.join(tmp, u"%s.FCStd" %(fp.Document.Name))
+	fp.Document.saveCopy(docFile)
+	_variantJobs = (docFile, fp.Name, folder)
+	try:
+		if (len(rows) == 0): # the table has no variants.
+			result = []
+		elif ((workers > 1) or (executable is not None)):
+			# consecutive rows per process as neighboring variants differ only in few parameters.
+			size   = (len(rows) + workers - 1) // workers
+			chunks = [rows[i:i + size] for i in range(0, len(rows), size)]
+			if (not fork):
+				result = _startVariantWorkers(fp, executable, chunks, tmp)
+			else:
+				result = []
+				with futures.ProcessPoolExecutor(workers, multiprocessing.get_context('fork')) as pool:
+					jobs = [pool.submit(_exportVariants, chunk) for chunk in chunks]
+					for chunk, job in zip(chunks, jobs):
+						try:
+							result += job.result()
+						except Exception as e: # e.g. the worker process crashed
+							logError(u"Can't export variants of rows %d-%d - %s", chunk[0], chunk[-1], e)
+							result += [{'variant': str(fp.Values[row][0]), 'row': row, 'status': 'failed', 'error': u"%s" %(e)} for row in chunk]
+		else:
+			result = _exportVariants(rows)
+	finally:
+		_variantJobs = None
+		shutil.rmtree(tmp, True)
+
+	failed = len([r for r in result if (r['status'] != 'ok')])
+	report = {
+		'document': fp.Document.Name,
+		'output'  : folder,
+		'workers' : workers,
+		'total'   : time.time() - start,
+		'exported': len(result) - failed,
+		'failed'  : failed,
+		'variants': result,
+	}
+	with io.open(reportFile, 'wt', encoding="UTF-8") as f:
+		json.dump(report, f, indent=2)
+	logAlways(u"Exported %d of %d variants in %.1fs - see '%s'.", report['exported'], len(rows), report['total'], reportFile)
+	return report
+
 class DlgIPartVariants(object):
 	def __init__(self, fp):
 		res = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Resources")
@@ -4,11 +4,11 @@
 InventorWorkbench.py
 '''
 
-import sys, FreeCAD, FreeCADGui
+import os, sys, FreeCAD, FreeCADGui
 from InventorViewProviders import *
 from FreeCADGui            import Workbench, addCommand
 from importerUtils         import getIconPath
-from PySide.QtGui          import QMessageBox
+from PySide.QtGui          import QMessageBox, QFileDialog
 from PySide.QtCore         import Qt
 import InventorViewProviders
 
@@ -102,6 +102,7 @@ _SHEET_METAL_REFOLD_  = PREFIX + 'FxRefold'          # FX missing
 
 # others
 _I_PART_              = PREFIX + 'iPart'
+_I_PART_EXPORT_       = PREFIX + 'iPartExport'
 _FX_DIRECT_EDIT_      = PREFIX + 'FxDirectEdit'      # FX missing
 
 def runSketcherCommand(cmd):
@@ -645,6 +646,36 @@ class _CmdiPart(_CmdAbstract):
 		FreeCADGui.doCommand("InventorViewProviders.createIPart()")
 		FreeCAD.ActiveDocument.commitTransaction()
 
+class _CmdiPartExport(_CmdAbstract):
+	def __init__(self):
+		super(_CmdiPartExport, self).__init__(menuText="Export iPart variants", toolTip="Exports each variant of the selected iPart as STEP file.\nThe variants are exported in separate FreeCADCmd processes - without FreeCADCmd they are exported sequentially", pixmap=getIconPath("iPart.png"))
+		self.running = False # the GUI handles events while waiting for the export.
+
+	def getVariants(self):
+		for obj in FreeCADGui.Selection.getSelection():
+			if (InventorViewProviders.isPartVariants(obj)):
+				return obj
+		return None
+
+	def IsActive(self):
+		return (not self.running) and (self.getVariants() is not None)
+
+	def Activated(self):
+		if (self.running):
+			return
+		fp = self.getVariants()
+		folder = QFileDialog.getExistingDirectory(None, "Folder for the STEP files of the variants")
+		if (folder):
+			self.running = True
+			try:
+				report = InventorViewProviders.exportPartVariants(fp, folder)
+			finally:
+				self.running = False
+			msg = u"Exported %d variants, %d failed - see '%s'." %(report['exported'], report['failed'], os.path.join(report['output'], 'variants.json'))
+			dlg = QMessageBox(QMessageBox.Information, 'FreeCAD: Inventor workbench...', msg)
+			dlg.setWindowModality(Qt.ApplicationModal)
+			dlg.exec_()
+
 class _CmdFxDirectEdit(_CmdAbstract):
 	def __init__(self):
 		super(_CmdFxDirectEdit, self).__init__(menuText="Direct edit", toolTip="Applies direct edits to bodies", pixmap=getIconPath("FxDirectEdit.png"))
@@ -671,7 +702,7 @@ class InventorWorkbench(Workbench):
 		self.appendMenu(["&Inventor", "Plas&tic"          ], [_FX_GRILL_, _FX_BOSS_, _FX_REST_, _FX_SNAP_FIT_, _FX_RULE_FILLET_, _FX_LIP_])
 		self.appendMenu(["&Inventor", "&Freeform"         ], [_FREEFORM_BOX_, _FREEFORM_PLANE_, _FREEFORM_CYLINDER, _FREEFORM_SPHERE, _FREEFORM_TORUS, _FREEFORM_QUAD_BALL])
 		self.appendMenu(["&Inventor", "Sheet-M&etal"      ], [_SHEET_METAL_FACE_, _SHEET_METAL_FLANGE_, _SHEET_METAL_CONTOUR_, _SHEET_METAL_LOFTED_, _SHEET_METAL_ROLL_, _SHEET_METAL_HEM_, _SHEET_METAL_BEND_, _SHEET_METAL_FOLD_, _SHEET_METAL_UNFOLD_, _SHEET_METAL_REFOLD_, _SEPARATOR_, _SHEET_METAL_CUT_, _SHEET_METAL_CORNER_, _SHEET_METAL_RIP_])
-		self.appendMenu(["&Inventor"], [_I_PART_])
+		self.appendMenu(["&Inventor"], [_I_PART_, _I_PART_EXPORT_])
 
 if (FreeCAD.GuiUp):
 	addCommand(_SKETCH_2D_          , _CmdSketch2D())
@@ -731,6 +762,7 @@ if (FreeCAD.GuiUp):
 	addCommand(_FREEFORM_QUAD_BALL  , _CmdFreeformQuadBall())
 	addCommand(_FREEFORMS_          , _CmdFreeforms())
 	addCommand(_I_PART_             , _CmdiPart())
+	addCommand(_I_PART_EXPORT_      , _CmdiPartExport())
 	addCommand(_FX_DIRECT_EDIT_     , _CmdFxDirectEdit())
 	addCommand(_SHEET_METAL_FACE_   , _CmdSheetMetalFace())
 	addCommand(_SHEET_METAL_FLANGE_ , _CmdSheetMetalFlange())
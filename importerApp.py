@@ -8,6 +8,7 @@ The importer can read files from Autodesk (R) Invetor (R) Inventro V2010 on. Old
 
 from importerSegment   import SegmentReader
 from importerUtils     import *
+from importerLayout    import layout
 from importerConstants import VAL_UINT8, VAL_UINT16, VAL_UINT32
 import importerSegNode
 
@@ -36,6 +37,7 @@ class AppReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('f64:f64_0 lst2<FLOAT64>:lst0', 'Read_Header0')
 	def Read_10389219(self, node):
 		i = node.Read_Header0()
 		i = node.ReadFloat64(i, 'f64_0')
@@ -93,6 +95,7 @@ class AppReader(SegmentReader):
 		i = node.ReadList2(i, importerSegNode._TYP_LIGHTNING_, 'lst0')
 		return i
 
+	@layout('u16[2]:u16_0 t16:txt_0 t16:txt_1 t16:txt_2 pref', 'Read_Header0')
 	def Read_2AE52C91(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt16A(i, 2, 'u16_0')
@@ -102,6 +105,7 @@ class AppReader(SegmentReader):
 		i = node.ReadParentRef(i)
 		return i
 
+	@layout('uid:uid_0 lst2<NODE_REF>:lst0 lst6<MAP_KEY_REF>:lst1 cref:cld_0 (x[4])>2010 (x[8])>2017', 'Read_Header0')
 	def Read_3235A9B8(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUUID(i, 'uid_0')
@@ -112,6 +116,7 @@ class AppReader(SegmentReader):
 		if (self.version > 2017): i += 8
 		return i
 
+	@layout('lst2<NODE_REF>:lst0 uid:uid_0 uid:uid_1', 'Read_Header0')
 	def Read_345EB9B1(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -153,6 +158,7 @@ class AppReader(SegmentReader):
 		i = node.ReadList2(i, importerSegNode._TYP_STRING16_, 'lst2')
 		return i
 
+	@layout('lst2<APP_1>:lst0 s u32:u32_0', 'Read_Header0')
 	def Read_37186901(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_APP_1_, 'lst0')
@@ -160,6 +166,7 @@ class AppReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('cref:layers', 'Read_Header0')
 	def Read_3A645317(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'layers')
@@ -183,6 +190,7 @@ class AppReader(SegmentReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('u32:u32_0', 'Read_Header0')
 	def Read_42A65DAA(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -205,6 +213,7 @@ class AppReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('t16:lBound t16:uBound u16[7]:a0 t16:equation', 'Read_Header0', 'BoundEquation')
 	def Read_473180FD(self, node): # bound equation for bend compensation
 		i = node.Read_Header0('BoundEquation')
 		i = node.ReadLen32Text16(i, 'lBound')
@@ -213,6 +222,7 @@ class AppReader(SegmentReader):
 		i = node.ReadLen32Text16(i, 'equation')
 		return i
 
+	@layout('uid:uid_0 s u32[2]:a0 t16 u32[2]:a1 s u32[4]:a2', 'Read_Header0', 'iMate')
 	def Read_55231213(self, node): # MateInterfaceDef
 		i = node.Read_Header0('iMate')
 		i = node.ReadUUID(i, 'uid_0')
@@ -224,6 +234,7 @@ class AppReader(SegmentReader):
 		i = node.ReadUInt32A(i, 4, 'a2')
 		return i
 
+	@layout('u16[4]:a1 s t16 uid:uid_0 lst2<NODE_REF>:lst0', 'Read_Header0')
 	def Read_553C5021(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt16A(i, 4, 'a1')
@@ -240,6 +251,7 @@ class AppReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('lst2<UINT32>:lst0 lst2<UINT32>:lst1 lst2<UINT32>:lst2 u8:u8_0 lst2<UINT32>:lst3 lst2<FLOAT64>:lst4 lst2<UINT32>:lst5 lst2<UINT32>:lst6 lst2<UINT32>:lst7', 'Read_Header0')
 	def Read_66DD88F6(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_UINT32_, 'lst0')
@@ -416,12 +428,14 @@ class AppReader(SegmentReader):
 			i = node.ReadUInt32(i, 'u32_3')
 		return i
 
+	@layout('t16 pref', 'Read_Header0')
 	def Read_6B4C0C42(self, node):
 		i = node.Read_Header0()
 		i = node.ReadLen32Text16(i)
 		i = node.ReadParentRef(i)
 		return i
 
+	@layout('uid:uid_0 s u32[2]:a0 t16:txt_0 u32[2]:a1 s', 'Read_Header0', 'AngleInterfaceDef')
 	def Read_6D8A4AC7(self, node): # AngleInterfaceDef
 		i = node.Read_Header0('AngleInterfaceDef')
 		i = node.ReadUUID(i, 'uid_0')
@@ -432,6 +446,7 @@ class AppReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('uid:uid_0 s u32[2]:a0 t16:txt_0', 'Read_Header0')
 	def Read_6D8A4AC8(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUUID(i, 'uid_0')
@@ -440,6 +455,7 @@ class AppReader(SegmentReader):
 		i = node.ReadLen32Text16(i, 'txt_0')
 		return i
 
+	@layout('uid:uid_0 s u32[2]:a0 t16:txt_0 u32[2]:a1', 'Read_Header0', 'InsertInterfaceDef')
 	def Read_6D8A4AC9(self, node): # InsertInterfaceDef
 		i = node.Read_Header0('InsertInterfaceDef')
 		i = node.ReadUUID(i, 'uid_0')
@@ -449,6 +465,7 @@ class AppReader(SegmentReader):
 		i = node.ReadUInt32A(i, 2, 'a1')
 		return i
 
+	@layout('t8 xref:cld_0 pref lst6<MAP_TEXT16_REF>:lst0 u32:codpage s (x[4])>2012', 'Read_Header0')
 	def Read_6DD8F4A0(self, node):
 		i = node.Read_Header0()
 		i = node.ReadLen32Text8(i)
@@ -477,6 +494,7 @@ class AppReader(SegmentReader):
 		i = node.ReadChildRef(i, 'ref_C')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0 u16[9]:a0 lst4<STRING8>:lst1 u16[4]:a1 s lst2<LIST_UINT32_A>:lst2 s', 'Read_Header0')
 	def Read_7313FAC3(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -494,12 +512,14 @@ class AppReader(SegmentReader):
 		i = node.ReadLen32Text16(i, 'FontName')
 		return i
 
+	@layout('u32:l0 uid:uid_0', 'Read_Header0')
 	def Read_81A9D693(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'l0')
 		i = node.ReadUUID(i, 'uid_0')
 		return i
 
+	@layout('uid:uid_0 s u32[2]:a0 t16', 'Read_Header0', 'CompositeInterfaceDef')
 	def Read_81AFC10F(self, node): # CompositeInterfaceDef
 		i = node.Read_Header0('CompositeInterfaceDef')
 		i = node.ReadUUID(i, 'uid_0')
@@ -553,6 +573,7 @@ class AppReader(SegmentReader):
 		i = node.ReadCrossRef(i, 'ref_1')
 		return i
 
+	@layout('t8 xref:default pref lst6<MAP_TEXT16_REF>:lst0 u16:localeId u8[2]:a0 s', 'Read_Header0')
 	def Read_A7A4FD41(self, node):
 		i = node.Read_Header0()
 		i = node.ReadLen32Text8(i)
@@ -568,6 +589,7 @@ class AppReader(SegmentReader):
 		i = node.Read_Header0()
 		return i
 
+	@layout('u32:u32_0 cref:ref_0', 'Read_Header0')
 	def Read_ADAF9728(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -656,6 +678,7 @@ class AppReader(SegmentReader):
 		i = node.Read_Header0()
 		return i
 
+	@layout('t16 pref u16:u16_0 t16:txt_0 u8:u8_0 u16[12]:u16_1 t16:txt_1 t16:txt_2', 'Read_Header0')
 	def Read_BA93BB36(self, node):
 		i = node.Read_Header0()
 		i = node.ReadLen32Text16(i)
@@ -679,6 +702,7 @@ class AppReader(SegmentReader):
 		i = node.ReadUInt8A(i, 3, 'a2')
 		return i
 
+	@layout('u32:u32_0', 'Read_Header0')
 	def Read_C5966B59(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -719,6 +743,7 @@ class AppReader(SegmentReader):
 		i = node.ReadLen32Text16(i, 'facSpline')
 		return i
 
+	@layout('uid:uid_0', 'Read_Header0', 'ASMFlatPatternPartRepresentation')
 	def Read_DD4C4D3A(self, node): # ASMFlatPatternPartRepresentation
 		i = node.Read_Header0('ASMFlatPatternPartRepresentation')
 		i = node.ReadUUID(i, 'uid_0')
@@ -733,6 +758,7 @@ class AppReader(SegmentReader):
 		i = node.ReadList2(i, importerSegNode._TYP_UINT16_A_, 'lst2', 2)
 		return i
 
+	@layout('f64[16]:a0 (x[1])>2023', 'Read_Header0')
 	def Read_E5DDE747(self, node):
 		i = node.Read_Header0()
 		i = node.ReadFloat64A(i, 16, 'a0')
@@ -748,6 +774,7 @@ class AppReader(SegmentReader):
 		i = node.ReadCrossRef(i, 'ref_1')
 		return i
 
+	@layout('t16 t16:txt_0', 'Read_Header0')
 	def Read_ED6CD739(self, node):
 		i = node.Read_Header0()
 		i = node.ReadLen32Text16(i)
@@ -758,6 +785,7 @@ class AppReader(SegmentReader):
 		i = node.Read_Header0()
 		return i
 
+	@layout('cref:ref_0 cref:ref_1 cref:ref_2 cref:ref_3 s cref:ref_4 cref:ref_5 cref:ref_6 cref:ref_7 cref:ref_8 (cref:ref_9)<2012 lst6<MAP_TEXT16_REF>:lst0 cref:ref_10', 'Read_Header0')
 	def Read_F6830E86(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_0')
@@ -776,11 +804,13 @@ class AppReader(SegmentReader):
 		i = node.ReadChildRef(i, 'ref_10')
 		return i
 
+	@layout('u32:u32_0', 'Read_Header0')
 	def Read_8B82CF25(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('lst2<APP_1>:lst0 s u32:u32_0', 'Read_Header0')
 	def Read_F80032B8(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_APP_1_, 'lst0') #[<LHHHff""dBBB]
@@ -788,6 +818,7 @@ class AppReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('cref:ref_1 cref:ref_2', 'Read_Header0')
 	def Read_F8A779F9(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_1')
@@ -864,6 +895,7 @@ class AppReader(SegmentReader):
 		i = self.readHeaderStyle(node, 'AnalysisSetup')
 		return i
 
+	@layout('uid:uid_0 u32[2]:a0 t16:txt_0', 'Read_Header0', 'FlushInterfaceDef')
 	def Read_FD1F3F21(self, node): # FlushInterfaceDef
 		i = node.Read_Header0('FlushInterfaceDef')
 		i = node.ReadUUID(i, 'uid_0')
@@ -892,6 +924,7 @@ class AppReader(SegmentReader):
 		i = self.readHeaderStyle(node)
 		return i
 
+	@layout('t8 xref:default pref lst6<MAP_TEXT16_REF>:lst0 u16:localeId', 'Read_Header0', 'LeaderCollection')
 	def Read_FDA6D020(self, node): # LeaderCollection
 		i = node.Read_Header0('LeaderCollection')
 		i = node.ReadLen32Text8(i)
@@ -10,6 +10,7 @@ from importerSegNode    import _TYP_UINT32_, _TYP_UINT32_A_, _TYP_NODE_REF_, _TY
 from importerSegment    import checkReadAll
 from importer_NameTable import NameTableReader
 from importerUtils      import *
+from importerLayout     import layout
 from importerConstants  import VAL_UINT16
 import importerSegNode
 
@@ -66,6 +67,7 @@ class BRepReader(NameTableReader):
 		i = self.ReadHeaderNameTableChild3Node(node)
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderNameTableChild3Node')
 	def Read_0BDC96E0(self, node):
 		i = self.ReadHeaderNameTableChild3Node(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -99,11 +101,13 @@ class BRepReader(NameTableReader):
 		i = self.ReadHeaderNameTableChild3Node(node)
 		return i
 
+	@layout('u32[4]:a1', 'ReadHeaderNameTableChild3Node')
 	def Read_56A95F20(self, node):
 		i = self.ReadHeaderNameTableChild3Node(node)
 		i = node.ReadUInt32A(i, 4, 'a1')
 		return i
 
+	@layout('u32[4]:a1 u32[10]:a3', 'ReadHeaderNameTableChild3Node')
 	def Read_0B7296C1(self, node):
 		i = self.ReadHeaderNameTableChild3Node(node)
 		i = node.ReadUInt32A(i, 4,  'a1')
@@ -154,6 +158,7 @@ class BRepReader(NameTableReader):
 		i = self.ReadHeaderNameTableChild3Node(node)
 		return i
 
+	@layout('u32:indexDC u8:u8_0 cref:asm u32:wrapperIdx x[4]', 'Read_Header0', 'AsmEntityWrapper')
 	def Read_CC0F7521(self, node): # AsmEntityWrapper
 		i = node.Read_Header0('AsmEntityWrapper')
 		i = node.ReadUInt32(i, 'indexDC')
@@ -281,6 +286,7 @@ class BRepReader(NameTableReader):
 		i = node.ReadList2(i, _TYP_UINT32_, 'lst0')
 		return i
 
+	@layout('u32[2]:a0 t16:txt1 f64[5]:a1 t16:txt2 v3:a2 u32[2]:a3 u16[3]:a4 (x[3])>2024 u8[2]:a5 t16:txt3 t16:txt4', 'ReadHeaderBRepComponent')
 	def Read_D797B7B9(self, node):
 		i = self.ReadHeaderBRepComponent(node)
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -296,6 +302,7 @@ class BRepReader(NameTableReader):
 		i = node.ReadLen32Text16(i, 'txt4')
 		return i
 
+	@layout('pref', 'ReadHeaderBRepComponent')
 	def Read_DDA265D6(self, node):
 		i = self.ReadHeaderBRepComponent(node)
 		i = node.ReadParentRef(i)
@@ -331,6 +338,7 @@ class BRepReader(NameTableReader):
 		i = node.ReadList2(i, _TYP_NODE_REF_, 'items')
 		return i
 
+	@layout('u32[2]:a1', 'ReadHeaderDeltaStateItem')
 	def Read_5363C623(self, node): # delta state item ???
 		i = self.ReadHeaderDeltaStateItem(node)
 		i = node.ReadUInt32A(i, 2, 'a1')
@@ -344,6 +352,7 @@ class BRepReader(NameTableReader):
 		i = self.ReadRefU32List(node, i, 'a2', REF_CHILD)
 		return i
 
+	@layout('xref:ref_1 s32:s32_1 xref:asm u32:wrapperIdx', 'ReadHeaderDeltaStateItem')
 	def Read_766EA5E5(self, node): # delta state item ???
 		i = self.ReadHeaderDeltaStateItem(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+'''
+importerBatch.py:
+Headless conversion of Autodesk Inventor, ACIS, Fusion360 and DXF files into STEP.
+Neither FreeCADGui nor PySide are loaded, so the conversion runs without GUI, e.g.:
+	FreeCADCmd -c "import importerBatch; importerBatch.convert(['/path/to/files'], '/path/to/step')"
+or with FreeCAD's lib folder in the PYTHONPATH:
+	python importerBatch.py --output /path/to/step /path/to/files
+'''
+
+import os, sys, io, json, time, traceback, argparse, multiprocessing
+import importerIL, importerClasses, Acis, Import_IPT, importerSAT, importerF3D, importerDXF
+from concurrent    import futures
+from importerUtils import logInfo, logError, logAlways, setLogSink, LogFile, setDumpMode
+from importerSAT   import resolveNodes
+from Acis2Step     import export
+
+__author__     = 'Jens M. Plonka'
+__copyright__  = 'Copyright 2018, Germany'
+__url__        = "https://www.github.com/jmplonka/InventorLoader"
+
+SUPPORTED_EXTENSIONS = ('.ipt', '.iam', '.ipn', '.idw', '.sat', '.sab', '.smb', '.smbh', '.f3d', '.dxf')
+
+def collectFiles(paths):
+	'''
+	Returns the supported files of the list. Folders are searched recursively.
+	'''
+	files = []
+	for path in paths:
+		if (os.path.isdir(path)):
+			for folder, dirs, names in os.walk(path):
+				dirs.sort()
+				for name in sorted(names):
+					if (os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS):
+						files.append(os.path.join(folder, name))
+		else:
+			files.append(path)
+	return files
+
+def getAcisModels(reader):
+	'''
+	Returns the ACIS models that were read by the reader module.
+	'''
+	if (reader is Import_IPT):
+		brep = importerClasses.getModel().getBRep()
+		return [asm.SAT for asm in getattr(brep, 'AcisList', [])]
+	if (reader is importerSAT):
+		return [Acis.getReader()]
+	if (reader is importerF3D):
+		return list(importerF3D.smb_files)
+	if (reader is importerDXF):
+		return list(importerDXF._3dSolids)
+	return []
+
+def _getStepName(filename, acis, count):
+	name = os.path.splitext(os.path.basename(filename))[0]
+	if (count > 1):
+		return u"%s_%s" %(name, acis.name)
+	return name
+
+def convertFile(filename, outputFolder):
+	'''
+	Converts the ACIS models of a file into STEP files in the output folder.
+	Returns a dict with the STEP files written and the times (in seconds) needed.
+	'''
+	result = {'file': filename, 'status': 'failed', 'steps': [], 'read': 0.0, 'export': 0.0}
+	start  = time.time()
+	try:
+		if (importerIL.isFileValid(filename)):
+			reader = importerIL.read(filename)
+			result['read'] = time.time() - start
+			if (reader is None):
+				result['error'] = u"Can't read file!"
+			else:
+				models = getAcisModels(reader)
+				for acis in models:
+					name = _getStepName(filename, acis, len(models))
+					stepFile = os.path.join(outputFolder, u"%s.step" %(name))
+					bodies = resolveNodes(acis)
+					with io.open(stepFile, 'wt', encoding="UTF-8") as stream:
+						export(name, acis.header, bodies, stream)
+					result['steps'].append(stepFile)
+				result['export'] = time.time() - start - result['read']
+				if (len(models) == 0):
+					result['error'] = u"File doesn't contain ACIS data!"
+				else:
+					result['status'] = 'ok'
+		else:
+			result['error'] = u"Invalid file!"
+	except Exception as e:
+		result['error'] = u"%s" %(e)
+		result['traceback'] = traceback.format_exc()
+	finally:
+		importerIL.releaseMemory()
+	result['total'] = time.time() - start
+	if (result['status'] == 'ok'):
+		logInfo(u"Converted '%s' in %.3fs.", filename, result['total'])
+	else:
+		logError(u"Can't convert '%s' - %s", filename, result['error'])
+	return result
+
+def _getPool(workers):
+	if ('fork' in multiprocessing.get_all_start_methods()):
+		return futures.ProcessPoolExecutor(workers, multiprocessing.get_context('fork'))
+	return futures.ProcessPoolExecutor(workers)
+
+def _convertFiles(files, outputFolder, workers):
+	if (workers <= 1):
+		return [convertFile(filename, outputFolder) for filename in files]
+	results = []
+	with _getPool(workers) as pool:
+		jobs = [pool.submit(convertFile, filename, outputFolder) for filename in files]
+		for filename, job in zip(files, jobs):
+			try:
+				results.append(job.result())
+			except Exception as e: # e.g. the worker process crashed
+				logError(u"Can't convert '%s' - %s", filename, e)
+				results.append({'file': filename, 'status': 'failed', 'steps': [], 'error': u"%s" %(e)})
+	return results
+
+def convert(paths, outputFolder, workers = None, reportFile = None, logFile = None, dump = False):
+	'''
+	Converts all supported files into STEP files in the output folder.
+	Parameters:
+	paths: list of files or folders (searched recursively).
+	workers: number of processes; None (default) for one per CPU.
+	reportFile: JSON file for the report; None (default) for 'report.json' in the output folder.
+	logFile: file for the log messages as JSON lines; None (default) for FreeCAD's console.
+	dump: True to write the debug files into the dump folders (default: False).
+	Returns:
+		The report as dict.
+	'''
+	if (workers is None):
+		workers = multiprocessing.cpu_count()
+	if (reportFile is None):
+		reportFile = os.path.join(outputFolder, 'report.json')
+	if (not os.path.exists(outputFolder)):
+		os.makedirs(outputFolder)
+
+	files  = collectFiles(paths)
+	start  = time.time()
+	sink   = None if (logFile is None) else LogFile(logFile)
+	previous = setLogSink(sink) if (sink is not None) else None
+	setDumpMode(dump)
+	try:
+		result = _convertFiles(files, os.path.abspath(outputFolder), min(workers, len(files)))
+	finally:
+		setDumpMode(None)
+		if (sink is not None):
+			setLogSink(previous)
+			sink.close()
+	failed = len([r for r in result if (r['status'] != 'ok')])
+	report = {
+		'output'   : os.path.abspath(outputFolder),
+		'workers'  : workers,
+		'total'    : time.time() - start,
+		'converted': len(result) - failed,
+		'failed'   : failed,
+		'files'    : result,
+	}
+	with io.open(reportFile, 'wt', encoding="UTF-8") as f:
+		json.dump(report, f, indent=2)
+	logAlways(u"Converted %d of %d files in %.1fs - see '%s'.", report['converted'], len(files), report['total'], reportFile)
+	return report
+
+def main(argv = None):
+	parser = argparse.ArgumentParser(description='Converts Autodesk Inventor, ACIS, Fusion360 and DXF files into STEP.')
+	parser.add_argument('paths', nargs='+', help='files or folders to convert')
+	parser.add_argument('-o', '--output', required=True, help='folder for the STEP files')
+	parser.add_argument('-j', '--jobs', type=int, default=None, help='number of processes (default: one per CPU)')
+	parser.add_argument('-r', '--report', default=None, help='JSON report file (default: OUTPUT/report.json)')
+	parser.add_argument('-l', '--log', default=None, help='log file for the messages as JSON lines (default: console)')
+	parser.add_argument('-d', '--dump', action='store_true', help='write the debug files into the dump folders')
+	args = parser.parse_args(argv)
+	report = convert(args.paths, args.output, args.jobs, args.report, args.log, args.dump)
+	return 0 if (report['failed'] == 0) else 1
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,600 @@
+# -*- coding: utf-8 -*-
+
+'''
+importerBenchmark.py:
+Simple timing helpers to compare alternative implementations of the readers.
+Use e.g. from FreeCAD's python console:
+	import importerBenchmark
+	importerBenchmark.benchmarkSatText('/path/to/file.sat')
+	importerBenchmark.benchmarkSabBinary('/path/to/file.sab')
+	importerBenchmark.benchmarkSegmentDispatch()
+	importerBenchmark.benchmarkDump('/path/to/file.ipt')
+	importerBenchmark.benchmarkMemory('/path/to/file.ipt')
+	importerBenchmark.benchmarkStages('/path/to/file.ipt')
+	importerBenchmark.benchmarkSuite('/path/to/benchmark.json', '/path/to/corpus')
+The suite also runs from the command line (FreeCAD's lib folder in the PYTHONPATH):
+	python importerBenchmark.py --output /path/to/benchmark.json --corpus /path/to/corpus
+'''
+
+import os, sys, io, json, time, uuid, shutil, tempfile, datetime, argparse, importerIL, Import_IPT, importerSAT, importerReader, importerSegment
+from math             import ceil, sqrt
+from struct           import Struct
+from FreeCAD          import ParamGet
+from importerUtils    import logAlways, logError, logWarning, setDumpMode, getSegmentWorkers, setSegmentWorkers
+from importerClasses  import getModel
+from importerSAT      import resolveNodes
+from importerBatch    import getAcisModels, collectFiles
+from Acis2Step        import export
+
+try:
+	import resource
+except:
+	resource = None # e.g. Windows
+
+try:
+	import tracemalloc
+except:
+	tracemalloc = None # python 2
+from importerClasses  import Segment, RSeSegment, VersionInfo, RSeStorageBlockType, RSeStorageBlockSize
+from importerSegment  import SegmentReader
+from Acis             import AcisReader, Header, version2int, buildFaceShapes, RANGE, SENSE, SENSEV, SIDES, BOOLEAN, CLOSURE, SINGULARITY, \
+                             TAG_CHAR, TAG_SHORT, TAG_LONG, TAG_FLOAT, TAG_DOUBLE, TAG_INT64, TAG_ENTITY_REF, TAG_ENUM_VALUE, TAG_POSITION, TAG_VECTOR_3D, TAG_VECTOR_2D, \
+                             TAG_UTF8_U8, TAG_UTF8_U16, TAG_UTF8_U32_A, TAG_UTF8_U32_B, TAG_IDENT, TAG_SUBIDENT, TAG_TRUE, TAG_FALSE, ACIS_CHUNK_TERMINATOR, \
+                             AcisChunkEntityRef, AcisChunkLong, AcisChunkDouble, AcisChunkPosition, AcisChunkVector3D, AcisChunkIdent, AcisChunkSubident, \
+                             AcisChunkUtf8U8, AcisChunkEnumValue, AcisChunkSubtypeOpen, AcisChunkSubtypeClose
+
+__author__     = 'Jens M. Plonka'
+__copyright__  = 'Copyright 2018, Germany'
+__url__        = "https://www.github.com/jmplonka/InventorLoader"
+
+def _timeit(action, repeat):
+	'''Returns the best time (in seconds) of repeat calls of action.'''
+	best = None
+	for i in range(repeat):
+		start = time.time()
+		action()
+		duration = time.time() - start
+		if ((best is None) or (duration < best)):
+			best = duration
+	return best
+
+def _readSatText(fileName, bulk):
+	with open(fileName, 'r') as stream:
+		reader = AcisReader(stream)
+		reader.readText(bulk)
+	return reader
+
+def benchmarkSatText(fileName, repeat = 3):
+	'''
+	Compares the character based scanner with the regular expression based
+	tokenizer for ACIS text files (*.sat).
+	Returns a dict with the best times (in seconds) of both readers.
+	'''
+	legacy  = _timeit(lambda: _readSatText(fileName, False), repeat)
+	bulk    = _timeit(lambda: _readSatText(fileName, True), repeat)
+	logAlways(u"SAT text '%s': scanner %.3fs, tokenizer %.3fs (x%.1f)", fileName, legacy, bulk, legacy / bulk if (bulk > 0) else 0.0)
+	return {'file': fileName, 'scanner': legacy, 'tokenizer': bulk}
+
+def _readSabBinary(data, batched):
+	reader = AcisReader(io.BytesIO(data))
+	reader.readBinary(batched)
+	return reader
+
+def benchmarkSabData(data, name = 'ASM', repeat = 3):
+	'''
+	Compares reading the chunks one by one with the batched decoder for ACIS
+	binary data, e.g. the ASM blocks of Inventor's BRep segments.
+	Returns a dict with the best times (in seconds) of both readers.
+	'''
+	single  = _timeit(lambda: _readSabBinary(data, False), repeat)
+	batched = _timeit(lambda: _readSabBinary(data, True), repeat)
+	logAlways(u"SAB binary '%s': single %.3fs, batched %.3fs (x%.1f)", name, single, batched, single / batched if (batched > 0) else 0.0)
+	return {'file': name, 'single': single, 'batched': batched}
+
+def benchmarkSabBinary(fileName, repeat = 3):
+	'''Compares both binary readers for an ACIS binary file (*.sab, *.smb).'''
+	with open(fileName, 'rb') as stream:
+		data = stream.read()
+	return benchmarkSabData(data, fileName, repeat)
+
+def _createSegment(count, types, size, unknown):
+	'''
+	Returns a synthetic segment with count blocks of size bytes and a reader
+	class for its block types. The last unknown block types have no reader.
+	'''
+	seg = Segment()
+	seg.segment = RSeSegment()
+	seg.segment.version = VersionInfo()
+	seg.segment.version.major = 23 # 2019
+	attributes = {}
+	for index in range(types):
+		blockType = RSeStorageBlockType(seg)
+		blockType.uid = uuid.uuid4()
+		seg.secBlkTyps[index] = blockType
+		if (index < types - unknown):
+			attributes['Read_%08X' %(blockType.uid.time_low)] = lambda self, node: 0
+	reader = type('BenchmarkReader', (SegmentReader,), attributes)
+	BLOCK = Struct('<L%dsLB' %(size))
+	data = bytearray()
+	for n in range(count):
+		data += BLOCK.pack(n % types, b'', size, 0)
+		seg.sec1.append(RSeStorageBlockSize(seg, 0x80000000 | size))
+	return seg, reader(seg), bytes(data)
+
+def _dispatchByName(reader, indices):
+	segment = reader.segment
+	for n in indices:
+		blockType = segment.secBlkTyps[n & 0xFF]
+		typeName = '%08X' % (blockType.uid.time_low)
+		getattr(reader, 'Read_%s' %(typeName), None)
+
+def _dispatchByTable(reader, indices):
+	blockTypes = reader.getBlockTypes()
+	for n in indices:
+		uid, typeName, readType = blockTypes[n & 0xFF]
+
+def benchmarkSegmentDispatch(count = 100000, types = 64, unknown = 4, repeat = 3):
+	'''
+	Compares resolving the node's reader by its type name with the segment's
+	table of block types for a synthetic segment. Also times reading the whole
+	segment and reports the counters of the block types without reader.
+	Returns a dict with the best times (in seconds).
+	'''
+	seg, reader, data = _createSegment(count, types, 8, unknown)
+	indices = [n % types for n in range(count)]
+	byName  = _timeit(lambda: _dispatchByName(reader, indices), repeat)
+	byTable = _timeit(lambda: _dispatchByTable(reader, indices), repeat)
+	segment = _timeit(lambda: reader.ReadSegmentData(None, data), repeat)
+	logAlways(u"Segment dispatch (%d blocks, %d types): by name %.3fs, by table %.3fs (x%.1f), segment %.3fs", count, types, byName, byTable, byName / byTable if (byTable > 0) else 0.0, segment)
+	return {'blocks': count, 'byName': byName, 'byTable': byTable, 'segment': segment, 'unknown': dict(reader.unknownTypes)}
+
+def _read(fileName, dump):
+	setDumpMode(dump)
+	try:
+		reader = importerIL.read(fileName)
+		if (reader is Import_IPT):
+			model = getModel()
+			for seg in model.RSeMetaData.values():
+				model.loadSegment(seg)
+		for acis in getAcisModels(reader):
+			resolveNodes(acis)
+	finally:
+		setDumpMode(None)
+		importerIL.releaseMemory()
+
+def benchmarkDump(fileName, repeat = 3):
+	'''
+	Compares reading a file (all segments and the ACIS entities) with and
+	without writing the debug files into the dump folder. Returns a dict with the best times (in seconds) and the time saved.
+	'''
+	dump   = _timeit(lambda: _read(fileName, True), repeat)
+	noDump = _timeit(lambda: _read(fileName, False), repeat)
+	logAlways(u"Dump '%s': with dump %.3fs, without %.3fs (saved %.3fs)", fileName, dump, noDump, dump - noDump)
+	return {'file': fileName, 'dump': dump, 'noDump': noDump, 'saved': dump - noDump}
+
+def _getPeakRSS():
+	'''Returns the peak resident set size of the process in mega bytes or None if unknown.'''
+	if (resource is None):
+		return None
+	rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	if (sys.platform == 'darwin'):
+		return rss / 1048576.0 # bytes
+	return rss / 1024.0 # kilo bytes
+
+def benchmarkMemory(fileName, trace = False):
+	'''
+	Reads the file (all segments and the ACIS entities) without dump files
+	and reports the peak RSS of the process. As the RSS never shrinks, run it
+	in a fresh process. With trace the peak of the memory allocated while
+	reading is determined by tracemalloc too (slow).
+	Returns a dict with the sizes in mega bytes.
+	'''
+	before = _getPeakRSS()
+	_read(fileName, False)
+	result = {'file': fileName, 'rssBefore': before, 'rssPeak': _getPeakRSS(), 'traced': None}
+	if (trace and (tracemalloc is not None)):
+		tracemalloc.start()
+		_read(fileName, False)
+		result['traced'] = tracemalloc.get_traced_memory()[1] / 1048576.0
+		tracemalloc.stop()
+	logAlways(u"Memory '%s': peak RSS %s MB (%s MB before), traced peak %s MB", fileName, result['rssPeak'], result['rssBefore'], result['traced'])
+	return result
+
+# ACIS models for the stage benchmark: planar and spline faces of 9x9 mm, each
+# with its own loop, and a history with a bulletin board per delta state.
+SYNTHETIC_SIZES = ((100, 10, 10), (1000, 100, 50), (5000, 500, 100)) # (faces, splines, delta states)
+
+BENCHMARK_EXTENSIONS = ('.ipt', '.iam', '.sat', '.sab', '.smb', '.smbh')
+
+STAGES = ('ole', 'decompress', 'segment', 'buildTree', 'acis', 'createEntity', 'shape', 'step')
+
+_SAB_FIXED = {
+	TAG_CHAR      : Struct('<BB'),
+	TAG_SHORT     : Struct('<Bh'),
+	TAG_LONG      : Struct('<Bl'),
+	TAG_FLOAT     : Struct('<Bf'),
+	TAG_DOUBLE    : Struct('<Bd'),
+	TAG_INT64     : Struct('<Bq'),
+	TAG_ENTITY_REF: Struct('<Bl'),
+	TAG_ENUM_VALUE: Struct('<BL'),
+}
+_SAB_ARRAYS = {
+	TAG_POSITION : Struct('<Bddd'),
+	TAG_VECTOR_3D: Struct('<Bddd'),
+	TAG_VECTOR_2D: Struct('<Bdd'),
+}
+_SAB_TEXTS = {
+	TAG_UTF8_U8   : Struct('<BB'),
+	TAG_IDENT     : Struct('<BB'),
+	TAG_SUBIDENT  : Struct('<BB'),
+	TAG_UTF8_U16  : Struct('<BH'),
+	TAG_UTF8_U32_A: Struct('<BL'),
+	TAG_UTF8_U32_B: Struct('<BL'),
+}
+_SAB_HEADER = Struct('<15sLLLL')
+
+__prmPrefBenchmark__ = ParamGet("User parameter:BaseApp/Preferences/Mod/InventorLoader")
+
+def getCorpusFolder():
+	'''Returns the folder with the real files for the stage benchmark or an empty string.'''
+	return __prmPrefBenchmark__.GetString('Benchmark.Corpus', '')
+
+def setCorpusFolder(folder):
+	__prmPrefBenchmark__.SetString('Benchmark.Corpus', folder)
+
+class SyntheticModel(object):
+	'''Records of a synthetic ACIS model, see createSyntheticModel.'''
+	def __init__(self, name):
+		self.name    = name
+		self.header  = Header()
+		self.header.version = 7.0
+		self.header.bodies  = 1
+		self.header.prodId  = 'InventorLoader'
+		self.header.prodVer = 'ACIS 7.0 synthetic'
+		self.records = []
+		self.history = []
+
+	def add(self, name, *chunks):
+		'''Appends a record and returns its index.'''
+		self.records.append((name, list(chunks) + [ACIS_CHUNK_TERMINATOR]))
+		return len(self.records) - 1
+
+def _ref(index):  return AcisChunkEntityRef(index)
+def _int(value):  return AcisChunkLong(value)
+def _dbl(value):  return AcisChunkDouble(value)
+def _pos(value):  return AcisChunkPosition(value)
+def _vec(value):  return AcisChunkVector3D(value)
+def _word(value): return AcisChunkIdent(value)
+def _flag(value, values): return AcisChunkEnumValue(TAG_TRUE if (value) else TAG_FALSE, TAG_TRUE if (value) else TAG_FALSE, values)
+def _enum(value, values): return AcisChunkEnumValue(TAG_ENUM_VALUE, value, values)
+
+_NONE = -1
+_INF  = (_flag(False, RANGE), _flag(False, RANGE)) # 'I I'
+
+def _addFace(model, shell, x, y, size, spline, last):
+	'''Adds a square face with its loop, coedges, edges, vertices and surface (23 records).'''
+	corners = ((x, y, 0.0), (x + size, y, 0.0), (x + size, y + size, 0.0), (x, y + size, 0.0))
+	base    = len(model.records)
+	face    = base
+	loop    = base + 1
+	coedges = [base + 2 + k for k in range(4)]
+	edges   = [base + 6 + k for k in range(4)]
+	verts   = [base + 10 + k for k in range(4)]
+	points  = [base + 14 + k for k in range(4)]
+	curves  = [base + 18 + k for k in range(4)]
+	surface = base + 22
+	nextFace = _NONE if (last) else (base + 23)
+	model.add('face', _ref(_NONE), _int(-1), _ref(_NONE), _ref(nextFace), _ref(loop), _ref(shell), _ref(_NONE), _ref(surface), _flag(False, SENSE), _flag(False, SIDES))
+	model.add('loop', _ref(_NONE), _int(-1), _ref(_NONE), _ref(_NONE), _ref(coedges[0]), _ref(face))
+	for k in range(4):
+		model.add('coedge', _ref(_NONE), _int(-1), _ref(_NONE), _ref(coedges[(k + 1) % 4]), _ref(coedges[(k + 3) % 4]), _ref(_NONE), _ref(edges[k]), _flag(False, SENSE), _ref(loop), _ref(_NONE))
+	for k in range(4):
+		model.add('edge', _ref(_NONE), _int(-1), _ref(_NONE), _ref(verts[k]), _dbl(0.0), _ref(verts[(k + 1) % 4]), _dbl(size), _ref(coedges[k]), _ref(curves[k]), _flag(False, SENSE), AcisChunkUtf8U8('unknown'))
+	for k in range(4):
+		model.add('vertex', _ref(_NONE), _int(-1), _ref(_NONE), _ref(edges[k]), _ref(points[k]))
+	for k in range(4):
+		model.add('point', _ref(_NONE), _int(-1), _ref(_NONE), _pos(corners[k]))
+	for k in range(4):
+		a, b = corners[k], corners[(k + 1) % 4]
+		direction = tuple((b[n] - a[n]) / size for n in range(3))
+		model.add('straight-curve', _ref(_NONE), _int(-1), _ref(_NONE), _pos(a), _vec(direction), *_INF)
+	if (spline):
+		# bicubic patch with straight borders in the XY-plane and a bump inside.
+		poles = []
+		for v in range(4):
+			for u in range(4):
+				z = 2.5 if ((u in (1, 2)) and (v in (1, 2))) else 0.0
+				poles.append(_pos((x + u * size / 3.0, y + v * size / 3.0, z)))
+		knots = [_dbl(0.0), _int(3), _dbl(1.0), _int(3)]
+		model.add('spline-surface', _ref(_NONE), _int(-1), _ref(_NONE), _flag(False, SENSE), AcisChunkSubtypeOpen(),
+			_word('exactsur'), _enum(0, SINGULARITY), _word('nubs'), _int(3), _int(3),
+			_enum(0, CLOSURE), _enum(0, CLOSURE), _enum(2, SINGULARITY), _enum(2, SINGULARITY), _int(2), _int(2),
+			*(knots + knots + poles + [_dbl(0.0)] + [_int(0)] * 6 + list(_INF + _INF) + [AcisChunkSubtypeClose()] + list(_INF + _INF)))
+	else:
+		model.add('plane-surface', _ref(_NONE), _int(-1), _ref(_NONE), _pos(corners[0]), _vec((0.0, 0.0, 1.0)), _vec((1.0, 0.0, 0.0)), _flag(False, SENSEV), *(_INF + _INF))
+	return face
+
+def createSyntheticModel(faces = 100, splines = 10, states = 10, name = None):
+	'''
+	Returns a synthetic ACIS model (version 7.0) with one sheet body of faces
+	planar and splines spline faces and a history of states delta states.
+	'''
+	if (name is None):
+		name = 'synthetic_f%d_s%d_h%d' %(faces, splines, states)
+	model = SyntheticModel(name)
+	count = faces + splines
+	model.add('body', _ref(_NONE), _int(-1), _ref(_NONE), _ref(1), _ref(_NONE), _ref(_NONE))
+	model.add('lump', _ref(_NONE), _int(-1), _ref(_NONE), _ref(_NONE), _ref(2), _ref(0))
+	model.add('shell', _ref(_NONE), _int(-1), _ref(_NONE), _ref(_NONE), _ref(_NONE), _ref(3 if (count > 0) else _NONE), _ref(_NONE), _ref(1))
+	columns = max(1, int(ceil(sqrt(count))))
+	created = []
+	for n in range(count):
+		x = (n % columns) * 12.0
+		y = (n // columns) * 12.0
+		created.append(_addFace(model, 2, x, y, 9.0, n >= faces, n == count - 1)) # poles on a 3mm grid => exact in text files
+	if (states > 0):
+		model.history.append(('Begin-of-ACIS-History-Data', [_word('history_stream'), _int(states), _int(states), _int(0), _int(0), _ref(states - 1), _ref(0), _ref(states - 1), _ref(_NONE), ACIS_CHUNK_TERMINATOR]))
+		for ds in range(states):
+			chunks = [_int(ds), _int(1), _int(0), _ref(ds - 1), _ref(ds + 1 if (ds + 1 < states) else _NONE), _ref(ds), _ref(_NONE), _ref(0), _flag(False, BOOLEAN)]
+			# each state's bulletin board lists the faces it created.
+			chunks += [_int(1), _ref(ds), _int(2)]
+			for face in created[ds::states]:
+				chunks += [_int(1), _ref(_NONE), _ref(face)]
+			chunks += [_int(0), _int(0), _int(0), ACIS_CHUNK_TERMINATOR]
+			model.history.append(('delta_state', chunks))
+	return model
+
+def _getSatChunk(chunk):
+	if (chunk.tag == TAG_POSITION):
+		return repr(chunk) # the synthetic models have the scale 1.0
+	return u"%s" %(chunk)
+
+def writeSat(fileName, model):
+	'''Writes the synthetic model as ACIS text file (*.sat).'''
+	model.header.records = len(model.records)
+	with io.open(fileName, 'wt', encoding='utf-8') as sat:
+		sat.write(u"%s" %(model.header))
+		for index, (name, chunks) in enumerate(model.records):
+			sat.write(u"-%d %s %s\n" %(index, name, ''.join(_getSatChunk(c) for c in chunks)))
+		if (len(model.history) > 0):
+			name, chunks = model.history[0]
+			sat.write(u"%s %s\n" %(name, ''.join(_getSatChunk(c) for c in chunks)))
+			for index, (name, chunks) in enumerate(model.history[1:]):
+				sat.write(u"-%d %s %s\n" %(index, name, ''.join(_getSatChunk(c) for c in chunks)))
+			sat.write(u"End-of-ACIS-History-Section\n")
+		sat.write(u"End-of-ACIS-data\n")
+	return fileName
+
+def _getSabChunk(chunk):
+	tag = chunk.tag
+	st  = _SAB_FIXED.get(tag)
+	if (st is not None):
+		return st.pack(tag, chunk.val)
+	st = _SAB_ARRAYS.get(tag)
+	if (st is not None):
+		return st.pack(tag, *chunk.val)
+	st = _SAB_TEXTS.get(tag)
+	if (st is not None):
+		text = chunk.val.encode('utf8')
+		return st.pack(tag, len(text)) + text
+	return bytes(bytearray((tag,))) # chunks without data: T, F, {, }, #
+
+def _getSabName(name):
+	names = name.split('-')
+	return b''.join([_getSabChunk(AcisChunkSubident(n)) for n in names[:-1]]) + _getSabChunk(AcisChunkIdent(names[-1]))
+
+def writeSab(fileName, model):
+	'''Writes the synthetic model as ACIS binary file (*.sab).'''
+	header = model.header
+	data   = bytearray(_SAB_HEADER.pack(b'ACIS BinaryFile', version2int(header.version), len(model.records), header.bodies, header.flags))
+	for chunk in (AcisChunkUtf8U8(header.prodId), AcisChunkUtf8U8(header.prodVer), AcisChunkUtf8U8(header.date), AcisChunkDouble(header.scale), AcisChunkDouble(header.resabs), AcisChunkDouble(header.resnor)):
+		data += _getSabChunk(chunk)
+	records = model.records + model.history
+	if (len(model.history) > 0):
+		records = records + [('End-of-ACIS-History-Section', [])]
+	for name, chunks in records + [('End-of-ACIS-data', [])]:
+		data += _getSabName(name)
+		for chunk in chunks:
+			data += _getSabChunk(chunk)
+	with open(fileName, 'wb') as sab:
+		sab.write(data)
+	return fileName
+
+def createCorpus(folder, sizes = SYNTHETIC_SIZES):
+	'''
+	Writes the synthetic models for the sizes (faces, splines, delta states)
+	into the folder, each as text (*.sat) and as binary file (*.sab).
+	Returns the list of files.
+	'''
+	if (not os.path.exists(folder)):
+		os.makedirs(folder)
+	files = []
+	for faces, splines, states in sizes:
+		model = createSyntheticModel(faces, splines, states)
+		files.append(writeSat(os.path.join(folder, model.name + '.sat'), model))
+		files.append(writeSab(os.path.join(folder, model.name + '.sab'), model))
+	return files
+
+class _StageTimer(object):
+	'''
+	Sums up the times spent in the stages. Functions can be wrapped to count
+	as stage. The time of a nested stage is not counted for the outer one.
+	'''
+	def __init__(self):
+		self.times    = {}
+		self.failed   = None # the innermost stage that raised an exception
+		self._nested  = []
+		self._wrapped = []
+
+	def measure(self, stage, action):
+		self._nested.append(0.0)
+		start = time.time()
+		try:
+			return action()
+		except:
+			if (self.failed is None):
+				self.failed = stage
+			raise
+		finally:
+			duration = time.time() - start
+			nested   = self._nested.pop()
+			self.times[stage] = self.times.get(stage, 0.0) + duration - nested
+			if (len(self._nested) > 0):
+				self._nested[-1] += duration
+
+	def wrap(self, owner, name, stage):
+		function = getattr(owner, name)
+		def timed(*args, **kwargs):
+			return self.measure(stage, lambda: function(*args, **kwargs))
+		setattr(owner, name, timed)
+		self._wrapped.append((owner, name, function))
+
+	def restore(self):
+		for owner, name, function in reversed(self._wrapped):
+			setattr(owner, name, function)
+		self._wrapped = []
+
+def _buildShapes(bodies):
+	count = 0
+	for body in bodies:
+		for lump in body.getLumps():
+			for shell in lump.getShells():
+				count += len([face for face in buildFaceShapes(shell.getFaces()) if (face is not None)])
+	return count
+
+def _readStages(fileName, timer):
+	ext = os.path.splitext(fileName)[1].lower()
+	if (ext == '.sat'):
+		return importerSAT if (importerSAT.readText(fileName)) else None
+	if (ext in ('.sab', '.smb', '.smbh')):
+		return importerSAT if (importerSAT.readBinary(fileName)) else None
+	ole = timer.measure('ole', lambda: Import_IPT.checkVersion(fileName))
+	if ((ole is None) or (not timer.measure('ole', lambda: Import_IPT.read(ole)))):
+		return None
+	model = getModel()
+	for seg in list(model.RSeMetaData.values()):
+		model.loadSegment(seg)
+	return Import_IPT
+
+def _runStages(fileName):
+	'''
+	Reads the file and converts its ACIS models once. Returns the times of the
+	stages, the number of faces, the failed stage and the error. The times of
+	the stages measured before an error are kept.
+	'''
+	timer = _StageTimer()
+	timer.wrap(importerReader, 'UncompressRSeMetaDataB', 'decompress')
+	timer.wrap(importerReader, 'ReadRSeSegmentData', 'segment')
+	timer.wrap(importerSegment, 'buildTree', 'buildTree')
+	timer.wrap(AcisReader, 'readText', 'acis')
+	timer.wrap(AcisReader, 'readBinary', 'acis')
+	faces = 0
+	error = None
+	try:
+		reader = _readStages(fileName, timer)
+		if (reader is None):
+			raise ValueError(u"Can't read file!")
+		for acis in getAcisModels(reader):
+			bodies = timer.measure('createEntity', lambda: resolveNodes(acis))
+			faces += timer.measure('shape', lambda: _buildShapes(bodies))
+			timer.measure('step', lambda: export(acis.name, acis.header, bodies, io.StringIO()))
+	except Exception as e:
+		error = u"%s" %(e)
+	finally:
+		timer.restore()
+		importerIL.releaseMemory()
+	return timer.times, faces, timer.failed, error
+
+def benchmarkStages(fileName, repeat = 3):
+	'''
+	Times the stages of reading and converting the file: OLE read, zlib
+	decompress, segment decode, buildTree, ACIS decode, createEntity, shape
+	build and STEP export. The segments are read sequentially and without
+	dump files, so that each stage is measured in this process.
+	Returns a dict with the best times (in seconds) of the stages. If a run
+	fails, the stage that failed and the error are recorded, the times of the
+	stages measured before are kept.
+	'''
+	result  = {'file': fileName, 'size': os.path.getsize(fileName), 'stages': {}, 'total': None, 'faces': 0, 'failed': None, 'error': None}
+	workers = getSegmentWorkers()
+	setSegmentWorkers(0)
+	setDumpMode(False)
+	try:
+		for i in range(repeat):
+			times, faces, failed, error = _runStages(fileName)
+			for stage, duration in times.items():
+				if (stage != failed): # the failed stage's time is incomplete
+					best = result['stages'].get(stage)
+					if ((best is None) or (duration < best)):
+						result['stages'][stage] = duration
+			if (error is not None):
+				result['failed'] = failed
+				result['error']  = error
+				break
+			result['faces'] = faces
+			total = sum(times.values())
+			if ((result['total'] is None) or (total < result['total'])):
+				result['total'] = total
+	finally:
+		setSegmentWorkers(workers)
+		setDumpMode(None)
+	stages = ", ".join(u"%s %.3fs" %(stage, result['stages'][stage]) for stage in STAGES if (stage in result['stages']))
+	if (result['error'] is None):
+		logAlways(u"Stages '%s': %s (%.3fs)", fileName, stages, result['total'])
+	else:
+		logError(u"Can't benchmark '%s' - stage '%s' failed: %s (%s)", fileName, result['failed'], result['error'], stages)
+	return result
+
+def benchmarkSuite(reportFile, corpus = None, sizes = SYNTHETIC_SIZES, repeat = 3):
+	'''
+	Runs the stage benchmark for the synthetic models of the sizes and the
+	files of the corpus folder (default: the preference, see setCorpusFolder)
+	and writes the results into the JSON report file, e.g. for nightly runs:
+		FreeCADCmd -c "import importerBenchmark; importerBenchmark.benchmarkSuite('/path/to/benchmark.json', '/path/to/corpus')"
+	Returns the report as dict.
+	'''
+	if (corpus is None):
+		corpus = getCorpusFolder()
+	start = time.time()
+	tmp   = tempfile.mkdtemp(prefix='InventorLoader_')
+	try:
+		files = [(f, 'synthetic') for f in createCorpus(tmp, sizes)]
+		if (corpus and os.path.isdir(corpus)):
+			files += [(f, 'corpus') for f in collectFiles([corpus]) if (os.path.splitext(f)[1].lower() in BENCHMARK_EXTENSIONS)]
+		elif (corpus):
+			logWarning(u"Corpus folder '%s' doesn't exist!", corpus)
+		results = []
+		for fileName, kind in files:
+			result = benchmarkStages(fileName, repeat)
+			result['kind'] = kind
+			if (kind == 'synthetic'):
+				result['file'] = os.path.basename(fileName)
+			results.append(result)
+	finally:
+		shutil.rmtree(tmp, True)
+	report = {
+		'date'  : datetime.datetime.now().isoformat(),
+		'python': sys.version.split()[0],
+		'repeat': repeat,
+		'corpus': corpus,
+		'total' : time.time() - start,
+		'failed': len([r for r in results if (r['error'] is not None)]),
+		'files' : results,
+	}
+	with io.open(reportFile, 'wt', encoding="UTF-8") as f:
+		json.dump(report, f, indent=2)
+	logAlways(u"Benchmarked %d files in %.1fs - see '%s'.", len(results), report['total'], reportFile)
+	return report
+
+def main(argv = None):
+	parser = argparse.ArgumentParser(description='Times the stages of reading Autodesk Inventor and ACIS files.')
+	parser.add_argument('-o', '--output', required=True, help='JSON report file')
+	parser.add_argument('-c', '--corpus', default=None, help='folder with real files (default: preference Benchmark.Corpus)')
+	parser.add_argument('-r', '--repeat', type=int, default=3, help='number of runs per file (default: 3)')
+	parser.add_argument('-s', '--size', nargs=3, type=int, action='append', metavar=('FACES', 'SPLINES', 'STATES'), help='size of a synthetic model (default: %s)' %(' '.join('%d,%d,%d' %(s) for s in SYNTHETIC_SIZES)))
+	args = parser.parse_args(argv)
+	report = benchmarkSuite(args.output, args.corpus, args.size or SYNTHETIC_SIZES, args.repeat)
+	return 0 if (report['failed'] == 0) else 1
+
+if __name__ == '__main__':
+	sys.exit(main())
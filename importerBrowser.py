@@ -8,6 +8,7 @@ The importer can read files from Autodesk (R) Invetor (R) Inventro V2010 on. Old
 
 from importerSegment   import SegmentReader, checkReadAll
 from importerUtils     import *
+from importerLayout    import layout
 from importerConstants import VAL_UINT16, VAL_UINT32, VAL_ENUM
 import importerSegNode
 
@@ -21,6 +22,12 @@ class BrowserReader(SegmentReader):
 		super(BrowserReader, self).__init__(segment)
 		self.__Str53_u16_0 = 0
 
+	def getLayoutState(self):
+		return self.__Str53_u16_0
+
+	def restoreLayoutState(self, node, state):
+		self.__Str53_u16_0 = state
+
 	def Read_664(self, offset, node):
 		i = node.ReadUInt32(offset, 'index')
 		i = node.ReadUInt32(i, 'a2a')
@@ -75,6 +82,7 @@ class BrowserReader(SegmentReader):
 		i = node.ReadSInt32A(i, 2, 'a1')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0 t16 u32:grIdx', 'Read_Header0')
 	def Read_189B3560(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -110,6 +118,7 @@ class BrowserReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('lst7<MAP_KEY_REF>:entries u32:u32_0', 'Read_Header0', 'EntryManager')
 	def Read_B251BFC0(self, node): # EntryManager
 		i = node.Read_Header0('EntryManager')
 		i = node.ReadList7(i, importerSegNode._TYP_MAP_KEY_REF_, 'entries')
@@ -164,6 +173,7 @@ class BrowserReader(SegmentReader):
 		i = self.skipBlockSize(i, 3)
 		return i
 
+	@layout('lst2<SINT32>:lst0 u32[3]:a1 bool:b1 u32[3]:a2 bool:b2 u32[2]:a3 bool:b3 t16:txt1 t16:txt2', 'Read_Header0')
 	def Read_D9F96B81(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i,  importerSegNode._TYP_SINT32_, 'lst0')
@@ -177,6 +187,7 @@ class BrowserReader(SegmentReader):
 		i = node.ReadLen32Text16(i, 'txt2')
 		return i
 
+	@layout('s uid:uid_0 t16 u32:u32_0', 'Read_Header0')
 	def Read_DDC7ED24(self, node):
 		i = node.Read_Header0()
 		i = self.skipBlockSize(i)
@@ -185,6 +196,7 @@ class BrowserReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('pref cref:ref_0 t16 lst4<STRING8>:lst0 u16:u16 t16:val', 'Read_Header0')
 	def Read_DF9CA7B0(self, node):
 		i = node.Read_Header0()
 		i = node.ReadParentRef(i)
@@ -280,6 +292,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderFolderItem(node)
 		return i
 
+	@layout('xref:ref_0 u32:u32_1 bool:b4 xref:ref_1 xref:ref_3 xref:ref_4 xref:ref_5 (x[4])>2010', 'ReadHeaderFolderItem')
 	def Read_2524F6EB(self, node): # AmDocEntry
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadCrossRef(i, 'ref_0')
@@ -292,11 +305,13 @@ class BrowserReader(SegmentReader):
 		if (self.version > 2010): i += 4
 		return i
 
+	@layout('u32:u32_2', 'ReadHeaderFolderItem')
 	def Read_2AFABC56(self, node): # AmWeldSymMember
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_2 s', 'ReadHeaderFolderItem')
 	def Read_2C57678C(self, node): # AmAssemblyFeaturesFolder
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
@@ -308,6 +323,7 @@ class BrowserReader(SegmentReader):
 		i = node.ReadCrossRef(i, 'ref_0')
 		return i
 
+	@layout('u32:u32_2', 'ReadHeaderFolderItem')
 	def Read_41289EFF(self, node): # AmAssemblyFeatureParticipant
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
@@ -325,29 +341,34 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderFolderItem(node)
 		return i
 
+	@layout('uid:uid u32:u32_2', 'ReadHeaderFolderItem')
 	def Read_562BDC08(self, node): # AmConfiguration
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUUID(i, 'uid')
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_3', 'ReadHeaderFolderItem')
 	def Read_58732973(self, node): # AmAssemblyFeaturesFolder
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32(i, 'u32_3')
 		return i
 
+	@layout('u32:u32_3 s', 'ReadHeaderFolderItem')
 	def Read_5900CD82(self, node): # AmConfigurationsFolder
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32(i, 'u32_3')
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32[2]:a1 x[4]', 'ReadHeaderFolderItem')
 	def Read_5913EBD7(self, node): # AmAssemblyFeature
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32A(i, 2, 'a1')
 		i += 4
 		return i
 
+	@layout('u32:u32_3 s', 'ReadHeaderFolderItem')
 	def Read_60BEF47B(self, node): # BrowserFolder
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32(i, 'u32_3')
@@ -358,11 +379,13 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderFolderItem(node)
 		return i
 
+	@layout('u32[2]:a0', 'ReadHeaderFolderItem', 'AnalysisToolEntry')
 	def Read_716B5CD1(self, node): # ATEntry
 		i = self.ReadHeaderFolderItem(node, 'AnalysisToolEntry')
 		i = node.ReadUInt32A(i, 2, 'a0')
 		return i
 
+	@layout('u32:u32_1 x[4]', 'ReadHeaderFolderItem')
 	def Read_7427F757(self, node): # AmAssemblyFeature
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -391,6 +414,7 @@ class BrowserReader(SegmentReader):
 		i = node.ReadSInt32(i, 's32_0')
 		return i
 
+	@layout('s32:s32_0 t16:str0 u32[2]:a0', 'ReadHeaderFolderItem')
 	def Read_7DFCC818(self, node): # BucketEntry
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -402,6 +426,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderFolderItem(node)
 		return i
 
+	@layout('u32[4]:a4', 'ReadHeaderFolderItem')
 	def Read_83FB036D(self, node):
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32A(i, 4, 'a4')
@@ -411,6 +436,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderFolderItem(node)
 		return i
 
+	@layout('u32:u32_2 u8:u8_6', 'ReadHeaderFolderItem')
 	def Read_9180FF9F(self, node): # OriginWorkFeatureEntry
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
@@ -421,6 +447,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderFolderItem(node)
 		return i
 
+	@layout('u32:u32_3 s', 'ReadHeaderFolderItem')
 	def Read_9FFCDAFC(self, node): # AmConfigurationsFolder
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32(i, 'u32_3')
@@ -431,11 +458,13 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderFolderItem(node)
 		return i
 
+	@layout('u8:u8_6', 'ReadHeaderFolderItem')
 	def Read_A742A7CD(self, node): # AmAssemblyFeature
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt8(i, 'u8_6')
 		return i
 
+	@layout('u32[5]:a4 s[2] u32:u32_3', 'ReadHeaderFolderItem')
 	def Read_AB12B392(self, node): # AssmMateInterfaceResultEntry
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32A(i, 5, 'a4')
@@ -443,6 +472,7 @@ class BrowserReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_3')
 		return i
 
+	@layout('u32[5]:a4 s[2]', 'ReadHeaderFolderItem')
 	def Read_AB12B393(self, node): # AssmFlushInterfaceResultEntry
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32A(i, 5, 'a4')
@@ -453,22 +483,26 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderFolderItem(node)
 		return i
 
+	@layout('u32[5]:a4 s[2]', 'ReadHeaderFolderItem')
 	def Read_AB12B396(self, node): # AssmInsertInterfaceResultEntry
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32A(i, 5, 'a4')
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_2', 'ReadHeaderFolderItem')
 	def Read_CA0059C5(self, node): # AmWeldingSymbol
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32[5]:a4', 'ReadHeaderFolderItem')
 	def Read_CAFCADC8(self, node): # AmSymmetryEntry
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32A(i, 5, 'a4')
 		return i
 
+	@layout('u32:u32_3 s xref:ref_0 (x[4])<2012', 'ReadHeaderFolderItem')
 	def Read_CC79C7E9(self, node): # AmRepresentationFolder
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32(i, 'u32_3')
@@ -477,6 +511,7 @@ class BrowserReader(SegmentReader):
 		if (self.version < 2012): i += 4 # skip REF
 		return i
 
+	@layout('s32:s32_0 t16:str2 t16:str3 cref:ref_0', 'ReadHeaderFolderItem')
 	def Read_D95A2DF2(self, node): # OleLinkAndEmbedEntry
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -493,11 +528,13 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderFolderItem(node)
 		return i
 
+	@layout('u32[2]:a4', 'ReadHeaderFolderItem')
 	def Read_E50694D7(self, node): # AmPatternElementEntry
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt32A(i, 2, 'a4')
 		return i
 
+	@layout('s u32:u32_2', 'ReadHeaderFolderItem')
 	def Read_E9AC0931(self, node): # AmViewRep
 		i = self.ReadHeaderFolderItem(node)
 		i = self.skipBlockSize(i)
@@ -508,6 +545,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderFolderItem(node)
 		return i
 
+	@layout('s uid:uid u32:u32_2 t16 u16[3]:a4 s', 'ReadHeaderFolderItem')
 	def Read_F02052E0(self, node): # AmConfiguration
 		i = self.ReadHeaderFolderItem(node)
 		i = self.skipBlockSize(i)
@@ -518,6 +556,7 @@ class BrowserReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u16[3]:a4 t16:txt_2', 'ReadHeaderFolderItem')
 	def Read_FEFA39AB(self, node): # AmDeselTable
 		i = self.ReadHeaderFolderItem(node)
 		i = node.ReadUInt16A(i, 3, 'a4')
@@ -575,17 +614,20 @@ class BrowserReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_3')
 		return i
 
+	@layout('u32:u32_2 s', 'ReadHeaderHospitalItem')
 	def Read_09CB9718(self, node):
 		i = self.ReadHeaderHospitalItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_2', 'ReadHeaderHospitalItem')
 	def Read_2AFDB131(self, node):
 		i = self.ReadHeaderHospitalItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_2 s s u32:u32_3', 'ReadHeaderHospitalItem')
 	def Read_44DBCB35(self, node):
 		i = self.ReadHeaderHospitalItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
@@ -594,6 +636,7 @@ class BrowserReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_3')
 		return i
 
+	@layout('u32:u32_2 s', 'ReadHeaderHospitalItem')
 	def Read_52879851(self, node):
 		i = self.ReadHeaderHospitalItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
@@ -606,17 +649,20 @@ class BrowserReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_2', 'ReadHeaderHospitalItem')
 	def Read_AC1898AD(self, node):
 		i = self.ReadHeaderHospitalItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_2 u32:u32_3', 'ReadHeaderHospitalItem')
 	def Read_9B451345(self, node):
 		i = self.ReadHeaderHospitalItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
 		i = node.ReadUInt32(i, 'u32_3')
 		return i
 
+	@layout('u32:u32_2 u32:u32_3', 'ReadHeaderHospitalItem')
 	def Read_CCA058B3(self, node):
 		i = self.ReadHeaderHospitalItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
@@ -630,12 +676,14 @@ class BrowserReader(SegmentReader):
 		i = node.ReadUInt8(i, 'u8_2')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0 u32:u32_2', 'ReadHeaderHospitalItem')
 	def Read_D2B2DF09(self, node):
 		i = self.ReadHeaderHospitalItem(node)
 		i = node.ReadList2(i,  importerSegNode._TYP_NODE_REF_, 'lst0')
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_2 u32:u32_3 u16:u16_2', 'ReadHeaderHospitalItem')
 	def Read_E7E4F967(self, node):
 		i = self.ReadHeaderHospitalItem(node)
 		i = node.ReadUInt32(i, 'u32_2')
@@ -680,6 +728,7 @@ class BrowserReader(SegmentReader):
 		node.Entry = True
 		return i
 
+	@layout('u32:folderIdx', 'ReadHeaderEntry', 'FolderAnnotations')
 	def Read_0C775998(self, node): # Annotations folder
 		i = self.ReadHeaderEntry(node, 'FolderAnnotations')
 		i = node.ReadUInt32(i, 'folderIdx')
@@ -723,6 +772,7 @@ class BrowserReader(SegmentReader):
 			i = node.ReadLen32Text16(i, 'path')
 		return i
 
+	@layout('u32[2]:a4', 'ReadHeaderEntry', 'MeshFeature')
 	def Read_363E8E7D(self, node): # Mesh Feature
 		i = self.ReadHeaderEntry(node, 'MeshFeature')
 		i = node.ReadUInt32A(i, 2, 'a4')
@@ -732,6 +782,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderEntry(node, 'Drawing')
 		return i
 
+	@layout('u32:u32_2 s', 'ReadHeaderEntry', 'Project2Surface')
 	def Read_3E54E601(self, node): # Project to Surface
 		i = self.ReadHeaderEntry(node, 'Project2Surface')
 		i = node.ReadUInt32(i, 'u32_2')
@@ -757,6 +808,7 @@ class BrowserReader(SegmentReader):
 		node.ReadUInt16A(i, cnt, 'a5')
 		return i
 
+	@layout('u8:u8_5 (x[8])>2016 (x[4])>2020', 'ReadHeaderEntry', '3dObject')
 	def Read_50C73580(self, node): # 3D-Object
 		i = self.ReadHeaderEntry(node, '3dObject')
 		i = node.ReadUInt8(i, 'u8_5')
@@ -782,6 +834,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderEntry(node)
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderEntry')
 	def Read_761C4FA0(self, node):
 		i = self.ReadHeaderEntry(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -795,6 +848,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderEntry(node, 'DirectEdit')
 		return i
 
+	@layout('u8[3]:a4 t16:str0', 'ReadHeaderEntry', 'Table')
 	def Read_84FA6B6C(self, node): # Table
 		i = self.ReadHeaderEntry(node, 'Table')
 		i = node.ReadUInt8A(i, 3, 'a4')
@@ -808,11 +862,13 @@ class BrowserReader(SegmentReader):
 			i = node.ReadUInt32A(i, 5, 'a4')
 		return i
 
+	@layout('u16[2]:a4', 'ReadHeaderEntry')
 	def Read_8BF242F4(self, node): # ???
 		i = self.ReadHeaderEntry(node)
 		i = node.ReadUInt16A(i, 2, 'a4')
 		return i
 
+	@layout('u16[2]:a4 u32:NtIdx', 'ReadHeaderEntry', 'Edges')
 	def Read_8C5986A1(self, node): # Edges
 		i = self.ReadHeaderEntry(node, 'Edges')
 		i = node.ReadUInt16A(i, 2, 'a4')
@@ -878,6 +934,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderEntry(node, 'ContourFlange')
 		return i
 
+	@layout('uid:ui', 'ReadHeaderEntry', 'ReferenceSolid')
 	def Read_C0465062(self, node): # Solid reference
 		i = self.ReadHeaderEntry(node, 'ReferenceSolid')
 		i = node.ReadUUID(i, 'ui')
@@ -891,6 +948,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderEntry(node, 'Refold')
 		return i
 
+	@layout('u32:dcCreatorIdx u32[2]:a5', 'ReadHeaderEntry', 'Body')
 	def Read_DD1ADF96(self, node): # Body
 		i = self.ReadHeaderEntry(node, 'Body')
 		i = node.ReadUInt32(i, 'dcCreatorIdx')
@@ -924,6 +982,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderEntry(node, 'Unfold')
 		return i
 
+	@layout('uid:ui', 'ReadHeaderEntry', 'ReferenceSurface')
 	def Read_EAFCF33F(self, node): # Surface reference
 		i = self.ReadHeaderEntry(node, 'ReferenceSurface')
 		i = node.ReadUUID(i, 'ui')
@@ -976,6 +1035,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderEntryConstraint(node, 'Rotation')
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderEntryConstraint', 'Mate')
 	def Read_98D79BB0(self, node): # AmMateEntry
 		i = self.ReadHeaderEntryConstraint(node, 'Mate')
 		i = node.ReadUInt32(i, 'u32_1')
@@ -1057,6 +1117,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderDxHierarchy(node)
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderDxHierarchy', 'Scene')
 	def Read_28F1F886(self, node):
 		i = self.ReadHeaderDxHierarchy(node, 'Scene')
 		i = node.ReadUInt32(i, 'u32_1')
@@ -1068,11 +1129,13 @@ class BrowserReader(SegmentReader):
 			x, i = getFloat64(node.data, i) # skip
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderDxHierarchy', 'Presentation')
 	def Read_51F99C85(self, node): # DxBrowser
 		i = self.ReadHeaderDxHierarchy(node, 'Presentation')
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderDxHierarchy')
 	def Read_959A9EA0(self, node):
 		i = self.ReadHeaderDxHierarchy(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -1102,6 +1165,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderDxHierarchy(node)
 		return i
 
+	@layout('f64:x', 'ReadHeaderDxHierarchy', 'TweakMember')
 	def Read_F4BF99A1(self, node):
 		i = self.ReadHeaderDxHierarchy(node, 'TweakMember')
 		i = node.ReadFloat64(i, 'x')
@@ -1194,6 +1258,7 @@ class BrowserReader(SegmentReader):
 		i = self.ReadHeaderDxHierarchy(node)
 		return i
 
+	@layout('u32:u32_1 t16:part', 'ReadHeaderDxHierarchy')
 	def Read_C2D84C27(self, node):
 		i = self.ReadHeaderDxHierarchy(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+'''
+importerCache.py:
+Persistent cache for the parsed models. Reading an Inventor, ACIS or Fusion360
+file again skips the whole decoding and restores the model from a compressed
+snapshot instead. The snapshot is keyed by the file's content and the cache
+version, so changed files or a changed reader won't pick up stale data.
+'''
+
+import os, sys, hashlib, pickle, zlib, importlib
+from FreeCAD       import ParamGet
+from importerUtils import logInfo, logWarning, setDumpFolder, chooseImportStrategy, getContext, setContext
+
+__author__     = 'Jens M. Plonka'
+__copyright__  = 'Copyright 2018, Germany'
+__url__        = "https://www.github.com/jmplonka/InventorLoader"
+
+# Increase whenever the parsed structures change!
+CACHE_VERSION = 8
+
+CACHE_EXTENSIONS = ('.ipt', '.iam', '.ipn', '.idw', '.sat', '.sab', '.smb', '.smbh', '.f3d')
+OLE_EXTENSIONS   = ('.ipt', '.iam', '.ipn', '.idw')
+
+# module variables of the readers that are set while reading a file.
+_READER_STATE = {
+	'importerSAT': ('_fileName',),
+	'importerF3D': ('smb_files', 'bulk_data', 'meta_data', 'sketches', 'refs'),
+}
+
+_SUFFIX = '.ilc'
+
+__prmPrefCache__ = ParamGet("User parameter:BaseApp/Preferences/Mod/InventorLoader")
+
+def isCacheEnabled():
+	return __prmPrefCache__.GetBool('Cache.Enabled', False)
+
+def setCacheEnabled(enabled):
+	__prmPrefCache__.SetBool('Cache.Enabled', enabled)
+
+def getCacheFolder():
+	folder = __prmPrefCache__.GetString('Cache.Folder', '')
+	if (len(folder) == 0):
+		folder = os.path.join(os.path.expanduser('~'), '.InventorLoader', 'cache')
+	return folder
+
+def setCacheFolder(folder):
+	__prmPrefCache__.SetString('Cache.Folder', folder)
+
+def getCacheSize():
+	'''Returns the maximum size of the cache in mega bytes.'''
+	return __prmPrefCache__.GetInt('Cache.SizeMB', 512)
+
+def setCacheSize(size):
+	__prmPrefCache__.SetInt('Cache.SizeMB', size)
+
+def getKey(filename):
+	'''
+	Returns the cache key for the file or None if the file shall not be cached.
+	'''
+	if (not isCacheEnabled()):
+		return None
+	ext = os.path.splitext(filename)[1].lower()
+	if (ext not in CACHE_EXTENSIONS):
+		return None
+	sha = hashlib.sha256()
+	try:
+		with open(filename, 'rb') as f:
+			for block in iter(lambda: f.read(0x100000), b''):
+				sha.update(block)
+	except Exception as e:
+		logWarning(u"Can't determine cache key for '%s' - %s", filename, e)
+		return None
+	return u"%s-%d-%d%d" %(sha.hexdigest(), CACHE_VERSION, sys.version_info[0], sys.version_info[1])
+
+def _getCacheFile(key):
+	return os.path.join(getCacheFolder(), key + _SUFFIX)
+
+def _getState(reader):
+	state = {}
+	state['reader']  = reader.__name__
+	state['context'] = getContext()
+	names = _READER_STATE.get(reader.__name__, ())
+	state['module'] = dict((name, getattr(reader, name)) for name in names)
+	return state
+
+def _setState(state):
+	reader = importlib.import_module(state['reader'])
+	setContext(state['context'])
+	for name, value in state['module'].items():
+		setattr(reader, name, value)
+	return reader
+
+def load(filename, key):
+	'''
+	Restores the model of the file from the cache.
+	Returns the reader module or None if the file isn't cached.
+	'''
+	if (key is None):
+		return None
+	cacheFile = _getCacheFile(key)
+	if (not os.path.exists(cacheFile)):
+		return None
+	try:
+		with open(cacheFile, 'rb') as f:
+			state = pickle.loads(zlib.decompress(f.read()))
+		reader = _setState(state)
+		setDumpFolder(filename)
+		os.utime(cacheFile, None) # mark as recently used.
+	except Exception as e:
+		logWarning(u"Can't load '%s' from cache - %s", filename, e)
+		_remove(cacheFile)
+		return None
+	if (os.path.splitext(filename)[1].lower() in OLE_EXTENSIONS):
+		chooseImportStrategy()
+	logInfo(u"Loaded '%s' from cache.", filename)
+	return reader
+
+def store(filename, key, reader):
+	'''
+	Saves the model that was read by the reader module into the cache.
+	'''
+	if (key is None):
+		return
+	folder = getCacheFolder()
+	cacheFile = _getCacheFile(key)
+	tmpFile = u"%s.%d" %(cacheFile, os.getpid())
+	try:
+		if (not os.path.exists(folder)):
+			os.makedirs(folder)
+		data = zlib.compress(pickle.dumps(_getState(reader), pickle.HIGHEST_PROTOCOL))
+		with open(tmpFile, 'wb') as f:
+			f.write(data)
+		os.replace(tmpFile, cacheFile)
+	except Exception as e:
+		logWarning(u"Can't save '%s' to cache - %s", filename, e)
+		_remove(tmpFile)
+		return
+	evict()
+
+def _remove(filename):
+	try:
+		os.remove(filename)
+	except:
+		pass
+
+def _getEntries(folder):
+	entries = []
+	for name in os.listdir(folder):
+		if (name.endswith(_SUFFIX)):
+			path = os.path.join(folder, name)
+			try:
+				stat = os.stat(path)
+				entries.append((stat.st_mtime, stat.st_size, path))
+			except:
+				pass
+	return entries
+
+def evict():
+	'''
+	Removes the least recently used entries until the cache fits its size.
+	'''
+	folder = getCacheFolder()
+	if (not os.path.isdir(folder)):
+		return
+	entries = sorted(_getEntries(folder))
+	limit   = getCacheSize() * 0x100000
+	total   = sum(e[1] for e in entries)
+	for mtime, size, path in entries:
+		if (total <= limit):
+			break
+		_remove(path)
+		total -= size
+
+def clear():
+	'''Removes all entries from the cache.'''
+	folder = getCacheFolder()
+	if (os.path.isdir(folder)):
+		for mtime, size, path in _getEntries(folder):
+			_remove(path)
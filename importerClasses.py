@@ -6,19 +6,15 @@ Collection of classes necessary to read and analyse Autodesk (R) Invetor (R) fil
 '''
 
 import sys, os, Part
-from importerUtils     import IntArr2Str, FloatArr2Str, logWarning, logError, getInventorFile, getUInt16, getUInt16A, isEqual, isEqual1D, UID, Color
+from importerUtils     import IntArr2Str, FloatArr2Str, logWarning, logError, getInventorFile, getUInt16, getUInt16A, isEqual, isEqual1D, UID, Color, getContext
 from math              import degrees, radians, pi
 from FreeCAD           import Vector as VEC
-from PySide.QtCore     import *
-from PySide.QtGui      import *
 from importerConstants import VAL_GUESS, VAL_UINT8, VAL_UINT16, VAL_UINT32, VAL_STR8, VAL_STR16, VAL_REF, VAL_ENUM
 
 __author__     = "Jens M. Plonka"
 __copyright__  = 'Copyright 2018, Germany'
 __url__        = "https://www.github.com/jmplonka/InventorLoader"
 
-model = None
-
 PART_LINE = Part.Line
 if (hasattr(Part, "LineSegment")):
 	PART_LINE = Part.LineSegment
@@ -315,94 +311,108 @@ class Inventor(object):
 		self.RSeRevisions       = RSeRevisions()
 		self.iProperties        = {}
 		self.RSeMetaData        = {}
+		self.segmentKinds       = {} # kind -> {name: segment}
 	def __del__(self):
 		self.iProperties.clear()
 		self.RSeMetaData.clear()
+		self.segmentKinds.clear()
 
 	def __repr__(self):
 		if (getInventorFile() is None): return u"#NV#"
 		return u"[%d]: %s" %(self.RSeDb.vers1.DisplayName(), os.path.split(os.path.abspath(getInventorFile()))[-1])
 
+	def loadSegment(self, seg):
+		'''
+		Reads the segment's data if it was deferred (see Import_IPT.ReadElement).
+		'''
+		dataB = seg.dataB
+		if (dataB is not None):
+			from importerReader import ReadRSeMetaDataB
+			seg.dataB = None
+			ReadRSeMetaDataB(dataB, seg)
+		return seg
+
+	def isDeferred(self, kind):
+		'''
+		Returns True if a segment of the kind (see SEGMENT_KINDS) isn't read yet.
+		'''
+		return any(seg.dataB is not None for seg in self.segmentKinds.get(kind, {}).values())
+
+	def addSegment(self, seg):
+		'''
+		Registers the segment and adds it to the index of its kinds.
+		'''
+		self.RSeMetaData[seg.name] = seg
+		for kind in seg.getKinds():
+			self.segmentKinds.setdefault(kind, {})[seg.name] = seg
+
+	def getSegments(self, kind):
+		'''
+		Iterates over the segments of the kind (see SEGMENT_KINDS) in the order they were registered.
+		'''
+		for seg in list(self.segmentKinds.get(kind, {}).values()):
+			yield self.loadSegment(seg)
+
+	def getSegment(self, kind):
+		'''
+		Returns the first segment of the kind (see SEGMENT_KINDS).
+		'''
+		segments = self.segmentKinds.get(kind)
+		if (segments):
+			for seg in segments.values():
+				return self.loadSegment(seg)
+		return EMPTY_SEGMENT
+
 	def getApp(self):
 		'''
 		Returns the segment that contains the application settings.
 		'''
-		for seg in self.RSeMetaData.values():
-			if (seg.isApp()): return seg
-		return EMPTY_SEGMENT
+		return self.getSegment('App')
 
 	def getBRep(self):
 		'''
 		Returns the segment that contains the boundary representation.
 		'''
-		for seg in self.RSeMetaData.values():
-			if (seg.isBRep()): return seg
-		return EMPTY_SEGMENT
+		return self.getSegment('BRep')
 
 	def getBrowser(self):
-		for seg in self.RSeMetaData.values():
-			if (seg.isBrowser()): return seg
-		return EMPTY_SEGMENT
+		return self.getSegment('Browser')
 
 	def getDC(self):
 		'''
 		Returns the segment that contains the 3D-objects.
 		'''
-		for seg in self.RSeMetaData.values():
-			if (seg.isDC()): return seg
-		return EMPTY_SEGMENT
+		return self.getSegment('DC')
 
 	def getDesignViews(self):
-		views = []
-		for seg in self.RSeMetaData.values():
-			if (seg.isDesignView()):
-				views.append(seg)
-		return views
+		return list(self.getSegments('DesignView'))
 
 	def getDirectory(self):
-		for seg in self.RSeMetaData.values():
-			if (seg.isDirectory()): return seg
-		return EMPTY_SEGMENT
+		return self.getSegment('Directory')
 
 	def getEeData(self):
-		for seg in self.RSeMetaData.values():
-			if (seg.isEeData()): return seg
-		return EMPTY_SEGMENT
+		return self.getSegment('EeData')
 
 	def getEeScene(self):
-		for seg in self.RSeMetaData.values():
-			if (seg.isEeScene()): return seg
-		return EMPTY_SEGMENT
+		return self.getSegment('EeScene')
 
 	def getFBAttribute(self):
-		for seg in self.RSeMetaData.values():
-			if (seg.isFBAttribute()): return seg
-		return EMPTY_SEGMENT
+		return self.getSegment('FBAttribute')
 
 	def getGraphics(self):
 		'''
 		Returns the segment that contains the graphic objects.
 		'''
-		for seg in self.RSeMetaData.values():
-			if (seg.isGraphics()): return seg
-		return EMPTY_SEGMENT
+		return self.getSegment('Graphics')
 
 	def getNBNotebook(self):
-		for seg in self.RSeMetaData.values():
-			if (seg.isNBNotebook()): return seg
-		return EMPTY_SEGMENT
+		return self.getSegment('NBNotebook')
 
 	def getResult(self):
-		for seg in self.RSeMetaData.values():
-			if (seg.isResult()): return seg
-		return EMPTY_SEGMENT
+		return self.getSegment('Result')
 
 	def getSheets(self):
-		sheets = []
-		for seg in self.RSeMetaData.values():
-			if (seg.isSheet()):
-				sheets.append(seg)
-		return sheets
+		return list(self.getSegments('Sheet'))
 
 class DbInterface(object):
 	TYPE_MAPPING = {
@@ -580,6 +590,8 @@ class Derived(AbstractValue):
 		super(Derived, self).__init__(s, 1.0, 0.0, unit)
 
 class DataNode(object):
+	__slots__ = ('data', 'isRef', 'children', 'parent', '__dict__')
+
 	def __init__(self, data):
 		## data must be an instance of AbstractData!
 		if (data):
@@ -817,7 +829,7 @@ class ParameterNode(DataNode):
 				except BaseException as be:
 					# replace by nominal value and unit!
 					value = self.getValue()
-					logWarning(u"    %s - replacing by nominal value %s!" %(be, value))
+					logWarning(u"    %s - replacing by nominal value %s!", be, value)
 			else:
 				value = self.getValue()
 			if (asText):
@@ -1354,6 +1366,7 @@ class Segment(object):
 		self.arr2         = []
 		self.segID        = None
 		self.segment      = None
+		self.dataB        = None # compressed data of a deferred segment
 		self.arr3         = []
 		self.sec1         = []
 		self.sec2         = []
@@ -1370,10 +1383,55 @@ class Segment(object):
 		self.nodes        = None
 		self.elementNodes = {}
 		self.indexNodes   = {}
+		self.typeNodes    = {} # typeName -> nodes
+		self.uidNodes     = {} # UID -> nodes
+		self.ntEntries    = {} # (name table's index, key) -> name table entry
 		self.tree         = DataNode(None)
 		self.acis         = None
 		self.bodies       = {}
 
+	def clearNodes(self):
+		self.elementNodes = {}
+		self.indexNodes   = {}
+		self.typeNodes    = {}
+		self.uidNodes     = {}
+		self.ntEntries    = {}
+
+	def indexNode(self, node):
+		'''Adds the decoded node to the segment's type and UID indexes.'''
+		nodes = self.typeNodes.get(node.typeName)
+		if (nodes is None):
+			self.typeNodes[node.typeName] = [node]
+		else:
+			nodes.append(node)
+		nodes = self.uidNodes.get(node.uid)
+		if (nodes is None):
+			self.uidNodes[node.uid] = [node]
+		else:
+			nodes.append(node)
+
+	def indexNameTable(self, nameTable):
+		for key, entry in nameTable.get('entries').items():
+			self.ntEntries[(nameTable.index, key)] = entry
+
+	def getNodes(self, typeName):
+		'''Returns the segment's nodes of the given type in the order they were read.'''
+		return self.typeNodes.get(typeName, [])
+
+	def getNode(self, typeName):
+		'''Returns the segment's first node of the given type or None.'''
+		nodes = self.typeNodes.get(typeName)
+		if (nodes): return nodes[0]
+		return None
+
+	def getNodesByUID(self, uid):
+		'''Returns the segment's nodes with the given UID in the order they were read.'''
+		return self.uidNodes.get(uid, [])
+
+	def getNameTableEntry(self, nameTable, key):
+		'''Returns the entry of the name table node with the given index or None.'''
+		return self.ntEntries.get((nameTable, key))
+
 	def getDcSatAttributes(self):
 		if (self.acis is None): return {}
 		return self.acis.get('dcAttributes', {})
@@ -1425,8 +1483,29 @@ class Segment(object):
 	def isSheet(self):
 		return (self.type in SEGMENTS_SHT)
 
+	def getKinds(self):
+		'''Returns the kinds of the segment (see SEGMENT_KINDS).'''
+		return [kind for kind, isKind in SEGMENT_KINDS if isKind(self)]
+
 EMPTY_SEGMENT = Segment()
 
+# kinds of the segments for Inventor.getSegment(s)
+SEGMENT_KINDS = (
+	('App',         Segment.isApp),
+	('BRep',        Segment.isBRep),
+	('Browser',     Segment.isBrowser),
+	('DC',          Segment.isDC),
+	('DesignView',  Segment.isDesignView),
+	('Directory',   Segment.isDirectory),
+	('EeData',      Segment.isEeData),
+	('EeScene',     Segment.isEeScene),
+	('FBAttribute', Segment.isFBAttribute),
+	('Graphics',    Segment.isGraphics),
+	('NBNotebook',  Segment.isNBNotebook),
+	('Result',      Segment.isResult),
+	('Sheet',       Segment.isSheet),
+)
+
 class _AbstractEdge_(object):
 	def p2v(self, p, f = 1.0):
 		return VEC(p[0], p[1], p[2]) * f
@@ -1583,13 +1662,54 @@ class ModelerTxnMgr(object):
 		return '%04X %04X [%s]' %(self.node, self.dcIdx, s)
 	def __repr__(self): return self.__str__()
 
+class PropertyShape(object):
+	'''
+	The names and classes of the properties that are shared by all nodes which
+	set the same properties in the same order. The node itself only keeps the
+	values in a flat list ordered like the shape's names.
+	'''
+	__slots__ = ('names', 'classes', 'index', 'appended', 'transitions')
+
+	def __init__(self, names, classes):
+		self.names       = names
+		self.classes     = classes
+		self.index       = dict((name, i) for i, name in enumerate(names))
+		self.appended    = {} # name -> shape with the new property name appended
+		self.transitions = {} # (name, class) -> shape
+
+	def getNext(self, name, cls):
+		'''
+		Returns the shape after the property name was set with the class cls.
+		'''
+		key = (name, cls)
+		shape = self.transitions.get(key)
+		if (shape is None):
+			i = self.index.get(name)
+			if (i is None):
+				shape = PropertyShape(self.names + (name,), self.classes + (cls,))
+				self.appended.setdefault(name, shape)
+			else:
+				shape = PropertyShape(self.names, self.classes[:i] + (cls,) + self.classes[i + 1:])
+			shape = self.transitions.setdefault(key, shape)
+		return shape
+
+# shape of nodes without properties
+EMPTY_SHAPE = PropertyShape((), ())
+
 class AbstractData(object):
+	# attributes of each node - others are stored in the instance's dictionary on demand.
+	__slots__ = ('uid', 'name', 'index', 'references', '_shape', '_index', '_values', 'size', 'visible', 'construction',
+	             'segment', 'geometry', 'sketchIndex', 'sketchPos', 'valid', 'handled', 'node', 'skipCheck',
+	             'typeName', 'data', 'parent', 'offset', 'reader', 'object3D', '__dict__')
+
 	def __init__(self):
 		self.uid          = None
 		self.name         = None
 		self.index        = -1
 		self.references   = []
-		self.properties   = {}
+		self._shape       = EMPTY_SHAPE
+		self._index       = EMPTY_SHAPE.index # the shape's index, for faster look ups
+		self._values      = []
 		self.size         = 0
 		self.visible      = False
 		self.construction = False
@@ -1633,9 +1753,29 @@ class AbstractData(object):
 			return '%s%d'     %(result, value)
 		return '%s%s' %(result, value)
 
+	@property
+	def properties(self):
+		'''
+		The properties as dictionary: name -> (value, class).
+		'''
+		shape = self._shape
+		return dict(zip(shape.names, zip(self._values, shape.classes)))
+
+	@properties.setter
+	def properties(self, properties):
+		shape  = EMPTY_SHAPE
+		values = []
+		for name, (value, cls) in properties.items():
+			shape = shape.getNext(name, cls)
+			values.append(value)
+		self._shape  = shape
+		self._index  = shape.index
+		self._values = values
+
 	@property
 	def content(self):
-		result = " ".join([self.__content__(n, p[0], p[1]) for n, p in self.properties.items()])
+		shape = self._shape
+		result = " ".join([self.__content__(n, v, c) for n, v, c in zip(shape.names, self._values, shape.classes)])
 		if (len(self.data) > 0):
 			result += " aX=(%s)" %(" ".join(["%02X"%(c) for c in self.data]))
 		return result
@@ -1647,10 +1787,25 @@ class AbstractData(object):
 		value: The value of the property.
 		'''
 		if (name):
-			if (self.skipCheck == False):
-				if (name in self.properties):
-					logError(u" ERROR in %08X.%s: '%s' already set!" %(self.uid.time_low, self.typeName, name))
-			self.properties[name] = (value, cls)
+			shape = self._shape.appended.get(name)
+			if ((shape is not None) and (shape.classes[-1] == cls)):
+				self._shape = shape
+				self._index = shape.index
+				self._values.append(value)
+				return
+			i = self._index.get(name)
+			if (i is None):
+				shape = self._shape.getNext(name, cls)
+				self._shape = shape
+				self._index = shape.index
+				self._values.append(value)
+			else:
+				if (self.skipCheck == False):
+					logError(u" ERROR in %08X.%s: '%s' already set!", self.uid.time_low, self.typeName, name)
+				if (self._shape.classes[i] != cls):
+					self._shape = self._shape.getNext(name, cls)
+					self._index = self._shape.index
+				self._values[i] = value
 
 	def get(self, name):
 		'''
@@ -1658,15 +1813,20 @@ class AbstractData(object):
 		name: The name of the property.
 		Returns None if the property is not yet set.
 		'''
-		return self.properties.get(name, (None, None))[0]
+		i = self._index.get(name)
+		if (i is None):
+			return None
+		return self._values[i]
 
 	def delete(self, name):
 		'''
 		Removes the value from the property given by the name.
 		name: The name of the property.
 		'''
-		if (name in self.properties):
-			del self.properties[name]
+		if (name in self._index):
+			properties = self.properties
+			del properties[name]
+			self.properties = properties
 
 	def getName(self):
 		if (hasattr(self, 'nameSet')): return self.name
@@ -1725,19 +1885,13 @@ Functions  = Enum([
 FunctionsNotSupported = ['sign', 'random', 'acosh', 'asinh', 'atanh', 'isolate']
 
 def createNewModel():
-	global model
-	model = Inventor()
+	getContext().model = Inventor()
 
 def getModel():
-	global model
-	if ('model' in globals()):
-		return model
-	return None
+	return getContext().model
 
 def releaseModel():
-	global model
-	if ('model' in globals()):
-		del model
+	getContext().model = None
 
 class NtEntry(object):
 	def __init__(self, nameTable, key):
@@ -1750,154 +1904,3 @@ class NtEntry(object):
 		return u""
 	def __repr__(self):
 		return self.__str__()
-
-class TableModel(QAbstractTableModel):
-	def __init__(self, parent, mylist, header, *args):
-		super(TableModel, self).__init__(parent, *args)
-		self.mylist = mylist
-		self.header = header
-		parent.setModel(self)
-
-	def rowCount(self, parent):
-		return len(self.mylist)
-
-	def columnCount(self, parent):
-		cols = [len(row) for row in self.mylist]
-		if (len(cols) == 0):
-			return 0
-		return max(cols)
-
-	def data(self, index, role):
-		if (index.isValid()):
-			value = self.mylist[index.row()][index.column()]
-			if (hasattr(value, 'Value')):
-				value = value.Value
-			if (type(value) == bool):
-				if (role == Qt.CheckStateRole):
-					if value:
-						return Qt.Checked
-					return Qt.Unchecked
-			else:
-				if (role in [Qt.EditRole, Qt.DisplayRole]):
-					return value
-		return None
-
-	def setData(self, index, value, role):
-		if (index.isValid()):
-			orgVal = self.mylist[index.row()][index.column()]
-			if (role == Qt.CheckStateRole):
-				value = (value == Qt.Checked)
-			if (hasattr(orgVal, 'Value')):
-				orgVal.Value = value
-			else:
-				self.mylist[index.row()][index.column()] = value
-			return True
-		return False
-
-	def headerData(self, position, orientation, role):
-		if ((role == Qt.DisplayRole) and (orientation == Qt.Horizontal)):
-			return self.header[position]
-		return QAbstractTableModel.headerData(self, position, orientation, role)
-
-	def setHeaderData(self, position, orientation, header, role): # int, orientation, QVariant, int = Qt.EditRole
-		if ((role == Qt.DisplayRole) and (orientation == Qt.Horizontal)):
-			self.header[position] = header
-			return True
-		return QAbstractTableModel.setHeaderData(self, position, orientation, header, role)
-
-	def insertRow(self, row, index=QModelIndex()):
-		'''Insert a row into the model.'''
-		self.beginInsertRows(index, row, row)
-		data = ['' for c in range(self.columnCount(self.parent))]
-		self.mylist.insert(row, data)
-		self.endInsertRows()
-		return True
-
-	def insertRows(self, position, rows=1, index=QModelIndex()):
-		'''Insert a row into the model.'''
-		self.beginInsertRows(index, position, position + rows - 1)
-		for row in range(rows):
-			data = ['' for c in range(self.columnCount(self.parent))]
-			self.mylist.insert(position + row, data)
-		self.endInsertRows()
-		return True
-
-	def removeRow(self, row, index=QModelIndex()):
-		'''Remove a row from the model.'''
-		self.beginRemoveRows(index, row, row)
-		del self.mylist[row]
-		self.endRemoveRows()
-		return True
-
-	def removeRows(self, position, rows=1, index=QModelIndex()):
-		'''Remove rows from the model.'''
-		self.beginRemoveRows(index, position, position + rows - 1)
-		del self.mylist[position:position+rows]
-		self.endRemoveRows()
-		return True
-
-	def insertColumn(self, column, index=QModelIndex()):
-		'''Insert a column into the model.'''
-		self.beginInsertColumns(index, column, column)
-		self.header.insert(column, '')
-		for row in self.mylist:
-			row.insert(column, '')
-		self.endInsertColumns()
-		return True
-
-	def insertColumns(self, position, column=1, index=QModelIndex()):
-		'''Insert a row into the model.'''
-		self.beginInsertColumns(index, position, position + column - 1)
-		for col in range(column):
-			self.header.insert(position + col, '')
-		for row in self.mylist:
-			for col in range(column):
-				row.insert(position + column, '')
-		self.endInsertColumns()
-		return True
-
-	def removeColumn(self, column, index=QModelIndex()):
-		'''Remove a column from the model.'''
-		self.beginRemoveColumns(index, column, column)
-		del self.header[column]
-		for row in self.mylist:
-			del row[column]
-		self.endRemoveColumns()
-		return True
-
-	def removeColumns(self, position, column=1, index=QModelIndex()):
-		'''Remove columns from the model.'''
-		self.beginRemoveColumns(index, position, position + column - 1)
-		for col in range(column):
-			del self.header[position]
-		for row in self.mylist:
-			del row[position:position+column]
-		self.endRemoveColumns()
-		return True
-
-	def flags(self, index):
-		'''Returns the item flags for the given index.
-		The base class implementation returns a combination of flags that enables the item
-		and allows it to be selected.'''
-		if not index.isValid():
-			return Qt.NoItemFlags
-		return Qt.ItemIsEnabled | Qt.ItemIsSelectable
-
-class ParameterTableModel(TableModel):
-	def __init__(self, parent, mylist, *args):
-		super(TableModel, self).__init__(parent, mylist, ['Variant', 'Source', 'Property', 'Parameter', 'Value', 'Units'], *args)
-	def flags(self, index):
-		if (index.column() == 0):
-			return Qt.ItemIsEnabled | Qt.ItemIsEditable | Qt.ItemIsUserCheckable
-		if (index.column() in [1, 2, 5]): # make object's name and property and unit column read only!
-			return Qt.ItemIsEnabled
-		return Qt.ItemIsEnabled | Qt.ItemIsEditable
-
-class VariantTableModel(TableModel):
-	def __init__(self, parent, values, *args):
-		if (values):
-			super().__init__(parent, values[1:], values[0], *args)
-		else:
-			super().__init__(parent, ['Part-01'], ['Member'], *args)
-	def flags(self, index):
-		return Qt.ItemIsEnabled | Qt.ItemIsEditable
@@ -8,6 +8,7 @@ The importer can read files from Autodesk (R) Invetor (R) Inventro V2010 on. Old
 '''
 from importerEeData         import EeDataReader
 from importerUtils          import *
+from importerLayout         import layout
 from importerClasses        import Tolerances, Functions, VAL_UINT8, VAL_UINT16, VAL_UINT32, VAL_REF, VAL_STR16, VAL_ENUM
 from xlrd                   import open_workbook
 import importerSegNode, re
@@ -137,6 +138,7 @@ class DCReader(EeDataReader):
 
 	#######################
 	# Parameter sections
+	@layout('cref:unit s', 'Read_Header0')
 	def ReadHeaderParameter(self, node, typeName):
 		i = node.Read_Header0(typeName)
 		i = node.ReadChildRef(i, 'unit')
@@ -164,6 +166,7 @@ class DCReader(EeDataReader):
 			node.set('operand', ref[0])
 		return i
 
+	@layout('f64:value u16:type (x[4])>2010', 'ReadHeaderParameter', 'ParameterValue')
 	def Read_F8A77A04(self, node): # ParameterValue
 		i = self.ReadHeaderParameter(node, 'ParameterValue')
 		i = node.ReadFloat64(i, 'value')
@@ -205,6 +208,7 @@ class DCReader(EeDataReader):
 
 	#######################
 	# content sections
+	@layout('cref:next u32:flags s (x[4])>2023 xref u32:index', 'Read_Header0', post='setHeaderContent')
 	def ReadHeaderContent(self, node, typeName = None, name = 'next'):
 		'''
 		Read the header for content objects like Sketch2D, Pads, ...
@@ -219,13 +223,21 @@ class DCReader(EeDataReader):
 		if (self.version > 2023): i += 4 # skip 00 00 00 00
 		i = node.ReadCrossRef(i)
 		i = node.ReadUInt32(i, 'index')
+		self.setHeaderContent(node)
+		return i
 
+	def setHeaderContent(self, node):
 		flags = node.get('flags')
 		node.visible             = (flags & 0x00000400) > 0
 		node.dimensioningVisible = (flags & 0x00800000) > 0
 		self.segment.indexNodes[node.get('index')] = node
 		node.Item = True
-		return i
+
+	def restoreLayoutState(self, node, state):
+		# the failed layout may have registered the node with a wrong index.
+		index = node.get('index')
+		if (self.segment.indexNodes.get(index) is node):
+			del self.segment.indexNodes[index]
 
 	def Read_033E027B(self, node):
 		i = self.ReadHeaderContent(node)
@@ -240,6 +252,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_3')
 		return i
 
+	@layout('s32:s32_0 cref:ref_0 xref:ref_1', 'ReadHeaderContent')
 	def Read_B4F8F817(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -252,6 +265,7 @@ class DCReader(EeDataReader):
 		if (self.version > 2018): i += 4 # skip FF FF FF FF
 		return i
 
+	@layout('s32:s32_0 lst2<NODE_X_REF>:lst0 xref:ref_1', 'ReadHeaderContent')
 	def Read_0AD21008(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -259,6 +273,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_1')
 		return i
 
+	@layout('s32:s32_0 lst2<NODE_X_REF>:lst0 xref:ref_1 xref:ref_2', 'ReadHeaderContent')
 	def Read_4B2376C4(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -267,6 +282,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('s32:s32_0 lst2<NODE_X_REF>:lst0 xref:ref_1 xref:ref_2 u32:u32_0 t16:container', 'ReadHeaderContent')
 	def Read_9C9E3CB3(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -277,6 +293,7 @@ class DCReader(EeDataReader):
 		i = node.ReadLen32Text16(i, 'container') # CAT-Container path
 		return i
 
+	@layout('s32:s32_0 lst2<NODE_X_REF>:faces xref:refEdge xref:refString', 'ReadHeaderContent')
 	def Read_DD80AC37(self, node): # something to do with text-alignment
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -285,6 +302,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'refString')
 		return i
 
+	@layout('s32:s32_0 lst2<NODE_X_REF>:faces u32[2]:a0 t16:clientId xref:parentToleranceFeature xref:ref_2 u32:u32_0 (x[4])>2018', 'ReadHeaderContent', 'ModelToleranceFeature')
 	def Read_DE172BCF(self, node): # ModelToleranceFeature {CEBC9A45-2058-4537-9D52-5E11419267DE}
 		i = self.ReadHeaderContent(node, 'ModelToleranceFeature')
 		i = node.ReadSInt32(i, 's32_0')
@@ -322,6 +340,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node, 'ModelGeneralNote')
 		return i
 
+	@layout('s32:s32_0 u32[2]:a0 lst6<MAP_TEXT16_UINT32>:lst0 lst6<MAP_TEXT16_UINT32>:lst1 lst6<MAP_TEXT16_UINT32>:lst2 u32:u32_0', 'ReadHeaderContent')
 	def Read_1128AE62(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -336,6 +355,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node)
 		return i
 
+	@layout('u32[2]:a0', 'ReadHeaderContent')
 	def Read_15E7211A(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -364,6 +384,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_1') # -> E70647C4
 		return i
 
+	@layout('(x[4])>2018 u32[2]:a0', 'ReadHeaderContent')
 	def Read_1A1C8265(self, node):
 		i = self.ReadHeaderContent(node)
 		if (self.version > 2018): i += 4 # skip FF FF FF FF
@@ -383,6 +404,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node)
 		return i
 
+	@layout('s xref:excelWorkbook s32:rowIndex uid:uid t16 xref:refParent lst2<NODE_X_REF>:iParts bool:selected', 'ReadHeaderContent', 'iPart')
 	def Read_26287E96(self, node): # iPart
 		i = self.ReadHeaderContent(node, 'iPart')
 		i = self.skipBlockSize(i)
@@ -395,6 +417,7 @@ class DCReader(EeDataReader):
 		i = node.ReadBoolean(i, 'selected')
 		return i
 
+	@layout('s[2] uid:uid', 'ReadHeaderContent')
 	def Read_274E16CD(self, node):
 		i = self.ReadHeaderContent(node)
 		i = self.skipBlockSize(i, 2)
@@ -407,6 +430,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('s v3:a1 xref:ref_0 u32:u32_0 s lst2<NODE_X_REF>:lst0', 'ReadHeaderContent')
 	def Read_28BE2D5B(self, node):
 		i = self.ReadHeaderContent(node)
 		i = self.skipBlockSize(i)
@@ -417,6 +441,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('s32:s32_0 u32:u32_0 t16 xref:ref_0 xref:transformation lst2<NODE_X_REF>:lst0', 'ReadHeaderContent')
 	def Read_28E17530(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -427,6 +452,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('s v3:a1 xref:ref_0 u32:u32_0 s u32:u32_1 f64:f0 s xref:ref_1', 'ReadHeaderContent')
 	def Read_2AF9B62B(self, node):
 		i = self.ReadHeaderContent(node)
 		i = self.skipBlockSize(i)
@@ -460,6 +486,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst2')
 		return i
 
+	@layout('s u32:u32_0 s[2] xref:ref_1 cref:ref_2 lst6<MAP_KEY_X_REF>:lst0 lst6<MAP_KEY_X_REF>:lst1', 'ReadHeaderContent', 'ReferenceEdgeLoopId')
 	def Read_2D86FC26(self, node): # ReferenceEdgeLoopId
 		i = self.ReadHeaderContent(node, 'ReferenceEdgeLoopId')
 		i = self.skipBlockSize(i)
@@ -471,6 +498,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList6(i, importerSegNode._TYP_MAP_KEY_X_REF_, 'lst1')
 		return i
 
+	@layout('s32:s32_0 u16[3]:a0 t16', 'ReadHeaderContent')
 	def Read_30F71B26(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -478,6 +506,7 @@ class DCReader(EeDataReader):
 		i = node.ReadLen32Text16(i)
 		return i
 
+	@layout('s32:s32_0 xref:ref_1 xref:ref_2 xref:transformation xref:part lst4<NODE_X_REF>:lst0 cref:ref_3 (x[4])>2016 u32:u32_0 lst2<UINT32>:lst0 t8:txt_0 lst2<UINT32>:lst1 uid:uid cref:ref_4 lst6<MAP_TEXT8_3D_F32>:lst2 f32[14]:a1 t16', 'ReadHeaderContent')
 	def Read_0334499C(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -499,6 +528,7 @@ class DCReader(EeDataReader):
 		i = node.ReadLen32Text16(i)
 		return i
 
+	@layout('s32:s32_0 xref:ref_1 xref:ref_2 xref:transformation xref:part lst4<NODE_X_REF>:lst0 cref:ref_3 (x[4])>2016 cref:ref_4', 'ReadHeaderContent')
 	def Read_338634AC(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -532,6 +562,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_3')
 		return i
 
+	@layout('s cref:document', 'ReadHeaderContent')
 	def Read_3AB895E9(self, node):
 		i = self.ReadHeaderContent(node)
 		i = self.skipBlockSize(i)
@@ -549,6 +580,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_5')
 		return i
 
+	@layout('t16 xref:ref_1 xref:ref_2 xref:ref_3 t16:equation', 'ReadHeaderContent')
 	def Read_3BD61A2C(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadLen32Text16(i)
@@ -558,6 +590,7 @@ class DCReader(EeDataReader):
 		i = node.ReadLen32Text16(i, 'equation')
 		return i
 
+	@layout('s[2] u16:u16_0', 'ReadHeaderContent', 'BodiesFolder')
 	def Read_3C7F67AA(self, node): # Bodies folder
 		i = self.ReadHeaderContent(node, 'BodiesFolder')
 		i = self.skipBlockSize(i, 2)
@@ -598,6 +631,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node)
 		return i
 
+	@layout('s32:s32_0 xref:ref_0 lst2<NODE_X_REF>:lst0 xref:ref_1 uid:id', 'ReadHeaderContent')
 	def Read_440C98C9(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -616,6 +650,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'param2')
 		return i
 
+	@layout('s32:s32_0 u32:u32_1 xref:transformation xref:parameter xref:entity3D u8:u8_0', 'ReadHeaderContent')
 	def Read_45825754(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -661,6 +696,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'transformation')
 		return i
 
+	@layout('s s32:s32_0 s xref:ref_1 s u8:style lst2<NODE_REF>:selection lst2<NODE_REF>:values u8:u8_1 u32:u32_0 (x[4])>2010 (x[1])>2012', 'ReadHeaderContent', 'Constraint')
 	def Read_4E86F047(self, node): # Assembly: Placement-Constaint
 		i = self.ReadHeaderContent(node, 'Constraint')
 		i = self.skipBlockSize(i)
@@ -681,6 +717,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node, 'ModelFeatureControlFrame')
 		return i
 
+	@layout('s32:s32_0 xref:ref_1 xref:ref_2 f64:f64_1 u32:u32_0', 'ReadHeaderContent', 'Drawing')
 	def Read_54846913(self, node):
 		i = self.ReadHeaderContent(node, 'Drawing')
 		i = node.ReadSInt32(i, 's32_0')
@@ -713,6 +750,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node)
 		return i
 
+	@layout('u32:u32_0', 'ReadHeaderContent')
 	def Read_5A6B6124(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -755,6 +793,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node)
 		return i
 
+	@layout('(x[4])>2018 u32:u32_0', 'ReadHeaderContent')
 	def Read_6489E49C(self, node):
 		i = self.ReadHeaderContent(node)
 		if (self.version > 2018): i += 4
@@ -781,11 +820,13 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node)
 		return i
 
+	@layout('u32[2]:a0', 'ReadHeaderContent')
 	def Read_66B388ED(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadUInt32A(i, 2, 'a0')
 		return i
 
+	@layout('(x[4])>2017 lst2<NODE_X_REF>:lst0', 'ReadHeaderContent')
 	def Read_671CE131(self, node):
 		i = self.ReadHeaderContent(node)
 		if (self.version > 2017): i += 4 # skip FF FF FF FF
@@ -800,6 +841,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node)
 		return i
 
+	@layout('(x[4])>2017 lst2<NODE_X_REF>:faces lst2<NODE_X_REF>:edges', 'ReadHeaderContent')
 	def Read_6BE30AF0(self, node):
 		i = self.ReadHeaderContent(node)
 		if (self.version > 2017): i += 4 # skip FF FF FF FF
@@ -807,6 +849,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'edges')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 xref:ref_3 u16:u16_0', 'ReadHeaderContent')
 	def Read_6F7A6F97(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -831,6 +874,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_4')
 		return i
 
+	@layout('s32:s32_0 xref:ref_1 lst6<MAP_U32_U32>:lst0 lst6<MAP_U32_U32>:lst1 xref:ref_2 xref:ref_3 xref:ref_4', 'ReadHeaderContent')
 	def Read_72E450AC(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -842,6 +886,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_4')
 		return i
 
+	@layout('(x[4])>2017 (x[4])>2020 cref:wrapper lst2<NODE_REF>:wrappers u32:u32_1', 'ReadHeaderContent', 'Freeform')
 	def Read_76BDB118(self, node): # new in 2015
 		i = self.ReadHeaderContent(node, 'Freeform')
 		if (self.version > 2017): i += 4 # skip FF FF FF FF
@@ -855,6 +900,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node)
 		return i
 
+	@layout('s s32:s32_0 xref:ref_1 xref:ref_2 xref:ref_3 xref:ref_4 xref:ref_5 xref:ref_6 u16[9]:a0 xref:ref_7', 'ReadHeaderContent')
 	def Read_7DA7F733(self, node):
 		i = self.ReadHeaderContent(node)
 		i = self.skipBlockSize(i)
@@ -869,6 +915,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_7')
 		return i
 
+	@layout('(x[4])>2018 (u32:u32_0)>2020 lst2<UINT32>:lst0', 'ReadHeaderContent')
 	def Read_7E15AA39(self, node):
 		i = self.ReadHeaderContent(node)
 		if (self.version > 2018): i += 4 # skip FF FF FF FF
@@ -877,6 +924,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_UINT32_, 'lst0') # really UINT32???
 		return i
 
+	@layout('(x[4])>2017 xref:ref_1 u32:u32_0 v3:p1 v3:p2 u32:u32_1 f64:f64_0 xref:point u32:u32', 'ReadHeaderContent')
 	def Read_7F7F05AC(self, node):
 		i = self.ReadHeaderContent(node)
 		if (self.version > 2017): i += 4 # skip FF FF FF FF
@@ -890,6 +938,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32')
 		return i
 
+	@layout('(x[4])>2018 f64[4]:a0 u8[11]:a1 f64[6]:a2 u32:u32_0 cref:ref0 cref:ref1 cref:ref2 cref:ref3 cref:ref4 cref:ref5 cref:ref6 cref:ref7 cref:ref8 cref:ref9 cref:refA cref:refB cref:refC cref:refD', 'ReadHeaderContent', 'SurfaceDetails')
 	def Read_81E94AB7(self, node):
 		i = self.ReadHeaderContent(node, 'SurfaceDetails')
 		if (self.version > 2018): i += 4 # skip FF FF FF FF
@@ -946,12 +995,14 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_6')
 		return i
 
+	@layout('(x[4])>2018 u32:u32_0', 'ReadHeaderContent', 'MeshPart')
 	def Read_8946E9E8(self, node): # MeshPart
 		i = self.ReadHeaderContent(node, 'MeshPart')
 		if (self.version > 2018):i += 4 # 0xFFFFFF
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('s s32:s32_0 xref:ref_1 lst2<UINT32>:lst0 (lst8<NODE_X_REF>:lst1)<2012 f64:d0', 'ReadHeaderContent')
 	def Read_8B1E9A97(self, node):
 		i = self.ReadHeaderContent(node)
 		i = self.skipBlockSize(i)
@@ -985,6 +1036,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'line')
 		return i
 
+	@layout('s s32:s32_0 s xref:ref_1 s xref:target lst3<NODE_REF>:mapping f64:f xref:paramRef u16:u16_0 u8:u8_0', 'ReadHeaderContent', 'ParameterMappings')
 	def Read_90874D40(self, node): # Mapping of parameters
 		i = self.ReadHeaderContent(node, 'ParameterMappings')
 		i = self.skipBlockSize(i)
@@ -1007,6 +1059,7 @@ class DCReader(EeDataReader):
 		if (self.version > 2020): i += 4 # skip FF FF FF FF
 		return i
 
+	@layout('u32:u32_0 xref:value', 'ReadCntHdr2S')
 	def Read_90874D61(self, node):
 		i = self.ReadCntHdr2S(node) # 'ref' contains IPT document!
 		i = node.ReadUInt32(i, 'u32_0')
@@ -1067,6 +1120,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32A(i, 2, 'a8')
 		return i
 
+	@layout('(x[4])>2017 u32:u32_0', 'ReadHeaderContent')
 	def Read_9C38036E(self, node):
 		i = self.ReadHeaderContent(node)
 		if (self.version > 2017): i += 4 # skip FF FF FF FF
@@ -1094,6 +1148,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node, 'ModelDimensionAngular')
 		return i
 
+	@layout('s s32:s32_0 xref:ref_1 xref:ref_2 u32[2]:a0', 'ReadHeaderContent')
 	def Read_A5428F7A(self, node):
 		i = self.ReadHeaderContent(node)
 		i = self.skipBlockSize(i)
@@ -1118,6 +1173,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_4')
 		return i
 
+	@layout('s32:s32_0 xref:transformation xref:drawing v3:a0 v3:a1', 'ReadHeaderContent')
 	def Read_AE8FDC73(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -1127,6 +1183,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_3D(i, 'a1')
 		return i
 
+	@layout('u32:u23_0 xref:plane xref:line xref:ref_2 v2:f64_0', 'ReadHeaderContent')
 	def Read_B3EAA9EC(self, node): # new in 2019
 		i = self.ReadHeaderContent(node)
 		i = node.ReadUInt32(i, 'u23_0')
@@ -1140,6 +1197,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node)
 		return i
 
+	@layout('s[2] (x[4])>2020 uid:uid_0', 'ReadHeaderContent')
 	def Read_B5DFF07E(self, node):
 		i = self.ReadHeaderContent(node)
 		i = self.skipBlockSize(i, 2)
@@ -1209,6 +1267,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_1')
 		return i
 
+	@layout('s32:s32_0 xref:ref_0 u32[2]:a0 cref:ref_1', 'ReadHeaderContent')
 	def Read_C6435233(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -1270,6 +1329,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderContent(node)
 		return i
 
+	@layout('s s32:s32_0 s xref:ref_1 s u32[2]:a0 s', 'ReadHeaderContent')
 	def Read_D739EDBB(self, node):
 		i = self.ReadHeaderContent(node)
 		i = self.skipBlockSize(i)
@@ -1288,6 +1348,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_3')
 		return i
 
+	@layout('(x[4])>2018 u32[26]:a0 f64[7]:a1', 'ReadHeaderContent')
 	def Read_DDCF0E1C(self, node):
 		i = self.ReadHeaderContent(node)
 		if (self.version > 2018): i += 4 # skip FF FF FF FF
@@ -1295,6 +1356,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64A(i, 7, 'a1')
 		return i
 
+	@layout('s32:s32_0 xref:ref_1 xref:ref_2 xref:ref_3 u8:u8_0', 'ReadHeaderContent')
 	def Read_DEBD4124(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -1304,6 +1366,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('s s32:s32_0 cref:ref_1 cref:ref_2 cref:ref_3', 'ReadHeaderContent')
 	def Read_E1D8C31B(self, node):
 		i = self.ReadHeaderContent(node)
 		i = self.skipBlockSize(i)
@@ -1313,6 +1376,7 @@ class DCReader(EeDataReader):
 		i = node.ReadChildRef(i, 'ref_3')
 		return i
 
+	@layout('(x[4])>2018 u32:u32_0 xref:ref_0 u32[3]:a0 (x[4])>2014 v3:m0 v3:m1 v3:m2 v3:center f64:angleStart f64:angleSweep', 'ReadHeaderContent')
 	def Read_E70647C4(self, node):
 		i = self.ReadHeaderContent(node)
 		if (self.version > 2018): i += 4 # skip FF FF FF FF
@@ -1328,6 +1392,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64(i, 'angleSweep')
 		return i
 
+	@layout('u32[2]:a0', 'ReadHeaderContent')
 	def Read_E8313971(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -1353,6 +1418,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'point')
 		return i
 
+	@layout('s32:s32_0 xref:ref_1 xref:ref_2 xref:ref_3 u32[4]:a0 u8:u8_0 xref:ref_4', 'ReadHeaderContent')
 	def Read_EEF10748(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -1394,6 +1460,7 @@ class DCReader(EeDataReader):
 			node.set('lst2', {}, VAL_REF)
 		return i
 
+	@layout('(x[4])>2018 lst2<NODE_X_REF>:parameters xref:sets xref:fx', 'ReadHeaderContent')
 	def Read_F7763F69(self, node):
 		i = self.ReadHeaderContent(node) #, '')
 		if (self.version > 2018): i += 4 # skip FF FF FF FF
@@ -1402,6 +1469,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'fx')
 		return i
 
+	@layout('s[2] (x[4])>2018 xref:proxy xref:faces xref:edges xref:fullDepth xref:reversed xref:length xref:offset bool:fully', 'ReadHeaderContent', 'ThreadDefinition')
 	def Read_8C1A567D(self, node):
 		i = self.ReadHeaderContent(node, 'ThreadDefinition')
 		i = self.skipBlockSize(i, 2)
@@ -1428,11 +1496,13 @@ class DCReader(EeDataReader):
 		if (self.version > 2020): i += 4 # skip FF FF FF FF
 		return i
 
+	@layout('lst2<NODE_X_REF>:transformations', 'ReadCntHdrFF')
 	def Read_0800FE29(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'transformations')
 		return i
 
+	@layout('lst2<NODE_X_REF>:points lst2<UINT32>:lst1 lst2<UINT32>:lst2', 'ReadCntHdrFF', 'SnapFitAnchors')
 	def Read_0CAC6298(self, node):
 		i = self.ReadCntHdrFF(node, 'SnapFitAnchors')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'points')
@@ -1440,11 +1510,13 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_UINT32_, 'lst2')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0', 'ReadCntHdrFF')
 	def Read_42BC8C9A(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
 		return i
 
+	@layout('xref:param lst2<NODE_X_REF>:lst0 xref:faces', 'ReadCntHdrFF')
 	def Read_1345015C(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadCrossRef(i, 'param')
@@ -1452,6 +1524,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'faces')
 		return i
 
+	@layout('f64[4]:a0 u16[3]:a1 cref:ref_1 u8:u8_0 v2:a2 v3:a3', 'ReadCntHdrFF')
 	def Read_37889260(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadFloat64A(i, 4, 'a0')
@@ -1462,6 +1535,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_3D(i, 'a3')
 		return i
 
+	@layout('lst2<NODE_X_REF>:points lst2<UINT32>:lst0 lst2<UINT32>:lst1', 'ReadCntHdrFF')
 	def Read_4DC465DF(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'points')
@@ -1469,6 +1543,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_UINT32_, 'lst1')
 		return i
 
+	@layout('f64[4]:a0 u32:u32_0 u8[7]:a1 f64[6]:a2 u32:u32_1 cref:ref_1 lst2<NODE_REF>:lst0 f64[4]:a3 u32:u32_2 u8:u8_0', 'ReadCntHdrFF')
 	def Read_502678E7(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadFloat64A(i, 4, 'a0')
@@ -1508,6 +1583,7 @@ class DCReader(EeDataReader):
 		node.set('e', e)
 		return i
 
+	@layout('xref:edgeProxies lst2<NODE_X_REF>:radii lst2<NODE_X_REF>:booleans', 'ReadCntHdrFF')
 	def Read_660DEE07(self, node): # ??? FilletSetback ???
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadCrossRef(i, 'edgeProxies')
@@ -1536,16 +1612,19 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_FLOAT64_A_,  'lst3', 3)
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst1', 'ReadCntHdrFF')
 	def Read_7DF60748(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst1')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadCntHdrFF')
 	def Read_8B2B8D96(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('u32[14]:a0 v3:a1 t16:txt1 u32[5]:a2 f64[6]:a3 u32[3]:a4 xref:ref1 xref:ref2 u32[6]:a5 cref:ref3 t16', 'ReadCntHdrFF')
 	def Read_8BE7021F(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadUInt32A(i, 14, 'a0') # 26 - 6 -1 = 19
@@ -1592,11 +1671,13 @@ class DCReader(EeDataReader):
 		node.set('lst0', lst, VAL_STR16)
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadCntHdrFF')
 	def Read_D70E9DDA(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:features', 'ReadCntHdrFF')
 	def Read_D9F7441B(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'features')
@@ -1619,17 +1700,20 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64A(i, node.get('a5')[0], 'a6')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0', 'ReadCntHdrFF')
 	def Read_E1913A46(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 xref:ref_1', 'ReadCntHdrFF')
 	def Read_F145279A(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		i = node.ReadCrossRef(i, 'ref_1')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 xref:ref_3 xref:ref_4 xref:ref_5 lst2<UINT32>:lst0 xref:ref_6', 'ReadCntHdrFF')
 	def Read_FCDC569A(self, node):
 		i = self.ReadCntHdrFF(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -1643,6 +1727,7 @@ class DCReader(EeDataReader):
 
 	#######################
 	# Content header 3xskip sections
+	@layout('s[3] (x[4])>2018 (x[4])>2020', 'ReadHeaderContent')
 	def ReadCntHdr3S(self, node, typeName = None):
 		i = self.ReadHeaderContent(node, typeName)
 		i = self.skipBlockSize(i, 3)
@@ -1650,11 +1735,13 @@ class DCReader(EeDataReader):
 		if (self.version > 2020): i += 4 # skip FF FF FF FF
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadCntHdr3S')
 	def Read_04B1FCF0(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 u8:u8_0 u32:u32_0', 'ReadCntHdr3S')
 	def Read_04D026D2(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -1662,43 +1749,51 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('u16[2]:a0 s', 'ReadCntHdr3S')
 	def Read_0D798B55(self, node): #
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadUInt16A(i, 2, 'a0')
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('lst2<NODE_X_REF>:items', 'ReadCntHdr3S', 'ObjectCollection')
 	def Read_0E6870AE(self, node): # ObjectCollection
 		i = self.ReadCntHdr3S(node, 'ObjectCollection')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'items')
 		return i
 
+	@layout('lst2<NODE_X_REF>:sets', 'ReadCntHdr3S', 'FxFilletEdgeSetsConstantR')
 	def Read_1B48E9DA(self, node): # Fillet sets with constant radii
 		i = self.ReadCntHdr3S(node, 'FxFilletEdgeSetsConstantR')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'sets')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadCntHdr3S', 'BoundaryPatch')
 	def Read_22947391(self, node): # BoundaryPatchFeature {16B36EBE-2DFA-4474-B11B-DF3D57C109B0}
 		i = self.ReadCntHdr3S(node, 'BoundaryPatch')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:items', 'ReadCntHdr3S', 'FaceCollection')
 	def Read_24BCB2F1(self, node):
 		i = self.ReadCntHdr3S(node, 'FaceCollection')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'items')
 		return i
 
+	@layout('xref:ref_1 lst2<NODE_X_REF>:lst0', 'ReadCntHdr3S')
 	def Read_2801D6C6(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadCrossRef(i, 'ref_1')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadCntHdr3S')
 	def Read_299B2DCE(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:items', 'ReadCntHdr3S', 'LoftSections')
 	def Read_312F9E50(self, node):
 		i = self.ReadCntHdr3S(node, 'LoftSections')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'items')
@@ -1722,23 +1817,27 @@ class DCReader(EeDataReader):
 			i = node.ReadCrossRef(i, 'ref_6')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 u32[2]:a0', 'ReadCntHdr3S')
 	def Read_51C2DDF1(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		i = node.ReadUInt32A(i, 2, 'a0')
 		return i
 
+	@layout('u32:u32_0 s', 'ReadCntHdr3S')
 	def Read_557C2ED5(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadUInt32(i, 'u32_0')
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('lst2<NODE_X_REF>:items', 'ReadCntHdr3S', 'SculptSurfaceCollection')
 	def Read_5FB25A7E(self, node):
 		i = self.ReadCntHdr3S(node, 'SculptSurfaceCollection')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'items')
 		return i
 
+	@layout('u32:u32_0 s cref:ref_2 u32:u32_1 s (x[4])>2017 uid:uid lst2<NODE_X_REF>:lst0 s', 'ReadCntHdr3S')
 	def Read_76CF355F(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -1752,11 +1851,13 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadCntHdr3S')
 	def Read_7C6D7B13(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('xref:point xref:ref_2 xref:ref_3 u8:u8_0', 'ReadCntHdr3S')
 	def Read_831EBCE9(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadCrossRef(i, 'point')
@@ -1765,17 +1866,20 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('u16[2]:a0 s', 'ReadCntHdr3S')
 	def Read_833687A1(self, node): #
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadUInt16A(i, 2, 'a0')
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadCntHdr3S')
 	def Read_833D1B91(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('t16 u32:isKey t16:value', 'ReadCntHdr3S', 'ParameterText')
 	def Read_8367B125(self, node): # ParameterText
 		i = self.ReadCntHdr3S(node, 'ParameterText')
 		i = node.ReadLen32Text16(i)
@@ -1783,6 +1887,7 @@ class DCReader(EeDataReader):
 		i = node.ReadLen32Text16(i, 'value')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 xref:ref_3 xref:ref_4 xref:ref_5 xref:ref_6 xref:ref_7 s32:s32_0 v3:a0', 'ReadCntHdr3S')
 	def Read_86173E3F(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -1796,12 +1901,14 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_3D(i, 'a0')
 		return i
 
+	@layout('u16[2]:a0 s', 'ReadCntHdr3S')
 	def Read_866CBE44(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadUInt16A(i, 2, 'a0')
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_0 s', 'ReadCntHdr3S')
 	def Read_866CBE45(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -1820,6 +1927,7 @@ class DCReader(EeDataReader):
 		i = node.ReadSInt16(i, 'u16_0')
 		return i
 
+	@layout('(t16 x[4])>2010 bool:value', 'ReadCntHdr3S', 'Boolean')
 	def Read_90874D28(self, node): # Boolean
 		i = self.ReadCntHdr3S(node, 'Boolean')
 		if (self.version > 2010):
@@ -1828,11 +1936,13 @@ class DCReader(EeDataReader):
 		i = node.ReadBoolean(i, 'value')
 		return i
 
+	@layout('lst2<NODE_X_REF>:items', 'ReadCntHdr3S', 'EdgeCollection')
 	def Read_90874D51(self, node):
 		i = self.ReadCntHdr3S(node, 'EdgeCollection')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'items')
 		return i
 
+	@layout('lst2<NODE_X_REF>:points', 'ReadCntHdr3S', 'HoleCenterPoints')
 	def Read_936522B1(self, node):
 		i = self.ReadCntHdr3S(node, 'HoleCenterPoints')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'points')
@@ -1890,6 +2000,7 @@ class DCReader(EeDataReader):
 		node.isAttr = True
 		return i
 
+	@layout('xref:face lst2<NODE_X_REF>:lst0 xref:ref_2 u32:number', 'ReadCntHdr3S', 'ProfileSelection')
 	def Read_B382A87C(self, node): # MatchedLoop
 		i = self.ReadCntHdr3S(node, 'ProfileSelection')
 		i = node.ReadCrossRef(i, 'face')
@@ -1898,12 +2009,14 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'number') # The numbber of the selection
 		return i
 
+	@layout('lst2<NODE_X_REF>:extrema lst2<NODE_X_REF>:additional', 'ReadCntHdr3S', 'FilletEdgeVariableR')
 	def Read_BA6E3112(self, node): # Fillet edge with variable radii
 		i = self.ReadCntHdr3S(node, 'FilletEdgeVariableR')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'extrema') # start and end radius
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'additional') # additional radii -> FilletVariableRadius
 		return i
 
+	@layout('t16 x[4] u32:valueNominal u32:valueModel', 'ReadCntHdr3S', 'Parameter')
 	def Read_BB1DD5DF(self, node): # RDxVar
 		i = self.ReadCntHdr3S(node, 'Parameter')
 		i = node.ReadLen32Text16(i)
@@ -1912,6 +2025,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'valueModel')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadCntHdr3S')
 	def Read_BB3762C8(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -1930,6 +2044,7 @@ class DCReader(EeDataReader):
 			i = node.ReadSInt32(i, 's32_0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:sets', 'ReadCntHdr3S', 'FxFilletEdgeSetsVariableR')
 	def Read_CA7AA850(self, node): # Fillet sets with variable radii
 		i = self.ReadCntHdr3S(node, 'FxFilletEdgeSetsVariableR')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'sets')
@@ -1946,21 +2061,25 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'facesSide2')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadCntHdr3S')
 	def Read_D656B956(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:images', 'ReadCntHdr3S', 'ImageCollection')
 	def Read_E0EA12F2(self, node): # ImageCollection
 		i = self.ReadCntHdr3S(node, 'ImageCollection')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'images')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadCntHdr3S')
 	def Read_E558F428(self, node):
 		i = self.ReadCntHdr3S(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadCntHdr3S', 'SurfaceSelection')
 	def Read_EFF2257A(self, node):
 		i = self.ReadCntHdr3S(node, 'SurfaceSelection')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -2002,6 +2121,7 @@ class DCReader(EeDataReader):
 			node.set('s32_0', -1)
 		return i
 
+	@layout('u32:u32_0', 'ReadHeaderIndexRefs', 'EdgeItem')
 	def Read_375C6982(self, node): # EdgeItem
 		i = self.ReadHeaderIndexRefs(node, 'EdgeItem')
 		i = node.ReadUInt32(i, 'u32_0')
@@ -2231,6 +2351,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'point')
 		return i
 
+	@layout('u32:u32_0 xref:entity1 xref:entity2 u32[4]:a0 s v2:a1 v2:a2', 'ReadHeaderConstraint2D', 'Dimension_Distance2D')
 	def Read_11058558(self, node): # OffsetDimConstraint {C173A077-012F-11D5-8DEA-0010B541CAA8}
 		i = self.ReadHeaderConstraint2D(node, 'Dimension_Distance2D')
 		i = node.ReadUInt32(i, 'u32_0')
@@ -2273,6 +2394,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'entity4')
 		return i
 
+	@layout('u32:u32_0 xref:line1 xref:line2 v2:pos u16:u16_0', 'ReadHeaderConstraint2D', 'Dimension_Angle2Line2D')
 	def Read_590D0A10(self, node): # TwoLineAngleDimConstraint {C173A07B-012F-11D5-8DEA-0010B541CAA8}
 		i = self.ReadHeaderConstraint2D(node, 'Dimension_Angle2Line2D')
 		i = node.ReadUInt32(i, 'u32_0')
@@ -2282,6 +2404,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('xref:line1 xref:line2 u16:s16_0', 'ReadHeaderConstraint2D', 'Geometric_Collinear2D')
 	def Read_5A9A7BE0(self, node): # CollinearConstraint {8006A076-ECC4-11D4-8DE9-0010B541CAA8}
 		i = self.ReadHeaderConstraint2D(node, 'Geometric_Collinear2D')
 		i = node.ReadCrossRef(i, 'line1')
@@ -2296,6 +2419,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_1 xref:circle u32[4]:a0', 'ReadHeaderConstraint2D', 'Dimension_Radius2D')
 	def Read_671BB700(self, node): # RadiusDimConstraint {C173A081-012F-11D5-8DEA-0010B541CAA8}
 		i = self.ReadHeaderConstraint2D(node, 'Dimension_Radius2D')
 		i = node.ReadUInt32(i, 'u32_1')
@@ -2303,6 +2427,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32A(i, 4, 'a0')
 		return i
 
+	@layout('xref:ref_1 xref:circle u32[4]:a0', 'ReadHeaderConstraint2D', 'Dimension_Diameter2D')
 	def Read_74DF96E0(self, node): # DiameterDimConstraint {C173A07F-012F-11D5-8DEA-0010B541CAA8}
 		i = self.ReadHeaderConstraint2D(node, 'Dimension_Diameter2D')
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -2310,6 +2435,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32A(i, 4, 'a0')
 		return i
 
+	@layout('xref:line1 xref:line2 xref:line3 xref:line4 xref:point1 xref:point2 xref:point3 xref:point4 u8:u8_0 f64:x', 'ReadHeaderConstraint2D', 'Geometric_TextBox2D')
 	def Read_7A98AD0E(self, node): # TextBoxConstraint {037C3FDB-8A3C-443F-8CF6-993D3295335C}
 		i = self.ReadHeaderConstraint2D(node, 'Geometric_TextBox2D')
 		i = node.ReadCrossRef(i, 'line1')
@@ -2343,6 +2469,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'entity2')
 		return i
 
+	@layout('xref:line1 xref:line2 u16:u16_0', 'ReadHeaderConstraint2D', 'Geometric_Parallel2D')
 	def Read_90874D95(self, node): # ParallelConstraint {8006A08A-ECC4-11D4-8DE9-0010B541CAA8}
 		i = self.ReadHeaderConstraint2D(node, 'Geometric_Parallel2D')
 		i = node.ReadCrossRef(i, 'line1')
@@ -2350,6 +2477,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('xref:line1 xref:line2 u16:u16_0', 'ReadHeaderConstraint2D', 'Geometric_Perpendicular2D')
 	def Read_90874D96(self, node): # PerpendicularConstraint {8006A08C-ECC4-11D4-8DE9-0010B541CAA8}
 		i = self.ReadHeaderConstraint2D(node, 'Geometric_Perpendicular2D')
 		i = node.ReadCrossRef(i, 'line1')
@@ -2365,12 +2493,14 @@ class DCReader(EeDataReader):
 			i += 4
 		return i
 
+	@layout('xref:line u8:u8_0', 'ReadHeaderConstraint2D', 'Geometric_Horizontal2D')
 	def Read_90874D98(self, node): # HorizontalConstraint {8006A084-ECC4-11D4-8DE9-0010B541CAA8}
 		i = self.ReadHeaderConstraint2D(node, 'Geometric_Horizontal2D')
 		i = node.ReadCrossRef(i, 'line')
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('xref:line u8:u8_0', 'ReadHeaderConstraint2D', 'Geometric_Vertical2D')
 	def Read_90874D99(self, node): # VerticalConstraint {8006A092-ECC4-11D4-8DE9-0010B541CAA8}
 		i = self.ReadHeaderConstraint2D(node, 'Geometric_Vertical2D')
 		i = node.ReadCrossRef(i, 'line')
@@ -2389,6 +2519,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ellipse')
 		return i
 
+	@layout('u32:u32_0 xref:point1 xref:point2 xref:point3 v2:pos u16:u16_0 u8:u8_0', 'ReadHeaderConstraint2D', 'Dimension_Angle3Point2D')
 	def Read_BF3B5C84(self, node): # ThreePointAngleDimConstraint {C173A07D-012F-11D5-8DEA-0010B541CAA8}:
 		i = self.ReadHeaderConstraint2D(node, 'Dimension_Angle3Point2D')
 		i = node.ReadUInt32(i, 'u32_0')
@@ -2412,6 +2543,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'center')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 xref:center xref:polygonCenter1 xref:polygonCenter2 u32:u32_0 xref:ref_3', 'ReadHeaderConstraint2D', 'Geometric_PolygonEdge2D')
 	def Read_FBDB891F(self, node): # PatternConstraint {C173A073-012F-11D5-8DEA-0010B541CAA8}
 		i = self.ReadHeaderConstraint2D(node, 'Geometric_PolygonEdge2D')
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -2425,6 +2557,7 @@ class DCReader(EeDataReader):
 
 	#######################
 	# 3D-sketch constraint sections
+	@layout('s s32:flags2 s xref:group s lst2<NODE_X_REF>:lst0 u8:u8_0 xref:sketch (lst6<MAP_X_REF_REF>:lst1 lst6<MAP_X_REF_FLOAT64>:lst2)>2012 (s)<=2012', 'ReadHeaderContent')
 	def ReadHeaderConstraint3D(self, node, typeName = None):
 		'''
 		Read the header for 3D constraints
@@ -2449,6 +2582,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderConstraint3D(node, 'SplineHandle3D')
 		return i
 
+	@layout('xref:parameter xref:fxDims u8:u8_1', 'ReadHeaderConstraint3D', 'Dimension_Length3D')
 	def Read_10B6ADEF(self, node): # LineLengthDimConstraint3D {04A196FD-3FBB-43EF-9A79-2735B3B99214}
 		i = self.ReadHeaderConstraint3D(node, 'Dimension_Length3D')
 		i = node.ReadCrossRef(i, 'parameter')
@@ -2469,6 +2603,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderConstraint3D(node, 'Geometric_Perpendicular3D')
 		return i
 
+	@layout('xref:ref_3 u32:u32_0 u8:u8_1', 'ReadHeaderConstraint3D', 'Dimension_Angle2Planes3D')
 	def Read_6A3EEA31(self, node): # Angle2PlanesDimConstraint {????}
 		i = self.ReadHeaderConstraint3D(node, 'Dimension_Angle2Planes3D')
 		i = node.ReadCrossRef(i, 'ref_3')
@@ -2476,6 +2611,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_1')
 		return i
 
+	@layout('(x[1])<2013 xref:parameter (x[1])<2013 u32:u32_0 u8:u8_1', 'ReadHeaderConstraint3D', 'Geometric_Tangential3D')
 	def Read_7457BB19(self, node): # TangentConstraint3D {0456FF0D-196E-4C72-989D-D86E3DD32955}
 		i = self.ReadHeaderConstraint3D(node, 'Geometric_Tangential3D')
 		if (self.version < 2013): i += 1
@@ -2500,6 +2636,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('u16:u16_0 u8:u8_1', 'ReadHeaderConstraint3D', 'Geometric_Smooth3D')
 	def Read_E8D30910(self, node): # SmoothConstraint3D  {281176E3-4EDC-4F4E-9804-6716B7B9059D}
 		i = self.ReadHeaderConstraint3D(node, 'Geometric_Smooth3D')
 		i = node.ReadUInt16(i, 'u16_0')
@@ -2508,6 +2645,7 @@ class DCReader(EeDataReader):
 
 	##########################
 	# Content + S l S S sections
+	@layout('s s32:s32_0 s[2]', 'ReadHeaderContent')
 	def ReadHeadersS32ss(self, node, typeName = None, name = 'next'):
 		i = self.ReadHeaderContent(node, typeName, name)
 		i = self.skipBlockSize(i)
@@ -2533,6 +2671,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('lst2<UINT32>:lst0 xref:ref_1 xref:ref_2', 'ReadHeadersS32ss')
 	def Read_065FFFB3(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_UINT32_, 'lst0')
@@ -2540,6 +2679,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('s32:s32_1 lst2<NODE_X_REF>:lst0 s u32:u32_1 lst2<NODE_X_REF>:lst1 cref:ref_1 u16:u16_0 u16:u16_1 u16:u16_2 t16 u16:u16_3 s[2]', 'ReadHeadersS32ss')
 	def Read_06DCEFA9(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadSInt32(i, 's32_1')
@@ -2556,6 +2696,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('xref:point s xref:line xref:plane f64[5]:a0', 'ReadHeadersS32ss')
 	def Read_07910C0B(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'point')
@@ -2616,6 +2757,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_0 s xref:mapping', 'ReadHeadersS32ss')
 	def Read_0D0F9548(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -2623,6 +2765,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'mapping')
 		return i
 
+	@layout('xref:plane1 s xref:plane2 xref:parameter u8:u8_0', 'ReadHeadersS32ss')
 	def Read_0D28D8C0(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'plane1')
@@ -2632,6 +2775,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 xref:ref_3 u16:u16_0', 'ReadHeadersS32ss')
 	def Read_13F4E5A3(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -2654,6 +2798,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'varRDx')
 		return i
 
+	@layout('xref:ref2D xref:transformation xref:ref3D u16:u16_0', 'ReadHeadersS32ss', 'RevolutionTransformation')
 	def Read_18951917(self, node): # RevolutionTransformation
 		i = self.ReadHeadersS32ss(node, 'RevolutionTransformation')
 		i = node.ReadCrossRef(i, 'ref2D')
@@ -2662,6 +2807,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 xref:ref_1 s', 'ReadHeadersS32ss')
 	def Read_18D844B8(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -2679,6 +2825,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'fx')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 xref:ref_1 s', 'ReadHeadersS32ss')
 	def Read_1B48AD11(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -2686,6 +2833,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('xref:ref_0 s[2] u32:u32_0', 'ReadHeadersS32ss')
 	def Read_1CB24874(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_0')
@@ -2701,6 +2849,7 @@ class DCReader(EeDataReader):
 			i += 8+4 # F64 + U32
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 xref:ref_3 xref:ref_4 s xref:ref_5 xref:ref_6 u32:u32_0', 'ReadHeadersS32ss')
 	def Read_1EF28758(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -2713,6 +2862,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('xref:point xref:text u32[2]:a0', 'ReadHeadersS32ss', 'Text2D')
 	def Read_2510347F(self, node): # TextBox {A907AE99-A78F-11D5-8DF8-0010B541CAA8}
 		i = self.ReadHeadersS32ss(node, 'Text2D')
 		i = node.ReadCrossRef(i, 'point')
@@ -2720,6 +2870,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32A(i, 2, 'a0')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 xref:ref_3 xref:ref_4 lst4<NODE_X_REF>:lst0 xref:ref_5 xref:ref_6', 'ReadHeadersS32ss')
 	def Read_25E6AD96(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -2738,6 +2889,7 @@ class DCReader(EeDataReader):
 		if (self.version > 2017): i += 4
 		return i
 
+	@layout('s uid:uid u32:u32_0 lst2<NODE_X_REF>:lst0 u32:u32_1', 'ReadHeadersS32ss')
 	def Read_26445303(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = self.skipBlockSize(i)
@@ -2774,6 +2926,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('xref:ref_1 lst2<NODE_X_REF>:lst0 xref:ref_2 s', 'ReadHeadersS32ss')
 	def Read_2AB534B2(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -2794,6 +2947,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_0 xref:surface xref:ref_2', 'ReadHeadersS32ss')
 	def Read_2E692E29(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -2806,6 +2960,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'fx')
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 s u32:u32_2 lst2<NODE_X_REF>:lst1 cref:ref_0 u16:u16_0 u32:u32_3 t16 u16:u16_1 s[2]', 'ReadHeadersS32ss')
 	def Read_317CDB03(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -2821,6 +2976,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('cref:document lst2<UINT32>:lst0 lst2<UINT32>:lst1 cref:fx xref:ref_3 xref:ref_4 cref:parameter xref:ref_6', 'ReadHeadersS32ss')
 	def Read_31DBA503(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadChildRef(i, 'document')
@@ -2849,6 +3005,7 @@ class DCReader(EeDataReader):
 		i = node.ReadLen32Text16(i)
 		return i
 
+	@layout('s lst2<NODE_REF>:lst0 s xref:ref_1 u32:u32_0', 'ReadHeadersS32ss')
 	def Read_339807AC(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = self.skipBlockSize(i)
@@ -2889,6 +3046,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_8')
 		return i
 
+	@layout('u32:u32_0 uid:uid s', 'ReadHeadersS32ss')
 	def Read_38C2654E(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -2896,6 +3054,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('xref:sketch u8:u8_0 xref:direction', 'ReadHeadersS32ss')
 	def Read_38C74735(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'sketch')
@@ -2903,6 +3062,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'direction')
 		return i
 
+	@layout('xref:transformation xref:ref_1 xref:ref_2 xref:ref_3 s xref:ref_4 xref:ref_5 xref:ref_6 xref:ref_7 xref:ref_8 s32:s32_1 s32:s32_2 v3:a0 v3:a1 (xref:ref_9 xref:ref_10 u8:u8_0)>2011', 'ReadHeadersS32ss')
 	def Read_3A083C7B(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'transformation')
@@ -2948,6 +3108,7 @@ class DCReader(EeDataReader):
 			i += 6*8
 		return i
 
+	@layout('xref:transformation1 xref:transformation2 s u16[7]:a1 s xref:plane', 'ReadHeadersS32ss', 'Sketch2DPlacementPlane')
 	def Read_3D64CCF0(self, node): # Sketch2DPlacementPlane
 		i = self.ReadHeadersS32ss(node, 'Sketch2DPlacementPlane')
 		i = node.ReadCrossRef(i, 'transformation1')
@@ -3035,6 +3196,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeadersS32ss(node)
 		return i
 
+	@layout('xref:group lst2<NODE_X_REF>:points u8:u8_0 xref:sketch', 'ReadHeadersS32ss')
 	def Read_4F240E1C(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'group')
@@ -3065,11 +3227,13 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_1')
 		return i
 
+	@layout('lst2<NODE_X_REF>:bends', 'ReadHeadersS32ss', 'FaceBendCollection')
 	def Read_53DCDF19(self, node):
 		i = self.ReadHeadersS32ss(node, 'FaceBendCollection')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'bends')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 u32:u32_0', 'ReadHeadersS32ss')
 	def Read_55279EE0(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -3077,6 +3241,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('u32:u32_1 s lst2<NODE_X_REF>:lst0 lst2<NODE_X_REF>:lst1 lst2<NODE_X_REF>:lst2 s', 'ReadHeadersS32ss')
 	def Read_572DBC7C(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -3102,6 +3267,7 @@ class DCReader(EeDataReader):
 		i = node.ReadLen32Text16(i)
 		return i
 
+	@layout('xref:ref_1 s xref:ref_2 xref:ref_3 u32:u32_0 u8:u8_0 f64[9]:a0', 'ReadHeadersS32ss')
 	def Read_5838B762(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -3149,6 +3315,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'seamGap')
 		return i
 
+	@layout('xref:ref_1 u8:u8_0 xref:ref_2', 'ReadHeadersS32ss')
 	def Read_5D93312C(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -3156,6 +3323,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 u16:u16_0', 'ReadHeadersS32ss')
 	def Read_5E040F0D(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -3180,6 +3348,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_3')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 xref:ref_3 xref:ref_4 u32[3]:a0 u8:u8_0', 'ReadHeadersS32ss')
 	def Read_6480700A(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -3190,6 +3359,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('s xref:entity xref:transformation xref:edge u16:u16_0', 'ReadHeadersS32ss')
 	def Read_64DE16F3(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = self.skipBlockSize(i)
@@ -3203,6 +3373,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeadersS32ss(node)
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 xref:ref_3 u16:u16_0', 'ReadHeadersS32ss')
 	def Read_6B6A06E7(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -3211,6 +3382,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('xref:extent xref:angle xref:thickness xref:flipDir xref:reliefWidth xref:ref_2 (xref:body)<2016 xref:ref_3 xref:ref_4 lst2<NODE_X_REF>:points xref:ref_5 xref:radius xref:ref_6 u32[2]:a0 u8:u8_0 xref:plane xref:direction xref:ref_7 xref:ref_8 xref:ref_9 xref:ref_A (xref:body)>2015 (x[4])>2020', 'ReadHeadersS32ss', 'FlangeShape')
 	def Read_6BF0A0AA(self, node): # Spape of flange
 		i = self.ReadHeadersS32ss(node, 'FlangeShape')
 		i = node.ReadCrossRef(i, 'extent')
@@ -3240,6 +3412,7 @@ class DCReader(EeDataReader):
 		if (self.version > 2020): i += 4 # skip 00 00 00 00
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 xref:ref_3 xref:ref_4 xref:ref_5 u8:u8_2', 'ReadHeadersS32ss')
 	def Read_6DC1CDC3(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -3250,6 +3423,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_2')
 		return i
 
+	@layout('xref:ref_1 lst2<UINT32>:lst0 xref:ref_2 u16:u16_0', 'ReadHeadersS32ss')
 	def Read_6F7A6F9C(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -3258,6 +3432,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('u32:u32_0 xref:ref_1 xref:ref_2 xref:ref_3 xref:ref_4 xref:ref_5 xref:ref_6 xref:ref_7 (x[8])>2017 s xref:ref_8 xref:ref_9 xref:ref_A xref:ref_B', 'ReadHeadersS32ss')
 	def Read_716090B3(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -3362,6 +3537,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'plane')
 		return i
 
+	@layout('xref:plane1 s xref:entity xref:plane2 xref:parameter u16[3]:a0 f64[9]:a1', 'ReadHeadersS32ss')
 	def Read_74E6F48A(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'plane1')
@@ -3409,6 +3585,7 @@ class DCReader(EeDataReader):
 #		i = node.ReadCrossRef(i, 'ref_7')
 		return i
 
+	@layout('cref:ref_1 xref:ref_2 cref:ref_3 xref:ref_4 cref:ref_5', 'ReadHeadersS32ss')
 	def Read_7911B59E(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadChildRef(i, 'ref_1')
@@ -3434,6 +3611,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_0')
 		return  i
 
+	@layout('s uid:uid1 s xref:ref_0 s32:s32_1 t16 u32[2]:a0 s xref:ref_1 s[2] uid:uid2 s xref:ref_2 s32:s32_2 t16:txt1 u32[2]:a1 s xref:ref_3 s[2] xref:ref_4', 'ReadHeadersS32ss')
 	def Read_8324D282(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = self.skipBlockSize(i)
@@ -3466,6 +3644,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'point2')
 		return i
 
+	@layout('xref:ref_1 lst2<NODE_X_REF>:lst0 xref:ref_2', 'ReadHeadersS32ss')
 	def Read_841B40DB(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -3492,6 +3671,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeadersS32ss(node, 'EndOfFeatures')
 		return i
 
+	@layout('u32:u32_0 xref:entity s v2:v0 s xref:ref_1 u32:u32_1 t16 u32[2]:a_0 s xref:ref_2 s', 'ReadHeadersS32ss')
 	def Read_8F02799B(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -3520,6 +3700,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'point2')
 		return i
 
+	@layout('s u32:numEntities lst8<NODE_X_REF>:entities s xref:transformation xref:direction u32[2]:a0 (lst2<NODE_X_REF>:lst1)>2012', 'ReadHeadersS32ss', 'Sketch2D')
 	def Read_90874D11(self, node): # PlanarSketch {2C16787F-83FF-11D4-8DDB-0010B541CAA8}
 		i = self.ReadHeadersS32ss(node, 'Sketch2D')
 		i = self.skipBlockSize(i)
@@ -3576,6 +3757,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('s32:s32_1 s[3] lst2<NODE_X_REF>:constrains lst6<MAP_U32_U32>:entries u32:u32_0', 'ReadHeadersS32ss', 'Group2D')
 	def Read_90874D62(self, node): # Group2D
 		i = self.ReadHeadersS32ss(node, 'Group2D')
 		i = node.ReadSInt32(i, 's32_1')
@@ -3592,12 +3774,14 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16A(i, 2,'a1')
 		return i
 
+	@layout('lst2<NODE_X_REF>:items xref:collection', 'ReadHeadersS32ss', 'ObjectCollectionDef')
 	def Read_90874D74(self, node): # ObjectCollectionDef
 		i = self.ReadHeadersS32ss(node, 'ObjectCollectionDef')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'items')
 		i = node.ReadCrossRef(i, 'collection') # -> ObjectCollection
 		return i
 
+	@layout('u32:outlineItem lst2<NODE_X_REF>:properties s u32:u32_1', 'ReadHeadersS32ss', 'Feature')
 	def Read_90874D91(self, node): # Feature
 		i = self.ReadHeadersS32ss(node, 'Feature')
 		i = node.ReadUInt32(i, 'outlineItem')
@@ -3624,6 +3808,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_3')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 xref:ref_3 u16:u16_0', 'ReadHeadersS32ss')
 	def Read_9D71D698(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -3632,12 +3817,14 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('lst2<UINT32>:lst0 xref:ref_1', 'ReadHeadersS32ss')
 	def Read_9E9570C8(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_UINT32_, 'lst0')
 		i = node.ReadCrossRef(i, 'ref_1')
 		return i
 
+	@layout('lst8<NODE_REF>:lst0 xref:ref_1 xref:ref_2 s', 'ReadHeadersS32ss')
 	def Read_A0564E4F(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList8(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -3646,6 +3833,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 xref:ref_1', 'ReadHeadersS32ss')
 	def Read_A1D74A3C(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -3656,6 +3844,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeadersS32ss(node)
 		return i
 
+	@layout('xref:parameter xref:entity u32:u32_1 u16:u16_0 u32:u32_2 v3:pos v3:dir v3:point u8:u8_0 s xref:edge xref:face', 'ReadHeadersS32ss', 'DirectionEdge')
 	def Read_A244457B(self, node): # edge pattern direction
 		i = self.ReadHeadersS32ss(node, 'DirectionEdge')
 		i = node.ReadCrossRef(i, 'parameter')
@@ -3672,6 +3861,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'face')
 		return i
 
+	@layout('lst8<NODE_REF>:lst0 xref:owner xref:body s', 'ReadHeadersS32ss')
 	def Read_A31E29E0(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList8(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -3719,6 +3909,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeadersS32ss(node)
 		return i
 
+	@layout('xref:face xref:edge u8:u8_0 xref:direction u8:u8_1', 'ReadHeadersS32ss')
 	def Read_AD416CEA(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'face')
@@ -3728,6 +3919,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_1')
 		return i
 
+	@layout('xref:ref_1 s xref:ref_2 xref:ref_3 f64:f64_0 f64:f64_1', 'ReadHeadersS32ss')
 	def Read_B3EAA9EE(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -3812,6 +4004,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_6')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 xref:ref_1 s', 'ReadHeadersS32ss')
 	def Read_C6E21E1A(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -3819,6 +4012,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('s32:flags2 u8:u8_0 xref:point xref:dir xref:curve xref:ref_4 xref:ref_5 xref:ref_6 xref:ref_7 xref:dcx', 'ReadHeadersS32ss')
 	def Read_C9A8BC23(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadSInt32(i, 'flags2')
@@ -3851,6 +4045,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'point')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 u32:u32_0 s t16 cref:ref_1', 'ReadHeadersS32ss', 'DerivedOccDataCollector')
 	def Read_CD7C1C53(self, node): # DerivedOccDataCollector
 		i = self.ReadHeadersS32ss(node, 'DerivedOccDataCollector')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -3868,6 +4063,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'plane')
 		return i
 
+	@layout('u32[2]:a0 xref:ref_1 xref:ref_2', 'ReadHeadersS32ss')
 	def Read_CFB519C2(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -3875,6 +4071,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('u32:u32_0 lst2<NODE_X_REF>:lst0 u32:u32_1', 'ReadHeadersS32ss')
 	def Read_D035D8A8(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -3941,6 +4138,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'solid')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst xref:profileSelection s', 'ReadHeadersS32ss')
 	def Read_DA4970B5(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst')
@@ -3967,6 +4165,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 lst6<MAP_KEY_REF>:lst1 xref:ref_1 (xref:ref_2)>2015', 'ReadHeadersS32ss')
 	def Read_DED39DA8(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -3990,12 +4189,14 @@ class DCReader(EeDataReader):
 		i = self.Read2RefList(node, i, 'lst0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 xref:ref_1', 'ReadHeadersS32ss')
 	def Read_E28A0597(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		i = node.ReadCrossRef(i, 'ref_1')
 		return i
 
+	@layout('s32:s32_1 cref:ref_1 bool:b_0', 'ReadHeadersS32ss')
 	def Read_E2C566C3(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadSInt32(i, 's32_1')
@@ -4003,6 +4204,7 @@ class DCReader(EeDataReader):
 		i = node.ReadBoolean(i, 'b_0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 lst6<MAP_KEY_REF>:Curves xref:ref_1 xref:ref_2 xref:ref_3 xref:ref_4 xref:ref_5 xref:ref_6 xref:ref_7 xref:ref_8 u32:u32_0 bool:b_0', 'ReadHeadersS32ss')
 	def Read_E4E57EF8(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -4019,6 +4221,7 @@ class DCReader(EeDataReader):
 		i = node.ReadBoolean(i, 'b_0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 t16 u16:u16_0 xref:ref_1 xref:ref_2 xref:ref_3 xref:ref_4 xref:ref_5 u16:u16_1 u8:u8_0', 'ReadHeadersS32ss')
 	def Read_E524B878(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -4071,11 +4274,13 @@ class DCReader(EeDataReader):
 			i = node.ReadCrossRef(i, 'ref_A')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadHeadersS32ss')
 	def Read_EBA98FD3(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:meshes u32:u32_0 (t16:meshId t16:meshTyp)<2017', 'ReadHeadersS32ss', 'MeshFolder')
 	def Read_EC2D4C66(self, node): # MeshFolder
 		i = self.ReadHeadersS32ss(node, 'MeshFolder')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'meshes')
@@ -4093,6 +4298,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_4')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 xref:ref_1 s[2] xref:ref_2 u32:u32_0 xref:ref_4', 'ReadHeadersS32ss')
 	def Read_EE792053(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -4103,6 +4309,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_4')
 		return i
 
+	@layout('xref:ref_1 s u8:u8_0 xref:ref_2', 'ReadHeadersS32ss')
 	def Read_EFE47BB4(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -4132,6 +4339,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_1')
 		return i
 
+	@layout('xref:ref_1 lst2<NODE_REF>:lst0 s t16 xref:doc lst2<NODE_REF>:lst1 cref:ref_2 u32[4]:a0 f64[11]:a1 cref:ref_3 cref:ref_4 u32:u32_3 f32[4]:a2 t16:txt0 u16:u16_0 u8:u0_0 u32:u32_4 t16:txt1 u16:u16_1 s (cref:ref_5 cref:ref_6)>2016', 'ReadHeadersS32ss', 'Scene')
 	def Read_F393AC92(self, node):
 		i = self.ReadHeadersS32ss(node, 'Scene')
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -4159,6 +4367,7 @@ class DCReader(EeDataReader):
 			i = node.ReadChildRef(i, 'ref_6')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 u8:u8_0 xref:ref_3 u8:u8_1 s v3:a0', 'ReadHeadersS32ss')
 	def Read_F67F0488(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -4203,6 +4412,7 @@ class DCReader(EeDataReader):
 #			i = node.ReadFloat64(i, 'x')
 		return i
 
+	@layout('lst2<LIST_X_REF>:lst0 lst2<NODE_X_REF>:lst1 xref:ref_1 xref:parameter xref:transformation', 'ReadHeadersS32ss')
 	def Read_FABE1977(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_LIST_X_REF_, 'lst0')
@@ -4212,6 +4422,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'transformation')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 u8:u8_0 xref:ref_3 u8:u8_1 s u32:u32_0', 'ReadHeadersS32ss')
 	def Read_FB73FDDF(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -4223,6 +4434,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 xref:ref_1 cref:ref_2', 'ReadHeadersS32ss')
 	def Read_FBC6C635(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -4237,6 +4449,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'point3D')
 		return i
 
+	@layout('xref:entity1 xref:transformation s lst2<NODE_X_REF>:lst0 xref:entity2 s u16:u16_0', 'ReadHeadersS32ss')
 	def Read_FF15793D(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'entity1')
@@ -4248,6 +4461,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('uid:uid', 'ReadHeadersS32ss', 'SketchFragment')
 	def Read_FFD270B8(self, node): # SketchFragment
 		i = self.ReadHeadersS32ss(node, 'SketchFragment')
 		i = node.ReadUUID(i, 'uid')
@@ -4260,6 +4474,7 @@ class DCReader(EeDataReader):
 		node.set('Feature', name)
 		return i
 
+	@layout('lst2<NODE_X_REF>:properties u32:outlineItem', 'ReadHeaderFeature', 'LoftedFlange')
 	def Read_03CC1996(self, node):
 		i = self.ReadHeaderFeature(node, 'LoftedFlange')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'properties')
@@ -4284,18 +4499,21 @@ class DCReader(EeDataReader):
 			i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('lst2<NODE_X_REF>:properties u32:u32_0', 'ReadHeaderFeature', 'DirectEdit')
 	def Read_1F6D59F6(self, node): # DirectEditFeature {602389D5-6C6A-4368-A6F2-47D54FA1FBA4}
 		i = self.ReadHeaderFeature(node, 'DirectEdit')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'properties')
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:refolds u32:u32_0', 'ReadHeaderFeature', 'Refold')
 	def Read_3902E4D1(self, node): # FxRefold
 		i = self.ReadHeaderFeature(node, 'Refold')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'refolds')
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:properties u32:u32_0 s t16:txt0 t16:txt1 u8:u8_0 xref:ref_1 lst8<UINT32>:lst0 lst8<UINT32>:lst1 u32:u32_1 t16:txt2 (u32:u32_2)>2011', 'ReadHeaderFeature', 'Client')
 	def Read_4EF32EF0(self, node): # ClientFeature {BB91C845-BD7E-4470-948F-C5A069B21BBC}
 		i = self.ReadHeaderFeature(node, 'Client')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'properties')
@@ -4313,6 +4531,7 @@ class DCReader(EeDataReader):
 			i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_0 lst2<NODE_X_REF>:properties s u32:u32_1 s xref:images u8:u8_0 u32[2]:a0 xref:sketch', 'ReadHeaderFeature', 'Decal')
 	def Read_7F936BAA(self, node): # DecalFeature {9C693BB0-7C99-4D06-961E-99936273C492}
 		i = self.ReadHeaderFeature(node, 'Decal')
 		i = node.ReadUInt32(i, 'u32_0')
@@ -4326,6 +4545,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'sketch')
 		return i
 
+	@layout('lst2<NODE_X_REF>:properties u32:u32_0 s[2]', 'ReadHeaderFeature', 'FlangeContour')
 	def Read_A03874B0(self, node): # ContourFlangeFeature {2390C0D0-A03F-4526-B4B1-7FBFC3C9A66E}
 		i = self.ReadHeaderFeature(node, 'FlangeContour')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'properties')
@@ -4368,6 +4588,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_FLOAT64_A_, 'coords', 3)
 		return i
 
+	@layout('u32:outlineItem lst2<NODE_X_REF>:properties s u32:u32_0 s u32:u32_1', 'ReadHeaderFeature', 'PunchTool')
 	def Read_C098D3CF(self, node): # PunchToolFeature {0DC3C610-F23D-44AD-B688-A47CAB5B04CB}
 		i = self.ReadHeaderFeature(node, 'PunchTool')
 		i = node.ReadUInt32(i, 'outlineItem')
@@ -4378,6 +4599,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('lst2<NODE_X_REF>:properties u32:u32_0 s', 'ReadHeaderFeature', 'NonParametricBase')
 	def Read_C2EF1CC7(self, node):
 		i = self.ReadHeaderFeature(node, 'NonParametricBase')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'properties')
@@ -4385,6 +4607,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('lst2<NODE_X_REF>:properties u32:u32_0 s[2]', 'ReadHeaderFeature', 'Flange')
 	def Read_C3DDDC08(self, node): # FlangeFeature {5475DDC1-3397-46D6-A7A3-E1C34FA5BD7E}
 		i = self.ReadHeaderFeature(node, 'Flange')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'properties')
@@ -4392,6 +4615,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('lst2<NODE_X_REF>:properties u32:u32_0 s[2]', 'ReadHeaderFeature', 'Face')
 	def Read_C4C14B90(self, node): # FaceFeature {600E3CEE-1600-4999-ACE4-7CED6483BECE}
 		i = self.ReadHeaderFeature(node, 'Face')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'properties')
@@ -4399,6 +4623,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('lst2<NODE_X_REF>:unfolds u32:u32_0', 'ReadHeaderFeature', 'Unfold')
 	def Read_F3DBA9D8(self, node): # FxUnfold
 		i = self.ReadHeaderFeature(node, 'Unfold')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'unfolds')
@@ -4560,6 +4785,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u8:u8_1', 'ReadHeaderComponentDerived', 'DerivedPart')
 	def Read_255D7ED7(self, node): # DerivedPartComponent {6D7C8AC8-722D-46C8-B6D9-F6001F1EDD2D}
 		i = self.ReadHeaderComponentDerived(node, 'DerivedPart')
 		i = node.ReadUInt8(i, 'u8_1')
@@ -4810,6 +5036,7 @@ class DCReader(EeDataReader):
 
 	#######################
 	# content header 2xskip cross reference sections
+	@layout('s (x[4])>2018 (x[4])>2020 xref:ref_1', 'ReadHeaderContent')
 	def ReadCntHdr1SCross(self, node, typeName = None, name = 'ref_1'):
 		i = self.ReadHeaderContent(node, typeName)
 		i = self.skipBlockSize(i)
@@ -4839,6 +5066,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('cref:ref_2 xref:ref_3 xref:thickness xref:reliefShahpe xref:reliefPosition xref:bendTransition xref:ref_4 xref:ref_5 lst6<MAP_U32_U32>:lst0', 'ReadCntHdr1SCross')
 	def Read_68821F22(self, node):
 		i = self.ReadCntHdr1SCross(node)
 		i = node.ReadChildRef(i, 'ref_2')
@@ -4854,6 +5082,7 @@ class DCReader(EeDataReader):
 
 	#######################
 	# content header 2xskip sections
+	@layout('s[2] (x[4])>2018 (x[4])>2020', 'ReadHeaderContent')
 	def ReadCntHdr2S(self, node, typeName = None):
 		i = self.ReadHeaderContent(node, typeName)
 		i = self.skipBlockSize(i, 2)
@@ -4895,6 +5124,7 @@ class DCReader(EeDataReader):
 		if (self.version > 2016 and self.version < 2025): i += 17
 		return i
 
+	@layout('v3:pos', 'ReadCntHdr2S')
 	def Read_262B3A9F(self, node):
 		i = self.ReadCntHdr2S(node)
 		i = node.ReadFloat64_3D(i, 'pos')
@@ -4919,6 +5149,7 @@ class DCReader(EeDataReader):
 		if (self.version > 2023): i += 4 # skip 00 00 00 00
 		return i
 
+	@layout('s32:s32_0 s u32[13]:a2 v3:a3 t16:txt0 u32[5]:a4 f64[6]:a5 u16[6]:a6 xref:parameter1 xref:parameter2 u32:u32_0 u32[2]:a7 s u32[2]:a8 xref:sketch', 'ReadCntHdr2S')
 	def Read_39A41830(self, node):
 		i = self.ReadCntHdr2S(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -4938,11 +5169,13 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'sketch')
 		return i
 
+	@layout('bool:value', 'ReadCntHdr2S')
 	def Read_3D8924FD(self, node):
 		i = self.ReadCntHdr2S(node)
 		i = node.ReadBoolean(i, 'value')
 		return i
 
+	@layout('v3:a1 v3:a2 v3:a3 u32:u32_0 lst2<NODE_X_REF>:lst0 u32:u32_1 lst2<NODE_X_REF>:lst1 u32:u32_2 xref:definition', 'ReadCntHdr2S', 'ThreadProxy')
 	def Read_4C478499(self, node):
 		i = self.ReadCntHdr2S(node, 'ThreadProxy')
 		i = node.ReadFloat64_3D(i, 'a1')
@@ -4975,11 +5208,13 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0', 'ReadCntHdr2S')
 	def Read_4F3DEE08(self, node):
 		i = self.ReadCntHdr2S(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
 		return i
 
+	@layout('lst2<UINT32>:lst0 lst2<UINT32>:lst1 lst2<UINT32>:lst2 lst2<UINT32>:lst3 lst2<UINT32>:lst4 u32[4]:a0', 'ReadCntHdr2S')
 	def Read_5CBF4E92(self, node):
 		i = self.ReadCntHdr2S(node)
 		i = node.ReadList2(i, importerSegNode._TYP_UINT32_, 'lst0')
@@ -4990,6 +5225,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32A(i, 4, 'a0')
 		return i
 
+	@layout('u32:u32_0 xref:ref_0 s lst2<NODE_REF>:lst0 s', 'ReadCntHdr2S')
 	def Read_71274EAC(self, node):
 		i = self.ReadCntHdr2S(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -4999,6 +5235,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_0 xref:ref_0 s lst2<NODE_REF>:lst0', 'ReadCntHdr2S')
 	def Read_7F614712(self, node):
 		i = self.ReadCntHdr2S(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -5007,6 +5244,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
 		return i
 
+	@layout('lst2<UINT32>:lst0 xref:ref_0 xref:ref_1 s u32[2]:a0 f64[8]:v0', 'ReadCntHdr2S')
 	def Read_88A7DE77(self, node):
 		i = self.ReadCntHdr2S(node)
 		i = node.ReadList2(i, importerSegNode._TYP_UINT32_, 'lst0')
@@ -5040,6 +5278,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_0')
 		return i
 
+	@layout('u32:u32_0 (x[1])>2017', 'ReadCntHdr2S')
 	def Read_90B64134(self, node):
 		i = self.ReadCntHdr2S(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -5056,16 +5295,19 @@ class DCReader(EeDataReader):
 			node.set('u32_1', 0, VAL_UINT32)
 		return i
 
+	@layout('v2:v0', 'ReadCntHdr2S')
 	def Read_CCD87CBA(self, node):
 		i = self.ReadCntHdr2S(node)
 		i = node.ReadFloat64_2D(i, 'v0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:items', 'ReadCntHdr2S', 'BodyCollection')
 	def Read_D5DAAA83(self, node): # SurfaceBodies {5DF860AE-6B16-11D3-B794-0060B0F159EF}
 		i = self.ReadCntHdr2S(node, 'BodyCollection')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'items')
 		return i
 
+	@layout('lst2<NODE_REF>:fxDimensions', 'ReadCntHdr2S', 'FeatureDimensions')
 	def Read_D83EF271(self, node):
 		i = self.ReadCntHdr2S(node, 'FeatureDimensions')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'fxDimensions')
@@ -5078,11 +5320,13 @@ class DCReader(EeDataReader):
 
 	#######################
 	# content header 2xskip cross reference sections
+	@layout('xref:ref_1', 'ReadCntHdr2S')
 	def ReadCntHdr2SCross(self, node, typeName = None, name = 'ref_1'):
 		i = self.ReadCntHdr2S(node, typeName)
 		i = node.ReadCrossRef(i, name)
 		return i
 
+	@layout('xref:thickness xref:ref_4 xref:ref_5 xref:ref_6 s xref:radius xref:ref_7 xref:reliefWidth xref:minRemnant xref:ref_2 u8[3]:a0 xref:ref_3 s u8:u8_0', 'ReadCntHdr2SCross', 'A96B5993_Def')
 	def Read_0455B440(self, node):
 		i = self.ReadCntHdr2SCross(node, 'A96B5993_Def')
 		i = node.ReadCrossRef(i, 'thickness')
@@ -5160,6 +5404,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'seamGap')
 		return i
 
+	@layout('xref:thickness xref:ref_2 xref:dir1 xref:dir2 s xref:radius xref:ref_3 xref:reliefWidth xref:minRemnant xref:ref_4 u8[3]:a0 xref:ref_5', 'ReadCntHdr2SCross', 'PlateDef')
 	def Read_A96B5992(self, node):
 		i = self.ReadCntHdr2SCross(node, 'PlateDef')
 		i = node.ReadCrossRef(i, 'thickness')
@@ -5176,6 +5421,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_5')
 		return i
 
+	@layout('xref:thickness xref:ref_3 xref:axis xref:dir s xref:radius xref:ref_7 xref:ref_8 xref:ref_9 xref:ref_A u8[3]:a0 xref:ref_B s u8:u8_0 s', 'ReadCntHdr2SCross', 'HemDef')
 	def Read_B310B8E5(self, node): # HemFeature {D9AB7AE5-6A67-4165-9E0B-0F008C9135B0}
 		i = self.ReadCntHdr2SCross(node, 'HemDef')
 		i = node.ReadCrossRef(i, 'thickness')
@@ -5195,11 +5441,13 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('cref:ref_2', 'ReadCntHdr2SCross')
 	def Read_BFBAAFA8(self, node):
 		i = self.ReadCntHdr2SCross(node)
 		i = node.ReadChildRef(i, 'ref_2')
 		return i
 
+	@layout('f64:f64_0', 'ReadCntHdr2SCross')
 	def Read_CDF78EC0(self, node):
 		i = self.ReadCntHdr2SCross(node)
 		i = node.ReadFloat64(i, 'f64_0')
@@ -5209,6 +5457,7 @@ class DCReader(EeDataReader):
 		i = self.ReadCntHdr2SCross(node)
 		return i
 
+	@layout('xref:ref_2 lst2<NODE_X_REF>:lst0', 'ReadCntHdr2SCross')
 	def Read_D30E5235(self, node):
 		i = self.ReadCntHdr2SCross(node)
 		i = node.ReadCrossRef(i, 'ref_2')
@@ -5268,12 +5517,14 @@ class DCReader(EeDataReader):
 
 	#######################
 	# H0 3xskip U32 skip sections
+	@layout('u32:flags2 s', 'ReadCntHdr3S')
 	def ReadHeadersss2S16s(self, node, typeName = None):
 		i = self.ReadCntHdr3S(node, typeName)
 		i = node.ReadUInt32(i, 'flags2')
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_1', 'ReadHeadersss2S16s')
 	def Read_0B85010C(self, node):
 		i = self.ReadHeadersss2S16s(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -5297,6 +5548,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_3D(i, 'point') # start point
 		return i
 
+	@layout('u8[2]:a0 xref:ref_0 u32[3]:a1 f32[4]:a2 u32[2]:a3 f32[4]:a4 lst2<UINT32>:lst0 lst2<FLOAT32>:lst1 lst2<UINT32>:lst2 f64[4]:a5 xref:reference', 'ReadHeadersss2S16s')
 	def Read_28CB7150(self, node):
 		i = self.ReadHeadersss2S16s(node)
 		i = node.ReadUInt8A(i, 2, 'a0')
@@ -5312,6 +5564,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'reference')
 		return i
 
+	@layout('u32:u32_1', 'ReadHeadersss2S16s', 'FaceDraft')
 	def Read_3170E5B0(self, node): # FaceDraftFeature {EA1D0D38-93AD-48BB-84AC-7707FAC29BAF}
 		i = self.ReadHeadersss2S16s(node, 'FaceDraft')
 		i = node.ReadUInt32(i, 'u32_1')
@@ -5321,6 +5574,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeadersss2S16s(node, 'FaceExtend')
 		return i
 
+	@layout('xref:ref_0 u32:u32_0 (x[4])>2017 s[2] u32[2]:a1 f64[10]:a2 f64:f64_0 u32[6]:a5 v2:a6', 'ReadHeadersss2S16s')
 	def Read_4116DA9E(self, node):
 		i = self.ReadHeadersss2S16s(node)
 		i = node.ReadCrossRef(i, 'ref_0')
@@ -5334,6 +5588,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_2D(i, 'a6') # Angle (e.g.: -pi ... +pi)
 		return i
 
+	@layout('u32:u32_0', 'ReadHeadersss2S16s')
 	def Read_46D500AA(self, node):
 		i = self.ReadHeadersss2S16s(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -5396,16 +5651,19 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64A(i, 7, 'a11')
 		return i
 
+	@layout('u32:u32_0', 'ReadHeadersss2S16s')
 	def Read_AD0D42B2(self, node):
 		i = self.ReadHeadersss2S16s(node)
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('u32:u32_0', 'ReadHeadersss2S16s')
 	def Read_B58135C4(self, node):
 		i = self.ReadHeadersss2S16s(node)
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('f64:a s (x[4])>2017 v3:dir', 'ReadHeadersss2S16s', 'DirectionAxis')
 	def Read_CE52DF40(self, node): # plain pattern direction
 		i = self.ReadHeadersss2S16s(node, 'DirectionAxis')
 		i = node.ReadFloat64(i, 'a')
@@ -5459,6 +5717,7 @@ class DCReader(EeDataReader):
 		node.isAttr = True
 		return i
 
+	@layout('xref:ref_0 u32:u32_0 (x[4])>2017 s[2] u32[2]:a1 f64[12]:a2 f64:f64_0 u32[2]:a3 u16[4]:a4 v3:a5', 'ReadHeadersss2S16s')
 	def Read_E70647C2(self, node):
 		i = self.ReadHeadersss2S16s(node)
 		i = node.ReadCrossRef(i, 'ref_0')
@@ -5515,6 +5774,7 @@ class DCReader(EeDataReader):
 
 	#######################
 	# 3D-sketch entity sections
+	@layout('xref:ref_0 xref:sketch (x[4])>2017 s', 'ReadHeadersss2S16s')
 	def ReadHeaderSketch3DEntity(self, node, typeName = None):
 		i = self.ReadHeadersss2S16s(node, typeName)
 		i = node.ReadCrossRef(i, 'ref_0')
@@ -5523,6 +5783,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('lst2<NODE_X_REF>:points s u32:u32_1 u8:u8_0 u32:u32_2', 'ReadHeaderSketch3DEntity', 'Spline3D_Fixed')
 	def Read_0B86AD43(self, node): # SketchFixedSpline3D {7A5B2F53-5756-4261-B6F1-4B5C3CDE1226}
 		i = self.ReadHeaderSketch3DEntity(node, 'Spline3D_Fixed')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'points')
@@ -5577,6 +5838,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:points s v3:pos v3:normal v3:m f64:r f64:startAngle f64:sweepAngle xref:center', 'ReadHeaderSketch3DEntity', 'Circle3D')
 	def Read_9E43716A(self, node): # Circle3D
 		i = self.ReadHeaderSketch3DEntity(node, 'Circle3D')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'points')
@@ -5590,6 +5852,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'center')
 		return i
 
+	@layout('lst2<NODE_X_REF>:points s v3:center v3:major v3:minor f64:a f64:b f64:startAngle f64:sweepAngle', 'ReadHeaderSketch3DEntity', 'Ellipse3D')
 	def Read_9E43716B(self, node): # Ellipse3D
 		i = self.ReadHeaderSketch3DEntity(node, 'Ellipse3D')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'points')
@@ -5603,6 +5866,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64(i, 'sweepAngle')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 s f64[6]:a0 u8:u8_0 s', 'ReadHeaderSketch3DEntity', 'SplineHandle3D')
 	def Read_C1A45D98(self, node): # SplineHandle3D
 		i = self.ReadHeaderSketch3DEntity(node, 'SplineHandle3D')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -5627,6 +5891,7 @@ class DCReader(EeDataReader):
 
 	#######################
 	# 2D-sketch entity sections
+	@layout('xref:sketch', 'ReadHeadersss2S16s')
 	def ReadHeaderSketch2DEntity(self, node, typeName = None):
 		i = self.ReadHeadersss2S16s(node, typeName)
 		i = node.ReadCrossRef(i, 'sketch')
@@ -5687,6 +5952,7 @@ class DCReader(EeDataReader):
 			i = self.skipBlockSize(i)
 		return i
 
+	@layout('xref:center f64:r u8:u8_0 s', 'ReadHeader2DEdge', 'Arc2D')
 	def Read_160915E2(self, node): # SketchArc {8006A046-ECC4-11D4-8DE9-0010B541CAA8}
 		i = self.ReadHeader2DEdge(node, 'Arc2D')
 		i = node.ReadCrossRef(i, 'center')
@@ -5718,12 +5984,14 @@ class DCReader(EeDataReader):
 #			i = node.ReadUInt32(i, 'u32_3')
 		return i
 
+	@layout('xref:entity f64:x', 'ReadHeader2DEdge', 'OffsetSpline2D')
 	def Read_3E55D947(self, node): # SketchOffsetSpline {063D7617-E630-4D35-B809-64D6695F57C0}:
 		i = self.ReadHeader2DEdge(node, 'OffsetSpline2D')
 		i = node.ReadCrossRef(i, 'entity')
 		i = node.ReadFloat64(i, 'x')
 		return i
 
+	@layout('xref:center v2:dA f64:a f64:b u8:u8_0', 'ReadHeader2DEdge', 'Ellipse2D')
 	def Read_4507D460(self, node): # SketchEllipse {8006A04A-ECC4-11D4-8DE9-0010B541CAA8}
 		i = self.ReadHeader2DEdge(node, 'Ellipse2D')
 		i = node.ReadCrossRef(i, 'center')
@@ -5733,12 +6001,14 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('f64[4]:a1 s', 'ReadHeader2DEdge', 'SplineHandle2D')
 	def Read_A644E76A(self, node): # SketchSplineHandle {1236D237-9BAC-4399-8CFB-66CB6B7FD5CA}
 		i = self.ReadHeader2DEdge(node, 'SplineHandle2D')
 		i = node.ReadFloat64A(i, 4, 'a1')
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('v2:pos v2:dir', 'ReadHeader2DEdge', 'Line2D')
 	def Read_CE52DF3A(self, node): # SketchLine {8006A016-ECC4-11D4-8DE9-0010B541CAA8}
 		i = self.ReadHeader2DEdge(node, 'Line2D')
 		# RootPoint
@@ -5747,6 +6017,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_2D(i, 'dir')
 		return i
 
+	@layout('xref:center f64:r u8:u8_0', 'ReadHeader2DEdge', 'Circle2D')
 	def Read_CE52DF3B(self, node): # SketchCircle {8006A04C-ECC4-11D4-8DE9-0010B541CAA8}
 		i = self.ReadHeader2DEdge(node, 'Circle2D')
 		i = node.ReadCrossRef(i, 'center')
@@ -5886,6 +6157,7 @@ class DCReader(EeDataReader):
 
 	##########################
 	# Linked element sections => FX-Attributes
+	@layout('u32[2]:a0 s (x[4])>2023 xref:owner pref cref:next s', 'Read_Header0', 'FxAttr_%s', 'setHeaderLinkedElement')
 	def ReadHeaderLinkedElement(self, node, typeName = None):
 		'''
 		Read the default header a0=UInt32[2], owner=SecNodeRef, next=SecNodeRef
@@ -5900,9 +6172,12 @@ class DCReader(EeDataReader):
 		i = node.ReadParentRef(i)
 		i = node.ReadChildRef(i, 'next')
 		i = self.skipBlockSize(i)
-		node.isAttr = True
+		self.setHeaderLinkedElement(node)
 		return i
 
+	def setHeaderLinkedElement(self, node):
+		node.isAttr = True
+
 	def Read_01E7910C(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		if (self.version > 2015):
@@ -5914,18 +6189,21 @@ class DCReader(EeDataReader):
 		i = self.ReadEdgeList(node, i)
 		return i
 
+	@layout('t16 s', 'ReadHeaderLinkedElement', 'FxAttrParameterComment')
 	def Read_0229768D(self, node): # FX-Attrirbute Parameter-Comment
 		i = self.ReadHeaderLinkedElement(node, 'FxAttrParameterComment')
 		i = node.ReadLen32Text16(i)
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('uid:uid s32[3]:a1', 'ReadHeaderLinkedElement')
 	def Read_025C7CD8(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUUID(i, 'uid')
 		i = node.ReadSInt32A(i, 3, 'a1')
 		return i
 
+	@layout('xref:entity2 u8:u8_0', 'ReadHeaderLinkedElement')
 	def Read_03D6552D(self, node): # FX-Attrirbute Sketch2D-Pre-Style
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadCrossRef(i, 'entity2')
@@ -5943,6 +6221,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'entity2')
 		return i
 
+	@layout('t16', 'ReadHeaderLinkedElement')
 	def Read_0E6B7F33(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadLen32Text16(i)
@@ -5956,12 +6235,14 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16A(i, 3, 'a2')
 		return i
 
+	@layout('t16 u32:u32_1', 'ReadHeaderLinkedElement', 'iFeatureTemplateDescriptor')
 	def Read_109727B0(self, node): # iFeatureTemplateDescriptor {3C69FF6F-6ADD-4CF5-8E9B-32CBD2B6BBF7}
 		i = self.ReadHeaderLinkedElement(node, 'iFeatureTemplateDescriptor')
 		i = node.ReadLen32Text16(i)
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('u32:u32_0', 'ReadHeaderLinkedElement')
 	def Read_10DC334C(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -5973,6 +6254,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('u32:u32_0 v3:a1 v3:a2', 'ReadHeaderLinkedElement')
 	def Read_1488B839(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -5980,6 +6262,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_3D(i, 'a2')
 		return i
 
+	@layout('f64:f64_0', 'ReadHeaderLinkedElement')
 	def Read_21004CF2(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadFloat64(i, 'f64_0')
@@ -5999,6 +6282,7 @@ class DCReader(EeDataReader):
 			i += 6*8 # ref. Sketch3D origin
 		return i
 
+	@layout('uid:id', 'ReadHeaderLinkedElement')
 	def Read_29AC9292(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUUID(i, 'id')
@@ -6008,17 +6292,20 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderLinkedElement(node)
 		return i
 
+	@layout('u8:u8_0 u16:u16_0', 'ReadHeaderLinkedElement')
 	def Read_2A636E60(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt8(i, 'u8_0')
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('u8:u8_0', 'ReadHeaderLinkedElement')
 	def Read_2AB13E5B(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('cref:ref_1 u16:u16_0 s xref:line1 xref:line2 u32:u32_1 v2:pos s (v3:p0 v3:p1 v3:p2 v3:p3 v3:p4)>2010', 'ReadHeaderLinkedElement')
 	def Read_2CE86835(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadChildRef(i, 'ref_1')
@@ -6037,6 +6324,7 @@ class DCReader(EeDataReader):
 			i = node.ReadFloat64_3D(i, 'p4')
 		return i
 
+	@layout('u32:u32_1 u8:u8_0', 'ReadHeaderLinkedElement')
 	def Read_2F39A056(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -6080,6 +6368,7 @@ class DCReader(EeDataReader):
 		i = node.ReadSInt16A(i, 2, 'a5')
 		return i
 
+	@layout('t16:standard t16:fastener t16:size u8:u8_0 u32:fit u32:u32_0', 'ReadHeaderLinkedElement', 'FxAttrClearanceHole')
 	def Read_46407F70(self, node): # FX-Attrirbute ClearanceHole
 		i = self.ReadHeaderLinkedElement(node, 'FxAttrClearanceHole')
 		i = node.ReadLen32Text16(i, 'standard')
@@ -6098,6 +6387,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32A(i, cnt, 'a1')
 		return i
 
+	@layout('cref:attr u16:u16_0 s u16:u16_1 xref:fxDims', 'ReadHeaderLinkedElement', 'FxAttrDimensionState')
 	def Read_475E7861(self, node): # FX-Attrirbute DimensionState
 		i = self.ReadHeaderLinkedElement(node, 'FxAttrDimensionState')
 		i = node.ReadChildRef(i, 'attr')
@@ -6107,17 +6397,20 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'fxDims')
 		return i
 
+	@layout('u16:u16_0', 'ReadHeaderLinkedElement')
 	def Read_48CF71CA(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('u8:u8_0 u16:u16_0', 'ReadHeaderLinkedElement')
 	def Read_4F8A6797(self, node): # FX-Attrirbute Sketch2D-Pre-Style
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt8(i, 'u8_0')
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('lst8<NODE_X_REF>:lst0', 'ReadHeaderLinkedElement')
 	def Read_52D04C41(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadList8(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -6130,12 +6423,14 @@ class DCReader(EeDataReader):
 		self.segment.ntKeys[key] = node
 		return i
 
+	@layout('u32:u32_0 u8:u8_0', 'ReadHeaderLinkedElement')
 	def Read_56970DFA(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32(i, 'u32_0')
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('cref:ref_1 cref:ref_2 cref:ref_3 cref:ref_4 cref:ref_5 cref:ref_6', 'ReadHeaderLinkedElement', 'FxAttrLabel')
 	def Read_59C3DD6C(self, node): # FX-Attrirbute Label
 		i = self.ReadHeaderLinkedElement(node, 'FxAttrLabel')
 		i = node.ReadChildRef(i, 'ref_1')
@@ -6158,6 +6453,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderLinkedElement(node)
 		return i
 
+	@layout('t16:txt_0 t16:txt_1 u8[3]:a1', 'ReadHeaderLinkedElement')
 	def Read_5ECA65C0(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadLen32Text16(i, 'txt_0')
@@ -6165,6 +6461,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8A(i, 3, 'a1')
 		return i
 
+	@layout('cref:ref_2', 'ReadHeaderLinkedElement')
 	def Read_5F425538(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadChildRef(i, 'ref_2')
@@ -6221,11 +6518,13 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderLinkedElement(node)
 		return i
 
+	@layout('u8:u8_0', 'ReadHeaderLinkedElement')
 	def Read_656DD01E(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('lst6<MAP_X_REF_REF>:lst0 lst6<MAP_X_REF_REF>:lst1 lst6<MAP_U32_U32>:lst2 lst6<MAP_U32_U32>:lst3', 'ReadHeaderLinkedElement')
 	def Read_6C69E7B8(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadList6(i, importerSegNode._TYP_MAP_X_REF_REF_, 'lst0')
@@ -6261,6 +6560,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'angle')  # Parameter
 		return i
 
+	@layout('u32:u32_0', 'ReadHeaderLinkedElement')
 	def Read_7C340AFD(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -6271,6 +6571,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_1')
 		return i
 
+	@layout('xref:ref_0 u16:u16_0', 'ReadHeaderLinkedElement')
 	def Read_7D981698(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadCrossRef(i, 'ref_0')
@@ -6282,12 +6583,14 @@ class DCReader(EeDataReader):
 		i = self.ReadTransformation3D(node, i)
 		return i
 
+	@layout('u32:u32_0 lst2<STRING16>:lst0', 'ReadHeaderLinkedElement')
 	def Read_7E36DE81(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32(i, 'u32_0')
 		i = node.ReadList2(i, importerSegNode._TYP_STRING16_, 'lst0')
 		return i
 
+	@layout('v3:pos lst6<MAP_U32_F64>:lst0', 'ReadHeaderLinkedElement')
 	def Read_8227E5B8(self, node): #
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadFloat64_3D(i, 'pos')
@@ -6319,11 +6622,13 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('u32[3]:a1', 'ReadHeaderLinkedElement')
 	def Read_878BD512(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32A(i, 3, 'a1')
 		return i
 
+	@layout('cref:ref_1 u16:u16_0 s xref:ref_2 v3:a1 s (x[48])>2010', 'ReadHeaderLinkedElement')
 	def Read_8C702CD5(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadChildRef(i, 'ref_1')
@@ -6335,11 +6640,13 @@ class DCReader(EeDataReader):
 		if (self.version > 2010): i += 48 # skip trailing 0x00's !
 		return i
 
+	@layout('u32:u32_0', 'ReadHeaderLinkedElement', 'FxAttrExtrusionSurface')
 	def Read_903F453F(self, node): # FX-Attribute ExtrusionSurface
 		i = self.ReadHeaderLinkedElement(node, 'FxAttrExtrusionSurface')
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('u32:u32_0 u32:associativeID u32:typEntity', 'ReadHeaderLinkedElement', 'FxAttrStyles')
 	def Read_90874D15(self, node): # FX-Attribute Styles
 		i = self.ReadHeaderLinkedElement(node, 'FxAttrStyles')
 		i = node.ReadUInt32(i, 'u32_0')
@@ -6354,6 +6661,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32A(i, 2, 'a2')
 		return i
 
+	@layout('u16:u16_0 t16:fmt1 t16:fmt2 cref:param1 cref:param2', 'ReadHeaderLinkedElement')
 	def Read_9271AB29(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt16(i, 'u16_0')
@@ -6384,6 +6692,7 @@ class DCReader(EeDataReader):
 		i = self.ReadUInt32A(node, i, cnt, 'lst1', 4)
 		return i
 
+	@layout('t16 t16:txt0 t16:standard t16:txt2 u32:u32_0 f64:x t16:txt3 t16:txt4 s t16:txt5 t16:txt6 t16:txt7 t16:txt8 t16:txt9 t16:txtA t16:txtB t16:txtC t16:txtD', 'ReadHeaderLinkedElement', 'FxAttrTappedHole')
 	def Read_A4087E1F(self, node): # FX-Attribute TappedHole
 		i = self.ReadHeaderLinkedElement(node, 'FxAttrTappedHole')
 		i = node.ReadLen32Text16(i)
@@ -6406,16 +6715,19 @@ class DCReader(EeDataReader):
 		i = node.ReadLen32Text16(i, 'txtD')
 		return i
 
+	@layout('u8:u8_0', 'ReadHeaderLinkedElement')
 	def Read_A5410F0A(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('cref:ref_2', 'ReadHeaderLinkedElement')
 	def Read_A917F560(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadChildRef(i, 'ref_2')
 		return i
 
+	@layout('cref:brep', 'ReadHeaderLinkedElement')
 	def Read_A9AEB67F(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadChildRef(i, 'brep')
@@ -6438,6 +6750,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderLinkedElement(node)
 		return i
 
+	@layout('t16:size t16:txt0 t16:txt1 u32[5]:a1 t16:txt2 t16:txt3 t16:txt4 t16:txt5 t16:txt6 t16:txt7 t16:txt8 t16:txt9 t16:txt10 t16:txt11 t16:txt12 t16:txt13 t16:txt14 t16:txt15 t16:txt16 t16:txt17 t16:txt18 t16:txt19', 'ReadHeaderLinkedElement', 'FxAttrTaperTappedHole')
 	def Read_B269ACEF(self, node): # FX-Attrbute TaperTappedHole
 		i = self.ReadHeaderLinkedElement(node, 'FxAttrTaperTappedHole')
 		i = node.ReadLen32Text16(i, 'size')
@@ -6480,6 +6793,7 @@ class DCReader(EeDataReader):
 			i += 4
 		return i
 
+	@layout('u16[5]:a1', 'ReadHeaderLinkedElement')
 	def Read_B59F6734(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt16A(i, 5, 'a1')
@@ -6505,6 +6819,7 @@ class DCReader(EeDataReader):
 		node.set('lst0', lst, VAL_UINT32)
 		return i
 
+	@layout('u8:u8_0', 'ReadHeaderLinkedElement')
 	def Read_B6C5116B(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt8(i, 'u8_0')
@@ -6517,6 +6832,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'parameter')
 		return i
 
+	@layout('xref:entity2 f64[4]:a1 u32:u32_0', 'ReadHeaderLinkedElement')
 	def Read_BFD09C43(self, node): # FX-Attribute Sketch2D-Pre-Style
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadCrossRef(i, 'entity2')
@@ -6532,6 +6848,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderLinkedElement(node)
 		return i
 
+	@layout('s u32:u32_0 v2:pos', 'ReadHeaderLinkedElement')
 	def Read_C89EF3C0(self, node): # FX-Attribute Sketch2D-Pre-Style
 		i = self.ReadHeaderLinkedElement(node)
 		i = self.skipBlockSize(i)
@@ -6539,6 +6856,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_2D(i, 'pos')
 		return i
 
+	@layout('u8:u8_0 u32:u32_0 lst2<UINT32>:lst0 u32:u32_1', 'ReadHeaderLinkedElement')
 	def Read_CB71CED6(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt8(i, 'u8_0')
@@ -6547,6 +6865,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('u32[2]:a1 cref:ref_6 u8:u8_0', 'ReadHeaderLinkedElement')
 	def Read_CCCB9A78(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32A(i, 2, 'a1')
@@ -6554,6 +6873,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('s u32:u32_0 v2:pos v2:dir', 'ReadHeaderLinkedElement')
 	def Read_D5F19E40(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = self.skipBlockSize(i)
@@ -6562,6 +6882,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_2D(i, 'dir')
 		return i
 
+	@layout('s u32:u32_0 v3:a1', 'ReadHeaderLinkedElement')
 	def Read_D5F19E41(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = self.skipBlockSize(i)
@@ -6569,6 +6890,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_3D(i, 'a1')
 		return i
 
+	@layout('s u32:u32_0 f64[6]:a1', 'ReadHeaderLinkedElement')
 	def Read_D5F19E42(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = self.skipBlockSize(i)
@@ -6576,6 +6898,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64A(i, 6, 'a1')
 		return i
 
+	@layout('u8:u8_0 t16 u16[5]:a1 u8:u8_1', 'ReadHeaderLinkedElement')
 	def Read_D7F4C16F(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt8(i, 'u8_0')
@@ -6601,11 +6924,13 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'participant')
 		return i
 
+	@layout('u32:u32_0', 'ReadHeaderLinkedElement')
 	def Read_E047663E(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('uid:uid', 'ReadHeaderLinkedElement')
 	def Read_E6158074(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUUID(i, 'uid')
@@ -6615,6 +6940,7 @@ class DCReader(EeDataReader):
 		i = self.ReadHeaderLinkedElement(node)
 		return i
 
+	@layout('t16', 'ReadHeaderLinkedElement')
 	def Read_ED3175C6(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadLen32Text16(i)
@@ -6626,6 +6952,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_0 xref:ref_3 xref:ref_4 xref:ref_5', 'ReadHeaderLinkedElement')
 	def Read_EE558505(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -6634,6 +6961,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_5')
 		return i
 
+	@layout('u32:u32_0 xref:ref_3 xref:ref_4 xref:ref_5 s xref:ref_6 xref:ref_7 xref:ref_8 xref:ref_9', 'ReadHeaderLinkedElement')
 	def Read_EE558506(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -6647,6 +6975,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_9')
 		return i
 
+	@layout('u32:u32_0 xref:ref_3 xref:ref_4 xref:ref_5 s xref:ref_6 xref:ref_7 xref:offset1 xref:offset2 xref:ref_A', 'ReadHeaderLinkedElement')
 	def Read_EE558507(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -6661,6 +6990,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_A')
 		return i
 
+	@layout('u32:u32_0 xref:parameter1 xref:direction xref:ref_3 s xref:ref_4 xref:parameter2 xref:parameter3', 'ReadHeaderLinkedElement')
 	def Read_EE558508(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadUInt32(i, 'u32_0')
@@ -6673,6 +7003,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'parameter3')
 		return i
 
+	@layout('cref:entity2 u16:u16_0 s xref:entity3 xref:entity4 u32:u32_0 v2:a1 s (v3:p1 v3:p2 v2:a2)>2010', 'ReadHeaderLinkedElement')
 	def Read_EEE03AF5(self, node): # FX-Attribute Sketch2D-Pre-Style
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadChildRef(i, 'entity2')
@@ -6694,6 +7025,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_0')
 		return i
 
+	@layout('cref:ref_1 cref:ref_2 cref:ref_3', 'ReadHeaderLinkedElement')
 	def Read_F4B6001D(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadChildRef(i, 'ref_1')
@@ -6701,11 +7033,13 @@ class DCReader(EeDataReader):
 		i = node.ReadChildRef(i, 'ref_3')
 		return i
 
+	@layout('bool:b0', 'ReadHeaderLinkedElement')
 	def Read_F8371DBE(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = node.ReadBoolean(i, 'b0')
 		return i
 
+	@layout('s u32:u32_1 v2:p1 v2:p2', 'ReadHeaderLinkedElement')
 	def Read_FA6E9782(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = self.skipBlockSize(i)
@@ -6723,6 +7057,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('s u32[9]:a1', 'ReadHeaderLinkedElement')
 	def Read_FD7702B0(self, node):
 		i = self.ReadHeaderLinkedElement(node)
 		i = self.skipBlockSize(i)
@@ -7085,6 +7420,7 @@ class DCReader(EeDataReader):
 	########################################
 	# other Functions sections (TODO)
 
+	@layout('xref:ref_1 (x[4])>2016 u16:u16_0 u32[2]:a0 lst6<MAP_U32_U32>:lst0', 'Read_Header0')
 	def Read_01E0570C(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -7094,6 +7430,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList6(i, importerSegNode._TYP_MAP_U32_U32_, 'lst0')
 		return i
 
+	@layout('u32:u32_0 pref u32[5]:a0 cref:ref_0 cref:ref_1', 'Read_Header0')
 	def Read_2F1C7025(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -7103,6 +7440,7 @@ class DCReader(EeDataReader):
 		i = node.ReadChildRef(i, 'ref_1')
 		return i
 
+	@layout('xref:ref_1 (x[4])>2016 u16:u16_0', 'Read_Header0')
 	def Read_588B9053(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -7120,6 +7458,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList6(i, importerSegNode._TYP_MAP_U32_U32_, 'lst0')
 		return i
 
+	@layout('xref:ref_1 (x[4])>2016 u32:u32_0 xref:ref_2 u8:u8_0', 'Read_Header0')
 	def Read_253BE3EB(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -7129,6 +7468,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('xref:ref_1 (x[4])>2016 u32:u32_0 xref:sketch u8:u8_0 u32:u32_1 u32:u32_2 lst6<MAP_KEY_X_REF>:lst0', 'Read_Header0')
 	def Read_4571AC37(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -7141,6 +7481,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList6(i, importerSegNode._TYP_MAP_KEY_X_REF_, 'lst0')
 		return i
 
+	@layout('cref:ref_4 (x[4])>2016 u16:u16_0', 'Read_Header0')
 	def Read_470BB79E(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_4')
@@ -7148,6 +7489,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('xref:ref_1 (x[4])>2016 u32:u32_0 xref:ref_2 u8:u8_0 u16:u16_0', 'Read_Header0')
 	def Read_4CAA281F(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -7158,6 +7500,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('cref:ref_1 (x[4])>2016 u32:u32_0 xref:ref_2 u8:u8_0', 'Read_Header0')
 	def Read_5246A008(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_1')
@@ -7167,6 +7510,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('xref (x[4])>2016 u16:u16_0', 'Read_Header0')
 	def Read_5BE20B76(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i)
@@ -7174,6 +7518,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('xref:ref_1 (x[4])>2016 u32:u32_0 xref:parameter u8:u8_0', 'Read_Header0')
 	def Read_D92A619C(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -7213,6 +7558,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_1')
 		return i
 
+	@layout('(x[4])>2023 cref:cld_0 u16[2]:a0 s lst2<NODE_REF>:lst0', 'Read_Header0')
 	def Read_040D7FB2(self, node):
 		i = node.Read_Header0()
 		if (self.version > 2023): i += 4 # skip 00 00 00 00
@@ -7250,6 +7596,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_3D(i, 'center')
 		return i
 
+	@layout('u32:u32_0 u32:u32_1 s (x[4])>2023 lst2<NODE_REF>:lst1', 'Read_Header0')
 	def Read_077D9583(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -7259,6 +7606,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst1')
 		return i
 
+	@layout('u32:u32_0 u32:u32_1 (x[4])>2023 xref:surface pref u32:u32_2 uid:uid', 'Read_Header0')
 	def Read_07AB2269(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -7297,6 +7645,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_3D(i, 'a1')
 		return i
 
+	@layout('u32[2]:a0 s (x[4])>2023 lst2<NODE_REF>:lst0', 'Read_Header0')
 	def Read_182D1C40(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -7325,7 +7674,7 @@ class DCReader(EeDataReader):
 		size = hdr[1]
 		if (size > 0):
 			i += 8
-			buffer = node.data[i:i+size]
+			buffer = bytes(node.data[i:i+size])
 			dumpFolder = getDumpFolder()
 			if (not (dumpFolder is None)):
 				filename = u"%s/%s_%04X.xls" %(dumpFolder, node.typeName, node.index)
@@ -7505,6 +7854,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'param4')
 		return i
 
+	@layout('pref lst2<NODE_X_REF>:lst0', 'Read_Header0')
 	def Read_315C9CC8(self, node):
 		i = node.Read_Header0()
 		i = node.ReadParentRef(i)
@@ -7526,6 +7876,7 @@ class DCReader(EeDataReader):
 		#			A1 14 00 80:9D 14 00 80
 		return i
 
+	@layout('pref cref:ref_0 u8[3]:a0 t16 cref:ref_1', 'Read_Header0')
 	def Read_3344C951(self, node):
 		i = node.Read_Header0()
 		i = node.ReadParentRef(i)
@@ -7605,6 +7956,7 @@ class DCReader(EeDataReader):
 			node.set('txt0', 'FlatPattern')
 		return i
 
+	@layout('pref u32[2]:a0 xref:ref_1 u32[3]:a1 xref:ref_2', 'Read_Header0')
 	def Read_4E2F2EF0(self, node):
 		i = node.Read_Header0()
 		i = node.ReadParentRef(i)
@@ -7614,6 +7966,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('u32[2]:a0 s uid:uid t16 lst2<NODE_X_REF>:lst0 u32[3]:a1 s cref:ref_0 cref:ref_1 s u32[4]:a2 s u32[2]:a3 cref:ref_2 u32[2]:a4 s cref:ref_3 cref:ref_4 f64:f0 u32:u32_0', 'Read_Header0')
 	def Read_58D705D0(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -7653,6 +8006,7 @@ class DCReader(EeDataReader):
 			i = node.ReadList6(i, importerSegNode._TYP_MAP_X_REF_1D_UINT32_, 'lst1')
 		return i
 
+	@layout('uid:uid_0 lst2<NODE_X_REF>:lst0 lst2<NODE_X_REF>:lst1 u32:u32_0 u32:u32_1 u32:u32_2', 'Read_Header0')
 	def Read_B2D25560(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUUID(i, 'uid_0')
@@ -7663,6 +8017,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('xref:ref_1 t16 u32:u32_0', 'Read_Header0')
 	def Read_4028CCAA(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -7720,6 +8075,7 @@ class DCReader(EeDataReader):
 		i = node.Read_Header0()
 		return i
 
+	@layout('u32[2]:a0 s (x[4])>2023 u32[3]:edge u32[3]:pt1 u32[3]:pt2 u8:u8_0 s xref:sketch xref:curve xref:point1 xref:point2', 'Read_Header0')
 	def Read_48CF47FA(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -7736,12 +8092,14 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'point2')
 		return i
 
+	@layout('xref:ref_1 u32[3]:a1', 'Read_Header0')
 	def Read_534DD87E(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
 		i = node.ReadUInt32A(i, 3, 'a1')
 		return i
 
+	@layout('u32[2]:a0 (x[4])>2023 pref u32:u32_0 cref:ref_1 xref:ref_2', 'Read_Header0')
 	def Read_55180D7F(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -7752,12 +8110,14 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('xref:parameter f64:x', 'Read_Header0')
 	def Read_553DA303(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'parameter')
 		i = node.ReadFloat64(i, 'x')
 		return i
 
+	@layout('u32:u32_0 uid:id f64[6]:a0', 'Read_Header0')
 	def Read_57BF6FCE(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -7765,6 +8125,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64A(i, 6, 'a0')
 		return i
 
+	@layout('v3:pos cref:ref_0 cref:ref_1 u32[2]:a0 cref:ref_2', 'Read_Header0')
 	def Read_6145BAFB(self, node):
 		i = node.Read_Header0()
 		i = node.ReadFloat64_3D(i, 'pos')
@@ -7796,6 +8157,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32A(i, 3, 'a5')
 		return i
 
+	@layout('u32:u32_0 s[2] u32[4]:a0', 'Read_Header0')
 	def Read_61B56690(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -7810,6 +8172,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList6(i, importerSegNode._TYP_MAP_KEY_X_REF_, 'lst0')
 		return i
 
+	@layout('u32[2]:a0 s t16 t16:txt0 t16:txt1 u8:u32_0', 'Read_Header0')
 	def Read_66398149(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -7833,12 +8196,14 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_UINT32_, 'lst1')
 		return i
 
+	@layout('pref u16:u16_0', 'Read_Header0')
 	def Read_6C7D97A9(self, node):
 		i = node.Read_Header0()
 		i = node.ReadParentRef(i)
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('cref:ref_0 cref:ref_1 cref:ref_2 cref:ref_3 cref:ref_4 cref:ref_5 cref:ref_6 cref:ref_7 cref:ref_8 cref:ref_9 cref:ref_10 cref:ref_11 cref:ref_12 u32[2]:a0 cref:ref_13 u32[3]:a1 cref:ref_14', 'Read_Header0')
 	def Read_6D1C07D1(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_0')
@@ -7860,6 +8225,7 @@ class DCReader(EeDataReader):
 		i = node.ReadChildRef(i, 'ref_14')
 		return i
 
+	@layout('xref:ref_1 u32:u32_0 t8:txt_0 u32:u32_1 t16 u32[3]:a0 t16:path', 'Read_Header0')
 	def Read_0B857D8D(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -7886,6 +8252,7 @@ class DCReader(EeDataReader):
 			node.set('lst0', [])
 		return i
 
+	@layout('xref:ref_1 u32:u32_0 t8:txt0 lst2<UINT32>:lst0', 'Read_Header0')
 	def Read_72A7D774(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -7900,6 +8267,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'side2')
 		return i
 
+	@layout('pref (xref:ref_1)>2016 u16:u16_0', 'Read_Header0')
 	def Read_774572D4(self, node):
 		i = node.Read_Header0()
 		i = node.ReadParentRef(i)
@@ -7916,6 +8284,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'parameter')
 		return i
 
+	@layout('xref:ref_1 (x[4])>2016 u32:u32_0 xref:ref_2 u8:u8_0 uid:id1 uid:id2 u32:u32_1', 'Read_Header0')
 	def Read_7E0E4CA9(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -7960,6 +8329,7 @@ class DCReader(EeDataReader):
 		i = self.Read2RefList(node, i, 'a1', importerSegNode.REF_CHILD, importerSegNode.REF_CHILD)
 		return i
 
+	@layout('xref:ref_0 xref:owner u8:u8_0 u16:u16_0 t16 cref:ref_2 (x[1])>2012 (x[4])>2017', 'Read_Header0')
 	def Read_80102AC1(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_0')
@@ -7972,11 +8342,13 @@ class DCReader(EeDataReader):
 		if (self.version > 2017): i += 4 # skip 00 00 00 00
 		return i
 
+	@layout('lst2<NODE_REF>:lst0', 'Read_Header0')
 	def Read_8398E8EC(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
 		return i
 
+	@layout('u32:u32_0 s[3] xref:component u32:u32_1', 'Read_Header0')
 	def Read_845212C7(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -7985,6 +8357,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('cref:ref_1 (x[4])>2018 u32:u32_0 cref:ref_2 u8:u8_0', 'Read_Header0')
 	def Read_855B1557(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_1')
@@ -7994,6 +8367,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('xref:ref_1 (x[4])>2016 u32:u32_0 xref:ref_2 u8:u8_0 u16:u16_0', 'Read_Header0')
 	def Read_86197AE1(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8004,6 +8378,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('u32:u32_0 u32:u32_1 (x[4])>2024 lst2<NODE_REF>:lst0 bool:b_0', 'Read_Header0')
 	def Read_872AC9CA(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -8017,6 +8392,7 @@ class DCReader(EeDataReader):
 		i = node.Read_Header0()
 		return i
 
+	@layout('u32:u32_0 s t16 s', 'Read_Header0')
 	def Read_30FDF0B9(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -8025,6 +8401,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_0 s t16', 'Read_Header0', 'SurfaceDetail')
 	def Read_8B3E95F7(self, node):
 		i = node.Read_Header0('SurfaceDetail')
 		i = node.ReadUInt32(i, 'u32_0')
@@ -8032,6 +8409,7 @@ class DCReader(EeDataReader):
 		i = node.ReadLen32Text16(i)
 		return i
 
+	@layout('u32:u32_0 s t16 s', 'Read_Header0')
 	def Read_DF3B2C5B(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -8044,6 +8422,7 @@ class DCReader(EeDataReader):
 		i = node.Read_Header0()
 		return i
 
+	@layout('cref:ref_1 s[3] xref:ref_2 u16:u16_0', 'Read_Header0')
 	def Read_8EDEE6CB(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_1')
@@ -8052,6 +8431,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('xref:ref_1 (x[4])>2016 u16:u16_0', 'Read_Header0')
 	def Read_907EAD2B(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8149,6 +8529,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16A(i, 9, 'a1')
 		return i
 
+	@layout('xref:value t16 u32:u32_0', 'Read_Header0')
 	def Read_95DC570D(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'value')
@@ -8224,6 +8605,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('xref:ref_1 xref:ref_2 xref:ref_3 u8:u8_0', 'Read_Header0')
 	def Read_B0B886C5(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8271,6 +8653,7 @@ class DCReader(EeDataReader):
 			lst.append((l, a, b, c))
 		return i
 
+	@layout('u32[2]:a0 s (x[4])>2023 lst2<NODE_REF>:lst0', 'Read_Header0')
 	def Read_B835A483(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -8309,6 +8692,7 @@ class DCReader(EeDataReader):
 			i = node.ReadUInt32(i, 'key_1')
 		return i
 
+	@layout('u32:u32_0 s[3] xref:ref_1 xref:ref_2 u32:u32_1', 'Read_Header0')
 	def Read_1F213DE0(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -8318,6 +8702,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('u32[2]:a0 s uid:uid t16 lst2<NODE_REF>:lst0 u32[3]:a1 s cref:ref_1 cref:ref_2 s u32[4]:a2 s', 'Read_Header0')
 	def Read_1F535F68(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -8334,6 +8719,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32[2]:a0 s (x[4])>2023 lst2<NODE_REF>:lst0 f64[5]:a1 u32:u32_0 u8:u8_0 f64[6]:a2 (uid:uid1 uid:uid2 uid:uid3 uid:uid4 (x[33])>2023)>2014', 'Read_Header0')
 	def Read_CB072B3B(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -8352,6 +8738,7 @@ class DCReader(EeDataReader):
 			if (self.version > 2023): i += 33 # skip 00...
 		return i
 
+	@layout('u32:u32_0 cref:ref_1 xref:ref_2', 'Read_Header0')
 	def Read_CB370222(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -8359,6 +8746,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('u32:index u8:u8_0 xref:asm u32:u32_1 x[4]', 'Read_Header0', 'AsmEntityWrapper')
 	def Read_CC0F7521(self, node): # AsmEntityWrapper
 		i = node.Read_Header0('AsmEntityWrapper')
 		i = node.ReadUInt32(i, 'index')
@@ -8372,6 +8760,7 @@ class DCReader(EeDataReader):
 		i = node.Read_Header0()
 		return i
 
+	@layout('u32[2]:a0 (x[4])>2024 xref:ref_1 pref xref:ref_3 lst2<STRING16>:lst1', 'Read_Header0')
 	def Read_CD1423D9(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -8382,6 +8771,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_STRING16_, 'lst1')
 		return i
 
+	@layout('xref:ref_1 (x[4])>2016 xref:ref_2 xref:ref_3 u8:u8_0', 'Read_Header0')
 	def Read_D589D818(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8405,6 +8795,7 @@ class DCReader(EeDataReader):
 		i = node.Read_Header0()
 		return i
 
+	@layout('lst6<MAP_U32_U32>:lst0 s u32:u32_0 u32:u32_1 t16 f64[5]:a0 t16:txt0 v3:a1 u32[2]:a2 u16[3]:a3 (x[3])>2024 u8[2]:a5 t16:txt1 t16:txt2 u32[11]:a4 u8:u8_0', 'Read_Header0')
 	def Read_D797B7B9(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList6(i, importerSegNode._TYP_MAP_U32_U32_, 'lst0')
@@ -8425,6 +8816,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('(x[4])>2023 cref:cld_0 u32:u32_0 s lst2<NODE_REF>:lst0 u16:length u16:angle u16:u16_0', 'Read_Header0', 'DisplayDecimals')
 	def Read_D95B951A(self, node): # Display decimals
 		i = node.Read_Header0('DisplayDecimals')
 		if (self.version > 2023): i += 4 # skip 00 00 00 00
@@ -8437,6 +8829,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('xref:ref_1 (x[4])>2016 u16:u16_0', 'Read_Header0')
 	def Read_DA2C89C5(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8477,6 +8870,7 @@ class DCReader(EeDataReader):
 		node.set('lst0', lst)
 		return i
 
+	@layout('u32:u32_0 s[2] lst2<UINT32>:lst0 lst2<UINT32>:lst1 s32[3]:a0', 'Read_Header0')
 	def Read_DDBFFD2F(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -8486,6 +8880,7 @@ class DCReader(EeDataReader):
 		i = node.ReadSInt32A(i, 3, 'a0')
 		return i
 
+	@layout('u32[2]:a0 s (x[4])>2023 u32:u32_0 t16 t16:txt1 lst2<NODE_X_REF>:parameters', 'Read_Header0')
 	def Read_E192FA73(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -8497,11 +8892,13 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'parameters')
 		return i
 
+	@layout('u32[3]:a0', 'Read_Header0')
 	def Read_E28D3B3F(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 3, 'a0')
 		return i
 
+	@layout('u32:u32_0 xref:ref_1 u8:u8_0 u32:u32_1 u16:u16_0 pref u8:u8_8', 'Read_Header0')
 	def Read_E2D83380(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -8539,6 +8936,7 @@ class DCReader(EeDataReader):
 		node.set('lst', lstJ)
 		return i
 
+	@layout('xref:ref_1 u32[2]:a0 xref:ref_2 u8:u8_0 u32[2]:a1 lst6<MAP_KEY_X_REF>:lst0 lst6<MAP_KEY_X_REF>:lst1', 'Read_Header0')
 	def Read_EE311CA5(self, node): # new in 2019
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8550,6 +8948,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList6(i, importerSegNode._TYP_MAP_KEY_X_REF_, 'lst1')
 		return i
 
+	@layout('u32[2]:a0 s xref:ref_1 xref:ref_2 u32:u32_0', 'Read_Header0')
 	def Read_F0F5EB21(self, node): # new in 2019
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -8563,6 +8962,7 @@ class DCReader(EeDataReader):
 		i = node.Read_Header0()
 		return i
 
+	@layout('xref:ref_0 xref:ref_1 u32:u32_0 s[2] xref:ref_3', 'Read_Header0')
 	def Read_F2C761B8(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_0')
@@ -8572,6 +8972,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_3')
 		return i
 
+	@layout('cref:ref_1 u32:flags s (x[4])>2023 pref cref:surface cref:ref_3 s u16[2]:a0 u16:idxCreator u16:u16_0', 'Read_Header0', 'SurfaceCreator')
 	def Read_F3FC69C6(self, node): # SurfaceCreator
 		i = node.Read_Header0('SurfaceCreator')
 		i = node.ReadChildRef(i, 'ref_1')
@@ -8594,6 +8995,7 @@ class DCReader(EeDataReader):
 		i = self.ReadNtEntry(node, i, 'ntEntry')
 		return i
 
+	@layout('cref:ref_1 cref:ref_2', 'Read_Header0')
 	def Read_F8A779F9(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_1')
@@ -8646,6 +9048,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUUID(i, 'uid3')
 		return i
 
+	@layout('s s32:s32_1 s xref:ref_0 s', 'ReadHeaderContent')
 	def ReadHeaderCntSLRS(self, node, typeName = None):
 		if (not typeName is None):
 			node.typeName = typeName
@@ -8657,6 +9060,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u8:u8_0 lst2<NODE_REF>:lst0 lst2<NODE_REF>:lst1 u8:u8_1 u32:u32_0 x[4]', 'ReadHeaderCntSLRS')
 	def Read_1E9612BA(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadUInt8(i, 'u8_0')
@@ -8667,6 +9071,7 @@ class DCReader(EeDataReader):
 		i += 4
 		return i
 
+	@layout('u8:u8_0 lst2<NODE_REF>:lst0 lst2<NODE_REF>:lst1 u8:u8_1 u32:u32_0 x[4] (x[1])>2012', 'ReadHeaderCntSLRS')
 	def Read_4E86F048(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadUInt8(i, 'u8_0')
@@ -8678,6 +9083,7 @@ class DCReader(EeDataReader):
 		if (self.version > 2012): i += 1
 		return i
 
+	@layout('u8:u8_0 lst2<NODE_REF>:lst0 lst2<NODE_REF>:lst1 u8:u8_1 u32:u32_0 x[4] (x[1])>2012', 'ReadHeaderCntSLRS')
 	def Read_4E86F04A(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadUInt8(i, 'u8_0')
@@ -8689,6 +9095,7 @@ class DCReader(EeDataReader):
 		if (self.version > 2012): i += 1
 		return i
 
+	@layout('u8:u8_0 lst2<NODE_REF>:lst0 lst2<NODE_REF>:lst1 u8:u8_1 u32:u32_0 x[4] (x[1])>2012', 'ReadHeaderCntSLRS')
 	def Read_4E86F04B(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadUInt8(i, 'u8_0')
@@ -8700,6 +9107,7 @@ class DCReader(EeDataReader):
 		if (self.version > 2012): i += 1
 		return i
 
+	@layout('u8:u8_0 lst2<NODE_REF>:lst0 lst2<NODE_REF>:lst1 u8:u8_1 u32:u32_0 x[4]', 'ReadHeaderCntSLRS')
 	def Read_5B10BF5B(self, node):
 		i = self.ReadHeaderCntSLRS(node)#
 		i = node.ReadUInt8(i, 'u8_0')
@@ -8710,6 +9118,7 @@ class DCReader(EeDataReader):
 		i += 4
 		return i
 
+	@layout('u8:u8_0 lst2<NODE_REF>:lst0 lst2<NODE_REF>:lst1 u8:u8_1 u32:u32_0 x[4] s', 'ReadHeaderCntSLRS')
 	def Read_668BF010(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadUInt8(i, 'u8_0')
@@ -8721,6 +9130,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('xref:ref_1 u32:u32_0 s bool:b0', 'ReadHeaderCntSLRS')
 	def Read_AE1C96C9(self, node): # Harness
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8729,6 +9139,7 @@ class DCReader(EeDataReader):
 		i = node.ReadBoolean(i, 'b0')
 		return i
 
+	@layout('u8:u8_0 lst2<NODE_REF>:lst0 lst2<NODE_REF>:lst1 u8:u8_1 u32:u32_0 x[4] (x[1])>2012', 'ReadHeaderCntSLRS')
 	def Read_B2D4290F(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadUInt8(i, 'u8_0')
@@ -8740,6 +9151,7 @@ class DCReader(EeDataReader):
 		if (self.version > 2012): i += 1
 		return i
 
+	@layout('u8:u8_0 lst2<NODE_REF>:lst0 lst2<NODE_X_REF>:lst1 u8:u8_1 u32:u32_0 x[4] (x[1])>2012 t16', 'ReadHeaderCntSLRS')
 	def Read_FA0306F9(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadUInt8(i, 'u8_0')
@@ -8752,6 +9164,7 @@ class DCReader(EeDataReader):
 		i = node.ReadLen32Text16(i)
 		return i
 
+	@layout('xref:ref_1 u32:u32_0 s xref:ref_2', 'ReadHeaderCntSLRS')
 	def Read_32C3DC38(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8760,6 +9173,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('xref:ref_1 u32:u32_0 s lst2<NODE_REF>:lst0', 'ReadHeaderCntSLRS')
 	def Read_6B19C0D9(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8768,6 +9182,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
 		return i
 
+	@layout('xref:ref_1 u32:u32_0 s lst2<NODE_REF>:lst0 lst2<NODE_X_REF>:lst1', 'ReadHeaderCntSLRS')
 	def Read_B8E70BB5(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8777,6 +9192,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst1')
 		return i
 
+	@layout('xref:ref_1 u32:u32_0 s lst2<NODE_X_REF>:lst0 s xref:ref_2 (xref:ref_3)>2017', 'ReadHeaderCntSLRS')
 	def Read_2EBC1160(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8789,6 +9205,7 @@ class DCReader(EeDataReader):
 			i = node.ReadCrossRef(i, 'ref_3')
 		return i
 
+	@layout('xref:ref_1 u32:u32_0 s lst2<NODE_REF>:lst0 s xref:ref_2 lst6<MAP_KEY_X_REF>:lst1', 'ReadHeaderCntSLRS')
 	def Read_659BE14E(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8800,6 +9217,7 @@ class DCReader(EeDataReader):
 		i = node.ReadList6(i, importerSegNode._TYP_MAP_KEY_X_REF_, 'lst1')
 		return i
 
+	@layout('xref:ref_1 u32:u32_0 s lst2<NODE_X_REF>:lst0 lst2<NODE_REF>:lst1 u32:cnt_lst1 lst2<UINT32>:lst0 u32[2]:a0 s xref:ref_2', 'ReadHeaderCntSLRS')
 	def Read_34AACB53(self, node):
 		i = self.ReadHeaderCntSLRS(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8908,6 +9326,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt16A(0, 9, 'a0')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0 pref s32:s32_1', 'ReadHeadersS32ss')
 	def Read_5CC350B8(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -8925,6 +9344,7 @@ class DCReader(EeDataReader):
 			i += node.ReadChildRef(i, 'ref_3')
 		return i
 
+	@layout('pref lst2<NODE_REF>:lst0 u32[2]:a0 bool:b0', 'ReadHeadersS32ss')
 	def Read_8B21126C(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadParentRef(i)
@@ -8946,6 +9366,7 @@ class DCReader(EeDataReader):
 			node.set('txt', '')
 		return i
 
+	@layout('t16 t16:txt_0 u32:u32_2 lst2<NODE_X_REF>:lst0 u32:u32_3 pref', 'ReadHeadersS32ss')
 	def Read_98A24D9A(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadLen32Text16(i)
@@ -8956,6 +9377,7 @@ class DCReader(EeDataReader):
 		i = node.ReadParentRef(i)
 		return i
 
+	@layout('xref:ref_1 u32:u32_0 xref:ref_2 xref:ref_3 u32[2]:a0 bool:b0 s', 'ReadHeadersS32ss')
 	def Read_8840FC91(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8967,6 +9389,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('xref:ref_1 u32:u32_0 xref:ref_2 xref:ref_3 u32[2]:a0 bool:b0 s', 'ReadHeadersS32ss')
 	def Read_8840FC92(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_1')
@@ -8978,6 +9401,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('xref:ref_0 u32:u32_0 xref:ref_1 lst2<NODE_REF>:lst1 xref:ref_2 u32[5]:a0 (x[4])>2015 (cref:ref_3)>2016', 'ReadHeadersS32ss')
 	def Read_8840FC94(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadCrossRef(i, 'ref_0')
@@ -9004,6 +9428,7 @@ class DCReader(EeDataReader):
 		if (self.version > 2016): i = len(node.data)
 		return i
 
+	@layout('t16 t16:description lst2<NODE_X_REF>:lst0 xref:ref_0', 'ReadHeadersS32ss')
 	def Read_AF3FD35F(self, node):
 		i = self.ReadHeadersS32ss(node)
 		i = node.ReadLen32Text16(i)
@@ -9069,6 +9494,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_1')
 		return i
 
+	@layout('s32:s32_0 u32:flags2 u16[3]:a0 t16:txt0 t16:txt1 u16:u16_0 u32:u32_1 lst2<UINT32>:lst1', 'ReadHeaderContent')
 	def Read_C903C161(self, node):
 		i = self.ReadHeaderContent(node)
 		i = node.ReadSInt32(i, 's32_0')
@@ -9093,12 +9519,14 @@ class DCReader(EeDataReader):
 		if (self.version > 2017): i += 4 # skip ref i = node.ReadChildRef(i, 'ref_4')
 		return i
 
+	@layout('s lst2<UINT32>:lst1', 'Read_Header0')
 	def Read_A21C387B(self, node):
 		i = node.Read_Header0()
 		i = self.skipBlockSize(i)
 		i = node.ReadList2(i, importerSegNode._TYP_UINT32_, 'lst1')
 		return i
 
+	@layout('cref:ref_0 xref:ref_1 u32[2]:a0 cref:ref_2', 'Read_Header0')
 	def Read_8F70B280(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_0')
@@ -9130,6 +9558,7 @@ class DCReader(EeDataReader):
 		node.set('lst3', lst, VAL_UINT32)
 		return i
 
+	@layout('s32:s32_0 cref:ref_0 bool:b0 s', 'Read_Header0')
 	def ReadHeaderI32RefBol(self, node, typeName = None):
 		i = node.Read_Header0(typeName)
 		i = node.ReadSInt32(i, 's32_0')
@@ -9138,6 +9567,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('lst3<NODE_REF>:lst0 s pref lst2<NODE_X_REF>:lst1 xref:default', 'ReadHeaderI32RefBol', 'FaceMergeData')
 	def Read_5DDB6DAF(self, node): # Presentation-FaceMergeData
 		i = self.ReadHeaderI32RefBol(node, 'FaceMergeData')
 		i = node.ReadList3(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -9147,6 +9577,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'default')
 		return i
 
+	@layout('lst3<NODE_REF>:lst0 s cref:ref_1 s cref:ref_2 bool:b1 s xref:ref_3', 'ReadHeaderI32RefBol')
 	def Read_8EA39F26(self, node):
 		i = self.ReadHeaderI32RefBol(node)
 		i = node.ReadList3(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -9159,6 +9590,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_3')
 		return i
 
+	@layout('lst3<NODE_REF>:lst0 s xref:scene', 'ReadHeaderI32RefBol')
 	def Read_A014A2CF(self, node):
 		i = self.ReadHeaderI32RefBol(node)
 		i = node.ReadList3(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -9174,6 +9606,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('s32:s32_0 cref:ref_0 u32[3]:a0 s lst2<NODE_REF>:lst0 bool:b0', 'Read_Header0')
 	def Read_A79EACCF(self, node):
 		i = node.Read_Header0()
 		i = node.ReadSInt32(i, 's32_0')
@@ -9184,6 +9617,7 @@ class DCReader(EeDataReader):
 		i = node.ReadBoolean(i, 'b0')
 		return i
 
+	@layout('s32:s32_0 cref:ref_0 u32:u32_1 pref u32:u32_0 s v3:pos f32:f u32:u32_1 u16:u16_0 s', 'Read_Header0')
 	def Read_4E17C8BC(self, node):
 		i = node.Read_Header0()
 		i = node.ReadSInt32(i, 's32_0')
@@ -9199,6 +9633,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('s32:s32_0 cref:ref_0 u32:u32_1 pref u32:u32_2 s v3:min v3:max', 'Read_Header0')
 	def Read_A79EACC7(self, node):
 		i = node.Read_Header0()
 		i = node.ReadSInt32(i, 's32_0')
@@ -9211,6 +9646,7 @@ class DCReader(EeDataReader):
 		i = node.ReadFloat64_3D(i, 'max')
 		return i
 
+	@layout('s32:s32_0 cref:ref_0 u32:u32_1 pref u32:u32_2 s v3:pos f64[9]:a1 bool:b0', 'Read_Header0')
 	def Read_A79EACCC(self, node):
 		i = node.Read_Header0()
 		i = node.ReadSInt32(i, 's32_0')
@@ -9224,6 +9660,7 @@ class DCReader(EeDataReader):
 		i = node.ReadBoolean(i, 'b0')
 		return i
 
+	@layout('xref:ref_0 u32:flags s xref:ref_1 u32:index s[2] (x[4])>2018 pref xref:ref_2 u32[6]:a2', 'Read_Header0')
 	def Read_8840FC95(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_0')
@@ -9238,6 +9675,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32A(i, 6, 'a2')
 		return i
 
+	@layout('pref lst2<NODE_REF>:lst1 bool:b0 u32:u32_0', 'Read_Header0')
 	def Read_4EABC45E(self, node):
 		i = node.Read_Header0()
 		i = node.ReadParentRef(i)
@@ -9325,6 +9763,7 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('t8 u32:u32_0 pref lst6<MAP_TEXT16_REF>:lst0 u32:u32_1 (x[4])>2012', 'Read_Header0')
 	def Read_FDA6D020(self, node):
 		i = node.Read_Header0()
 		i = node.ReadLen32Text8(i)
@@ -9388,6 +9827,7 @@ class DCReader(EeDataReader):
 		i = len(node.data)
 		return i
 
+	@layout('cref:ref_0 (cref:ref_1 cref:ref_2 cref:ref_3)>2016', 'Read_Header0')
 	def Read_8AF12C98(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_0')
@@ -9397,6 +9837,7 @@ class DCReader(EeDataReader):
 			i = node.ReadChildRef(i, 'ref_3')
 		return i
 
+	@layout('xref:ref_0 u32:u32_0 s uid:uid u32:u32_1 lst2<NODE_X_REF>:lst0 u32[3]:a0 s xref:ref_1 xref:ref_2 s', 'Read_Header0')
 	def Read_F393AC93(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_0')
@@ -9412,17 +9853,20 @@ class DCReader(EeDataReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32[5]:a0', 'Read_Header0')
 	def Read_A2A5CCEC(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 5, 'a0')
 		return i
 
+	@layout('xref:ref_0 u32:u32_0', 'Read_Header0')
 	def Read_52426994(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'ref_0')
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('uid:uid lst2<NODE_REF>:lst0 lst6<MAP_TEXT16_UINT32>:lst1 cref:cld_0 (x[4])>2010 (x[8])>2017', 'Read_Header0')
 	def Read_3235A9B8(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUUID(i, 'uid')
@@ -9451,6 +9895,7 @@ class DCReader(EeDataReader):
 		return i
 
 
+	@layout('xref:scene uid:uid u32:u32_0 t16:txt0 t16:txt1 u32:u32_1 f64:x u32:u32_2 lst6<MAP_X_REF_REF>:lst0 f64[11]:a0 u32:u32_3', 'Read_Header0')
 	def Read_34210B4B(self, node):
 		i = node.Read_Header0()
 		i = node.ReadCrossRef(i, 'scene')
@@ -9466,6 +9911,7 @@ class DCReader(EeDataReader):
 		i = node.ReadUInt32(i, 'u32_3')
 		return i
 
+	@layout('u16:u16_0 xref:ref_0 u32:u32_0 lst6<MAP_U32_U8>:lst0 lst6<MAP_U32_U8>:lst1', 'Read_Header0')
 	def Read_179808F1(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt16(i, 'u16_0')
@@ -9495,6 +9941,7 @@ class DCReader(EeDataReader):
 		i = node.ReadCrossRef(i, 'ref_2')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0 u32:u32_0', 'Read_Header0')
 	def Read_2578E638(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -63,8 +63,9 @@ def create3dModel(group, doc):
 			importModel(group)
 		elif (strategy == STRATEGY_STEP):
 			convertModel(group, doc.Name)
-		satFile = _getSatFileName(reader.name)
-		if (not os.path.exists(satFile)):
-			dumpSat(satFile, reader, False)
+		if (getDumpFolder() is not None):
+			satFile = _getSatFileName(reader.name)
+			if (not os.path.exists(satFile)):
+				dumpSat(satFile, reader, False)
 		setReader(None)
 	return
@@ -11,6 +11,7 @@ TODO:
 from importerConstants import VAL_REF
 from importerSegment import SegmentReader
 from importerUtils   import *
+from importerLayout  import layout
 from importerSegNode import _TYP_NODE_REF_, _TYP_UINT32_, _TYP_LIST_UINT32_A_, _TYP_NODE_REF_
 
 __author__      = 'Jens M. Plonka'
@@ -21,6 +22,7 @@ class DesignViewReader(SegmentReader):
 	def __init__(self, segment):
 		super(DesignViewReader, self).__init__(segment)
 
+	@layout('s v3:target v3:eye v3:a0 f64:angle f64:f64_0 v3:up', 'Read_Header0', 'Camera')
 	def Read_08823621(self, node):
 		i = node.Read_Header0('Camera')
 		i = self.skipBlockSize(i)
@@ -44,6 +46,7 @@ class DesignViewReader(SegmentReader):
 		i = node.ReadLen32Text16(i)
 		return i
 
+	@layout('u32:u32_0 t16 u32:u32_1 u8[2]:a0 u32[2]:a1', 'Read_Header0')
 	def Read_301D4138(self, node): # member of ViewDirection.lst0
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -53,6 +56,7 @@ class DesignViewReader(SegmentReader):
 		i = node.ReadUInt32A(i, 2, 'a1')
 		return i
 
+	@layout('s cref:ref0 s bool:b0', 'Read_Header0')
 	def Read_47C98A81(self, node):
 		i = node.Read_Header0()
 		i = self.skipBlockSize(i)
@@ -61,6 +65,7 @@ class DesignViewReader(SegmentReader):
 		i = node.ReadBoolean(i, 'b0')
 		return i
 
+	@layout('s cref:ref0 s bool:b0', 'Read_Header0')
 	def Read_71C22321(self, node):
 		i = node.Read_Header0()
 		i = self.skipBlockSize(i)
@@ -86,12 +91,14 @@ class DesignViewReader(SegmentReader):
 			i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('f64:scale u32:u32_0', 'Read_Header0', 'ViewScale')
 	def Read_551FB1BF(self, node):
 		i = node.Read_Header0('ViewScale')
 		i = node.ReadFloat64(i, 'scale')
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('u32:flags', 'Read_Header0')
 	def Read_8902B593(self, node): # member of ViewDirection.lst0
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'flags')
@@ -121,12 +128,14 @@ class DesignViewReader(SegmentReader):
 		i = node.Read_Header0()
 		return i
 
+	@layout('cref:ref_0 t16', 'Read_Header0')
 	def Read_D4DDE1F5(self, node): # member of ViewDirection.lst0
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_0')
 		i = node.ReadLen32Text16(i)
 		return i
 
+	@layout('s cref:ref0 s bool:b0 s u32:u32_0', 'Read_Header0')
 	def Read_D8B8F230(self, node):
 		i = node.Read_Header0()
 		i = self.skipBlockSize(i)
@@ -175,6 +184,7 @@ class DesignViewReader(SegmentReader):
 		i = node.ReadUInt16A(i, n, 'a0')
 		return i
 
+	@layout('cref:ref_0 bool:b0', 'Read_Header0')
 	def Read_F2E6BC0B(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_0')
@@ -8,6 +8,7 @@ The importer can read files from Autodesk (R) Invetor (R) Inventro V2010 on. Old
 
 from importerSegment import SegmentReader, checkReadAll
 from importerUtils   import *
+from importerLayout  import layout
 import importerSegNode
 
 __author__     = "Jens M. Plonka"
@@ -23,6 +24,7 @@ class DirectoryReader(SegmentReader):
 		i = node.Read_Header0()
 		return i
 
+	@layout('lst2<APP_1>:lst0 s u32:u32_0', 'Read_Header0')
 	def Read_3E9F410E(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_APP_1_, 'lst0')
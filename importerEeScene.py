@@ -8,6 +8,7 @@ The importer can read files from Autodesk (R) Invetor (R) Inventro V2010 on. Old
 
 from importer_Style    import StyleReader
 from importerUtils     import *
+from importerLayout    import layout
 from importerConstants import VAL_REF
 import importerSegNode
 
@@ -89,6 +90,7 @@ class EeSceneReader(StyleReader):
 			i = self.ReadTransformation3D(node, i)
 		return i
 
+	@layout('u8:u8_0 s lst2<NODE_REF>:attributes', 'ReadHeaderSU32S', 'Attributes')
 	def Read_120284EF(self, node):
 		i = self.ReadHeaderSU32S(node, 'Attributes')
 		i = node.ReadUInt8(i, 'u8_0')
@@ -96,6 +98,7 @@ class EeSceneReader(StyleReader):
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'attributes')
 		return i
 
+	@layout('u8:u8_0 s u8:u8_1', 'ReadHeaderSU32S')
 	def Read_13FC8170(self, node):
 		i = self.ReadHeaderSU32S(node)
 		i = node.ReadUInt8(i, 'u8_0')
@@ -116,6 +119,7 @@ class EeSceneReader(StyleReader):
 		self.faces.append(node)
 		return i
 
+	@layout('u8:u8_0', 'ReadHeaderEdge')
 	def Read_A79EACCB(self, node): # Edge ...
 		i = self.ReadHeaderEdge(node)
 		i = node.ReadUInt8(i, 'u8_0')
@@ -148,12 +152,14 @@ class EeSceneReader(StyleReader):
 		i = node.ReadList2(i, importerSegNode._TYP_UINT8_A_, 'lst6', 4)
 		return i
 
+	@layout('u32:u32_0 u8:u8_0', 'ReadHeaderSurface', 'SurfacePlane')
 	def Read_37DB9D1E(self, node): # Plane surface
 		i = self.ReadHeaderSurface(node, 'SurfacePlane')
 		i = node.ReadUInt32(i, 'u32_0')
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('u32:u32_0 u8:u8_0 s v3:center v3:normal', 'ReadHeaderSurface', 'SurfaceCylinder')
 	def Read_03E3D90B(self, node):
 		i = self.ReadHeaderSurface(node, 'SurfaceCylinder')
 		i = node.ReadUInt32(i, 'u32_0')
@@ -163,6 +169,7 @@ class EeSceneReader(StyleReader):
 		i = node.ReadFloat64_3D(i, 'normal')
 		return i
 
+	@layout('u32:u32_1 lst2<UINT32>:lst0 s u8:u8_1 s', 'ReadHeaderAttribute')
 	def Read_6C6322EB(self, node):
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -187,6 +194,7 @@ class EeSceneReader(StyleReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_1 lst6<MAP_KEY_X_REF>:lst1 s', 'ReadHeaderU32RefU8List3')
 	def Read_28461343(self, node):
 		i = self.ReadHeaderU32RefU8List3(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -209,6 +217,7 @@ class EeSceneReader(StyleReader):
 		self.objects3D.append(node)
 		return i
 
+	@layout('v3:pos f32:f32_0 s32:s32_0 u16:u16_0', 'ReadHeader3dObject', 'Point3D')
 	def Read_A79EACD3(self, node): # Point 3D-Object
 		i = self.ReadHeader3dObject(node, 'Point3D')
 		i = node.ReadFloat64_3D(i, 'pos')
@@ -225,6 +234,7 @@ class EeSceneReader(StyleReader):
 		i = node.ReadList2(i, importerSegNode._TYP_UINT16_A_, 'lst1', 2)
 		return i
 
+	@layout('v3:pos v3:dir', 'ReadHeader3dObject', 'Line3D')
 	def Read_A79EACC7(self, node): # Line 3D-Object
 		i = self.ReadHeader3dObject(node, 'Line3D')
 		i = node.ReadFloat64_3D(i, 'pos')
@@ -251,6 +261,7 @@ class EeSceneReader(StyleReader):
 		node.set('points', [])
 		return i
 
+	@layout('v2:c f64:b f64:a v2:dB v2:dA f64:startAngle f64:sweepAngle', 'ReadHeader3dObject', 'Ellipse2D')
 	def Read_4B57DC56(self, node): # Ellipse2D
 		i = self.ReadHeader3dObject(node, 'Ellipse2D')
 		i = node.ReadFloat64_2D(i, 'c')       # center of the ellipse
@@ -296,6 +307,7 @@ class EeSceneReader(StyleReader):
 		i = node.ReadBoolean(i, 'b_0')
 		return i
 
+	@layout('cref:points cref:pointIndices cref:normals cref:normalIndices u32[5]:a0 lst2<UINT32>:lst0 u32[2]:a1', 'ReadHeader3dObject', 'MeshFacets')
 	def Read_E1EB685C(self, node): # MeshFacets 3D-Object
 		i = self.ReadHeader3dObject(node, 'MeshFacets')
 		i = node.ReadChildRef(i, 'points')
@@ -319,18 +331,21 @@ class EeSceneReader(StyleReader):
 		i = self.ReadHeader3dObject(node)
 		return i
 
+	@layout('f32[10]:a0 f64[2]:a1', 'ReadHeader3dObject')
 	def Read_A79EACCD(self, node): # ??? 3D-Object
 		i = self.ReadHeader3dObject(node)
 		i = node.ReadFloat32A(i, 10, 'a0') # ffffffffff
 		i = node.ReadFloat64A(i, 2, 'a1')
 		return i
 
+	@layout('f64[13]:a0', 'ReadHeader3dObject')
 	def Read_AFD5CEEB(self, node): # ??? 3D-Object
 		i = self.ReadHeader3dObject(node)
 		i = node.ReadFloat64A(i, 13, 'a0')
 		return i
 
 
+	@layout('u16[8]:a0', 'ReadHeader3dObject')
 	def Read_B069BC6A(self, node): # ??? 3D-Object
 		i = self.ReadHeader3dObject(node)
 		i = node.ReadUInt16A(i, 8, 'a0')
@@ -3,12 +3,10 @@
 from importerUtils     import *
 from datetime          import datetime
 from importerSAT       import dumpSat, importModel, convertModel, buildBody, resolveNodes
-from Acis2Step         import export
+from Acis2Step         import export, releaseStepFile
 from zipfile           import is_zipfile, ZipFile
 from FreeCAD           import ParamGet
 from Acis              import AcisReader
-from importerFreeCAD   import createGroup
-from ImportGui         import insert
 from importerConstants import REF_CHILD, REF_CROSS, REF_PARENT
 from importerConstants import VAL_DATETIME, VAL_ENUM, VAL_GUESS, VAL_REF, VAL_STR8, VAL_STR16, VAL_UINT8, VAL_UINT16, VAL_UINT32, VAL_UINT64, VAL_FORMAT
 import traceback
@@ -133,6 +131,8 @@ def read_manifest(f3d, path):
 			n3, i = getUInt8(data, i)
 	# dump
 	dumpFolder = getDumpFolder()
+	if (dumpFolder is None):
+		return
 	with open(u"%s/Manifest.log" %(dumpFolder), 'w') as log:
 		log.write(f"t1 = '{t1}'\n")
 		log.write(f"t2 = '{t2}'\n")
@@ -183,6 +183,7 @@ def read(filename):
 
 def importModel(root):
 	global lumps, wires, smb_files
+	from importerFreeCAD import createGroup
 	for acis in smb_files:
 		wires = 0
 		lumps = 0
@@ -196,10 +197,14 @@ def importModel(root):
 
 def convertModel(docName):
 	global smb_files
+	from ImportGui import insert
 	for acis in smb_files:
 		bodies = resolveNodes(acis)
 		stepfile = export(acis.name, acis.header, bodies)
-		insert(stepfile, docName)
+		try:
+			insert(stepfile, docName)
+		finally:
+			releaseStepFile(stepfile)
 
 def create3dModel(root, doc):
 	strategy = chooseImportStrategyAcis()
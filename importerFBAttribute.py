@@ -10,6 +10,7 @@ TODO:
 
 from importerSegment import SegmentReader, checkReadAll
 from importerUtils   import *
+from importerLayout  import layout
 import importerSegNode
 
 __author__      = 'Jens M. Plonka'
@@ -21,6 +22,7 @@ class FBAttributeReader(SegmentReader):
 	def __init__(self, segment):
 		super(FBAttributeReader, self).__init__(segment)
 
+	@layout('lst2<NODE_REF>:lst0 u8:u8_0 s lst2<UINT8>:data s uid:uid', 'Read_Header0')
 	def Read_080ED92F(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -31,6 +33,7 @@ class FBAttributeReader(SegmentReader):
 		i = node.ReadUUID(i, 'uid')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0 u8:u8_0 lst2<UINT8>:data u8[2]:a0 u16[2]:a1 uid:uid', 'Read_Header0')
 	def Read_28C25C43(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -41,6 +44,7 @@ class FBAttributeReader(SegmentReader):
 		i = node.ReadUUID(i, 'uid')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0 t16 u32:u32_0', 'Read_Header0')
 	def Read_28C25C44(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -63,5 +67,5 @@ class FBAttributeReader(SegmentReader):
 		elif (t == 4):
 			i = node.ReadList2(i, importerSegNode._TYP_UINT8_, 'data')
 		else:
-			logError("    ERROR> Don't know what to do with %d in Read_28C25C45!" %(t))
+			logError("    ERROR> Don't know what to do with %d in Read_28C25C45!", t)
 		return i
@@ -7,7 +7,7 @@ __url__        = "https://www.github.com/jmplonka/InventorLoader"
 '''
 importerFreeCAD.py
 '''
-import FreeCAD, Draft, Part, Sketcher, traceback, Mesh, InventorViewProviders, Acis, re
+import FreeCAD, FreeCADGui, Draft, Part, Sketcher, traceback, Mesh, InventorViewProviders, Acis, re
 
 from importerClasses   import *
 from importerUtils     import *
@@ -158,6 +158,55 @@ def unsupportedNode(node):
 	node.setGeometry(None)
 	return None
 
+class RecomputeScheduler(object):
+	'''
+	Defers the document's recomputes while features are created. An object is
+	recomputed together with its dependencies only when its shape is required,
+	everything else is recomputed once at the end of the import.
+	'''
+	def __init__(self):
+		self.dirty = set() # names of the created objects that weren't recomputed yet
+		self.count = 0     # number of recomputes of the current import
+
+	def reset(self):
+		self.dirty.clear()
+		self.count = 0
+
+	def touch(self, obj):
+		self.dirty.add(obj.Name)
+
+	def _recompute(self, objs):
+		doc = FreeCAD.ActiveDocument
+		try:
+			doc.recompute(objs)
+		except TypeError: # FreeCAD < 0.19 recomputes the whole document only.
+			doc.recompute()
+			self.dirty.clear()
+		self.count += 1
+
+	def update(self, obj):
+		'''Recomputes the object(s) and their dependencies if their shapes aren't up to date.'''
+		if (obj is None): return
+		objs = []
+		for o in (obj if (type(obj) is list) else [obj]):
+			objs.append(o)
+			objs += o.OutListRecursive
+		names = set(o.Name for o in objs)
+		if ((not names.isdisjoint(self.dirty)) or any(o.isTouched() for o in objs)):
+			self._recompute(objs)
+			self.dirty -= names
+
+	def flush(self):
+		'''Recomputes all outstanding objects of the document.'''
+		FreeCAD.ActiveDocument.recompute()
+		self.dirty.clear()
+		self.count += 1
+
+_recomputes = RecomputeScheduler()
+
+def getRecomputeScheduler():
+	return _recomputes
+
 def newObject(className, name, body = None):
 	doc  = FreeCAD.ActiveDocument
 	view = FreeCADGui.ActiveDocument.ActiveView
@@ -169,6 +218,7 @@ def newObject(className, name, body = None):
 		activeBody.addObject(obj)
 	if (obj):
 		obj.Label = name
+		_recomputes.touch(obj)
 		if (body):
 			try:
 				body.addObject(obj)
@@ -560,9 +610,7 @@ def hide(geos):
 
 def resolveNameTableItem(item, vk):
 	if (hasattr(vk, 'entry') and (vk.entry is None)):
-		nt  = item.segment.elementNodes.get(vk.nameTable)
-		if (nt is not None):
-			vk.entry = nt.get('entries')[vk.key]
+		vk.entry = item.segment.getNameTableEntry(vk.nameTable, vk.key)
 		return vk.entry
 	return None
 
@@ -767,7 +815,7 @@ def _DBG_checkFeatureAttributes(attr):
 	return
 
 def _DBG_checkBrowserSegment(browser):
-	mgr = browser.tree.getFirstChild('EntryManager')
+	mgr = browser.getNode('EntryManager')
 	if (mgr is not None):
 		entries = mgr.get('entries')
 		for e in entries:
@@ -776,7 +824,7 @@ def _DBG_checkBrowserSegment(browser):
 				FreeCAD.Console.PrintError(" NO ENTRY: %r\n" %(o.typeName))
 
 def _DBG_checkDcSegment(dc):
-	doc = dc.tree.getFirstChild('Document')
+	doc = dc.getNode('Document')
 	if (doc):
 		component = doc.get('component')
 		for o in component.get('objects'):
@@ -1094,7 +1142,7 @@ class FreeCADImporter(object):
 		if (entity is not None):
 			# create an entity that can be featured (e.g. loft, sweep, ...)
 			section = newObject('Part::Feature', participant.name)
-			FreeCAD.ActiveDocument.recompute()
+			_recomputes.update(entity)
 
 			# FIXME: Howto convert Inventor-Indices to FreeCAD-Indices?
 			if (wireIndex == 0):   wireIndex = 1
@@ -1116,6 +1164,7 @@ class FreeCADImporter(object):
 					creator    = item.segment.indexNodes[creatorIdx]
 					node       = self.getGeometry(creator)
 					if (node is not None):
+						_recomputes.update(node)
 						wireIndex = edgeId.get('wireIndex')
 						if (wireIndex < len(node.Shape.Wires)):
 							edge = node.Shape.Wires[wireIndex]
@@ -1226,7 +1275,7 @@ class FreeCADImporter(object):
 	#	elif (typ[0: 5] == 'Block'):
 	#	elif (typ[0: 5] == 'Image'):
 		else:
-			logWarning(u"    ... Don't know how to create edge from %s.%s" %(edge.__class__.__module__, edge.__class__.__name__))
+			logWarning(u"    ... Don't know how to create edge from %s.%s", edge.__class__.__module__, edge.__class__.__name__)
 		if (edge is not None):
 			if (hasattr(boundarySketch, 'addGeometry')):
 				boundarySketch.addGeometry(edge)
@@ -1300,6 +1349,7 @@ class FreeCADImporter(object):
 					edgeAttrs = acis.get(idxRef)
 					if (not edgeAttrs is None):
 						acisEdges = edgeAttrs.getEdges()
+						_recomputes.update(geometry)
 						idxEdge   = findFcEdgeIndex(geometry.Shape, acisEdges)
 						if (idxEdge is not None):
 							return idxCreator, idxEdge
@@ -1332,6 +1382,7 @@ class FreeCADImporter(object):
 					faceAttrs = acis.get(idxRef)
 					if (faceAttrs):
 						acisFaces = faceAttrs.getFaces()
+						_recomputes.update(geometry)
 						idxFace   = findFcFaceIndex(geometry.Shape, acisFaces)
 						if (idxFace):
 							return idxCreator, idxFace
@@ -1391,7 +1442,7 @@ class FreeCADImporter(object):
 
 	def getEdges(self, wire):
 		if (wire is not None):
-			FreeCAD.ActiveDocument.recompute()
+			_recomputes.update(wire)
 			count = len(wire.Shape.Edges)
 			return ['Edge%i' %(i) for i in range(1, count + 1)]
 
@@ -1400,6 +1451,7 @@ class FreeCADImporter(object):
 	def getLength(self, body, dir):
 		node = self.getBodyNode(body)
 		if (node):
+			_recomputes.update(node.geometry)
 			box = node.geometry.Shape.BoundBox
 			lx = box.XLength * box.XLength if (not isEqual1D(dir.x, 0)) else 0.0
 			ly = box.YLength * box.YLength if (not isEqual1D(dir.y, 0)) else 0.0
@@ -1734,6 +1786,7 @@ class FreeCADImporter(object):
 		else:
 			revolution.Axis = -axis
 		revolution.Base = base
+		_recomputes.update(source)
 		revolution.Solid = solid and source.Shape.isClosed()
 		revolution.Placement = PLC(CENTER, ROT(axis, -getGRAD(angle2)), base)
 		setDefaultViewObjectValues(revolution)
@@ -2202,7 +2255,7 @@ class FreeCADImporter(object):
 			self.Create_Sketch_Node(sketch, g.node)
 
 		# need to recompute otherwise FreeCAD messes up directions for other constraints!
-		FreeCAD.ActiveDocument.recompute()
+		_recomputes.update(sketch)
 
 		for d in dims:
 			self.Create_Sketch_Node(sketch, d.node)
@@ -2413,7 +2466,7 @@ class FreeCADImporter(object):
 			solid      = (surface is None)
 
 			if (boundary):
-				FreeCAD.ActiveDocument.recompute()
+				_recomputes.update(boundary)
 				if (extend1.get('value') == 1): # 'DirectionAxis' => AngleExtent
 					if (angle2 is None):
 						if (direction.get('value') == 0): # positive
@@ -2953,6 +3006,7 @@ class FreeCADImporter(object):
 			thickenGeo.SelfIntersection = False
 			if (hasattr(thickenGeo, 'Fill')): thickenGeo.Fill = solid is not None
 			offset = -sourceOffsets[key]
+			if (offset != 0.0): _recomputes.update(source)
 			if ((offset != 0.0) and (len(source.Shape.Faces)>0)):
 				normal = source.Shape.Faces[0].normalAt(0,0)
 				thickenGeo.Placement.Base += source.Placement.Base - normal * offset
@@ -4061,7 +4115,6 @@ class FreeCADImporter(object):
 		# check for correct implementation of  attribute sections:
 #		_DBG_checkFeatureAttributes(fxNode.get('next'))
 
-		FreeCAD.ActiveDocument.recompute()
 		return
 
 	def addSketch_Spline3D_Curve(self, bezierNode, sketchObj):
@@ -4297,9 +4350,16 @@ class FreeCADImporter(object):
 #		_DBG_checkSegments()
 
 		_initPreferences()
+		_recomputes.reset()
+		InventorViewProviders.setRecomputeScheduler(_recomputes)
+		try:
+			self.createModel(root)
+		finally:
+			InventorViewProviders.setRecomputeScheduler(None)
 
+	def createModel(self, root):
 		dc = getModel().getDC()
-		doc = dc.tree.getFirstChild('Document')
+		doc = dc.getNode('Document')
 		if (doc is not None):
 			self.root           = root
 			self.mapConstraints = {}
@@ -4313,7 +4373,8 @@ class FreeCADImporter(object):
 				if (obj.typeName in IMPLEMENTED_COMPONENTS):
 					self.getGeometry(obj)
 
-			FreeCAD.ActiveDocument.recompute()
+			_recomputes.flush()
+			logInfo(u"    ... %d recomputes.", _recomputes.count)
 
 			# apply colors stored in graphics segment
 			gr = getModel().getGraphics()
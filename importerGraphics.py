@@ -11,6 +11,7 @@ from importerSegment        import checkReadAll
 from importerEeScene        import EeSceneReader
 from importerTransformation import Transformation3D
 from importerUtils          import *
+from importerLayout         import layout
 from importerConstants      import VAL_UINT8, VAL_UINT16, VAL_UINT32, VAL_REF
 from math                   import fabs
 
@@ -43,6 +44,7 @@ class GraphicsReader(EeSceneReader):
 		node.object3D = True
 		return i
 
+	@layout('cref:object3D s u32:u32_1 v3:a3 u32:u32_2', 'ReadHeaderU32RefU8List3')
 	def Read_0DE8E459(self, node):
 		i = self.ReadHeaderU32RefU8List3(node)
 		i = node.ReadChildRef(i, 'object3D')
@@ -52,6 +54,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('cref:object3D s u8:u8_1 u32:u32_1 u32:u32_2', 'ReadHeaderU32RefU8List3')
 	def Read_27DFC9F5(self, node):
 		i = self.ReadHeaderU32RefU8List3(node)
 		i = node.ReadChildRef(i, 'object3D')
@@ -61,6 +64,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('cref:ref_1 s pref u32:u32_1 u8[4]:a2', 'ReadHeaderU32RefU8List3')
 	def Read_3DA2C291(self, node):
 		i = self.ReadHeaderU32RefU8List3(node)
 		i = node.ReadChildRef(i, 'ref_1')
@@ -117,6 +121,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadUInt32(i, 'index')
 		return i
 
+	@layout('u32:index', 'ReadHeaderU32RefU8List3')
 	def Read_6A05AA75(self, node):
 		i = self.ReadHeaderU32RefU8List3(node)
 		i = node.ReadUInt32(i, 'index')
@@ -142,6 +147,7 @@ class GraphicsReader(EeSceneReader):
 			i = node.ReadUInt32(i, 'index')
 		return i
 
+	@layout('s u32:u32_1', 'ReadHeaderU32RefU8List3', 'NoteGlyphGroup')
 	def Read_9215A162(self, node): # NoteGlyphGroup
 		i = self.ReadHeaderU32RefU8List3(node, 'NoteGlyphGroup')
 		i = self.skipBlockSize(i)
@@ -207,12 +213,14 @@ class GraphicsReader(EeSceneReader):
 		i = self.ReadHeaderU32RefU8List3(node)
 		return i
 
+	@layout('u32:u32_1 cref:obj', 'ReadHeaderU32RefU8List3')
 	def Read_B9D0D00A(self, node): # Assembly
 		i = self.ReadHeaderU32RefU8List3(node)
 		i = node.ReadUInt32(i, 'u32_1')
 		i = node.ReadChildRef(i, 'obj')
 		return i
 
+	@layout('u32:u32_1 cref:obj', 'ReadHeaderU32RefU8List3')
 	def Read_B9D0D008(self, node): # Assembly
 		i = self.ReadHeaderU32RefU8List3(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -257,6 +265,7 @@ class GraphicsReader(EeSceneReader):
 		i = self.ReadIndexDC(node, i)
 		return i
 
+	@layout('cref:ref_1 s u8:u8_1 s u32:key lst6<MAP_KEY_REF>:lst1 u8:u8_2 lst6<MAP_KEY_REF>:lst2 u8:u8_3', 'ReadHeaderU32RefU8List3', 'Sketch3D')
 	def Read_DA58AA0E(self, node): # Sketch3D
 		i = self.ReadHeaderU32RefU8List3(node, 'Sketch3D')
 		i = node.ReadChildRef(i, 'ref_1')
@@ -287,6 +296,7 @@ class GraphicsReader(EeSceneReader):
 		i = self.ReadHeaderU32RefU8List3(node)
 		return i
 
+	@layout('cref:ref_0 s x[4] u32:index', 'ReadHeaderU32RefU8List3')
 	def Read_FB11E67E(self, node):
 		i = self.ReadHeaderU32RefU8List3(node)
 		i = node.ReadChildRef(i, 'ref_0')
@@ -363,11 +373,13 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadUInt16A(i, 2, 'a0')
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderAttribute')
 	def Read_0244393C(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 s u8:u8_1 s u8:u8_2', 'ReadHeaderAttribute')
 	def Read_0270FFC7(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -378,6 +390,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadUInt8(i, 'u8_2')
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 u8[2]:a0 f32[17]:a1 u8[2]:a2 f32:f1 u16[2]:a3 u8:b0 f32[4]:a4', 'ReadHeaderAttribute')
 	def Read_04F234D9(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -391,6 +404,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadFloat32A(i, 4, 'a4')
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 u8[2]:a1', 'ReadHeaderAttribute')
 	def Read_097A6824(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -415,6 +429,7 @@ class GraphicsReader(EeSceneReader):
 #		i = node.ReadUInt32(i, 'u32_1')
 #		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 xref:ref_0 f64[16]:a0', 'ReadHeaderAttribute')
 	def Read_184FDA9C(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -433,6 +448,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 u8[2]:a0 f32[17]:a1 u8[2]:a2 f32:f1 u16[2]:a3 u8:b0 f32[4]:a4', 'ReadHeaderAttribute')
 	def Read_23974603(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -446,6 +462,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadFloat32A(i, 4, 'a4')
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 s u32:u32_3 xref:ref_0 s bool:b0 u8:u8_1 xref:body s', 'ReadHeaderAttribute')
 	def Read_2E56FF78(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -460,6 +477,7 @@ class GraphicsReader(EeSceneReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 s[2]', 'ReadHeaderAttribute')
 	def Read_337E7C53(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -467,11 +485,13 @@ class GraphicsReader(EeSceneReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderAttribute')
 	def Read_35E93051(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 u8:u8_1', 'ReadHeaderAttribute')
 	def Read_56235A51(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -479,6 +499,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadUInt8(i, 'u8_1')
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 s bool:b0 s u32:u32_3', 'ReadHeaderAttribute')
 	def Read_5A972561(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -489,6 +510,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadUInt32(i, 'u32_3')
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 s u32:u32_3 xref:group s u32:u32_4', 'ReadHeaderAttribute')
 	def Read_6399C27C(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -500,6 +522,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadUInt32(i, 'u32_4')
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 s u8:u8_1', 'ReadHeaderAttribute')
 	def Read_76986821(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -508,12 +531,14 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadUInt8(i, 'u8_1')
 		return i
 
+	@layout('u32:u32_1 u32:u32_2', 'ReadHeaderAttribute')
 	def Read_913D5CD2(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 u8[2]:a0 f32[17]:a1 u8[2]:a2 f32:f1 u16[2]:a3', 'ReadHeaderAttribute')
 	def Read_9E2FB889(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -558,6 +583,7 @@ class GraphicsReader(EeSceneReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_1 lst2<UINT32>:lst0 s u32:u32_2', 'ReadHeaderAttribute')
 	def Read_C9DA5109(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -573,6 +599,7 @@ class GraphicsReader(EeSceneReader):
 		node.set('a0', a)
 		return i
 
+	@layout('u32:u32_1 lst2<NODE_REF>:lst0 u8:u8_1', 'ReadHeaderAttribute')
 	def Read_D95D32FC(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -580,6 +607,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadUInt8(i, 'u8_1')
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderAttribute')
 	def Read_DFDFCB84(self, node): # Attribute ...
 		i = self.ReadHeaderAttribute(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -591,6 +619,7 @@ class GraphicsReader(EeSceneReader):
 
 	#########################
 	# 3D object sections
+	@layout('lst2<NODE_REF>:lst0 u8:u8_0 s[2] v3:a0 v3:a1', 'ReadHeader3dObject')
 	def Read_5194E9A2(self, node):
 		i = self.ReadHeader3dObject(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -695,11 +724,13 @@ class GraphicsReader(EeSceneReader):
 		i = self.ReadTransformation3D(node, i)
 		return i
 
+	@layout('lst2<NODE_REF>:lst0', 'Read_Header0')
 	def Read_4E951290(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
 		return i
 
+	@layout('lst2<NODE_X_REF>:lst0 t16', 'Read_Header0')
 	def Read_4E951291(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'lst0')
@@ -892,6 +923,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadUInt16A(i, 7, 'a5')
 		return i
 
+	@layout('u16[4]:a0 u8:u8_0 s v3:a1 s u32[14]:a2', 'Read_Header0', 'CompInterfaceNode')
 	def Read_DBE41D91(self, node): # CompInterfaceNode
 		i = node.Read_Header0('CompInterfaceNode')
 		i = node.ReadUInt16A(i, 4, 'a0')
@@ -922,11 +954,13 @@ class GraphicsReader(EeSceneReader):
 			node.set('lst1', [], VAL_REF)
 		return i
 
+	@layout('lst2<FONT>:lst0', 'Read_Header0')
 	def Read_EF1E3BE5(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_FONT_, 'lst0')
 		return i
 
+	@layout('u16[4]:a0 u8:u8_0 v3:f64_0 u32:u32_0', 'Read_Header0', 'NoteGlyphNode')
 	def Read_FB96D24A(self, node): # NoteGlyphNode
 		i = node.Read_Header0('NoteGlyphNode')
 		i = node.ReadUInt16A(i, 4, 'a0')
@@ -948,12 +982,14 @@ class GraphicsReader(EeSceneReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('lst2<NODE_X_REF>:outlines u32:index', 'ReadHeaderOutline')
 	def Read_5FA87956(self, node): # Group feature outline
 		i = self.ReadHeaderOutline(node)
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'outlines')
 		i = node.ReadUInt32(i, 'index')
 		return i
 
+	@layout('lst2<NODE_X_REF>:outlines u32:index', 'ReadHeaderOutline', 'OutlineCompositeFx')
 	def Read_7DFC2448(self, node): # Composite feature outline
 		i = self.ReadHeaderOutline(node, 'OutlineCompositeFx')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'outlines')
@@ -982,6 +1018,7 @@ class GraphicsReader(EeSceneReader):
 		i = node.ReadList2(i, importerSegNode._TYP_LIST_FLOAT64_A_, 'points', 3)
 		return i
 
+	@layout('lst2<NODE_X_REF>:outlines u32:u32_1 u32:index u32:u32_2 u16[4]:a2 v3:a3 v3:a4', 'ReadHeaderOutline', 'OutlinePatternFx')
 	def Read_A94779E2(self, node): # Pattern feature outline
 		i = self.ReadHeaderOutline(node, 'OutlinePatternFx')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_X_REF_, 'outlines')
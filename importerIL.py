@@ -5,12 +5,14 @@ importer.py:
 Collection of 3D Mesh importers
 '''
 
-import os, sys, FreeCAD, FreeCADGui, importerSAT, importerDXF, Import_IPT, importerF3D
-import Acis, importerClasses
-from importerUtils   import canImport, logInfo, logWarning, logError, logAlways, getAuthor, getComment, getLastModifiedBy, setThumbnail
+import os, sys, FreeCAD, importerSAT, importerDXF, Import_IPT, importerF3D
+import Acis, importerClasses, importerCache
+from importerUtils   import canImport, logInfo, logWarning, logError, logAlways, getAuthor, getComment, getLastModifiedBy, setThumbnail, setContext
 from olefile         import isOleFile
-from importerFreeCAD import createGroup
-from pivy            import coin
+
+if (FreeCAD.GuiUp):
+	import FreeCADGui
+	from pivy import coin
 
 __author__     = "Jens M. Plonka"
 __copyright__  = 'Copyright 2018, Germany'
@@ -26,6 +28,7 @@ def decode(name):
 	return decodedName
 
 def insertGroup(filename):
+	from importerFreeCAD import createGroup
 	grpName = os.path.splitext(os.path.basename(filename))[0]
 	#There's a problem with adding groups starting with numbers!
 	root = createGroup('_%s' %(grpName))
@@ -34,7 +37,22 @@ def insertGroup(filename):
 	return root
 
 def read(filename):
-	setThumbnail(None)
+	setContext(None) # every import starts with a fresh state
+	key = importerCache.getKey(filename)
+	reader = importerCache.load(filename, key)
+	if (reader is None):
+		reader = _read(filename)
+		if (reader is not None):
+			if (reader is Import_IPT):
+				Import_IPT.loadRequiredSegments() # cache the decoded segments, not the B-streams.
+			importerCache.store(filename, key, reader)
+	elif ((reader is Import_IPT) and Import_IPT.loadRequiredSegments()):
+		# e.g. cached with another import strategy
+		logWarning(u"Cached model of '%s' had undecoded segments - updating cache.", filename)
+		importerCache.store(filename, key, reader)
+	return reader
+
+def _read(filename):
 	name, ext = os.path.splitext(filename)
 	ext = ext.lower()
 	if (ext == '.ipt'):
@@ -117,7 +135,8 @@ def insert(filename, docname, skip = [], only = [], root = None):
 				group = insertGroup(name)
 				reader.create3dModel(group, doc)
 			releaseMemory()
-			FreeCADGui.SendMsgToActiveView("ViewFit")
+			if (FreeCAD.GuiUp):
+				FreeCADGui.SendMsgToActiveView("ViewFit")
 	else:
 		_open(filename, skip, only, root)
 	logInfo(u"DONE!")
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+'''
+importerLayout.py:
+Declarative layouts for the nodes of the segments. A layout lists the node's
+fields in the order they are stored, e.g.:
+	@layout('s s32:s32_0 (x[4])>2018 xref:ref_1 u32[2]:a0 t16', 'ReadHeaderContent')
+	def Read_XXXXXXXX(self, node):
+		...
+The layout is compiled once per reader class and file version into a reader
+that unpacks each run of fixed size fields with a single Struct. Headers that
+have a layout themselves are inlined. The decorated method stays as fallback in
+case the layout can't be compiled or fails for a node. Before falling back, the
+changes of the reader's header and post methods are undone (see
+SegmentReader.getLayoutState).
+
+Fields are given as CODE[COUNT]:NAME, where [COUNT] reads an array and NAME
+defaults to the name the corresponding node.ReadXXX method would use.
+	u8, u16, s16, u32, s32, f32, f64 -> node.ReadUInt8 ... node.ReadFloat64
+	bool, uid, v2, v3                -> node.ReadBoolean, ReadUUID, ReadFloat64_2D, ReadFloat64_3D
+	xref, cref, pref                 -> node.ReadCrossRef, ReadChildRef, ReadParentRef
+	t8, t16                          -> node.ReadLen32Text8, ReadLen32Text16 (without name: node.name)
+	lst2<TYP> ... lst8<TYP>          -> node.ReadList2(i, importerSegNode._TYP_<TYP>_, name) ...
+	s, x                             -> skipBlockSize, skip bytes (x[4] skips 4 bytes)
+	(FIELDS)>2018                    -> only for file versions > 2018 (also <, >=, <= and ==)
+'''
+
+import re, operator, importerSegNode
+from struct            import Struct
+from importerUtils     import logWarning, getBlockSize, VEC, UID
+from importerClasses   import Header0
+from importerConstants import VAL_GUESS, VAL_UINT8, VAL_UINT16, VAL_UINT32, REF_CHILD, REF_CROSS
+
+__author__     = 'Jens M. Plonka'
+__copyright__  = 'Copyright 2018, Germany'
+__url__        = "https://www.github.com/jmplonka/InventorLoader"
+
+# code: (struct format, number of values, property class or reference type)
+_FIXED = {
+	'u8':   ('B',   1, VAL_UINT8),
+	'u16':  ('H',   1, VAL_UINT16),
+	's16':  ('h',   1, VAL_GUESS),
+	'u32':  ('L',   1, VAL_UINT32),
+	's32':  ('l',   1, VAL_GUESS),
+	'f32':  ('f',   1, VAL_GUESS),
+	'f64':  ('d',   1, VAL_GUESS),
+	'bool': ('B',   1, VAL_GUESS),
+	'uid':  ('16s', 1, VAL_GUESS),
+	'v2':   ('d',   2, VAL_GUESS),
+	'v3':   ('d',   3, VAL_GUESS),
+	'xref': ('L',   1, REF_CROSS),
+	'cref': ('L',   1, REF_CHILD),
+	'pref': ('L',   1, REF_CROSS),
+}
+
+_SCALARS       = ('bool', 'uid', 'v2', 'v3', 'xref', 'cref', 'pref')
+_LISTS         = ('lst2', 'lst3', 'lst4', 'lst6', 'lst7', 'lst8')
+_DEFAULT_NAMES = {'xref': 'ref', 'cref': 'ref', 'pref': 'parent'}
+
+_COMPARE = {'>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le, '==': operator.eq}
+
+_TOKEN = re.compile(r'\(|\)(?:[<>]=?|==)\d+|[^\s()]+')
+_FIELD = re.compile(r'^(\w+?)(?:<(\w+)>)?(?:\[(\d+)\])?(?::(\w+))?$')
+_GATE  = re.compile(r'^\)([<>]=?|==)(\d+)$')
+
+def _parse(fields):
+	'''Returns the nested list of fields: (code, typ, count, name) or (compare, version, fields)'''
+	stack = [[]]
+	for token in _TOKEN.findall(fields):
+		if (token == '('):
+			stack.append([])
+		elif (token.startswith(')')):
+			m = _GATE.match(token)
+			group = stack.pop()
+			stack[-1].append((_COMPARE[m.group(1)], int(m.group(2)), group))
+		else:
+			m = _FIELD.match(token)
+			if (m is None):
+				raise ValueError(u"Unknown field '%s'!" %(token))
+			code, typ, count, name = m.groups()
+			if ((code not in _FIXED) and (code not in _LISTS) and (code not in ('s', 'x', 't8', 't16'))):
+				raise ValueError(u"Unknown field '%s'!" %(token))
+			if ((code in _SCALARS) and (count is not None)):
+				raise ValueError(u"Arrays of '%s' are not supported!" %(code))
+			stack[-1].append((code, typ, None if (count is None) else int(count), name))
+	if (len(stack) != 1):
+		raise ValueError(u"Unbalanced brackets in '%s'!" %(fields))
+	return stack[0]
+
+def _flatten(fields, version, result):
+	for field in fields:
+		if (callable(field[0])):
+			if (field[0](version, field[1])):
+				_flatten(field[2], version, result)
+		else:
+			result.append(field)
+	return result
+
+def _expand(cls, header, typeName, nodeType, version, result):
+	'''
+	Appends the fields of the header to the result. Headers with a layout are
+	inlined, all others are called.
+	'''
+	if (header == 'Read_Header0'):
+		result.append(('hdr', None, None, None))
+		result.append(('s', None, None, None))
+		if (typeName is not None):
+			result.append(('type', None, None, typeName))
+	elif (header is not None):
+		l = getattr(getattr(cls, header, None), 'layout', None)
+		if (l is None):
+			result.append(('call', None, None, (header, typeName)))
+		else:
+			if ((typeName is None) and (l.typeName is not None)):
+				typeName = l.typeName.replace('%s', nodeType)
+			_expand(cls, l.header, typeName, nodeType, version, result)
+			_flatten(_parse(l.fields), version, result)
+			if (l.post is not None):
+				result.append(('post', None, None, l.post))
+	return result
+
+def _getSetter(code, count, name, k):
+	n   = _FIXED[code][1] * (count or 1)
+	cls = _FIXED[code][2]
+	if (name is None):
+		name = _DEFAULT_NAMES.get(code)
+	if (code in ('xref', 'cref', 'pref')):
+		return ["node.SetNodeRef(v[%d], %r, None, %d)" %(k, name, cls)]
+	if (code == 'bool'):
+		return ["if (v[%d] > 1): raise ValueError(u'Expected either 0 or 1 but found %%02X' %%(v[%d]))" %(k, k),
+		        "setValue(%r, v[%d] == 1)" %(name, k)]
+	if (code == 'uid'):
+		return ["setValue(%r, UID(bytes_le=v[%d]))" %(name, k)]
+	if (code == 'v2'):
+		return ["setValue(%r, VEC(v[%d:%d] + (0.0,)))" %(name, k, k + 2)]
+	if (code == 'v3'):
+		return ["setValue(%r, VEC(v[%d:%d]))" %(name, k, k + 3)]
+	if (count is None):
+		return ["setValue(%r, v[%d], %d)" %(name, k, cls)]
+	if (code == 'f32'):
+		return ["setValue(%r, list(v[%d:%d]), %d)" %(name, k, k + n, cls)]
+	return ["setValue(%r, v[%d:%d], %d)" %(name, k, k + n, cls)]
+
+def _compileFixed(fields, blockSize, structs):
+	'''Returns the source lines that read the run of fixed size fields with one Struct.'''
+	fmt   = '<'
+	lines = []
+	k     = 0
+	for code, typ, count, name in fields:
+		if (code == 's'):
+			fmt += '%dx' %(blockSize * (count or 1))
+		elif (code == 'x'):
+			fmt += '%dx' %(count or 1)
+		elif (code == 'type'):
+			lines.append("node.typeName = %r" %(name))
+		elif (code == 'post'):
+			lines.append("reader.%s(node)" %(name))
+		elif (code == 'hdr'):
+			fmt += 'LH'
+			lines.append("setValue('hdr', Header0(v[%d], v[%d]), None)" %(k, k + 1))
+			k += 2
+		else:
+			f, n, cls = _FIXED[code]
+			n *= (count or 1)
+			fmt += f if (n == 1) else '%d%s' %(n, f)
+			lines += _getSetter(code, count, name, k)
+			k += n
+	st = Struct(fmt)
+	if (k > 0):
+		unpack = 'unpack%d' %(len(structs))
+		structs[unpack] = st.unpack_from
+		lines.insert(0, "v = %s(node.data, i)" %(unpack))
+	if (st.size > 0):
+		lines.append("i += %d" %(st.size))
+	return lines
+
+def _compileVariable(cls, code, typ, count, name):
+	if (code == 'call'):
+		header, typeName = name
+		args = "" if (typeName is None) else ", %r" %(typeName)
+		if (hasattr(cls, header)):
+			return ["i = reader.%s(node%s)" %(header, args)]
+		getattr(importerSegNode.SecNode, header) # raises AttributeError for unknown headers
+		return ["i = node.%s(%s)" %(header, args[2:])]
+	if (code == 't16'):
+		return ["i = node.ReadLen32Text16(i, %r)" %(name)]
+	if (code == 't8'):
+		return ["i = node.ReadLen32Text8(i, %r)" %(name)]
+	return ["i = node.ReadList%s(i, %d, %r)" %(code[3], getattr(importerSegNode, '_TYP_%s_' %(typ)), name)]
+
+class Layout(object):
+	def __init__(self, fields, header, typeName, post):
+		self.fields   = fields
+		self.header   = header
+		self.typeName = typeName
+		self.post     = post
+		self.readers  = {}
+		_parse(fields) # fail early for syntax errors
+
+	def compile(self, cls, version, nodeType):
+		'''
+		Returns the source of the reader for nodes of files with the given
+		version and the unpack functions of its Structs.
+		'''
+		fields  = _expand(cls, self.header, self.typeName, nodeType, version, [])
+		_flatten(_parse(self.fields), version, fields)
+		structs = {}
+		lines   = ["i = 0", "setValue = node.set"]
+		fixed   = []
+		for field in fields:
+			if ((field[0] in _FIXED) or (field[0] in ('s', 'x', 'hdr', 'type', 'post'))):
+				fixed.append(field)
+			else:
+				lines += _compileFixed(fixed, getBlockSize(), structs)
+				lines += _compileVariable(cls, *field)
+				fixed = []
+		lines += _compileFixed(fixed, getBlockSize(), structs)
+		lines.append("return i")
+		return "def read(reader, node):\n\t" + "\n\t".join(lines) + "\n", structs
+
+	def getReader(self, cls, version, method):
+		'''
+		Returns the compiled reader for the reader class and file version.
+		The compiled readers are cached.
+		'''
+		key = (cls, version)
+		read = self.readers.get(key)
+		if (read is None):
+			try:
+				source, structs = self.compile(cls, version, method.__name__[5:])
+				read = _createReader(source, structs, method)
+			except Exception as e:
+				logWarning(u"    Can't compile layout for %s.%s - %s", cls.__name__, method.__name__, e)
+				read = method
+			self.readers[key] = read
+		return read
+
+def _createReader(source, structs, method):
+	namespace = {'UID': UID, 'VEC': VEC, 'Header0': Header0}
+	namespace.update(structs)
+	exec(compile(source, '<layout %s>' %(method.__name__), 'exec'), namespace)
+	compiled = namespace['read']
+	stateful = ('reader.' in source) # the reader's header or post methods are called.
+	def read(reader, node):
+		typeName = node.typeName
+		state    = reader.getLayoutState() if (stateful) else None
+		try:
+			return compiled(reader, node)
+		except Exception as e:
+			logWarning(u"    Layout of %s.%s failed - %s", reader.__class__.__name__, method.__name__, e)
+			if (stateful):
+				reader.restoreLayoutState(node, state)
+			node.typeName   = typeName
+			node.name       = None
+			node.properties = {}
+			node.references = []
+			return method(reader, node)
+	return read
+
+def layout(fields, header = None, typeName = None, post = None):
+	'''
+	Decorator that attaches the node's layout to a Read_XXXXXXXX or header method.
+	fields:   the node's fields (see module documentation).
+	header:   name of the reader's (or node's) method that reads the header.
+	typeName: the type name passed to the header method ('%s' for the node's UID).
+	post:     name of the reader's method that is called with the node after the fields are read.
+	'''
+	def decorate(method):
+		method.layout = Layout(fields, header, typeName, post)
+		return method
+	return decorate
+
+def getNodeReader(cls, version, method):
+	'''
+	Returns the compiled layout of the Read_XXXXXXXX method for the file version or the method itself.
+	'''
+	l = getattr(method, 'layout', None)
+	if (l is None):
+		return method
+	return l.getReader(cls, version, method)
@@ -11,6 +11,7 @@ TODO:
 from importerSegment import SegmentReader, checkReadAll
 import importerSegNode
 from importerUtils   import *
+from importerLayout  import layout
 from importerConstants import VAL_UINT32
 
 __author__      = 'Jens M. Plonka'
@@ -22,12 +23,14 @@ class NotebookReader(SegmentReader):
 	def __init__(self, segment):
 		super(NotebookReader, self).__init__(segment)
 
+	@layout('lst2<CHAR>:rtf', 'Read_Header0', 'RtfContent')
 	def Read_386E04F0(self, node): # RtfContent
 		i = node.Read_Header0('RtfContent')
 		i = node.ReadList2(i, importerSegNode._TYP_CHAR_, 'rtf')
 		# TODO: convert RTF to HTML/TEXT
 		return i
 
+	@layout('lst3<NODE_REF>:lst0 uid:uid_0 u32:u32_0 u8:u8_0', 'Read_Header0')
 	def Read_7ABDF905(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList3(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -36,6 +39,7 @@ class NotebookReader(SegmentReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('u8[6]:a0 s u8:u8_0 lst2<UINT32>:lst0 s cref:ref_0 u8:u8_1 s', 'Read_Header0')
 	def Read_8115E243(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt8A(i, 6, 'a0')
@@ -78,6 +82,7 @@ class NotebookReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('pref', 'ReadHeaderU32RefU8List3')
 	def Read_E23E5AE6(self, node):
 		i = self.ReadHeaderU32RefU8List3(node)
 		i = node.ReadParentRef(i)
@@ -97,6 +102,7 @@ class NotebookReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('cref:ref_0 u8:u8_0 u32:self u8:u8_1', 'ReadHeaderU32Lst2', 'Notebook')
 	def Read_3C95B7CE(self, node): # Notebook
 		i = self.ReadHeaderU32Lst2(node, 'Notebook')
 		i = node.ReadChildRef(i, 'ref_0')
@@ -105,6 +111,7 @@ class NotebookReader(SegmentReader):
 		i = node.ReadUInt8(i, 'u8_1')
 		return i
 
+	@layout('t16 lst3<NODE_REF>:lst1 u16[2]:a1', 'ReadHeaderU32Lst2', 'Note')
 	def Read_4C415964(self, node): # Note
 		i = self.ReadHeaderU32Lst2(node, 'Note')
 		i = node.ReadLen32Text16(i)
@@ -112,6 +119,7 @@ class NotebookReader(SegmentReader):
 		i = node.ReadUInt16A(i, 2, 'a1')
 		return i
 
+	@layout('u32:l1 v3:a1', 'ReadHeaderU32Lst2', 'Folder')
 	def Read_74E34413(self, node): # Folder
 		i = self.ReadHeaderU32Lst2(node, 'Folder')
 		i = node.ReadUInt32(i, 'l1')
@@ -746,11 +746,19 @@ def getReader(seg):
 	seg.AcisList = []
 	reader = SEG_TYPE_READERS.get(seg.type, None)
 	if (reader is None):
-		logError(u"    NO READER DEFINED FOR %s '%s'" %(seg.type, seg.name))
+		logError(u"    NO READER DEFINED FOR %s '%s'", seg.type, seg.name)
 		return SegmentReader(seg)
 	return reader(seg)
 
-def ReadRSeMetaDataB(dataB, seg):
+def UncompressRSeMetaDataB(dataB):
+	i = 0
+	uid, i = getUUID(dataB, i)
+	n, i = getUInt16(dataB, i)
+	z = zlib.decompressobj()
+	return z.decompress(dataB[i:])
+
+def ReadRSeSegmentData(data, seg):
+	'''Reads the uncompressed data of the segment's B-stream.'''
 	reader = getReader(seg)
 	if (reader):
 		newFile = None
@@ -758,17 +766,15 @@ def ReadRSeMetaDataB(dataB, seg):
 		if (not (dumpFolder is None)):
 			newFile = codecs.open(u"%s/%s.log" %(dumpFolder, seg.name), 'wb', 'utf8')
 			newFile.write('[%s]\n' %(reader.version))
-		i = 0
-		uid, i = getUUID(dataB, i)
-		n, i = getUInt16(dataB, i)
-		z = zlib.decompressobj()
-		data = z.decompress(dataB[i:])
-
 		reader.ReadSegmentData(newFile, data)
 		if (not (newFile is None)):
 			newFile.close()
 	return
 
+def ReadRSeMetaDataB(dataB, seg):
+	ReadRSeSegmentData(UncompressRSeMetaDataB(dataB), seg)
+	return
+
 def ReadRSeMetaDataM(dataM, name):
 	i = 0
 	value = Segment()
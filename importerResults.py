@@ -9,6 +9,7 @@ The importer can read files from Autodesk (R) Invetor (R) Inventro V2010 on. Old
 from importerSegment import SegmentReader, checkReadAll
 from importerClasses import ResultItem4, AbstractData
 from importerUtils   import *
+from importerLayout  import layout
 import importerSegNode
 
 __author__     = 'Jens M. Plonka'
@@ -48,6 +49,7 @@ class ResultReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_0 s u32:schema s u32:u32_2 u8:u8_0 s32:s32_0 s (x[1])>2018 cref:ref_1 s32:lastKey', 'Read_Header0')
 	def Read_F645595C(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -63,6 +65,7 @@ class ResultReader(SegmentReader):
 		i = node.ReadSInt32(i, 'lastKey')
 		return i
 
+	@layout('s32:s32_0 s pref lst2<UINT32>:delta_states lst6<MAP_KEY_REF>:delta_mapping cref:ref_1', 'Read_Header0', 'SatHistory')
 	def Read_F78B08D5(self, node):
 		i = node.Read_Header0('SatHistory')
 		i = node.ReadSInt32(i, 's32_0')
@@ -73,6 +76,7 @@ class ResultReader(SegmentReader):
 		i = node.ReadChildRef(i, 'ref_1')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0 lst2<NODE_REF>:lst1 lst2<NODE_REF>:lst2 cref:ref_1 cref:ref_2 u8:u8_0', 'Read_Header0')
 	def Read_EC60C64B(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -83,6 +87,7 @@ class ResultReader(SegmentReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0 u32:u32_0 u16:u16_0 u32[3]:a0 lst4<RESULT_1>:lst1 u32[2]:a1 s lst2<LIST_CHAR>:lst2 s', 'Read_Header0')
 	def Read_7313FAC3(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
@@ -137,6 +142,7 @@ class ResultReader(SegmentReader):
 		if (self.version > 2014): i = len(node.data) # skip ???
 		return i
 
+	@layout('f64[14]:a0 u8[17]:u8_0 f64[2]:a1 u8[2]:a2 f64[6]:a3', 'Read_Header0')
 	def Read_E5DDE747(self, node):
 		i = node.Read_Header0()
 		i = node.ReadFloat64A(i, 14, 'a0')
@@ -150,6 +156,7 @@ class ResultReader(SegmentReader):
 		i = node.Read_Header0()
 		return i
 
+	@layout('lst2<UINT32>:lst0 lst2<NODE_REF>:lst1', 'Read_Header0')
 	def Read_F17A4562(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_UINT32_, 'lst0')
@@ -170,6 +177,7 @@ class ResultReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('lst2<UINT32>:lst0 u32:u32_0 xref:ref_0 cref:ref_1 uid:uid_0 u8:u8_0 f64[6]:box u8:u8_1 s u32[2]:a2 uid:uid_1', 'Read_Header0')
 	def Read_46C5CF3F(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_UINT32_, 'lst0')
@@ -185,12 +193,14 @@ class ResultReader(SegmentReader):
 		i = node.ReadUUID(i, 'uid_1')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0 u32:u32_0', 'Read_Header0')
 	def Read_4E32D51B(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
 		i = node.ReadUInt32(i, 'u32_0')
 		return i
 
+	@layout('u32:u32_0 s u32:u32_1 xref:ref_0 u32:u32_2', 'Read_Header0')
 	def Read_1F4A6D7D(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -200,6 +210,7 @@ class ResultReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('(x[4])<2012 t16 cref:ref_1', 'Read_Header0')
 	def Read_246184A0(self, node):
 		i = node.Read_Header0()
 		if (self.version < 2012): i += 4 #skip REF
@@ -273,6 +284,7 @@ class ResultReader(SegmentReader):
 		if (self.version > 2014):  i = len(node.data) # skip!!!
 		return i
 
+	@layout('u32:u32_0 cref:ref_0', 'Read_Header0')
 	def Read_ADAF9728(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32(i, 'u32_0')
@@ -448,6 +460,7 @@ class ResultReader(SegmentReader):
 		i = node.ReadLen32Text16(i)
 		return i
 
+	@layout('xref:ref_0 cref:ref_1 u32:u32_1 s', 'ReadHeaderU32Txt')
 	def Read_7DD5B203(self, node):
 		i = self.ReadHeaderU32Txt(node)
 		i = node.ReadCrossRef(i, 'ref_0')
@@ -5,10 +5,10 @@ importerSAT.py:
 Collection of classes necessary to read and analyse Autodesk (R) Invetor (R) files.
 '''
 
-import os, FreeCAD, Part, ImportGui, io
+import os, FreeCAD, Part, io
 from importerUtils   import logInfo, logAlways, chooseImportStrategyAcis, STRATEGY_SAT, STRATEGY_NATIVE, STRATEGY_STEP, setDumpFolder, getDumpFolder
-from Acis2Step       import export
-from Acis            import TAG_ENTITY_REF, getReader, setReader, AcisReader, createEntity, init
+from Acis2Step       import export, releaseStepFile
+from Acis            import TAG_ENTITY_REF, getReader, setReader, AcisReader, createEntity, init, buildFaceShapes
 
 __author__     = 'Jens M. Plonka'
 __copyright__  = 'Copyright 2018, Germany'
@@ -58,8 +58,7 @@ def buildFaces(shells, root, name, transform):
 	faces = []
 
 	for shell in shells:
-		for face in shell.getFaces():
-			surface = face.build()
+		for surface in buildFaceShapes(shell.getFaces()):
 			if (surface):
 				faces.append(surface)
 		for wire in shell.getWires():
@@ -122,7 +121,8 @@ def resolveNodes(acis):
 	bodies = []
 	setReader(acis)
 
-	if (getDumpFolder()[-3:].lower() != 'sat'):
+	dumpFolder = getDumpFolder()
+	if ((dumpFolder is not None) and (dumpFolder[-3:].lower() != 'sat')):
 		name = _getSatFileName(acis.name)
 		dumpSat(name, acis)
 	for record in acis.getRecords():
@@ -146,7 +146,11 @@ def convertModel(group, docName):
 	bodies = resolveNodes(acis)
 
 	stepfile = export(acis.name, acis.header, bodies)
-	ImportGui.insert(stepfile, docName)
+	import ImportGui
+	try:
+		ImportGui.insert(stepfile, docName)
+	finally:
+		releaseStepFile(stepfile)
 
 def readText(fileName):
 	global _fileName
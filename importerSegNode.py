@@ -226,6 +226,7 @@ TYP_MAP_FUNC = {
 }
 
 class SecNode(AbstractData):
+	__slots__ = ('analysed', 'isAttr', 'Item', 'dimensioningVisible')
 
 	def __init__(self):
 		super(SecNode, self).__init__()
@@ -398,6 +399,10 @@ class SecNode(AbstractData):
 
 	def ReadNodeRef(self, offset, name, number, type):
 		m, i = getUInt32(self.data, offset)
+		self.SetNodeRef(m, name, number, type)
+		return i
+
+	def SetNodeRef(self, m, name, number, type):
 		ref = SecNodeRef(m, type, name)
 
 		if (ref.index > 0):
@@ -409,7 +414,6 @@ class SecNode(AbstractData):
 		else:
 			ref = None
 		self.set(name, ref, VAL_REF)
-		return i
 
 	def ReadChildRef(self, offset, name = 'ref', number = None):
 		return self.ReadNodeRef(offset, name, number , REF_CHILD)
@@ -1469,6 +1473,7 @@ class SecNode(AbstractData):
 		return None
 
 class SecNodeRef(object):
+	__slots__ = ('index', 'mask', 'type', 'number', '_data', 'analysed', 'attrName', '__dict__')
 
 	def __init__(self, m, refType, name):
 		self.index    = (m & 0x7FFFFFFF)
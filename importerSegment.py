@@ -11,10 +11,10 @@ from importerClasses        import *
 from importerTransformation import Transformation2D, Transformation3D
 from importerSegNode        import isList, CheckList, SecNode, SecNodeRef, _TYP_NODE_REF_, _TYP_UINT32_A_, REF_PARENT, REF_CHILD, REF_CROSS
 from importerUtils          import *
+from importerLayout         import getNodeReader
 from Acis                   import clearEntities, AcisReader, setVersion, TAG_ENTITY_REF, createEntity, getNameMatchAttributes, getDcAttributes
 from importerSAT            import dumpSat
 from uuid                   import UUID
-import importerUtils
 
 __author__     = 'Jens M. Plonka'
 __copyright__  = 'Copyright 2018, Germany'
@@ -40,6 +40,25 @@ def resolveEntityReferences(node):
 
 def Read_Dummy(self, node): return 0
 
+def Read_Unknown(self, node):
+	self.unknownTypes[node.typeName] = self.unknownTypes.get(node.typeName, 0) + 1
+	return 0
+
+# dispatch tables of the readers: (reader class, file version) -> {typeName: Read_XXXXXXXX}
+_readTypes = {}
+
+def getReadTypes(cls, version):
+	'''
+	Returns the dispatch table for the reader class and the file version.
+	The readers of the nodes are added on first use.
+	'''
+	key = (cls, version)
+	readTypes = _readTypes.get(key)
+	if (readTypes is None):
+		readTypes = {}
+		_readTypes[key] = readTypes
+	return readTypes
+
 def dumpHistory(nodeIdx, history):
 	dumpFolder = getDumpFolder()
 	if (not (dumpFolder is None)):
@@ -61,17 +80,11 @@ def checkReadAll(node, i, l):
 	return
 
 def dumpData(file, data, offset, end):
-	if (offset < end):
+	if ((offset < end) and (not file is None)):
 		arr8, dummy = getUInt8A(data, offset, end - offset)
-		if (not file is None):
-			file.write('\t[%s]\n' %(IntArr2Str(arr8, 2)))
+		file.write('\t[%s]\n' %(IntArr2Str(arr8, 2)))
 	return
 
-def getNodeUID(index, seg):
-	assert (index in seg.secBlkTyps), "Index %X not defined in segment's section block types!" %(index)
-	blockType = seg.secBlkTyps[index]
-	return blockType.uid
-
 def getStart(m, data, offset):
 	if (m):
 		return m.start() - offset
@@ -146,39 +159,63 @@ def __dumpBranch(file, ref, branch, level, prefix):
 	return
 
 def buildBranch(parent, file, data, level, ref):
-	parent.append(data.node)
-
-	if (data.analysed == False):
-		__dumpBranch(file, ref, data.node, level, '')
-		data.analysed = True
-		for childRef in data.references:
+	'''
+	Appends the branch of the data node to the parent. The branch is walked
+	with an explicit stack, as deep trees would exceed the recursion limit.
+	'''
+	stack = [] # (parent, data, level, iterator of the data's references)
+	while (True):
+		if (data is not None):
+			parent.append(data.node)
+			if (data.analysed == False):
+				__dumpBranch(file, ref, data.node, level, '')
+				data.analysed = True
+				stack.append((parent, data, level, iter(data.references)))
+			elif (not file is None):
+				__dumpBranch(file, ref, data.node.getRefText(), level, '*')
+			data = None
+		if (len(stack) == 0):
+			break
+		parent, current, level, references = stack[-1]
+		for childRef in references:
 			if (not childRef.analysed):
 				childRef.analysed = True
 				child = childRef._data
 				if (child is not None):
 					if (childRef.type == REF_CHILD):
-						buildBranch(data.node, file, child, level + 1, childRef)
+						parent, data, level, ref = current.node, child, level + 1, childRef
+						break
 					elif (childRef.type == REF_CROSS):
 						node = childRef.node
 						if (node is not None):
-							parent.append(childRef.node)
-							__dumpBranch(file, childRef, node.getRefText(), level + 1, '*')
-	else:
-		__dumpBranch(file, ref, data.node.getRefText(), level, '*')
+							parent.append(node)
+							if (not file is None):
+								__dumpBranch(file, childRef, node.getRefText(), level + 1, '*')
+		else:
+			stack.pop()
 	return
 
 def resolveReferences(nodes):
+	'''
+	Links the node's references with the corresponding nodes.
+	Returns the array of the indices of the nodes' 'parent' properties.
+	'''
+	parents = [None] * (max(nodes) + 1 if (len(nodes) > 0) else 0)
 	for node in nodes.values():
 		getBranchNode(node)
 		node.handled = False
 		node.sketchIndex = None
 		node.parent = None
+		parent = node.get('parent')
+		if (parent is not None):
+			parents[node.index] = parent.index
 		isRadius2D = (node.typeName == 'Dimension_Radius2D')
 		for ref in node.references:
-			if (ref.index in nodes):
-				ref._data = nodes[ref.index]
+			data = nodes.get(ref.index)
+			if (data is not None):
+				ref._data = data
 				if (ref.type == REF_PARENT):
-					node.parent = ref._data
+					node.parent = data
 			elif (ref.index > -1):
 				logError(u"ERROR> %s.py - index out of range for %08X.%s = %X!", node.__module__, node.uid.time_low, ref.attrName, ref.index)
 			if (isRadius2D and (ref.typeName in ['Circle2D', 'Ellipse2D', 'Arc2D'])):
@@ -200,18 +237,13 @@ def resolveReferences(nodes):
 		elif (node.typeName == 'ObjectCollectionDef'):
 			definition = node.get('collection')
 			definition.set('objectCollection', node)
-	return
+	return parents
 
-def isParent(ref, parent):
-	node = ref.get('parent')
-	if (node is None): return False
-	return node.index == parent.index
-
-def resolveParentNodes(nodes):
+def resolveParentNodes(nodes, parents):
 	for parent in nodes.values():
 		for ref in parent.references:
 			child = ref._data
-			if (isParent(ref, parent)):
+			if ((child is not None) and (parents[child.index] == parent.index)):
 				ref.type = REF_CHILD
 				child.parent = parent
 			elif (ref.index > parent.index):
@@ -228,10 +260,10 @@ def resolveParentNodes(nodes):
 
 def buildTree(file, nodes):
 	# link the node's references with the corresponding nodes
-	resolveReferences(nodes)
+	parents = resolveReferences(nodes)
 
 	# set the parent property for each node
-	resolveParentNodes(nodes)
+	resolveParentNodes(nodes, parents)
 
 	# now the tree can be build
 	roots = DataNode(None)
@@ -255,7 +287,36 @@ class SegmentReader(object):
 		self.version = segment.segment.version.major
 		if (self.version > 11): self.version += 1996
 		setFileVersion(self.version)
+		self.blockSize   = getBlockSize()
 		self.nodeCounter = 0
+		self.readTypes   = getReadTypes(self.__class__, self.version)
+		self.blockTypes  = []
+		self.unknownTypes = {}
+
+	def __getstate__(self):
+		# the compiled layouts of the dispatch table can't be pickled => rebuild the table.
+		state = self.__dict__.copy()
+		state['readTypes']  = None
+		state['blockTypes'] = []
+		return state
+
+	def __setstate__(self, state):
+		self.__dict__.update(state)
+		self.readTypes = getReadTypes(self.__class__, self.version)
+
+	def getLayoutState(self):
+		'''
+		Returns the state of the reader that its header methods change, so that
+		it can be restored if a compiled layout fails (see importerLayout).
+		'''
+		return None
+
+	def restoreLayoutState(self, node, state):
+		'''
+		Undoes the changes of the header methods for the node, before the
+		node is read again by the hand-written Read_XXXXXXXX method.
+		'''
+		return
 
 	def postRead(self):
 		for node in self.segment.elementNodes.values():
@@ -563,15 +624,35 @@ class SegmentReader(object):
 	def Read_791C333D(self, node): return self.Read_Unit(node, 'XXX',     'User'                        , 0.0, 0.0) # not supported -> Tuner.iam?
 	def Read_9CBB2613(self, node): return self.Read_Unit(node, '9CBB2613' , '9CBB2613'                  , 0.0, 1.0         , True)
 
-	def HandleBlock(self, node):
+	def getReadType(self, typeName):
+		'''
+		Returns the reader for the node type and adds it to the reader's dispatch table.
+		'''
+		readType = getattr(self.__class__, 'Read_%s' %(typeName), None)
+		if (readType is None):
+			readType = Read_Unknown
+		else:
+			readType = getNodeReader(self.__class__, self.version, readType)
+		self.readTypes[typeName] = readType
+		return readType
+
+	def getBlockTypes(self):
+		'''
+		Returns the segment's block types as table: index -> (UID, type name, reader).
+		'''
+		blockTypes = [None] * 0x100
+		for index, blockType in self.segment.secBlkTyps.items():
+			typeName = '%08X' % (blockType.uid.time_low)
+			readType = self.readTypes.get(typeName)
+			if (readType is None):
+				readType = self.getReadType(typeName)
+			blockTypes[index & 0xFF] = (blockType.uid, typeName, readType)
+		return blockTypes
+
+	def HandleBlock(self, node, readType):
 		i = 0
 		try:
-			readType = getattr(self, 'Read_%s' %(node.typeName))
-			i = readType(node)
-		except AttributeError:
-			if (self.__class__.__name__ != 'SegmentReader'):
-				logError(u"ERROR> %s.py missing 'def Read_%08X(self, node)'!", self.__module__, node.uid.time_low)
-				setattr(self.__class__, 'Read_%s' %(node.typeName), Read_Dummy)
+			i = readType(self, node)
 		except:
 			logError(traceback.format_exc())
 
@@ -590,14 +671,16 @@ class SegmentReader(object):
 		self.segment.elementNodes[node.index] = node
 		# set node's data
 		n, i = getUInt32(data, node.offset)
-		node.uid = getNodeUID((n & 0xFF), self.segment)
-		node.typeName = '%08X' % (node.uid.time_low)
-		node.data = data[i:i + node.size]
-		self.HandleBlock(node)
+		blockType = self.blockTypes[n & 0xFF]
+		assert (blockType is not None), "Index %X not defined in segment's section block types!" %(n & 0xFF)
+		node.uid, node.typeName, readType = blockType
+		node.data = data[i:i + node.size] # memoryview => no copy of the block's data!
+		self.HandleBlock(node, readType)
+		self.segment.indexNode(node)
 		return node
 
 	def skipBlockSize(self, offset, l = 1):
-		return offset + l * importerUtils._block_size
+		return offset + l * self.blockSize
 
 	def ReadRefU32AList(self, node, offset, name, size, type):
 		cnt, i = getUInt32(node.data, offset)
@@ -725,11 +808,13 @@ class SegmentReader(object):
 		return i
 
 	def ReadSegmentData(self, file, buffer):
-		self.nodeCounter = 0
-		self.segment.elementNodes = {}
-		self.segment.indexNodes   = {}
+		self.nodeCounter  = 0
+		self.segment.clearNodes()
+		self.blockTypes   = self.getBlockTypes()
+		self.unknownTypes = {}
 
 		i = 0
+		buffer = memoryview(buffer) # nodes will share the segment's buffer
 
 		for sec in self.segment.sec1:
 			if (sec.flags == 1):
@@ -739,7 +824,11 @@ class SegmentReader(object):
 				l, i = getUInt32(buffer, i)
 				i = self.ReadTrailer(buffer, i)
 				if ((l != 0) and (sec.length != l)):
-					logError('%s: BLOCK[%04X] - incorrect block size %X != 	%X found for offset %X for %s!' %(self.__class__.__name__, data.index, l, sec.length, start, data.typeName))
+					logError('%s: BLOCK[%04X] - incorrect block size %X != 	%X found for offset %X for %s!', self.__class__.__name__, data.index, l, sec.length, start, data.typeName)
+
+		if (self.__class__.__name__ != 'SegmentReader'):
+			for typeName, count in sorted(self.unknownTypes.items()):
+				logError(u"ERROR> %s.py missing 'def Read_%s(self, node)' for %d nodes!", self.__module__, typeName, count)
 
 		self.segment.tree = buildTree(file, self.segment.elementNodes)
 		self.postRead()
@@ -2,6 +2,7 @@
 
 from importerSegment   import SegmentReader
 from importerUtils     import *
+from importerLayout    import layout
 from importerConstants import VAL_UINT32
 import importerSegNode
 
@@ -183,6 +184,7 @@ class SheetDlReader(SegmentReader):
 		return i
 
 	####################
+	@layout('cref:ref_00 cref:ref_01 cref:ref_02 cref:ref_03 cref:ref_04 cref:ref_05 cref:ref_06 cref:ref_07 cref:ref_08 cref:ref_09 cref:ref_10 cref:ref_11 cref:ref_12 cref:ref_13 cref:ref_14 cref:ref_15 cref:ref_16 cref:ref_17 cref:ref_18 cref:ref_19 cref:ref_20', 'Read_Header0')
 	def Read_837EFBB8(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_00')
@@ -208,6 +210,7 @@ class SheetDlReader(SegmentReader):
 		i = node.ReadChildRef(i, 'ref_20')
 		return i
 
+	@layout('s u32[5]:a0', 'Read_Header0')
 	def Read_98536631(self, node):
 		i = node.Read_Header0()
 		i = self.skipBlockSize(i)
@@ -220,6 +223,7 @@ class SheetDlReader(SegmentReader):
 		i = node.ReadList2(i, importerSegNode._TYP_UINT16_, 'lst0')
 		return i
 
+	@layout('cref:ref_0 u32:u32_0 bool:b0 lst2<FLOAT64>:lst0', 'Read_Header0')
 	def Read_9EC607A4(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_0')
@@ -259,6 +263,7 @@ class SheetDlReader(SegmentReader):
 		i = node.ReadList2(i, importerSegNode._TYP_SINT32_A_, 'lst0', 2)
 		return i
 
+	@layout('u32:flags cref:styles cref:numRef pref u32:u32_0 s v2:c f64:b f64:a v2:dB v2:dA f64:startAngle f64:sweepAngle', 'Read_Header0', 'Ellipse2D')
 	def Read_4B57DC56(self, node):
 		i = node.Read_Header0('Ellipse2D')
 		i = node.ReadUInt32(i, 'flags')
@@ -305,6 +310,7 @@ class SheetDlReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_3')
 		return i
 
+	@layout('v3:a1 f32:f0 u16[3]:a2 s u32:u32_1', 'ReadHeaderDL')
 	def Read_41305114(self, node):
 		i = self.ReadHeaderDL(node)
 		i = node.ReadFloat64_3D(i, 'a1')
@@ -314,24 +320,28 @@ class SheetDlReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('f64[12]:a1 bool:b0', 'ReadHeaderDL')
 	def Read_A79EACCC(self, node):
 		i = self.ReadHeaderDL(node)
 		i = node.ReadFloat64A(i, 12, 'a1')
 		i = node.ReadBoolean(i, 'b0')
 		return i
 
+	@layout('f64[7]:a1 bool:b1', 'ReadHeaderDL')
 	def Read_A79EACCD(self, node):
 		i = self.ReadHeaderDL(node)
 		i = node.ReadFloat64A(i, 7, 'a1')
 		i = node.ReadBoolean(i, 'b1')
 		return i
 
+	@layout('f64[13]:a1 bool:b0', 'ReadHeaderDL')
 	def Read_AFD5CEEB(self, node):
 		i = self.ReadHeaderDL(node)
 		i = node.ReadFloat64A(i, 13, 'a1')
 		i = node.ReadBoolean(i, 'b0')
 		return i
 
+	@layout('v3:a1 v3:a2', 'ReadHeaderDL')
 	def Read_A79EACC7(self, node):
 		i = self.ReadHeaderDL(node)
 		i = node.ReadFloat64_3D(i, 'a1')
@@ -348,6 +358,7 @@ class SheetDlReader(SegmentReader):
 		i = node.ReadFloat64(i, 'f0')
 		return i
 
+	@layout('t16:txt_0 v3:a1 v3:a2 u16:u16_1 u32:u32_1 bool:b0', 'ReadHeaderDL')
 	def Read_A79EACD5(self, node):
 		i = self.ReadHeaderDL(node)
 		i = node.ReadLen32Text16(i, 'txt_0')
@@ -404,6 +415,7 @@ class SheetDlReader(SegmentReader):
 		i = self.ReadHeaderTransform(node)
 		return i
 
+	@layout('s cref:ref_2 bool:b0', 'ReadHeaderTransform')
 	def Read_A979CDC5(self, node):
 		i = self.ReadHeaderTransform(node)
 		i = self.skipBlockSize(i)
@@ -2,6 +2,7 @@
 
 from importerSegment   import SegmentReader
 from importerUtils     import *
+from importerLayout    import layout
 from importerConstants import VAL_UINT16, VAL_UINT32
 
 import importerSegNode
@@ -52,6 +53,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s s', 'ReadHeaderSmObjRef')
 	def Read_CDB613FA(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -60,6 +62,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s s u32:u32_2', 'ReadHeaderSmObjRef')
 	def Read_025E3388(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -69,6 +72,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_1 bool:b1 s s u32:u32_2 s', 'ReadHeaderSmObjRef')
 	def Read_B2D41A36(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -79,6 +83,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s s', 'ReadHeaderSmObjRef')
 	def Read_5E4E86C7(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -87,6 +92,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s s', 'ReadHeaderSmObjRef')
 	def Read_F5A6ED7A(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -95,6 +101,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[3]', 'ReadHeaderSmObjRef')
 	def Read_35ECB98A(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -102,6 +109,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 3)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[3]', 'ReadHeaderSmObjRef')
 	def Read_D8727CE0(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -109,6 +117,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 3)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2]', 'ReadHeaderSmObjRef')
 	def Read_028C9254(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -116,6 +125,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2]', 'ReadHeaderSmObjRef')
 	def Read_C0CA9B69(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -123,6 +133,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2]', 'ReadHeaderSmObjRef')
 	def Read_45A1B92D(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -130,6 +141,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2]', 'ReadHeaderSmObjRef')
 	def Read_5EB510C2(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -137,6 +149,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2]', 'ReadHeaderSmObjRef')
 	def Read_4B13984A(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -144,6 +157,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2]', 'ReadHeaderSmObjRef')
 	def Read_59ACDE3F(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -151,6 +165,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2]', 'ReadHeaderSmObjRef')
 	def Read_C2607F03(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -158,6 +173,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2]', 'ReadHeaderSmObjRef')
 	def Read_EA9293EA(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -165,6 +181,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2]', 'ReadHeaderSmObjRef')
 	def Read_FE56BF50(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -172,6 +189,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2]', 'ReadHeaderSmObjRef')
 	def Read_FE44386F(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -179,6 +197,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2]', 'ReadHeaderSmObjRef')
 	def Read_9B3499D1(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -186,6 +205,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2]', 'ReadHeaderSmObjRef')
 	def Read_648CD16A(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -193,6 +213,7 @@ class SheetSmReader(SegmentReader):
 		i = self.skipBlockSize(i, 2)
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2] u32:u32_2', 'ReadHeaderSmObjRef')
 	def Read_B86459E3(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -201,6 +222,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2] u32:u32_2', 'ReadHeaderSmObjRef')
 	def Read_8FB07810(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -209,6 +231,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2] u32:u32_2', 'ReadHeaderSmObjRef')
 	def Read_1513AE96(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -217,6 +240,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2] u32:u32_2', 'ReadHeaderSmObjRef')
 	def Read_EF7D412D(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -225,6 +249,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2] u32:u32_2', 'ReadHeaderSmObjRef')
 	def Read_8DEAF986(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -233,6 +258,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2] u32:u32_2', 'ReadHeaderSmObjRef')
 	def Read_5CBE01A1(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -241,6 +267,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2] u32:u32_2', 'ReadHeaderSmObjRef')
 	def Read_F3F435A2(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -249,6 +276,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2] u32:u32_2', 'ReadHeaderSmObjRef')
 	def Read_502678E8(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -280,6 +308,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('bool:b1 s u32:u32_1 bool:b2', 'ReadHeaderSmObjRef')
 	def Read_FFCFCF1F(self, node):
 		i = self.ReadHeaderSmObjRef(node)
 		i = node.ReadBoolean(i, 'b1')
@@ -309,6 +338,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2] u32:u32_2', 'ReadHeaderSmObjU32')
 	def Read_05A6BF7B(self, node):
 		i = self.ReadHeaderSmObjU32(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -317,6 +347,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('u32:u32_1 bool:b1 s[2] u32:u32_2', 'ReadHeaderSmObjU32')
 	def Read_8466CB8A(self, node):
 		i = self.ReadHeaderSmObjU32(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -413,6 +444,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('bool:b1 s v3:a0 v3:a1', 'ReadHeaderSmObjU32')
 	def Read_F04E03FE(self, node):
 		i = self.ReadHeaderSmObjU32(node)
 		i = node.ReadBoolean(i, 'b1')
@@ -465,6 +497,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt32A(i, 3, 'a2')
 		return i
 
+	@layout('u32[2]:a0 cref:ref_0 pref u32:u32_1 s v3:a1 f32:f1 u32:u32_2 u16:u16_0 s u32:u32_4', 'Read_Header0')
 	def Read_41305114(self, node):
 		i = node.Read_Header0()
 		i = node.ReadUInt32A(i, 2, 'a0')
@@ -496,6 +529,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadList2(i, importerSegNode._TYP_FLOAT32_A_, 'lst0', 3)
 		return i
 
+	@layout('t16:txt_0 v3:a0 v3:a1 u16:u16_0 u32:u32_2 bool:b0', 'ReadHeaderSmItem')
 	def Read_A79EACD5(self, node):
 		i = self.ReadHeaderSmItem(node)
 		i = node.ReadLen32Text16(i, 'txt_0')
@@ -506,18 +540,21 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadBoolean(i, 'b0')
 		return i
 
+	@layout('v3:a0 v3:a1', 'ReadHeaderSmItem')
 	def Read_A79EACC7(self, node):
 		i = self.ReadHeaderSmItem(node)
 		i = node.ReadFloat64_3D(i, 'a0')
 		i = node.ReadFloat64_3D(i, 'a1')
 		return i
 
+	@layout('f64[12]:a1 bool:b0', 'ReadHeaderSmItem')
 	def Read_A79EACCC(self, node):
 		i = self.ReadHeaderSmItem(node)
 		i = node.ReadFloat64A(i, 12, 'a1')
 		i = node.ReadBoolean(i, 'b0')
 		return i
 
+	@layout('v3:a0 v3:a1 f64:f bool:b', 'ReadHeaderSmItem')
 	def Read_A79EACCD(self, node):
 		i = self.ReadHeaderSmItem(node)
 		i = node.ReadFloat64_3D(i, 'a0')
@@ -685,6 +722,7 @@ class SheetSmReader(SegmentReader):
 			i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
 		return i
 
+	@layout('cref:ref_0 cref:ref_1 cref:ref_2 cref:ref_3 cref:ref_4', 'Read_Header0')
 	def Read_093834F3(self, node):
 		i = node.Read_Header0()
 		i = node.ReadChildRef(i, 'ref_0')
@@ -708,6 +746,7 @@ class SheetSmReader(SegmentReader):
 		i = node.ReadUInt16A(i, 3, 'a2')
 		return i
 
+	@layout('lst2<FONT>:lst0', 'Read_Header0')
 	def Read_EF1E3BE5(self, node):
 		i = node.Read_Header0()
 		i = node.ReadList2(i, importerSegNode._TYP_FONT_, 'lst0')
@@ -5,14 +5,18 @@ importerUtils.py:
 Collection of functions necessary to read and analyse Autodesk (R) Invetor (R) files.
 '''
 
-import os, sys, datetime, FreeCADGui, json, shutil, re
-from PySide.QtCore     import *
-from PySide.QtGui      import *
+import os, sys, io, time, datetime, json, shutil, re, threading, collections, FreeCAD
 from struct            import Struct, unpack_from, pack
 from FreeCAD           import Vector as VEC, Console, ParamGet
 from olefile           import OleFileIO
 from importerConstants import ENCODING_FS, CENTER
 
+# Don't load the GUI modules for headless conversions (e.g. FreeCADCmd)!
+if (FreeCAD.GuiUp):
+	import FreeCADGui
+	from PySide.QtCore import *
+	from PySide.QtGui  import *
+
 __author__     = 'Jens M. Plonka'
 __copyright__  = 'Copyright 2018, Germany'
 __url__        = "https://www.github.com/jmplonka/InventorLoader"
@@ -148,18 +152,60 @@ UUID_NAMES = {
 	'd31891c248bf14c3aa42ea872a846b2a': 'UFRxRef',
 }
 
-_fileVersion = 0
-_fileBeta        = -1
 _can_import      = True
 _use_sheet_metal = True
-_block_size      = 0
 
 __prmPrefOW__ = ParamGet("User parameter:BaseApp/Preferences/OutputWindow")
 __prmPrefIL__ = ParamGet("User parameter:BaseApp/Preferences/Mod/InventorLoader")
 
-# The file the be imported
-_inventor_file = None
-_dump_folder   = None
+class ParserContext(object):
+	'''
+	The state of a single import: the file's version and document properties,
+	the model and the current ACIS reader.
+	Each thread works on its own context, so several files can be imported
+	at the same time.
+	'''
+	def __init__(self):
+		self.fileVersion         = 0
+		self.fileBeta            = -1
+		self.blockSize           = 0
+		self.inventorFile        = None # The file the be imported
+		self.dumpFolder          = None
+		self.author              = ''
+		self.company             = ''
+		self.comment             = ''
+		self.lastModifiedBy      = ''
+		self.description         = ''
+		self.colorDefault        = ''
+		self.thumbnail           = None
+		self.model               = None # importerClasses.Inventor
+		self.acisReader          = None # Acis.AcisReader
+		self.nameMatchAttributes = {}
+		self.dcAttributes        = {}
+
+_contexts = threading.local()
+
+def getContext():
+	'''
+	Returns the parser context of the current thread.
+	'''
+	context = getattr(_contexts, 'current', None)
+	if (context is None):
+		context = ParserContext()
+		_contexts.current = context
+	return context
+
+def setContext(context):
+	'''
+	Sets the parser context for the current thread.
+	Parameters:
+	context: ParserContext
+		The context for the next import, or None for a new one.
+	'''
+	if (context is None):
+		context = ParserContext()
+	_contexts.current = context
+	return context
 
 STRATEGY_SAT    = 0
 STRATEGY_NATIVE = 1
@@ -170,12 +216,6 @@ __strategy__ = __prmPrefIL__.GetInt("strategy", STRATEGY_SAT)
 
 IS_CELL_REF = re.compile('^[a-z](\\d+)?$', re.IGNORECASE)
 IS_BETA     = re.compile('^.* Beta(\\d+) .*$', re.IGNORECASE)
-_author         = ''
-_company        = ''
-_comment        = ''
-_lastModifiedBy = ''
-_description    = ''
-_colorDefault   = ''
 
 with open(os.path.join(os.path.dirname(os.path.abspath(__file__)),"colors.json"), encoding='utf-8') as colorPalette:
 	_colorNames = json.load(colorPalette)
@@ -188,17 +228,15 @@ with open(os.path.join(os.path.dirname(os.path.abspath(__file__)),"colors.json")
 			_colorNames[n] = (r, g, b)
 
 def setColorDefault(r, g, b):
-	global _colorDefault
-	_colorDefault = (r, g, b)
+	getContext().colorDefault = (r, g, b)
 
 def getColorDefault():
-	global _colorDefault
-	return _colorDefault
+	return getContext().colorDefault
 
 def getColor(name):
-	global _colorNames, _colorDefault
+	global _colorNames
 
-	return _colorNames.get(name, _colorDefault)
+	return _colorNames.get(name, getContext().colorDefault)
 
 def setColor(name, r, g, b):
 	global _colorNames
@@ -223,66 +261,92 @@ def isStrategyStep():
 def isStrategyNative():
 	return getStrategy() == STRATEGY_NATIVE
 
+def getSegmentWorkers():
+	'''Number of processes to parse the segments of a file (0 or 1: sequential).'''
+	return __prmPrefIL__.GetInt("Others.SegmentWorkers", 0)
+
+def setSegmentWorkers(workers):
+	__prmPrefIL__.SetInt("Others.SegmentWorkers", workers)
+
+def getFaceWorkers():
+	'''Number of processes to trim the faces of an ACIS body (0 or 1: sequential).'''
+	return __prmPrefIL__.GetInt("Others.FaceWorkers", 0)
+
+def setFaceWorkers(workers):
+	__prmPrefIL__.SetInt("Others.FaceWorkers", workers)
+
+_dumpMode = None # None => preference 'Others.DumpFiles'
+
+def isDumpEnabled():
+	'''Returns False if the imports shall not write any files into the dump folder.'''
+	if (_dumpMode is None):
+		return __prmPrefIL__.GetBool("Others.DumpFiles", True)
+	return _dumpMode
+
+def setDumpEnabled(enabled):
+	__prmPrefIL__.SetBool("Others.DumpFiles", enabled)
+
+def setDumpMode(enabled):
+	'''
+	Overrides the preference for the dump files of this session, e.g. for batch runs.
+	None restores the preference.
+	'''
+	global _dumpMode
+	_dumpMode = enabled
+
 def setAuthor(author):
-	global _author
 	if (author):
-		_author = author
+		getContext().author = author
 	else:
-		_author = ''
+		getContext().author = ''
 	return
 
 def getAuthor():
-	global _author
-	return _author
+	return getContext().author
 
 def setCompany(company):
-	global _company
 	if (company):
-		_company = company
+		getContext().company = company
 	else:
-		_company = ''
+		getContext().company = ''
 	return
 
 def getCompany():
-	global _company
-	return _company
+	return getContext().company
 
 def setComment(comment):
-	global _comment
 	if (comment):
-		_comment = comment
+		getContext().comment = comment
 	else:
-		_comment = ''
+		getContext().comment = ''
 	return
 
 def getComment():
-	global _comment
-	return _comment
+	return getContext().comment
 
 def setLastModifiedBy(lastModifiedBy):
-	global _lastModifiedBy
 	if (lastModifiedBy):
-		_lastModifiedBy = lastModifiedBy
+		getContext().lastModifiedBy = lastModifiedBy
 	else:
-		_lastModifiedBy = ''
+		getContext().lastModifiedBy = ''
 	return
 
 def getLastModifiedBy():
-	global _lastModifiedBy
-	return _lastModifiedBy
+	return getContext().lastModifiedBy
 
 def setDescription(description):
-	global _description
 	if (description):
-		_description = description
+		getContext().description = description
 	else:
-		_description = ''
+		getContext().description = ''
 	return
 
 def getDescription():
-	return _description
+	return getContext().description
 
 def chooseImportStrategyAcis():
+	if (not FreeCAD.GuiUp):
+		return getStrategy()
 	btnCnvrt  = QPushButton('&convert to STEP')
 	btnNativ  = QPushButton('&nativ')
 	btnCancel = QPushButton('Cancel')
@@ -312,6 +376,8 @@ def chooseImportStrategyAcis():
 	return strategy
 
 def chooseImportStrategy():
+	if (not FreeCAD.GuiUp):
+		return getStrategy()
 	btnCnvrt  = QPushButton('&convert to STEP')
 	btnSat    = QPushButton('&SAT')
 	btnNativ  = QPushButton('&nativ')
@@ -366,14 +432,24 @@ class Thumbnail(object):
 		self.width = 0
 		self.height = 0
 		self.icon = None
+	def __getstate__(self):
+		# QPixmap can't be pickled => rebuild it from the data.
+		state = self.__dict__.copy()
+		state['icon'] = None
+		return state
+	def __setstate__(self, state):
+		self.__dict__.update(state)
+		if (self._data is not None):
+			self.setIconData(self._data)
 	def getData(self):
 		return self._data
 	def setIconData(self, data):
 		self._data = data
-		self.icon = QPixmap()
-		self.icon.loadFromData(QByteArray(data))
-		self.width  = self.icon.width()
-		self.height = self.icon.height()
+		if (FreeCAD.GuiUp):
+			self.icon = QPixmap()
+			self.icon.loadFromData(QByteArray(data))
+			self.width  = self.icon.width()
+			self.height = self.icon.height()
 	def readData(self, filename):
 		with open(filename, 'rb') as f:
 			self.setIconData(f.read())
@@ -405,9 +481,7 @@ class Thumbnail(object):
 	def __repr__(self): return self.__str__()
 	def getIcon(self):  return self.icon
 
-_thumbnail = None
 def writeThumbnail(data):
-	global _thumbnail
 	if (data):
 		thumbnail = Thumbnail()
 		thumbnail.setData(data[1])
@@ -417,16 +491,14 @@ def writeThumbnail(data):
 				file.write(thumbnail.getData())
 		setThumbnail(thumbnail)
 	else:
-		_thumbnail = None
-	return _thumbnail
+		setThumbnail(None)
+	return getThumbnail()
 
 def getThumbnail():
-	global _thumbnail
-	return _thumbnail
+	return getContext().thumbnail
 
 def setThumbnail(thumbnail):
-	global _thumbnail
-	_thumbnail = thumbnail
+	getContext().thumbnail = thumbnail
 	return
 
 UINT8      = Struct('<B').unpack_from
@@ -840,7 +912,7 @@ def getUUID(data, offset):
 		The new position in the 'stream'.
 	'''
 	end = offset + 16
-	val = UID(bytes_le=data[offset:end])
+	val = UID(bytes_le=bytes(data[offset:end]))
 	return val, end
 
 def getDateTime(data, offset):
@@ -863,10 +935,11 @@ def getDateTime(data, offset):
 def getText8(data, offset, l):
 	i = offset
 	end = i + l
+	buffer = bytes(data[i: end])
 	try:
-		txt = data[i: end].decode(ENCODING_FS)
+		txt = buffer.decode(ENCODING_FS)
 	except:
-		txt = data[i: end].decode('ansi')
+		txt = buffer.decode('ansi')
 	if (txt[-1:] == '\0'):
 		txt = txt[:-1]
 
@@ -885,14 +958,14 @@ def getLen32Text8(data, offset):
 	try:
 		txt, i = getText8(data, i, l)
 	except UnicodeDecodeError:
-		txt = data[i:i+l]
+		txt = bytes(data[i:i+l])
 		i += l
 	return txt, i
 
 def getLen32Text16(data, offset):
 	l, i = getUInt32(data, offset)
 	end = i + 2 * l
-	txt = data[i: end].decode('UTF-16LE')
+	txt = bytes(data[i: end]).decode('UTF-16LE')
 	if (txt[-1:] == '\0'):
 		txt = txt[:-1]
 
@@ -943,46 +1016,131 @@ def isEqual1D(a, b, e = 0.0001):
 	if (b is None): return isEqual1D(a, 0.0)
 	return abs(a - b) < e
 
-def _log(caller, method, msg, args):
+class LogRingBuffer(object):
+	'''
+	Log sink that keeps the last records in memory, e.g. for batch runs.
+	'''
+	def __init__(self, size = 10000):
+		self.records = collections.deque(maxlen=size)
+
+	def write(self, record):
+		self.records.append(record)
+
+	def getRecords(self, level = None):
+		return [r for r in self.records if ((level is None) or (r['level'] == level))]
+
+	def clear(self):
+		self.records.clear()
+
+class LogFile(object):
+	'''
+	Log sink that appends the records as JSON lines to a file.
+	'''
+	def __init__(self, filename):
+		self.filename = filename
+		self.lock     = threading.Lock()
+		self.stream   = io.open(filename, 'at', encoding='utf8')
+
+	def write(self, record):
+		line = u"%s\n" %(json.dumps(record, ensure_ascii=False))
+		with self.lock:
+			self.stream.write(line)
+			self.stream.flush()
+
+	def close(self):
+		self.stream.close()
+
+class LogLevelObserver(object):
+	'''
+	Refreshes the cached log levels whenever the output window's settings change.
+	'''
+	def OnChange(self, grp, name):
+		if (name in ('checkLogging', 'checkWarning', 'checkError')):
+			refreshLogLevels()
+
+# The log levels are cached as the parameter store is too slow to be asked for each message.
+_logInfo    = False
+_logWarning = False
+_logError   = True
+_logSink    = None # None => FreeCAD's console
+
+def refreshLogLevels():
+	global _logInfo, _logWarning, _logError
+	_logInfo    = __prmPrefOW__.GetBool("checkLogging", False)
+	_logWarning = __prmPrefOW__.GetBool("checkWarning", False)
+	_logError   = __prmPrefOW__.GetBool("checkError", True)
+
+refreshLogLevels()
+__logObserver__ = LogLevelObserver()
+try:
+	__prmPrefOW__.Attach(__logObserver__)
+except:
+	pass # old FreeCAD versions: levels are only refreshed by setLoggingXXX
+
+def getLogSink():
+	return _logSink
+
+def setLogSink(sink):
+	'''
+	Redirects the log messages to the sink (e.g. LogFile or LogRingBuffer)
+	or to FreeCAD's console for None. Returns the previous sink.
+	'''
+	global _logSink
+	previous = _logSink
+	_logSink = sink
+	return previous
+
+def _log(caller, level, method, msg, args):
 	try:
-		s = u"%s\n" %(msg)
 		if (len(args) > 0):
-			method(s %args)
+			s = msg %args
+		else:
+			s = u"%s" %(msg)
+		if (_logSink is None):
+			method(u"%s\n" %(s))
 		else:
-			method(s)
+			_logSink.write({'time': time.time(), 'level': level, 'thread': threading.current_thread().name, 'message': s})
 	except:
 		Console.PrintError("FATAL ERROR in %s:\n" %(caller))
-		Console.PrintError("msg   = " + msg)
-		if (len(args) > 0): Console.PrintError("*args = (%s)" %(",".join(args)))
+		Console.PrintError("msg   = %s\n" %(msg))
+		if (len(args) > 0): Console.PrintError("*args = %r\n" %(args,))
 
 def setLoggingInfo(val):
 	__prmPrefOW__.SetInt("checkLogging", val)
+	refreshLogLevels()
 def setLoggingWarn(val):
 	__prmPrefOW__.SetInt("checkWarning", val)
+	refreshLogLevels()
 def setLoggingError(val):
 	__prmPrefOW__.SetInt("checkError", val)
+	refreshLogLevels()
+
+def isLoggingInfo():
+	return _logInfo
+def isLoggingWarn():
+	return _logWarning
+def isLoggingError():
+	return _logError
 
+# The arguments are only formatted if the level is enabled - pass them instead of formatting the message!
 def logInfo(msg, *args):
-	if (__prmPrefOW__.GetBool("checkLogging", False)): _log("logInfo",    Console.PrintMessage, msg, args)
+	if (_logInfo):    _log("logInfo",    'info',    Console.PrintMessage, msg, args)
 def logWarning(msg, *args):
-	if (__prmPrefOW__.GetBool("checkWarning", False)): _log("logWarning", Console.PrintWarning, msg, args)
+	if (_logWarning): _log("logWarning", 'warning', Console.PrintWarning, msg, args)
 def logError(msg, *args):
-	if (__prmPrefOW__.GetBool("checkError", True)):    _log("logError",   Console.PrintError,   msg, args)
+	if (_logError):   _log("logError",   'error',   Console.PrintError,   msg, args)
 
 def logAlways(msg, *args):
-	_log("logAlways", Console.PrintMessage, msg, args)
+	_log("logAlways", 'always', Console.PrintMessage, msg, args)
 
 def getFileVersion():
-	global _fileVersion
-	return _fileVersion
+	return getContext().fileVersion
 
 def getFileBeta():
-	global _fileBeta
-	return _fileBeta
+	return getContext().fileBeta
 
 def getBlockSize():
-	global _block_size
-	return _block_size
+	return getContext().blockSize
 
 def getProperty(ole, path, key):
 	p = ole.getproperties([path], convert_time=True)
@@ -996,17 +1154,15 @@ def getProperty(ole, path, key):
 		return None
 
 def setFileVersion(version):
-	global _fileVersion, _block_size
-	_fileVersion = version
-	_block_size = 0 if (_fileVersion > 2010) else 4
+	context = getContext()
+	context.fileVersion = version
+	context.blockSize = 0 if (version > 2010) else 4
 
 def getInventorFile():
-	global _inventor_file
-	return _inventor_file
+	return getContext().inventorFile
 
 def getDumpFolder():
-	global _dump_folder
-	return _dump_folder
+	return getContext().dumpFolder
 
 def cleanDumpFolder():
 	folder = getDumpFolder()
@@ -1018,17 +1174,20 @@ def cleanDumpFolder():
 			shutil.rmtree(p)
 
 def setDumpFolder(anyInputFile):
-	global _dump_folder
+	context = getContext()
+	if (not isDumpEnabled()):
+		context.dumpFolder = None
+		return
 	fileParts = os.path.splitext(anyInputFile)
-	_dump_folder = os.path.abspath(u"%s_%s" %(fileParts[0], fileParts[1][1:]))
+	context.dumpFolder = os.path.abspath(u"%s_%s" %(fileParts[0], fileParts[1][1:]))
 
-	if (os.path.exists(_dump_folder)):
+	if (os.path.exists(context.dumpFolder)):
 		cleanDumpFolder()
 	else:
 		try:
-			os.mkdir(_dump_folder)
+			os.mkdir(context.dumpFolder)
 		except:
-			_dump_folder = None
+			context.dumpFolder = None
 			# can't create folder, e.g. insuficien usr right.
 			tmp = os.getenv('TEMP')
 			if ((tmp is None) or (not os.path.exists(tmp))):
@@ -1048,25 +1207,23 @@ def setDumpFolder(anyInputFile):
 								tmp = None
 			if (not tmp is None):
 				ifile = os.path.splitext(os.path.basename(anyInputFile))
-				_dump_folder = os.path.join(tmp, "%s_%s" %(ifile[0], ifile[1][1:]))
+				context.dumpFolder = os.path.join(tmp, "%s_%s" %(ifile[0], ifile[1][1:]))
 				try:
-					if (not os.path.exists(_dump_folder)):
-						os.mkdir(_dump_folder)
+					if (not os.path.exists(context.dumpFolder)):
+						os.mkdir(context.dumpFolder)
 					else:
 						cleanDumpFolder()
 				except:
-					_dump_folder = None
-			if (_dump_folder is None):
+					context.dumpFolder = None
+			if (context.dumpFolder is None):
 				logWarning(u"Can't locate any dump folder! Ignoring dump files!")
 			else:
-				logWarning(u"Using TEMP folder for dumping files: '%s'" %(_dump_folder))
+				logWarning(u"Using TEMP folder for dumping files: '%s'" %(context.dumpFolder))
 
 
 def setInventorFile(file):
-	global _inventor_file
-
-	_inventor_file = os.path.abspath(file)
-	setDumpFolder(_inventor_file)
+	getContext().inventorFile = os.path.abspath(file)
+	setDumpFolder(getInventorFile())
 	return OleFileIO(file)
 
 def isString(value):
@@ -1122,14 +1279,24 @@ def getTableValue(table, col, row):
 	except:
 		return None
 
-def setTableValue(table, col, row, val):
+def _getTableContent(val):
 	if (type(val) == str):
-		table.set(getCellRef(col, row), val)
-	else:
-		if ((sys.version_info.major < 3) and (type(val) == unicode)):
-			table.set(getCellRef(col, row), "%s" %(val.encode("utf8")))
-		else:
-			table.set(getCellRef(col, row), str(val))
+		return val
+	if ((sys.version_info.major < 3) and (type(val) == unicode)):
+		return "%s" %(val.encode("utf8"))
+	return str(val)
+
+def setTableValue(table, col, row, val):
+	table.set(getCellRef(col, row), _getTableContent(val))
+
+def updateTableValue(table, col, row, val):
+	'''Sets the cell's value only if it changes the cell's content. Returns True if the cell was changed.'''
+	cell    = getCellRef(col, row)
+	content = _getTableContent(val)
+	if (table.getContents(cell) == content):
+		return False
+	table.set(cell, content)
+	return True
 
 def calcAliasname(name):
 	alias = name.replace(':', '_')
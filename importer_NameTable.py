@@ -8,6 +8,7 @@ import importerSegNode
 
 from importerSegment import SegmentReader
 from importerUtils   import *
+from importerLayout  import layout
 from importerSegNode import _TYP_NODE_REF_, _TYP_NODE_X_REF_, _TYP_UINT32_A_, _TYP_NT_ENTRY_, REF_CHILD, REF_CROSS
 from importerClasses import NtEntry, VAL_UINT32, VAL_REF
 
@@ -182,6 +183,7 @@ class NameTableReader(SegmentReader): # for BRep and DC
 			val, i = self.ReadNodeRef(node, i, key, REF_CHILD, 'entries')
 			lst[key] = val
 		node.set('entries', lst, VAL_REF)
+		self.segment.indexNameTable(node)
 		return i
 
 	def Read_CCC5085A(self, node): # FaceMergeData
@@ -370,6 +372,7 @@ class NameTableReader(SegmentReader): # for BRep and DC
 		i = node.ReadList2(i, _TYP_UINT32_A_, 'lst1', 2)
 		return i
 
+	@layout('u32:u32_1 s u32:u32_2 u8:u8_0 u32[4]:a1 (x[1])>2011', 'ReadHeaderNameTableChild2Node')
 	def Read_0811C56E(self, node): # Name table child node
 		i = self.ReadHeaderNameTableChild2Node(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -394,6 +397,7 @@ class NameTableReader(SegmentReader): # for BRep and DC
 		i = self.ReadHeaderNameTableChild2Node(node)
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderNameTableChild2Node')
 	def Read_896A9790(self, node): # Name table child node
 		i = self.ReadHeaderNameTableChild2Node(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -409,6 +413,7 @@ class NameTableReader(SegmentReader): # for BRep and DC
 		i = node.ReadUInt32A(i, 3, 'a4')   # always (0,0,0)
 		return i
 
+	@layout('s u32[3]:a1', 'ReadHeaderNameTableChild2Node')
 	def Read_90F4820A(self, node): # Name table child node for points (first-vertex)
 		i = self.ReadHeaderNameTableChild2Node(node)
 		i = self.skipBlockSize(i)
@@ -427,6 +432,7 @@ class NameTableReader(SegmentReader): # for BRep and DC
 		node.set('lst2', lst, VAL_UINT32)
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderNameTableChild2Node')
 	def Read_E5289C69(self, node): # Name table child node
 		i = self.ReadHeaderNameTableChild2Node(node)
 		i = node.ReadUInt32(i, 'u32_1')
@@ -4,6 +4,7 @@ import importerSegNode
 
 from importerSegment import SegmentReader
 from importerUtils   import *
+from importerLayout  import layout
 from importerClasses import AbstractData
 
 '''
@@ -32,6 +33,7 @@ class StyleReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('v3:vec_1 v3:vec_2 t16', 'ReadHeaderStyle', 'Style_0AE12F04')
 	def Read_0AE12F04(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_0AE12F04')
 		i = node.ReadFloat64_3D(i, 'vec_1')
@@ -39,6 +41,7 @@ class StyleReader(SegmentReader):
 		i = node.ReadLen32Text16(i)
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderStyle', 'Style_440D2B29')
 	def Read_440D2B29(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_440D2B29')
 		i = node.ReadUInt32(i, 'u32_1')
@@ -50,6 +53,7 @@ class StyleReader(SegmentReader):
 		i = node.ReadUInt8(i, 'u8_0')
 		return i
 
+	@layout('f64:f64_0 v3:vec f64:f64_1 u32:u32_1', 'ReadHeaderStyle', 'Style_B32BF6A7')
 	def Read_6E176BB6(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_B32BF6A7')
 		i = node.ReadFloat64(i, 'f64_0')
@@ -67,12 +71,14 @@ class StyleReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_2')
 		return i
 
+	@layout('lst2<NODE_REF>:lst0 u32:u32_1', 'ReadHeaderStyle', 'Style_824D8FD9')
 	def Read_824D8FD9(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_824D8FD9')
 		i = node.ReadList2(i, importerSegNode._TYP_NODE_REF_, 'lst0')
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('v2:a0', 'ReadHeaderStyle', 'Style_7AE0E1A3')
 	def Read_7AE0E1A3(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_7AE0E1A3')
 		i = node.ReadFloat64_2D(i, 'a0')
@@ -90,6 +96,7 @@ class StyleReader(SegmentReader):
 		i = node.ReadUInt16A(i, 10, 'a11')
 		return i
 
+	@layout('u16[10]:a0 u8:u8_0 u16[3]:a1 s u16[4]:a2 s u32:u32_1', 'ReadHeaderStyle', 'Style_8F0B160C')
 	def Read_8F0B160C(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_8F0B160C')
 		i = node.ReadUInt16A(i, 10, 'a0')
@@ -101,6 +108,7 @@ class StyleReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('v3:vec (v3:dir)>2013', 'ReadHeaderStyle', 'Style_9795E56A')
 	def Read_9795E56A(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_9795E56A')
 		i = node.ReadFloat64_3D(i, 'vec')
@@ -119,11 +127,13 @@ class StyleReader(SegmentReader):
 		i = node.ReadUInt8(i, 'u8_1')
 		return i
 
+	@layout('v3:vec', 'ReadHeaderStyle', 'Style_B255D907')
 	def Read_B255D907(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_B255D907')
 		i = node.ReadFloat64_3D(i, 'vec')
 		return i
 
+	@layout('f32[4]:a0 s f32[4]:a1 s f32[4]:a2 s f32[4]:a3 s f32:f32_0 s', 'ReadHeaderStyle', 'Style_B32BF6A2')
 	def Read_B32BF6A2(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_B32BF6A2')
 		i = node.ReadFloat32A(i, 4, 'a0')
@@ -138,21 +148,25 @@ class StyleReader(SegmentReader):
 		i = self.skipBlockSize(i)
 		return i
 
+	@layout('bool:visible', 'ReadHeaderStyle', 'Style_Visibility')
 	def Read_B32BF6A3(self, node): # visibility style
 		i = self.ReadHeaderStyle(node, 'Style_Visibility')
 		i = node.ReadBoolean(i, 'visible')
 		return i
 
+	@layout('u16:u16_0', 'ReadHeaderStyle', 'Style_B32BF6A5')
 	def Read_B32BF6A5(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_B32BF6A5')
 		i = node.ReadUInt16(i, 'u16_0')
 		return i
 
+	@layout('bool:solid', 'ReadHeaderStyle', 'Style_Solid')
 	def Read_B32BF6A6(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_Solid')
 		i = node.ReadBoolean(i, 'solid')
 		return i
 
+	@layout('f64:f64_0 v3:vec f64:f64_1 u32:u32_1', 'ReadHeaderStyle', 'Style_B32BF6A7')
 	def Read_B32BF6A7(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_B32BF6A7')
 		i = node.ReadFloat64(i, 'f64_0')
@@ -161,16 +175,19 @@ class StyleReader(SegmentReader):
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('u32:u32_1', 'ReadHeaderStyle', 'Style_B32BF6A8')
 	def Read_B32BF6A8(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_B32BF6A8')
 		i = node.ReadUInt32(i, 'u32_1')
 		return i
 
+	@layout('u16:u16_1', 'ReadHeaderStyle', 'Style_B32BF6A9')
 	def Read_B32BF6A9(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_B32BF6A9')
 		i = node.ReadUInt16(i, 'u16_1') # Enm???
 		return i
 
+	@layout('u8:u8_0', 'ReadHeaderStyle', 'Style_B32BF6AB')
 	def Read_B32BF6AB(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_B32BF6AB')
 		i = node.ReadUInt8(i, 'u8_0')
@@ -234,11 +251,13 @@ class StyleReader(SegmentReader):
 #		i = node.ReadUInt8(i, 'u8_2')
 		return i
 
+	@layout('v3:a0', 'ReadHeaderStyle', 'Style_C29D5C11')
 	def Read_C29D5C11(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_C29D5C11')
 		i = node.ReadFloat64_3D(i, 'a0')
 		return i
 
+	@layout('u32:u32_1 s32:s32_1 f32:f32_1 bool:b1', 'ReadHeaderStyle', 'Style_F2FB355D')
 	def Read_F2FB355D(self, node): # Object style ...
 		i = self.ReadHeaderStyle(node, 'Style_F2FB355D')
 		i = node.ReadUInt32(i,  'u32_1')